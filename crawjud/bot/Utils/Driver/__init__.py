@@ -6,9 +6,12 @@ import json
 import platform
 import shutil
 import traceback
-from os import getcwd, path
+from contextlib import suppress
+from os import getcwd, getenv, path
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import psutil
 from selenium.webdriver.remote.webdriver import WebDriver
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.core.driver_cache import DriverCacheManager
@@ -21,6 +24,11 @@ from crawjud.bot.core import (
     Service,
     WebDriverWait,
 )
+from crawjud.bot.Utils.elements.profiles import FULL, BrowserProfile, browser_profile
+from crawjud.bot.Utils.profiling import timed
+
+if TYPE_CHECKING:
+    from crawjud.bot.Utils.Driver.pool import PooledSession
 
 if __name__ == "__main__":
     from getchrome_version import another_chrome_ver, chrome_ver
@@ -28,8 +36,33 @@ else:
     from crawjud.bot.Utils.Driver.getchrome_version import another_chrome_ver, chrome_ver  # noqa: F401
 
 
+# Profile directories are copied from BROWSER_BASE_PROFILE without these caches
+PROFILE_CACHES = ("Cache", "Code Cache", "GPUCache", "Service Worker", "Singleton*")
+LEAN_ARGS = [
+    "--headless=new",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--mute-audio",
+    "--no-first-run",
+    "--renderer-process-limit=2",
+    "--disk-cache-size=33554432",
+    "--media-cache-size=1",
+]
+
+
 class DriverBot(CrawJUD):
-    """Bot for handling WebDriver operations within CrawJUD framework."""
+    """Bot for handling WebDriver operations within CrawJUD framework.
+
+    Attributes:
+        profile_ (BrowserProfile): Browser profile of the current session.
+        peak_rss_mb_ (float): Highest memory measured for the browser between rows.
+
+    """
+
+    profile_: BrowserProfile = FULL
+    peak_rss_mb_: float = 0.0
 
     def __init__(self) -> None:
         """
@@ -97,17 +130,48 @@ class DriverBot(CrawJUD):
 
     def add_options(self, chrome_options: Options) -> None:
         """Add options to the Chrome WebDriver instance."""
-        self.chr_dir = Path(self.pid_path).joinpath("chrome").resolve()
-        chrome_options.add_argument(f"user-data-dir={str(self.chr_dir)}")
+        profile_name = f"chrome-{self.worker_id}" if self.worker_id else "chrome"
+        self.chr_dir = Path(self.pid_path).joinpath(profile_name).resolve()
+        DriverBot.profile_ = browser_profile(self.system, self.browser_profile)
+        self.fill_options(chrome_options, self.chr_dir, self.pid_path, self.system, self.list_args, DriverBot.profile_)
+
+    @classmethod
+    def fill_options(
+        cls,
+        chrome_options: Options,
+        chr_dir: Path,
+        download_dir: Path,
+        system: str,
+        list_args: list[str] = None,
+        profile: BrowserProfile = None,
+    ) -> None:
+        """Fill Chrome options with the profile, arguments, extensions and preferences of the bot.
+
+        Args:
+            chrome_options (Options): The options to fill.
+            chr_dir (Path): The Chrome profile directory.
+            download_dir (Path): The default download directory.
+            system (str): The target system.
+            list_args (list[str], optional): Chrome arguments (defaults to ``list_args_``).
+            profile (BrowserProfile, optional): The browser profile (defaults to the one of the system).
+
+        """
+        profile = profile or browser_profile(system)
+        cls.seed_profile(Path(chr_dir))
+        chrome_options.add_argument(f"user-data-dir={str(chr_dir)}")
+
+        list_args = list_args or cls.list_args_
+        if profile.lean:
+            list_args = [arg for arg in list_args if not arg.startswith("--display")]
+            list_args.extend(arg for arg in LEAN_ARGS if arg not in list_args)
 
-        list_args = self.list_args
         for argument in list_args:
             chrome_options.add_argument(argument)
 
         this_path = Path(__file__).parent.resolve().joinpath("extensions")
         for root, _, files in this_path.walk():
             for file_ in files:
-                if ".crx" in file_:
+                if ".crx" in file_ and profile.extensions:
                     path_plugin = str(root.joinpath(file_).resolve())
                     chrome_options.add_extension(path_plugin)
 
@@ -115,16 +179,149 @@ class DriverBot(CrawJUD):
             "download.prompt_for_download": False,
             "plugins.always_open_pdf_externally": True,
             "profile.default_content_settings.popups": 0,
-            "printing.print_preview_sticky_settings.appState": json.dumps(self.settings),
-            "download.default_directory": f"{self.pid_path}",
+            "printing.print_preview_sticky_settings.appState": json.dumps(cls.settings),
+            "download.default_directory": f"{download_dir}",
             "credentials_enable_service": False,
             "profile.password_manager_enabled": False,
         }
+        if profile.lean and profile.block_images:
+            chrome_prefs["profile.managed_default_content_settings.images"] = 2
 
-        if self.system == "projudi":
+        if system == "projudi":
             chrome_options.add_argument("--incognito")
         chrome_options.add_experimental_option("prefs", chrome_prefs)
 
+    @staticmethod
+    def seed_profile(chr_dir: Path) -> None:
+        """Start a new profile directory from the base profile, if one is configured.
+
+        ``BROWSER_BASE_PROFILE`` points at a profile prepared once (accepted
+        certificates, settings); it is copied without its caches so each session
+        starts from a small directory instead of an empty one.
+
+        Args:
+            chr_dir (Path): The Chrome profile directory.
+
+        """
+        base = getenv("BROWSER_BASE_PROFILE")
+        if not base or chr_dir.exists() or not Path(base).is_dir():
+            return
+
+        with suppress(OSError):
+            shutil.copytree(base, chr_dir, ignore=shutil.ignore_patterns(*PROFILE_CACHES))
+
+    @staticmethod
+    def apply_profile(driver: WebDriver, profile: BrowserProfile) -> None:
+        """Block the requests the profile does not need through CDP.
+
+        Args:
+            driver (WebDriver): The driver.
+            profile (BrowserProfile): The browser profile.
+
+        """
+        blocked = profile.blocked_urls()
+        if not blocked:
+            return
+
+        with suppress(Exception):
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked})
+
+    @staticmethod
+    def rss_mb(driver: WebDriver) -> float:
+        """Return the resident memory of chromedriver and its Chrome processes.
+
+        Args:
+            driver (WebDriver): The driver.
+
+        Returns:
+            float: The memory in megabytes (0 when it cannot be measured).
+
+        """
+        with suppress(Exception):
+            root = psutil.Process(driver.service.process.pid)
+            procs = [root, *root.children(recursive=True)]
+            return sum(proc.memory_info().rss for proc in procs) / (1024 * 1024)
+
+        return 0.0
+
+    def recycle(self) -> None:
+        """Restart the browser between rows once it grows past the memory cap of the profile.
+
+        Sessions leased from the driver pool are left alone; the pool recycles them itself.
+        """
+        if self.driver is None:
+            return
+
+        rss = self.rss_mb(self.driver)
+        DriverBot.peak_rss_mb_ = max(DriverBot.peak_rss_mb_, rss)
+
+        cap = DriverBot.profile_.memory_cap_mb
+        if not cap or rss <= cap or self.pooled_session:
+            return
+
+        self.message = f"Navegador com {rss:.0f} MB (limite {cap} MB), reiniciando"
+        self.type_log = "log"
+        self.prt()
+
+        with suppress(Exception):
+            self.driver.quit()
+
+        self.driver, self.wait = self.driver_launch(message="Reiniciando WebDriver")
+        self.auth_bot()
+
+    def memory_report(self) -> str | None:
+        """Return the profile and peak memory of the browser, for the execution log.
+
+        Returns:
+            str | None: The summary, or None if the memory was never measured.
+
+        """
+        if not DriverBot.peak_rss_mb_:
+            return None
+
+        return f"Perfil do navegador: {DriverBot.profile_.mode}, pico de memória: {DriverBot.peak_rss_mb_:.0f} MB"
+
+    @staticmethod
+    def chromedriver_path() -> str:
+        """Return the chromedriver binary, downloading it to the bot temp cache if needed.
+
+        Returns:
+            str: The chromedriver path.
+
+        """
+        return ChromeDriverManager(
+            os_system_manager=OperationSystemManager(),
+            cache_manager=DriverCacheManager(Path(__file__).cwd().joinpath("crawjud", "bot", "temp").resolve()),
+        ).install()
+
+    def use_pooled(self, session: PooledSession) -> tuple[WebDriver, WebDriverWait]:
+        """Take over a warm session leased by the worker's DriverPool.
+
+        Args:
+            session (PooledSession): The leased session.
+
+        Returns:
+            tuple[WebDriver, WebDriverWait]: The session driver and a new wait instance.
+
+        """
+        self.pid_path = self.output_dir_path.resolve()
+        driver = session.driver
+        DriverBot.profile_ = browser_profile(self.system, self.browser_profile)
+
+        # Downloads of this execution must land in its own output directory
+        driver.execute_cdp_cmd(
+            "Browser.setDownloadBehavior",
+            {"behavior": "allow", "downloadPath": str(self.pid_path)},
+        )
+
+        self.message = "WebDriver reaproveitado do pool"
+        self.type_log = "log"
+        self.prt()
+
+        return (driver, WebDriverWait(driver, 20, 0.01))
+
+    @timed("navegador")
     def driver_launch(self, message: str = "Inicializando WebDriver") -> tuple[WebDriver, WebDriverWait]:
         """
         Launch WebDriver with options and extensions, then return driver and wait to run well.
@@ -153,13 +350,9 @@ class DriverBot(CrawJUD):
             self.create_path_accepted()
             self.add_options(chrome_options)
 
-            path_chrome = ChromeDriverManager(
-                os_system_manager=OperationSystemManager(),
-                cache_manager=DriverCacheManager(Path(__file__).cwd().joinpath("crawjud", "bot", "temp").resolve()),
-            ).install()
-
-            serve = Service(path_chrome)
+            serve = Service(self.chromedriver_path())
             driver = Chrome(service=serve, options=chrome_options)
+            self.apply_profile(driver, DriverBot.profile_)
 
             wait = WebDriverWait(driver, 20, 0.01)
             driver.delete_all_cookies()
@@ -0,0 +1,387 @@
+"""Driver pool module: Keep warm, authenticated Chrome sessions across bot executions.
+
+Bots run in a process forked from the Celery worker (see ``WorkerBot`` launchers), so a
+WebDriver created in the worker remains usable by the bot process: only the HTTP client
+is copied, the chromedriver and Chrome processes stay owned by the worker. The pool
+launches those sessions in the worker, hands one to each execution with the same
+(system, state_or_client, username, browser profile mode) key and takes it back when the
+bot process exits.
+
+Settings (environment variables):
+    DRIVER_POOL_SIZE: Maximum number of pooled sessions per worker (0 disables the pool).
+    DRIVER_POOL_MAX_USES: Executions served by a session before it is recycled.
+    DRIVER_POOL_MAX_RSS_MB: Chrome memory (RSS) above which a session is recycled.
+    DRIVER_POOL_IDLE_TIMEOUT: Seconds an idle session is kept before being closed.
+    DRIVER_POOL_AUTH_TTL: Seconds a released session is trusted to still be logged in.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import platform
+import shutil
+import time
+import traceback
+from contextlib import contextmanager, suppress
+from os import getenv
+from pathlib import Path
+from threading import RLock
+from typing import Generator
+from uuid import uuid4
+
+from billiard import Value
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from crawjud.bot.core import Chrome, Options, Service
+from crawjud.bot.Utils.elements.profiles import browser_profile
+
+logger = logging.getLogger(__name__)
+
+PoolKey = tuple[str, str, str, str]
+
+
+class PooledSession:
+    """A Chrome session owned by the pool.
+
+    Attributes:
+        key (PoolKey): The (system, state_or_client, username, profile mode) served by the session.
+        driver (WebDriver): The WebDriver bound to the session.
+        profile_dir (Path): The Chrome profile directory of the session.
+        uses (int): Number of executions already served.
+        released_at (float): Monotonic time of the last release.
+        authenticated (Value): Shared flag set by the bot process after a successful login.
+
+    """
+
+    key: PoolKey
+    driver: WebDriver
+    profile_dir: Path
+    uses: int
+    released_at: float
+    authenticated: Value
+
+    def __init__(self, key: PoolKey, driver: WebDriver, profile_dir: Path) -> None:
+        """Initialize the PooledSession.
+
+        Args:
+            key (PoolKey): The pool key served by the session.
+            driver (WebDriver): The launched WebDriver.
+            profile_dir (Path): The Chrome profile directory.
+
+        """
+        self.key = key
+        self.driver = driver
+        self.profile_dir = profile_dir
+        self.uses = 0
+        self.released_at = time.monotonic()
+        self.authenticated = Value("b", 0, lock=False)
+
+    def auth_valid(self) -> bool:
+        """Return whether the session can skip the login step.
+
+        Returns:
+            bool: True if the session logged in and was released within the auth TTL.
+
+        """
+        auth_ttl = float(getenv("DRIVER_POOL_AUTH_TTL", "900"))
+        return bool(self.authenticated.value) and (time.monotonic() - self.released_at) < auth_ttl
+
+    def rss_mb(self) -> float:
+        """Return the resident memory of chromedriver and its Chrome processes.
+
+        Returns:
+            float: The memory in megabytes (0 when it cannot be measured).
+
+        """
+        from crawjud.bot.Utils.Driver import DriverBot
+
+        return DriverBot.rss_mb(self.driver)
+
+    def healthy(self) -> bool:
+        """Check that the browser still answers, closing windows left behind by the last run.
+
+        Returns:
+            bool: True if the session is usable.
+
+        """
+        try:
+            handles = self.driver.window_handles
+            if not handles:
+                return False
+
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+
+            self.driver.switch_to.window(handles[0])
+            return True
+
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        """Quit the browser and remove its profile directory."""
+        with suppress(Exception):
+            self.driver.quit()
+
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class DriverPool:
+    """Lease warm Chrome sessions to bot executions of the Celery worker.
+
+    Attributes:
+        idle_ (dict[PoolKey, list[PooledSession]]): Sessions waiting for an execution.
+        in_use_ (int): Number of sessions currently leased.
+        lock_ (RLock): Guards the pool, shared by the worker threads.
+        stats_ (dict[str, float]): Hit, miss and launch counters.
+
+    """
+
+    idle_: dict[PoolKey, list[PooledSession]] = {}
+    in_use_: int = 0
+    lock_ = RLock()
+    stats_: dict[str, float] = {
+        "hits": 0,
+        "misses": 0,
+        "recycled": 0,
+        "launch_seconds": 0.0,
+        "saved_seconds": 0.0,
+    }
+
+    @staticmethod
+    def size() -> int:
+        """Return the maximum number of pooled sessions (0 when disabled).
+
+        Returns:
+            int: The configured pool size.
+
+        """
+        if platform.system() == "Windows":
+            # Sessions are handed to the bot through fork, not available on Windows
+            return 0
+
+        return int(getenv("DRIVER_POOL_SIZE", "4"))
+
+    @staticmethod
+    def key_of(kwargs: dict[str, str]) -> PoolKey | None:
+        """Build the pool key of an execution from its arguments file.
+
+        Args:
+            kwargs (dict[str, str]): The launcher keyword arguments (with ``path_args``).
+
+        Returns:
+            PoolKey | None: The key, or None when the execution cannot share a session.
+
+        """
+        try:
+            with Path(kwargs["path_args"]).open() as f:
+                bot_args: dict[str, str] = json.load(f)
+
+        except Exception:
+            return None
+
+        username = bot_args.get("username")
+        if not username or bot_args.get("login_method") == "cert":
+            return None
+
+        state_or_client = str(bot_args.get("state") or bot_args.get("client") or "").split(" - ")[0]
+        system = str(kwargs.get("system") or bot_args.get("system") or "").lower()
+        mode = browser_profile(system, bot_args.get("browser_profile")).mode
+        return (system, state_or_client, str(username), mode)
+
+    @classmethod
+    def launch(cls, key: PoolKey) -> PooledSession:
+        """Launch a new Chrome session for the given key.
+
+        Args:
+            key (PoolKey): The pool key.
+
+        Returns:
+            PooledSession: The new session.
+
+        """
+        from crawjud.bot.Utils.Driver import DriverBot
+
+        profile_dir = Path(__file__).cwd().joinpath("crawjud", "bot", "temp", "pool", uuid4().hex).resolve()
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+        start = time.perf_counter()
+        profile = browser_profile(key[0], key[3])
+        chrome_options = Options()
+        DriverBot.fill_options(chrome_options, profile_dir, profile_dir, key[0], profile=profile)
+        driver = Chrome(service=Service(DriverBot.chromedriver_path()), options=chrome_options)
+        DriverBot.apply_profile(driver, profile)
+        driver.delete_all_cookies()
+
+        with cls.lock_:
+            cls.stats_["launch_seconds"] += time.perf_counter() - start
+
+        return PooledSession(key, driver, profile_dir)
+
+    @classmethod
+    def acquire(cls, key: PoolKey) -> PooledSession | None:
+        """Take an idle session for the key, launching one if none is available.
+
+        Args:
+            key (PoolKey): The pool key.
+
+        Returns:
+            PooledSession | None: The leased session, or None when the pool is full.
+
+        """
+        with cls.lock_:
+            cls.reap()
+            idle = cls.idle_.get(key, [])
+            while idle:
+                session = idle.pop()
+                if session.healthy():
+                    cls.in_use_ += 1
+                    cls.stats_["hits"] += 1
+                    cls.stats_["saved_seconds"] += cls.average_launch()
+                    return session
+
+                session.close()
+
+            if cls.in_use_ + cls.idle_count() >= cls.size():
+                return None
+
+            cls.in_use_ += 1
+            cls.stats_["misses"] += 1
+
+        try:
+            return cls.launch(key)
+
+        except Exception:
+            with cls.lock_:
+                cls.in_use_ -= 1
+
+            logger.exception(traceback.format_exc())
+            return None
+
+    @classmethod
+    def release(cls, session: PooledSession) -> None:
+        """Return a session to the pool, or close it if it should be recycled.
+
+        Args:
+            session (PooledSession): The session leased by ``acquire``.
+
+        """
+        session.uses += 1
+        max_uses = int(getenv("DRIVER_POOL_MAX_USES", "20"))
+        max_rss = float(getenv("DRIVER_POOL_MAX_RSS_MB", "1500"))
+
+        keep = session.uses < max_uses and session.healthy() and session.rss_mb() < max_rss
+        with cls.lock_:
+            cls.in_use_ -= 1
+            if keep:
+                session.released_at = time.monotonic()
+                cls.idle_.setdefault(session.key, []).append(session)
+                return
+
+            cls.stats_["recycled"] += 1
+
+        session.close()
+
+    @classmethod
+    def reap(cls) -> None:
+        """Close the sessions idle for longer than the idle timeout."""
+        idle_timeout = float(getenv("DRIVER_POOL_IDLE_TIMEOUT", "900"))
+        now = time.monotonic()
+        with cls.lock_:
+            for key, sessions in list(cls.idle_.items()):
+                expired = [session for session in sessions if now - session.released_at >= idle_timeout]
+                for session in expired:
+                    sessions.remove(session)
+                    session.close()
+
+                if not sessions:
+                    cls.idle_.pop(key, None)
+
+    @classmethod
+    def idle_count(cls) -> int:
+        """Return the number of idle sessions.
+
+        Returns:
+            int: The idle sessions of every key.
+
+        """
+        return sum(len(sessions) for sessions in cls.idle_.values())
+
+    @classmethod
+    def average_launch(cls) -> float:
+        """Return the mean Chrome launch time measured by the pool.
+
+        Returns:
+            float: The average launch time in seconds.
+
+        """
+        launches = cls.stats_["misses"]
+        return cls.stats_["launch_seconds"] / launches if launches else 0.0
+
+    @classmethod
+    def metrics(cls) -> dict[str, float]:
+        """Return the pool counters with the hit rate.
+
+        Returns:
+            dict[str, float]: Hits, misses, recycled sessions, hit rate and launch time saved.
+
+        """
+        with cls.lock_:
+            stats = dict(cls.stats_)
+            total = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = stats["hits"] / total if total else 0.0
+            stats["idle"] = cls.idle_count()
+            stats["in_use"] = cls.in_use_
+            return stats
+
+    @classmethod
+    @contextmanager
+    def lease(cls, kwargs: dict[str, str]) -> Generator[dict[str, PooledSession], None, None]:
+        """Lease a session for one bot execution.
+
+        Yields the extra keyword arguments to pass to the bot process, empty when the
+        execution cannot use the pool (disabled, certificate login or pool full).
+
+        Args:
+            kwargs (dict[str, str]): The launcher keyword arguments.
+
+        Yields:
+            dict[str, PooledSession]: ``{"pooled_session": session}`` or an empty dict.
+
+        """
+        key = cls.key_of(kwargs) if cls.size() > 0 else None
+        session = cls.acquire(key) if key else None
+        if session is None:
+            yield {}
+            return
+
+        logger.info("Driver pool %s: sessão %s", "reuso" if session.uses else "nova", key)
+        try:
+            yield {"pooled_session": session}
+
+        except BaseException:
+            with cls.lock_:
+                cls.in_use_ -= 1
+                cls.stats_["recycled"] += 1
+
+            session.close()
+            raise
+
+        cls.release(session)
+        logger.info("Driver pool metrics: %s", cls.metrics())
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Close every idle session (called when the worker exits)."""
+        with cls.lock_:
+            for sessions in cls.idle_.values():
+                for session in sessions:
+                    session.close()
+
+            cls.idle_.clear()
+
+
+atexit.register(DriverPool.shutdown)
@@ -3,6 +3,8 @@
 Using openpyxl, build an Excel file with headers and styles based on CrawJUD attributes.
 """
 
+from pathlib import Path
+
 import openpyxl
 from openpyxl.styles import Font, PatternFill
 
@@ -25,12 +27,13 @@ class MakeXlsx(CrawJUD):
         No additional parameters are required during initialization.
         """
 
-    def make_output(self, type_xlsx: str, path_template: str) -> list[str]:
+    def make_output(self, type_xlsx: str, path_template: str, keep_existing: bool = False) -> list[str]:
         """Build and save an Excel file with customized headers and styles.
 
         Args:
             type_xlsx (str): String defining Excel template type.
             path_template (str): File system path to save the generated Excel file.
+            keep_existing (bool, optional): Keep the file if it already exists (resumed executions).
 
         Returns:
             list[str]: The list of headers used in the created Excel file.
@@ -49,6 +52,9 @@ class MakeXlsx(CrawJUD):
         list_to_append.extend(lista_colunas)
         cabecalhos.extend(list_to_append)
 
+        if keep_existing and Path(path_template).exists():
+            return cabecalhos
+
         # Define style settings
         my_red = openpyxl.styles.colors.Color(rgb="A6A6A6")
         my_fill = PatternFill(patternType="solid", fgColor=my_red)
@@ -1,11 +1,19 @@
 """Module to handle sending messages via SocketIo.
 
 Classes:
+    LogShipper: Ship queued log messages in batches from a background thread.
     SendMessage: Handle sending messages via SocketIo.
 
 """
 
+import logging
+import os
+import traceback
+from collections import deque
+from contextlib import suppress
 from os import getenv
+from pathlib import Path
+from threading import Event, Lock, Thread
 from typing import Self
 
 import socketio
@@ -14,6 +22,142 @@ from dotenv import load_dotenv
 from crawjud.bot.core import CrawJUD
 
 load_dotenv()
+logger = logging.getLogger(__name__)
+
+MAX_QUEUE = 1000
+BATCH_SIZE = 50
+FLUSH_INTERVAL = 0.5
+
+
+class LogShipper:
+    """Ship queued log messages in batches from a background thread.
+
+    Messages wait in a bounded queue; when it is full the oldest message is dropped,
+    so a slow or unreachable server never blocks the bot. Every ``FLUSH_INTERVAL``
+    seconds (or as soon as ``BATCH_SIZE`` messages are waiting) the queue is sent as
+    a single ``log_message`` event carrying a ``messages`` list. A batch the server did
+    not receive goes back to the front of the queue and is sent on the next flush.
+    Every message is appended to the execution LogFile on the first flush after it
+    was queued, whether or not the server is reachable, and is never dropped from it.
+
+    Attributes:
+        sender (SendMessage): The instance that owns the socket connection.
+        stats (dict[str, int]): Queued, sent, batches and dropped message counters.
+        lock (Lock): Guards the queue and the counters (held only briefly).
+        send_lock (Lock): Keeps flushes from the thread and from status changes in order.
+
+    """
+
+    def __init__(self, sender: "SendMessage") -> None:
+        """Initialize the LogShipper and start its thread.
+
+        Args:
+            sender (SendMessage): The instance that owns the socket connection.
+
+        """
+        self.sender = sender
+        self.queue: deque[dict] = deque(maxlen=MAX_QUEUE)
+        self.unlogged: list[dict] = []
+        self.wakeup = Event()
+        self.lock = Lock()
+        self.send_lock = Lock()
+        self.owner_pid = os.getpid()
+        self.stats = {"queued": 0, "sent": 0, "batches": 0, "dropped": 0}
+        self.reported_drops = 0
+
+        self.thread = Thread(target=self.run, name="log-shipper", daemon=True)
+        self.thread.start()
+
+    def put(self, data: dict) -> None:
+        """Queue a message without blocking.
+
+        Args:
+            data (dict): The message payload.
+
+        """
+        with self.lock:
+            if len(self.queue) == MAX_QUEUE:
+                self.stats["dropped"] += 1
+
+            self.queue.append(data)
+            self.unlogged.append(data)
+            self.stats["queued"] += 1
+            full = len(self.queue) >= BATCH_SIZE
+
+        if full:
+            self.wakeup.set()
+
+    def run(self) -> None:
+        """Flush the queue periodically until the process exits."""
+        while True:
+            self.wakeup.wait(FLUSH_INTERVAL)
+            self.wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.error(traceback.format_exc())
+
+    def flush(self) -> None:
+        """Write the new messages to the LogFile and send every queued message, in batches of ``BATCH_SIZE``.
+
+        Stops at the first batch the server does not receive, which is queued again.
+        """
+        with self.send_lock:
+            with self.lock:
+                unlogged, self.unlogged = self.unlogged, []
+
+            if unlogged:
+                self.write_log_file(unlogged)
+
+            while True:
+                with self.lock:
+                    batch: list[dict] = []
+                    while self.queue and len(batch) < BATCH_SIZE:
+                        batch.append(self.queue.popleft())
+
+                    dropped = self.stats["dropped"] - self.reported_drops
+
+                if not batch:
+                    return
+
+                payload = {"pid": batch[-1]["pid"], "messages": batch, "dropped": dropped}
+                if not self.sender.socket_message(payload):
+                    self.requeue(batch)
+                    return
+
+                with self.lock:
+                    self.reported_drops += dropped
+                    self.stats["sent"] += len(batch)
+                    self.stats["batches"] += 1
+
+    def requeue(self, batch: list[dict]) -> None:
+        """Put a batch that was not sent back at the front of the queue.
+
+        Messages queued meanwhile keep their place; if the queue cannot hold the
+        whole batch, its newest messages are dropped and counted.
+
+        Args:
+            batch (list[dict]): The messages, oldest first.
+
+        """
+        with self.lock:
+            keep = batch[: MAX_QUEUE - len(self.queue)]
+            self.queue.extendleft(reversed(keep))
+            self.stats["dropped"] += len(batch) - len(keep)
+
+    def write_log_file(self, batch: list[dict]) -> None:
+        """Append the batch prompts to the execution LogFile.
+
+        Args:
+            batch (list[dict]): The messages, oldest first.
+
+        """
+        if not self.sender.output_dir_path:
+            return
+
+        savelog = Path(self.sender.output_dir_path).resolve().joinpath(f"LogFile - PID {batch[-1]['pid']}.txt")
+        with savelog.open("a") as f:
+            f.writelines(f"{data['message']}\n" for data in batch)
 
 
 class SendMessage(CrawJUD):
@@ -21,6 +165,7 @@ class SendMessage(CrawJUD):
 
     Functions:
         setup_message: Set up the message to be sent by the bot.
+        flush_logs: Send the messages still waiting in the log shipper.
         socket_message: Emit log message to the socket with termination checks.
         badnamespace: Handle bad namespace error when emitting an event.
         connectionerror: Handle connection error when emitting an event.
@@ -28,11 +173,29 @@ class SendMessage(CrawJUD):
 
     """
 
+    shipper_: LogShipper = None
+
     def __init__(self) -> None:
         """Initialize the SendMessage class."""
 
+    @property
+    def shipper(self) -> LogShipper:
+        """The log shipper of this process, started on first use."""
+        if SendMessage.shipper_ is None or SendMessage.shipper_.owner_pid != os.getpid():
+            SendMessage.shipper_ = LogShipper(self)
+
+        return SendMessage.shipper_
+
+    def flush_logs(self) -> None:
+        """Send the messages still waiting in the log shipper."""
+        self.shipper.flush()
+
     def setup_message(self, status_bot: str = "Em Execução") -> None:
-        """Set up the message to be sent by the bot."""
+        """Set up the message to be sent by the bot.
+
+        Regular messages are queued for the log shipper. Status changes flush
+        the queue first and are sent right away, so they keep their order.
+        """
         data = {
             "message": self.prompt,
             "pid": self.pid,
@@ -44,12 +207,16 @@ class SendMessage(CrawJUD):
             "schedule": self.schedule,
         }
 
-        if status_bot != "Em Execução":
-            self.socket_message(data, "stop_bot")
+        if status_bot == "Em Execução":
+            self.shipper.put(data)
+            return
 
+        self.flush_logs()
+        self.shipper.write_log_file([data])
+        self.socket_message(data, "stop_bot")
         self.socket_message(data)
 
-    def socket_message(self: Self, data: dict, event: str = "log_message") -> None:
+    def socket_message(self: Self, data: dict, event: str = "log_message") -> bool:
         """Emit log message to the socket with termination checks.
 
         Updates data with system info if termination patterns are detected and
@@ -59,6 +226,9 @@ class SendMessage(CrawJUD):
             data (dict): Dictionary containing log details.
             event (str, optional): The event to emit. Defaults to "log_message".
 
+        Returns:
+            bool: True if the message was emitted.
+
         """
         url = getenv("URL_WEB")
         err = None
@@ -79,9 +249,11 @@ class SendMessage(CrawJUD):
             err = str(e)
 
         if err:
-            self.logger.error(err)
+            (self.logger or logger).error(err)
 
-    def badnamespace(self, e: Exception, url: str, event: str, data: dict) -> str:
+        return not err
+
+    def badnamespace(self, e: Exception, url: str, event: str, data: dict) -> str | None:
         """Handle bad namespace error when emitting an event."""
         self.connected = False
         err = str(e)
@@ -89,17 +261,20 @@ class SendMessage(CrawJUD):
             self.connected = False
             self.connect_socket(url)
             self.sio.emit(event, data, namespace="/log")
+            err = None
         except Exception as e:
-            if "Client is not in a disconnected state" in str(e):
-                self.sio.disconnect()
-                self.connected = False
-                self.connect_socket(url)
-                self.sio.emit(event, data, namespace="/log")
             err = str(e)
+            if "Client is not in a disconnected state" in str(e):
+                with suppress(Exception):
+                    self.sio.disconnect()
+                    self.connected = False
+                    self.connect_socket(url)
+                    self.sio.emit(event, data, namespace="/log")
+                    err = None
 
         return err
 
-    def connectionerror(self, e: Exception, url: str, event: str, data: dict) -> str:
+    def connectionerror(self, e: Exception, url: str, event: str, data: dict) -> str | None:
         """Handle connection error when emitting an event."""
         err = str(e)
         try:
@@ -107,9 +282,11 @@ class SendMessage(CrawJUD):
                 self.connected = False
                 self.connect_socket(url)
                 self.sio.emit(event, data, namespace="/log")
+                err = None
             elif "Already connected" in str(e):
                 self.sio.emit(event, data, namespace="/log")
                 self.connected = True
+                err = None
         except Exception as e:
             err = str(e)
 
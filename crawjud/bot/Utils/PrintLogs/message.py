@@ -6,7 +6,6 @@ Additional utilities are available to emit, print, and store log messages.
 
 import traceback
 from datetime import datetime
-from pathlib import Path
 from threading import Thread  # noqa: F401
 from time import sleep
 from typing import Self
@@ -20,7 +19,6 @@ from dotenv import load_dotenv
 from crawjud.bot.core import CrawJUD
 
 codificacao = "UTF-8"
-mensagens = []
 load_dotenv()
 
 
@@ -40,7 +38,7 @@ class PrintBot(CrawJUD):
         """Print current log message and emit it via the socket.
 
         Uses internal message attributes, logs the formatted string,
-        and appends the output to the messages list.
+        and queues it for the log shipper.
         """
         log = self.message
         if self.message_error:
@@ -55,32 +53,25 @@ class PrintBot(CrawJUD):
             log=log,
         )
         self.logger.info(self.prompt)
-        self.list_messages = mensagens
+        self.sendmsg.setup_message(status_bot=status_bot)
         if "fim da execução" in self.message.lower():
-            sleep(1)
             self.file_log(self)
 
-        self.sendmsg.setup_message(status_bot=status_bot)
-        mensagens.append(self.prompt)
         tqdm.tqdm.write(self.prompt)  # noqa: T201
 
     @classmethod
     def file_log(cls, self: Self) -> None:
-        """Write log messages to a file based on the list_messages attribute.
+        """Flush the queued log messages, which also writes them to the LogFile.
 
-        Opens (or creates) a log file specific to the process id and writes
-        each relevant message.
+        The LogFile (one per process id) is appended batch by batch by the log
+        shipper, so the messages are not kept in memory until the end.
 
         Args:
             self (Self): The current PrintBot instance.
 
         """
         try:
-            savelog = Path(self.output_dir_path).resolve().joinpath(f"LogFile - PID {self.pid}.txt")
-            with savelog.open("a") as f:
-                for mensagem in self.list_messages:
-                    if self.pid in mensagem:
-                        f.write(f"{mensagem}\n")
+            self.sendmsg.flush_logs()
 
         except Exception:
             # Aguarda 2 segundos
@@ -18,7 +18,7 @@ from contextlib import suppress
 from datetime import datetime
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Generic, TypeVar, Union
+from typing import Union
 
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
@@ -28,31 +28,61 @@ from werkzeug.utils import secure_filename
 from crawjud.bot.common import ExecutionError
 from crawjud.bot.core import CrawJUD, pd
 from crawjud.bot.Utils.auth import AuthBot
+from crawjud.bot.Utils.checkpoint import Checkpoint
+from crawjud.bot.Utils.downloads import DownloadManager
 from crawjud.bot.Utils.Driver import DriverBot
 from crawjud.bot.Utils.elements import ELAW_AME, ESAJ_AM, PJE_AM, PROJUDI_AM, ElementsBot
+from crawjud.bot.Utils.fetcher import DocumentFetcher
 from crawjud.bot.Utils.interator import Interact
+from crawjud.bot.Utils.lookup_cache import EntityCache
 from crawjud.bot.Utils.MakeTemplate import MakeXlsx
+from crawjud.bot.Utils.pdf_extract import PdfExtractor
 from crawjud.bot.Utils.PrintLogs import PrintBot, SendMessage
+from crawjud.bot.Utils.profiling import PhaseTimer, timed
+from crawjud.bot.Utils.result_sink import ResultSink
 from crawjud.bot.Utils.search import SearchBot
+from crawjud.bot.Utils.session_store import SessionStore
+from crawjud.bot.Utils.snapshot import TableSnapshot
+from crawjud.bot.Utils.waits import WaitEngine
 from crawjud.types import Numbers
 
-T = TypeVar("AnyValue", bound=str)
-
 __all__ = [
     "ELAW_AME",
     "ESAJ_AM",
     "PJE_AM",
     "PROJUDI_AM",
     "AuthBot",
+    "Checkpoint",
+    "DocumentFetcher",
+    "DownloadManager",
     "DriverBot",
     "ElementsBot",
+    "EntityCache",
     "Interact",
     "MakeXlsx",
+    "PdfExtractor",
+    "PhaseTimer",
     "PrintBot",
+    "ResultSink",
     "SearchBot",
     "SendMessage",
+    "SessionStore",
+    "TableSnapshot",
+    "WaitEngine",
 ]
 
+# Object columns whose values pandas infers as one of these kinds cannot hold a date
+DATELESS_KINDS = frozenset({
+    "empty",
+    "string",
+    "bytes",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+    "decimal",
+    "boolean",
+})
+
 TypeData = Union[list[dict[str, Union[str, Numbers, datetime]]], dict[str, Union[str, Numbers, datetime]]]
 
 logger = logging.getLogger(__name__)
@@ -73,7 +103,7 @@ class OtherUtils(CrawJUD):
 
     @property
     def nomes_colunas(self) -> list[str]:
-        """Return a list of column names used in legal process spreadsheets.
+        """The column names used in legal process spreadsheets.
 
         Returns:
             list[str]: A list containing all the required column labels.
@@ -195,7 +225,7 @@ class OtherUtils(CrawJUD):
 
     @property
     def elaw_data(self) -> dict[str, str]:
-        """Return a dict with keys for legal case details and empty string values.
+        """A dict with keys for legal case details and empty string values.
 
         Returns:
             dict[str, str]: Keys mapped to empty strings for default legal data.
@@ -233,7 +263,7 @@ class OtherUtils(CrawJUD):
 
     @property
     def cities_Amazonas(self) -> dict[str, str]:  # noqa: N802
-        """Return a dictionary categorizing Amazonas cities as 'Capital' or 'Interior'.
+        """A dictionary categorizing Amazonas cities as 'Capital' or 'Interior'.
 
         Returns:
             dict[str, str]: City names with associated regional classification.
@@ -307,8 +337,8 @@ class OtherUtils(CrawJUD):
     def dataFrame(self) -> list[dict[str, str]]:  # noqa: N802
         """Convert an Excel file to a list of dictionaries with formatted data.
 
-        Reads an Excel file, processes the data by formatting dates and floats,
-        and returns the data as a list of dictionaries.
+        Reads an Excel file, formats dates and floats one column at a time (see
+        ``format_column``) and returns the data as a list of dictionaries.
 
         Returns:
             list[dict[str, str]]: A record list from the processed Excel file.
@@ -323,27 +353,43 @@ class OtherUtils(CrawJUD):
         df = pd.read_excel(input_file)
         df.columns = df.columns.str.upper()
 
-        def format_data(x: Generic[T]) -> str:
-            if str(x) == "NaT" or str(x) == "nan":
-                return ""
+        for col in df.columns:
+            df[col] = self.format_column(df[col])
 
-            if isinstance(x, (datetime, Timestamp)):
-                return x.strftime("%d/%m/%Y")
+        return df.to_dict(orient="records")
 
-            return x
+    def format_column(self, column: pd.Series) -> pd.Series:
+        """Format a spreadsheet column the way the bots expect its values.
 
-        def format_float(x: Generic[T]) -> str:
-            return f"{x:.2f}".replace(".", ",")
+        Dates become ``dd/mm/YYYY`` strings, float columns without blanks become
+        ``0,00`` strings and blank cells become ``""``. Typed columns are converted
+        with vectorized pandas operations; object columns are only visited value by
+        value when pandas cannot rule out that they hold a date.
 
-        for col in df.columns:
-            df[col] = df[col].apply(format_data)
+        Args:
+            column (pd.Series): The column read from the spreadsheet.
+
+        Returns:
+            pd.Series: The formatted column.
 
-        for col in df.select_dtypes(include=["float"]).columns:
-            df[col] = df[col].apply(format_float)
+        """
+        if pd.api.types.is_datetime64_any_dtype(column):
+            return column.dt.strftime("%d/%m/%Y").fillna("")
+
+        if pd.api.types.is_float_dtype(column):
+            if column.isna().any():
+                return column.astype(object).where(column.notna(), "")
+
+            return column.map("{:.2f}".format).str.replace(".", ",", regex=False)
+
+        if not pd.api.types.is_object_dtype(column):
+            return column
 
-        to_list = [dict(list(item.items())) for item in df.to_dict(orient="records")]
+        column = column.where(column.notna(), "")
+        if pd.api.types.infer_dtype(column, skipna=True) not in DATELESS_KINDS:
+            column = column.map(lambda x: x.strftime("%d/%m/%Y") if isinstance(x, (datetime, Timestamp)) else x)
 
-        return to_list
+        return column
 
     def elawFormats(self, data: dict[str, str]) -> dict[str, str]:  # noqa: N802
         """Format a legal case dictionary according to pre-defined rules.
@@ -414,6 +460,7 @@ class OtherUtils(CrawJUD):
         else:
             raise ExecutionError(message="Nenhuma Movimentação encontrada")
 
+    @timed("planilha")
     def append_success(
         self,
         data: TypeData,
@@ -437,15 +484,8 @@ class OtherUtils(CrawJUD):
             if fileN or not output_success:
                 output_success = Path(self.path).parent.resolve().joinpath(fileN)
 
-            if not output_success.exists():
-                df = pd.DataFrame(data)
-            else:
-                df_existing = pd.read_excel(output_success)
-                df = df_existing.to_dict(orient="records")
-                df.extend(data)
-
-            new_data = pd.DataFrame(df)
-            new_data.to_excel(output_success, index=False)
+            self.result_sink.append(output_success, data)
+            self.checkpoint.mark()
 
         typed = type(data) is list and all(isinstance(item, dict) for item in data)
 
@@ -469,6 +509,7 @@ class OtherUtils(CrawJUD):
             self.message = message
             self.prt()
 
+    @timed("planilha")
     def append_error(self, data: dict[str, str] = None) -> None:
         """Append error information to the error spreadsheet file.
 
@@ -476,15 +517,11 @@ class OtherUtils(CrawJUD):
             data (dict[str, str], optional): The error record to log.
 
         """
-        if not os.path.exists(self.path_erro):
-            df = pd.DataFrame([data])
-        else:
-            df_existing = pd.read_excel(self.path_erro)
-            df = df_existing.to_dict(orient="records")
-            df.extend([data])
+        self.result_sink.append(self.path_erro, [data])
 
-        new_data = pd.DataFrame(df)
-        new_data.to_excel(self.path_erro, index=False)
+        # A row cut off by a stop request must run again when the execution is resumed
+        if not self.isStoped:
+            self.checkpoint.mark(failed=True)
 
         with suppress(Exception):
             numero_processo = self.bot_data["NUMERO_PROCESSO"]
@@ -501,15 +538,7 @@ class OtherUtils(CrawJUD):
         """
         nomeplanilha = f"CAMPOS VALIDADOS PID {self.pid}.xlsx"
         planilha_validar = Path(self.path).parent.resolve().joinpath(nomeplanilha)
-        if not os.path.exists(planilha_validar):
-            df = pd.DataFrame(data)
-        else:
-            df_existing = pd.read_excel(planilha_validar)
-            df = df_existing.to_dict(orient="records")
-            df.extend(data)
-
-        new_data = pd.DataFrame(df)
-        new_data.to_excel(planilha_validar, index=False)
+        self.result_sink.append(planilha_validar, data)
 
     def count_doc(self, doc: str) -> Union[str, None]:
         """Determine whether a document number is CPF or CNPJ based on character length.
@@ -593,18 +622,57 @@ class OtherUtils(CrawJUD):
     def finalize_execution(self) -> None:
         """Finalize bot execution by closing browsers and logging total time.
 
-        Performs cookie cleanup, quits the driver, and prints summary logs.
+        Performs cookie cleanup, quits the driver, waits for parallel workers,
+        builds the result spreadsheets from their journals, and prints summary logs.
+        Worker processes only close their own browser, and a session leased from
+        the driver pool is left open (and logged in) for the next execution.
         """
         window_handles = self.driver.window_handles
         self.row += 1
-        if window_handles:
+        if window_handles and not self.pooled_session:
             self.driver.delete_all_cookies()
             self.driver.quit()
 
+        self.download_manager.stop()
+        self.pdf_extractor.shutdown()
+
+        # Each worker logs in with its own browser, so each one reports its sessions
+        session_report = self.session_store.report()
+        if session_report:
+            self.type_log = "log"
+            self.message = session_report
+            self.prt()
+
+        if self.worker_id:
+            self.sendmsg.flush_logs()
+            return
+
+        self.join_workers()
+        self.result_sink.finalize()
+
         end_time = time.perf_counter()
         execution_time = end_time - self.start_time
         minutes, seconds = divmod(int(execution_time), 60)
 
+        self.type_log = "log"
+        self.message = self.wait_engine.report(execution_time)
+        self.prt()
+
+        phase_report = self.phase_timer.report()
+        if phase_report:
+            self.message = phase_report
+            self.prt()
+
+        cache_report = self.entity_cache.report()
+        if cache_report:
+            self.message = cache_report
+            self.prt()
+
+        memory_report = self.memory_report()
+        if memory_report:
+            self.message = memory_report
+            self.prt()
+
         self.prt(status="Finalizado")
 
         flag_path = Path(self.output_dir_path).joinpath(f"{self.pid}.flag")
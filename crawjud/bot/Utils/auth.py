@@ -22,6 +22,7 @@ from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
 from crawjud.bot.core import CrawJUD
+from crawjud.bot.Utils.profiling import timed
 
 if platform.system() == "Windows":
     from crawjud.bot.core import Application
@@ -42,9 +43,14 @@ class AuthBot(CrawJUD):
         """
         # Initialize any additional attributes here
 
+    @timed("login")
     def auth(self) -> bool:
         """Dynamically execute the proper authentication method based on the system.
 
+        A session saved by a previous execution is restored first; the interactive
+        login only runs when there is none or it has expired, and its session is
+        saved for the next executions.
+
         Returns:
             bool: The result from the invoked authentication method.
 
@@ -53,10 +59,20 @@ class AuthBot(CrawJUD):
 
         """
         to_call: Callable[[], bool] = getattr(AuthBot, f"{self.system.lower()}_auth", None)
-        if to_call:
-            return to_call(self)
+        if not to_call:
+            raise RuntimeError("Sistema Não encontrado!")
+
+        if self.session_store.restore():
+            self.message = "Sessão anterior restaurada, login dispensado"
+            self.type_log = "log"
+            self.prt()
+            return True
+
+        logged = to_call(self)
+        if logged is True:
+            self.session_store.save()
 
-        raise RuntimeError("Sistema Não encontrado!")
+        return logged
 
     def esaj_auth(self) -> bool:
         """Authenticate on ESAJ system using certificate or credentials.
@@ -0,0 +1,155 @@
+"""Checkpoint module: Record finished rows so an interrupted execution can resume.
+
+This module provides the Checkpoint class. Every row that lands in the success or
+error spreadsheet is recorded in a Redis set of its execution (one for successes,
+one for failures), keyed by its position in the input spreadsheet plus its process
+number. When the same PID is launched again in resume mode (``"resume": true`` in
+its arguments file, set by the executions page), the successful rows are skipped
+and the output spreadsheets are kept, so a crash near the end of a long execution
+only costs the rows that had not finished. Failed rows are tried again unless the
+arguments set ``"retry_errors": false``. A row cut off by a stop request is not
+recorded at all.
+
+The sets live in the database of ``redis_conn.redis_url()`` (``REDIS_DB_LOGS``). They
+were kept in database 0 of ``REDIS_URL`` before; ``migrate_checkpoints`` copies the
+sets left there, so executions interrupted before the upgrade can still resume.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import redis
+
+from crawjud.bot.common.redis_conn import redis_client
+from crawjud.bot.core import CrawJUD
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TTL = 60 * 60 * 24 * 7
+
+
+def checkpoint_key(pid: str, failed: bool = False) -> str:
+    """Return the Redis set holding the finished rows of an execution.
+
+    Args:
+        pid (str): The execution PID.
+        failed (bool, optional): Return the set of the rows that failed instead.
+
+    Returns:
+        str: The set key.
+
+    """
+    return f"crawjud:checkpoint:{pid}:erros" if failed else f"crawjud:checkpoint:{pid}"
+
+
+def migrate_checkpoints(source: redis.Redis) -> int:
+    """Copy the checkpoint sets of another Redis database into the shared one.
+
+    Run once after upgrading, with a client of the database the checkpoints used
+    before (database 0 of ``REDIS_URL``)::
+
+        migrate_checkpoints(redis.Redis.from_url(os.environ["REDIS_URL"], decode_responses=True))
+
+    Args:
+        source (redis.Redis): A client of the old database.
+
+    Returns:
+        int: The number of sets copied.
+
+    """
+    target = redis_client(decode_responses=True)
+    copied = 0
+    for key in source.scan_iter(match="crawjud:checkpoint:*", count=500):
+        rows = source.smembers(key)
+        if not rows:
+            continue
+
+        ttl = source.ttl(key)
+        pipe = target.pipeline()
+        pipe.sadd(key, *rows)
+        pipe.expire(key, ttl if ttl > 0 else CHECKPOINT_TTL)
+        pipe.execute()
+        copied += 1
+
+    return copied
+
+
+class Checkpoint(CrawJUD):
+    """Record finished rows and skip them when an execution is resumed."""
+
+    def __init__(self) -> None:
+        """Initialize the Checkpoint instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    def row_key(self, row: int, data: dict[str, str]) -> str | None:
+        """Return the key identifying a spreadsheet row.
+
+        The position is used instead of a hash of the values because some bots
+        reformat ``bot_data`` in place (see ``elawFormats``) before writing results.
+
+        Args:
+            row (int): The row number (position + 1, as in ``self.row``).
+            data (dict[str, str]): The row data.
+
+        Returns:
+            str | None: ``row:NUMERO_PROCESSO``, or None if there is no row data.
+
+        """
+        if not isinstance(data, dict) or not data or not row:
+            return None
+
+        return f"{row}:{data.get('NUMERO_PROCESSO', '')}"
+
+    def mark(self, failed: bool = False) -> None:
+        """Record the current row as finished.
+
+        Args:
+            failed (bool, optional): The row went to the error spreadsheet.
+
+        """
+        key = self.row_key(self.row, self.bot_data)
+        if key is None or not self.pid:
+            return
+
+        try:
+            pipe = redis_client(decode_responses=True).pipeline()
+            pipe.sadd(checkpoint_key(self.pid, failed), key)
+            pipe.expire(checkpoint_key(self.pid, failed), CHECKPOINT_TTL)
+            pipe.execute()
+
+        except redis.RedisError as e:
+            logger.warning("Falha ao registrar checkpoint do PID %s: %s", self.pid, str(e))
+
+    def pending(self, rows: list[tuple[int, dict[str, str]]]) -> list[tuple[int, dict[str, str]]]:
+        """Drop the rows finished by a previous run of the execution.
+
+        Rows that failed are kept, unless the arguments set ``"retry_errors": false``.
+
+        Args:
+            rows (list[tuple[int, dict[str, str]]]): The (position, row) pairs of the spreadsheet.
+
+        Returns:
+            list[tuple[int, dict[str, str]]]: The rows still to be processed.
+
+        """
+        retry_errors = str(self.retry_errors).lower() not in ("false", "0")
+        try:
+            client = redis_client(decode_responses=True)
+            finished = client.smembers(checkpoint_key(self.pid))
+            if not retry_errors:
+                finished |= client.smembers(checkpoint_key(self.pid, failed=True))
+
+        except redis.RedisError as e:
+            logger.warning("Checkpoints indisponíveis para o PID %s: %s", self.pid, str(e))
+            return rows
+
+        pending = [(pos, row) for pos, row in rows if self.row_key(pos + 1, row) not in finished]
+
+        self.message = f"Retomando execução: {len(rows) - len(pending)} linhas já processadas serão ignoradas"
+        self.type_log = "log"
+        self.prt()
+
+        return pending
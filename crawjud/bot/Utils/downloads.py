@@ -0,0 +1,248 @@
+"""Downloads module: Resolve browser downloads from file system events.
+
+This module provides the DownloadManager class. A watchdog observer watches the
+output directory of the execution, where Chrome saves downloads, and records every
+file the browser finishes writing: Chrome writes ``<name>.crdownload`` and renames it
+once the download is complete, so the rename (or the creation of a file that is not
+partial) marks the completion. Bots register the download they are about to trigger
+with ``expect`` and get a future that resolves to the final path, so several downloads
+can be in flight at once and the output tree is never scanned.
+
+Only the directory itself is watched: the files the bots move into subdirectories
+(or the Chrome profile kept there) are not downloads. Files already present when a
+download is expected are ignored, so a late event of an earlier file cannot resolve it.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from os import getenv
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
+
+from crawjud.bot.common.exceptions import ExecutionError
+from crawjud.bot.core import CrawJUD
+from crawjud.bot.Utils.profiling import timed
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_TIMEOUT = float(getenv("DOWNLOAD_TIMEOUT", "120"))
+PARTIAL_SUFFIXES = frozenset({".crdownload", ".part", ".tmp"})
+
+type Matcher = Callable[[str], bool]
+type Waiter = tuple[Matcher, Future[Path], frozenset[str]]
+
+
+def is_complete(path: Path) -> bool:
+    """Return whether a file is a finished download.
+
+    Args:
+        path (Path): The file.
+
+    Returns:
+        bool: False for partial files, files still being written and empty files.
+
+    """
+    if path.suffix.lower() in PARTIAL_SUFFIXES:
+        return False
+
+    try:
+        return path.stat().st_size > 0 and not path.with_name(f"{path.name}.crdownload").exists()
+
+    except OSError:
+        return False
+
+
+class DownloadHandler(FileSystemEventHandler):
+    """Forward finished files to the DownloadManager."""
+
+    def dispatch_file(self, path: str | bytes) -> None:
+        """Resolve the download waiting for a file, if any.
+
+        Args:
+            path (str | bytes): The file path reported by watchdog.
+
+        """
+        path = Path(os.fsdecode(path))
+        if is_complete(path):
+            DownloadManager.resolve(path)
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle a file written straight to its final name."""
+        if not event.is_directory:
+            self.dispatch_file(event.src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle a partial file renamed once the download finished."""
+        if not event.is_directory:
+            self.dispatch_file(event.dest_path)
+
+    def on_closed(self, event: FileSystemEvent) -> None:
+        """Handle a file closed after being written (inotify only)."""
+        if not event.is_directory:
+            self.dispatch_file(event.src_path)
+
+
+class DownloadManager(CrawJUD):
+    """Hand out a future per browser download, resolved when the file is complete.
+
+    Attributes:
+        waiters_ (list[Waiter]): Downloads not finished yet, with the files present when each was expected.
+        observer_ (BaseObserver): Observer watching the output directory.
+        watched_ (str): The directory being watched.
+        owner_pid_ (int): Process the observer belongs to (a forked worker starts its own).
+        lock_ (Lock): Guards ``waiters_`` against the observer thread.
+
+    """
+
+    waiters_: list[Waiter] = []
+    observer_: BaseObserver = None
+    watched_: str = None
+    owner_pid_: int = None
+    lock_ = Lock()
+
+    def __init__(self) -> None:
+        """Initialize the DownloadManager instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    def start(self) -> None:
+        """Watch the output directory of the execution, once per process."""
+        directory = str(Path(self.output_dir_path).resolve())
+        if DownloadManager.owner_pid_ == os.getpid() and DownloadManager.watched_ == directory:
+            return
+
+        if DownloadManager.owner_pid_ == os.getpid():
+            self.stop()
+
+        DownloadManager.owner_pid_ = os.getpid()
+        DownloadManager.waiters_ = []
+        DownloadManager.lock_ = Lock()
+
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        observer = Observer()
+        observer.schedule(DownloadHandler(), directory, recursive=False)
+        observer.daemon = True
+        observer.start()
+
+        DownloadManager.observer_ = observer
+        DownloadManager.watched_ = directory
+
+    def stop(self) -> None:
+        """Stop watching the output directory."""
+        observer = DownloadManager.observer_
+        if observer is None or DownloadManager.owner_pid_ != os.getpid():
+            return
+
+        observer.stop()
+        observer.join(timeout=5)
+        DownloadManager.observer_ = None
+        DownloadManager.watched_ = None
+
+    def expect(self, match: str | Matcher) -> Future[Path]:
+        """Register a download before triggering it.
+
+        Args:
+            match (str | Matcher): The expected file name, or a predicate on the file name.
+
+        Returns:
+            Future[Path]: Resolves to the final path once the file is complete.
+
+        """
+        self.start()
+        if isinstance(match, str):
+            match = match.__eq__
+
+        existing = frozenset(os.listdir(DownloadManager.watched_))
+        download: Future[Path] = Future()
+        with DownloadManager.lock_:
+            DownloadManager.waiters_.append((match, download, existing))
+
+        return download
+
+    @classmethod
+    def resolve(cls, path: Path) -> None:
+        """Resolve the oldest download waiting for a finished file.
+
+        Files outside the watched directory (moved into a subdirectory) are ignored.
+
+        Args:
+            path (Path): The finished file.
+
+        """
+        if str(path.parent) != cls.watched_:
+            return
+
+        with cls.lock_:
+            for pos, (match, download, existing) in enumerate(cls.waiters_):
+                if path.name in existing:
+                    continue
+
+                try:
+                    matched = match(path.name)
+
+                except Exception as e:
+                    logger.warning("Falha ao comparar o download %s: %s", path.name, str(e))
+                    continue
+
+                if matched:
+                    del cls.waiters_[pos]
+                    download.set_result(path)
+                    return
+
+    def discard(self, download: Future[Path]) -> None:
+        """Stop waiting for a download.
+
+        Args:
+            download (Future[Path]): The download returned by ``expect``.
+
+        """
+        with DownloadManager.lock_:
+            DownloadManager.waiters_ = [item for item in DownloadManager.waiters_ if item[1] is not download]
+
+        download.cancel()
+
+    @timed("download")
+    def wait(self, download: Future[Path], timeout: float = None) -> Path | None:
+        """Wait for a download to finish.
+
+        Args:
+            download (Future[Path]): The download returned by ``expect``.
+            timeout (float, optional): The longest wait. Defaults to ``DOWNLOAD_TIMEOUT``.
+
+        Returns:
+            Path | None: The final path, or None if the timeout was reached.
+
+        Raises:
+            ExecutionError: If a stop was requested for the execution.
+
+        """
+        timeout = DOWNLOAD_TIMEOUT if timeout is None else timeout
+        started = time.perf_counter()
+        try:
+            while True:
+                try:
+                    return download.result(timeout=min(1.0, max(timeout - (time.perf_counter() - started), 0)))
+
+                except FutureTimeoutError:
+                    if self.stop_signal.is_set():
+                        self.discard(download)
+                        raise ExecutionError(message="Execução interrompida pelo usuário") from None
+
+                    if time.perf_counter() - started >= timeout:
+                        self.discard(download)
+                        logger.warning("Download não concluído em %.0fs", timeout)
+                        return None
+
+        finally:
+            self.wait_engine.account(time.perf_counter() - started)
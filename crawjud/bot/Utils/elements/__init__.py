@@ -7,7 +7,7 @@ Classes:
 
 Methods:
     __init__: Initializes the ElementsBot instance.
-    Config: Configures the elements_bot attribute by dynamically importing a module based on the system and state_or_client attributes.
+    Config: Configures the elements_bot attribute with the frozen element set of the system and state_or_client attributes.
     bot_elements: Retrieves the elements bot instance.
 
 Attributes:
@@ -17,7 +17,6 @@ Attributes:
 
 from __future__ import annotations
 
-from importlib import import_module
 from typing import Self
 
 from crawjud.bot.core import CrawJUD
@@ -25,6 +24,7 @@ from crawjud.bot.Utils.elements.elaw import ELAW_AME
 from crawjud.bot.Utils.elements.esaj import ESAJ_AM
 from crawjud.bot.Utils.elements.pje import PJE_AM
 from crawjud.bot.Utils.elements.projudi import PROJUDI_AM
+from crawjud.bot.Utils.elements.registry import ElementRegistry
 
 
 class ElementsBot(CrawJUD):
@@ -34,8 +34,8 @@ class ElementsBot(CrawJUD):
     and state_or_client attributes.
 
     Attributes:
-        elements_bot (Optional[Union[ELAW_AME, ESAJ_AM, PJE_AM, PROJUDI_AM]):
-            The current elements bot instance.
+        elements_bot (Optional[ElementSet]): The frozen selectors of the current
+            system (see ElementRegistry).
 
     """
 
@@ -50,18 +50,15 @@ class ElementsBot(CrawJUD):
     def config(self) -> Self:
         """Configure the elements_bot attribute.
 
-        Dynamically import the module based on `system` and `state_or_client`,
-        and assign the corresponding class to elements_bot.
+        Take the element set of `system` and `state_or_client` from the
+        ElementRegistry, which loads every system once per process.
 
         Returns:
             Self: The configured ElementsBot instance.
 
         """
         if self.elements_bot is None:
-            self.elements_bot = getattr(
-                import_module(f".{self.system.lower()}", __package__),
-                f"{self.system.upper()}_{self.state_or_client.upper()}",
-            )
+            self.elements_bot = ElementRegistry.get(self.system, self.state_or_client)
         return self
 
     @property
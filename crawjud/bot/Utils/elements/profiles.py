@@ -0,0 +1,105 @@
+"""Browser profiles of each system.
+
+A profile tells DriverBot how heavy a browser the system needs. ``full`` is the
+historical setup (headed Chrome on the virtual display, bundled extensions, a
+profile directory per PID). ``lean`` runs ``--headless=new`` with a smaller
+footprint: images and web fonts are not downloaded where the system works
+without them, third-party trackers are blocked through CDP, caches are kept
+small, and the browser is restarted between rows once it grows past a memory
+cap.
+
+The mode of an execution comes from its ``browser_profile`` argument, then the
+``BROWSER_PROFILE`` environment variable, then the default of the system below.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from os import getenv
+
+THIRD_PARTY_URLS: tuple[str, ...] = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+)
+FONT_URLS: tuple[str, ...] = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot")
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserProfile:
+    """Browser settings of a system.
+
+    Attributes:
+        mode (str): ``full`` or ``lean``.
+        block_images (bool): Do not download images (lean only).
+        block_fonts (bool): Do not download web fonts (lean only).
+        extensions (bool): Load the bundled ``.crx`` extensions (certificate signers).
+        memory_cap_mb (int): Restart the browser between rows above this RSS (0 disables).
+
+    """
+
+    mode: str = "full"
+    block_images: bool = False
+    block_fonts: bool = False
+    extensions: bool = True
+    memory_cap_mb: int = 0
+
+    @property
+    def lean(self) -> bool:
+        """Whether the profile is lean."""
+        return self.mode == "lean"
+
+    def blocked_urls(self) -> list[str]:
+        """Return the URL patterns blocked through CDP.
+
+        Returns:
+            list[str]: The patterns (empty for full profiles).
+
+        """
+        if not self.lean:
+            return []
+
+        return [*THIRD_PARTY_URLS, *(FONT_URLS if self.block_fonts else ())]
+
+
+FULL = BrowserProfile()
+LEAN = BrowserProfile(mode="lean", memory_cap_mb=int(getenv("BROWSER_MEMORY_CAP_MB", "1200")))
+
+# Lean settings per system; systems that sign with a certificate keep the extensions.
+LEAN_PROFILES: dict[str, BrowserProfile] = {
+    "pje": replace(LEAN, block_images=True, block_fonts=True, extensions=False),
+    "elaw": replace(LEAN, block_images=True, block_fonts=True, extensions=False),
+    "esaj": replace(LEAN, block_fonts=True),
+    "projudi": replace(LEAN, block_fonts=True),
+    "caixa": replace(LEAN, extensions=False),
+    "calculadoras": replace(LEAN, extensions=False),
+}
+
+# Mode used when neither the execution nor the environment chooses one.
+DEFAULT_MODES: dict[str, str] = {
+    "pje": "lean",
+    "elaw": "lean",
+}
+
+
+def browser_profile(system: str, mode: str = None) -> BrowserProfile:
+    """Return the browser profile of a system.
+
+    Args:
+        system (str): The system name.
+        mode (str, optional): ``full`` or ``lean``; falls back to ``BROWSER_PROFILE`` and
+            then to the default of the system.
+
+    Returns:
+        BrowserProfile: The profile.
+
+    """
+    system = str(system or "").lower()
+    mode = str(mode or getenv("BROWSER_PROFILE") or DEFAULT_MODES.get(system, "full")).lower()
+    if mode != "lean":
+        return FULL
+
+    return LEAN_PROFILES.get(system, LEAN)
@@ -0,0 +1,271 @@
+"""Element registry: Load the selectors of every system once per process.
+
+``ElementsBot.config()`` used to import the module of the system and look the
+configuration class up by name for every bot. The registry loads all of them the
+first time it is used in a process and turns each configuration class into a
+frozen ``ElementSet``: an object with ``__slots__`` holding the selectors, so
+attribute access is a slot read and nothing can change a selector at runtime.
+
+The selectors are validated as they are loaded (unbalanced quotes or brackets
+are logged), and a ``(By, selector)`` locator is precomputed for each of them.
+XPaths that only match an ``id``/``name``/``class`` attribute, such as
+``//select[contains(@id, 'comboVara_input')]``, get the equivalent CSS
+selector (``select[id*="comboVara_input"]``), which the browser matches without
+evaluating an XPath. Set ``ELEMENTS_XPATH_REWRITE=0`` to keep the original
+XPaths.
+
+Locators are meant for lookups from the driver: an XPath starting with ``//``
+searches the whole document even from an element, while CSS only searches its
+descendants.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from importlib import import_module
+from os import getenv
+from typing import ClassVar
+
+from selenium.webdriver.common.by import By
+
+from crawjud.bot.Utils.elements.properties import Configuracao
+
+logger = logging.getLogger(__name__)
+
+SYSTEMS = ("caixa", "calculadoras", "elaw", "esaj", "pje", "projudi")
+
+XPATH_CONTAINS = re.compile(r"""^//(\*|[a-z]+)\[contains\(@(id|name|class),\s*(['"])([^'"]+)\3\)\]$""")
+XPATH_EQUALS = re.compile(r"""^//(\*|[a-z]+)\[@(id|name)\s*=\s*(['"])([^'"]+)\3\]$""")
+PLAIN_ID = re.compile(r"^[A-Za-z][\w-]*$")
+PAIRS = {"(": ")", "[": "]"}
+
+
+def to_css(xpath: str) -> str | None:
+    """Return the CSS selector equivalent to a single-attribute XPath.
+
+    Args:
+        xpath (str): The XPath.
+
+    Returns:
+        str | None: The CSS selector, or None if the XPath has no exact CSS equivalent.
+
+    """
+    contains = XPATH_CONTAINS.match(xpath)
+    if contains:
+        tag, attr, _, value = contains.groups()
+        return f'{tag}[{attr}*="{value}"]'
+
+    equals = XPATH_EQUALS.match(xpath)
+    if equals:
+        tag, attr, _, value = equals.groups()
+        if attr == "id" and PLAIN_ID.match(value):
+            return f"{'' if tag == '*' else tag}#{value}"
+
+        return f'{tag}[{attr}="{value}"]'
+
+    return None
+
+
+def balanced(selector: str) -> bool:
+    """Return whether the quotes, brackets and parentheses of a selector are balanced.
+
+    Args:
+        selector (str): The XPath or CSS selector.
+
+    Returns:
+        bool: True if the selector is well formed as far as nesting goes.
+
+    """
+    stack: list[str] = []
+    quote = None
+    for char in selector:
+        if quote:
+            quote = None if char == quote else quote
+
+        elif char in "'\"":
+            quote = char
+
+        elif char in PAIRS:
+            stack.append(PAIRS[char])
+
+        elif char in PAIRS.values() and (not stack or stack.pop() != char):
+            return False
+
+    return quote is None and not stack
+
+
+def locator_of(selector: str, rewrite: bool) -> tuple[str, str]:
+    """Return the locator of a selector.
+
+    Args:
+        selector (str): The XPath or CSS selector.
+        rewrite (bool): Whether XPaths with a CSS equivalent are rewritten.
+
+    Returns:
+        tuple[str, str]: The ``(By, selector)`` pair.
+
+    """
+    if not selector.startswith(("/", "(", "./")):
+        return (By.CSS_SELECTOR, selector)
+
+    css = to_css(selector) if rewrite else None
+    return (By.CSS_SELECTOR, css) if css else (By.XPATH, selector)
+
+
+class ElementSet:
+    """Frozen selectors of a system and state.
+
+    Subclasses are built by the ElementRegistry with one slot per selector.
+
+    Attributes:
+        locators_ (dict[str, tuple[str, str]]): The precomputed locator of each selector.
+
+    """
+
+    __slots__ = ("locators_",)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Refuse changes to the selectors.
+
+        Raises:
+            AttributeError: Always.
+
+        """
+        raise AttributeError(f"Elemento {name} é somente leitura")
+
+    def __delattr__(self, name: str) -> None:
+        """Refuse changes to the selectors.
+
+        Raises:
+            AttributeError: Always.
+
+        """
+        raise AttributeError(f"Elemento {name} é somente leitura")
+
+    def locator(self, name: str) -> tuple[str, str]:
+        """Return the locator of a selector, for ``find_element`` or the expected conditions.
+
+        Args:
+            name (str): The selector name.
+
+        Returns:
+            tuple[str, str]: The ``(By, selector)`` pair.
+
+        Raises:
+            AttributeError: If the selector does not exist.
+
+        """
+        try:
+            return self.locators_[name]
+
+        except KeyError:
+            raise AttributeError(f"Elemento {name} não encontrado") from None
+
+
+class ElementRegistry:
+    """Build and keep the ElementSet of every system and state, once per process.
+
+    Attributes:
+        sets_ (dict[tuple[str, str], ElementSet]): The element sets by (system, state).
+        owner_pid_ (int): Process the sets were loaded in.
+
+    """
+
+    sets_: ClassVar[dict[tuple[str, str], ElementSet]] = {}
+    owner_pid_: ClassVar[int] = None
+
+    @staticmethod
+    def selectors(config: type) -> dict[str, object]:
+        """Return the public class attributes of a configuration class.
+
+        Args:
+            config (type): The configuration class.
+
+        Returns:
+            dict[str, object]: The attributes, inherited ones included.
+
+        """
+        values: dict[str, object] = {}
+        for klass in reversed(config.__mro__):
+            if klass in (object, Configuracao):
+                continue
+
+            for name, value in vars(klass).items():
+                if not name.startswith("_") and not callable(value) and not isinstance(value, (property, classmethod)):
+                    values[name] = value
+
+        return values
+
+    @classmethod
+    def build(cls, config: type) -> ElementSet:
+        """Turn a configuration class into a frozen ElementSet.
+
+        Args:
+            config (type): The configuration class.
+
+        Returns:
+            ElementSet: The element set.
+
+        """
+        values = cls.selectors(config)
+        rewrite = getenv("ELEMENTS_XPATH_REWRITE", "1") != "0"
+
+        locators: dict[str, tuple[str, str]] = {}
+        for name, value in values.items():
+            if not isinstance(value, str) or not value or value.startswith("http"):
+                continue
+
+            if not balanced(value):
+                logger.warning("Seletor malformado %s.%s: %s", config.__name__, name, value)
+                continue
+
+            locators[name] = locator_of(value, rewrite)
+
+        element_set = type(config.__name__, (ElementSet,), {"__slots__": tuple(values)})
+        instance = object.__new__(element_set)
+        object.__setattr__(instance, "locators_", locators)
+        for name, value in values.items():
+            object.__setattr__(instance, name, value)
+
+        return instance
+
+    @classmethod
+    def load(cls) -> None:
+        """Load the selectors of every system, once per process."""
+        if cls.owner_pid_ == os.getpid():
+            return
+
+        cls.sets_ = {}
+        for system in SYSTEMS:
+            module = import_module(f".{system}", __package__)
+            prefix = f"{system.upper()}_"
+            for name, config in vars(module).items():
+                if isinstance(config, type) and name.startswith(prefix) and config.__module__ == module.__name__:
+                    cls.sets_[(system, name.removeprefix(prefix).lower())] = cls.build(config)
+
+        cls.owner_pid_ = os.getpid()
+
+    @classmethod
+    def get(cls, system: str, state_or_client: str) -> ElementSet:
+        """Return the element set of a system and state.
+
+        Args:
+            system (str): The system name.
+            state_or_client (str): The state or client.
+
+        Returns:
+            ElementSet: The element set.
+
+        Raises:
+            AttributeError: If the system has no selectors for the state.
+
+        """
+        cls.load()
+        key = (system.lower(), state_or_client.lower())
+        if key not in cls.sets_:
+            module = import_module(f".{key[0]}", __package__)
+            cls.sets_[key] = cls.build(getattr(module, f"{key[0].upper()}_{key[1].upper()}"))
+
+        return cls.sets_[key]
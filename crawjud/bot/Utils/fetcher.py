@@ -0,0 +1,132 @@
+"""Fetcher module: Download documents over HTTP with the browser's authenticated session.
+
+This module provides the DocumentFetcher class. Instead of downloading each document
+through the browser (or a blocking request per link), the links collected from the page
+are fetched concurrently by a pooled HTTP client that carries the WebDriver cookies, and
+streamed straight to disk.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+from crawjud.bot.core import CrawJUD
+from crawjud.bot.Utils.profiling import timed
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_CONCURRENCY = 4
+
+
+class DocumentFetcher(CrawJUD):
+    """Fetch documents concurrently reusing the authenticated WebDriver session.
+
+    Attributes:
+        client_ (httpx.Client): Pooled HTTP client of the current process.
+        executor_ (ThreadPoolExecutor): Bounded pool running the downloads.
+        owner_pid_ (int): Process that created the client (a forked worker builds its own).
+
+    """
+
+    client_: httpx.Client = None
+    executor_: ThreadPoolExecutor = None
+    owner_pid_: int = None
+
+    def __init__(self) -> None:
+        """Initialize the DocumentFetcher instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled HTTP client, created on first use in this process."""
+        if DocumentFetcher.client_ is None or DocumentFetcher.owner_pid_ != os.getpid():
+            DocumentFetcher.client_ = httpx.Client(
+                follow_redirects=True,
+                timeout=httpx.Timeout(60.0, connect=15.0),
+                limits=httpx.Limits(
+                    max_connections=DOWNLOAD_CONCURRENCY,
+                    max_keepalive_connections=DOWNLOAD_CONCURRENCY,
+                ),
+                verify=False,  # noqa: S501
+            )
+            DocumentFetcher.executor_ = ThreadPoolExecutor(max_workers=DOWNLOAD_CONCURRENCY)
+            DocumentFetcher.owner_pid_ = os.getpid()
+
+        return DocumentFetcher.client_
+
+    def sync_session(self) -> None:
+        """Copy the WebDriver cookies and user agent into the HTTP client."""
+        client = self.client
+        client.cookies.clear()
+        for cookie in self.driver.get_cookies():
+            client.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+        client.headers["User-Agent"] = self.driver.execute_script("return navigator.userAgent")
+
+    @timed("download")
+    def stream_to(self, url: str, path_file: Path) -> bool:
+        """Stream a document to disk, writing to a temporary file first.
+
+        Args:
+            url (str): The document URL.
+            path_file (Path): The destination file.
+
+        Returns:
+            bool: True if the document was downloaded.
+
+        """
+        part = path_file.with_name(f"{path_file.name}.part")
+        try:
+            with self.client.stream("GET", url) as response:
+                if response.status_code != 200:
+                    return False
+
+                with part.open("wb") as f:
+                    for chunk in response.iter_bytes(chunk_size=65536):
+                        f.write(chunk)
+
+            part.replace(path_file)
+            return True
+
+        except httpx.HTTPError:
+            logger.warning("Falha ao baixar %s: %s", url, traceback.format_exc())
+            part.unlink(missing_ok=True)
+            return False
+
+    def submit(self, downloads: list[tuple[str, Path]]) -> list[Future[bool]]:
+        """Start downloading every (url, path) pair with bounded concurrency.
+
+        Args:
+            downloads (list[tuple[str, Path]]): The document URLs and their destination files.
+
+        Returns:
+            list[Future[bool]]: One future per download, in the same order.
+
+        """
+        self.sync_session()
+        return [DocumentFetcher.executor_.submit(self.stream_to, url, Path(path)) for url, path in downloads]
+
+    def fetch_all(self, downloads: list[tuple[str, Path]]) -> list[bool]:
+        """Download every (url, path) pair concurrently and wait for them.
+
+        Args:
+            downloads (list[tuple[str, Path]]): The document URLs and their destination files.
+
+        Returns:
+            list[bool]: Whether each document was downloaded, in the same order.
+
+        """
+        return [future.result() for future in self.submit(downloads)]
@@ -7,8 +7,9 @@ web elements, including clicking, sending keys, and waiting for visual changes.
 import re
 from contextlib import suppress
 from time import sleep
+from typing import Literal
 
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
@@ -16,45 +17,94 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.wait import WebDriverWait
 
-from crawjud.bot.common.exceptions import NotFoundError  # noqa: F401
+from crawjud.bot.common.exceptions import ExecutionError, NotFoundError  # noqa: F401
 from crawjud.bot.core import CrawJUD
 
+type InputMode = Literal["fast", "js", "slow"]
+
+OPTION_SIMILARITY = 0.8
+SELENIUM_KEYS = frozenset(
+    value for name, value in vars(Keys).items() if not name.startswith("_") and isinstance(value, str)
+)
+
+# Set the value through the native setter, so frameworks tracking it see the change
+SET_VALUE_SCRIPT = """
+const element = arguments[0];
+const prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(prototype, "value").set.call(element, arguments[1]);
+element.dispatchEvent(new Event("input", { bubbles: true }));
+element.dispatchEvent(new Event("change", { bubbles: true }));
+"""
+
+# Read every option of a select in one call; skip them if the signature is unchanged
+SELECT_OPTIONS_SCRIPT = """
+const options = Array.from(arguments[0].options);
+let hash = options.length;
+for (const option of options) {
+    for (let i = 0; i < option.value.length; i++) {
+        hash = (hash * 31 + option.value.charCodeAt(i)) | 0;
+    }
+}
+const signature = String(hash);
+if (signature === arguments[1]) {
+    return [signature, null];
+}
+return [signature, options.map((option) => [option.textContent || "", option.value])];
+"""
+
 
 class Interact(CrawJUD):
     """Provide helper methods to interact with web elements via Selenium WebDriver.
 
     Each method ensures actions are performed with appropriate delays and error handling.
+
+    Attributes:
+        option_index_ (dict): Option indexes of the select elements, per session and select id.
+
     """
 
+    option_index_: dict[tuple[str, str], dict[str, str | dict[str, str]]] = {}
+
     def __init__(self) -> None:
         """Initialize Interact instance.
 
         Set up required attributes for element interactions.
         """
 
-    def send_key(self, element: WebElement, word: any) -> None:
-        """Send keys to a web element character by character if needed.
+    def send_key(self, element: WebElement, word: any, mode: InputMode = "fast") -> None:
+        """Type a text or a special key into a web element.
 
         Args:
             element (WebElement): The target web element.
             word (any): The text or key code to send.
+            mode (InputMode, optional): How the text is typed. ``"fast"`` sends it in a
+                single ``send_keys`` call (the browser still emits the key events of
+                each character); ``"js"`` sets the value by script and dispatches
+                ``input``/``change``, for long plain text; ``"slow"`` types one
+                character at a time, for masked fields that drop fast input.
+                Defaults to ``"fast"``.
 
         Sends the whole key if it matches a Selenium key.
 
         """
-        send = None
-        for key in dir(Keys):
-            if getattr(Keys, key) == word:
-                send = ""
-                element.send_keys(word)
-                break
+        if word in SELENIUM_KEYS:
+            element.send_keys(word)
+            return
+
+        text = str(word)
+        if mode == "js":
+            self.driver.execute_script(SET_VALUE_SCRIPT, element, text)
+            return
 
-        if send is None:
-            element.click()
+        element.click()
+        if mode == "slow":
             sleep(0.05)
-            for c in str(word):
+            for c in text:
                 sleep(0.001)
                 element.send_keys(c)
+            return
+
+        element.send_keys(text)
 
     def click(self, element: WebElement) -> None:
         """Perform a click action on a web element with brief pauses.
@@ -108,9 +158,21 @@ class Interact(CrawJUD):
 
         """
         element.click()
-        sleep(0.5)
         element.clear()
-        sleep(1)
+        self.wait_engine.idle()
+
+    def wait_or_stop(self, timeout: float) -> None:
+        """Sleep between polls of a wait, aborting it as soon as the execution is stopped.
+
+        Args:
+            timeout (float): The time to sleep, in seconds.
+
+        Raises:
+            ExecutionError: If a stop was requested for the execution.
+
+        """
+        if self.stop_signal.wait(timeout):
+            raise ExecutionError(message="Execução interrompida pelo usuário")
 
     def sleep_load(self, element: str = 'div[id="j_id_4p"]') -> None:
         """Wait until the loading indicator for a specific element is hidden.
@@ -120,13 +182,13 @@ class Interact(CrawJUD):
 
         """
         while True:
-            sleep(2)
-            load = None
+            self.wait_engine.idle()
+            # querySelector does not block on the implicit wait when the spinner is absent
+            load: WebElement = self.driver.execute_script(
+                "return document.querySelector(arguments[0]);",
+                f"{element} > div > i",
+            )
             aria_value = None
-            with suppress(TimeoutException):
-                load: WebElement = WebDriverWait(self.driver, 5).until(
-                    ec.presence_of_element_located((By.CSS_SELECTOR, f"{element} > div > i")),
-                )
 
             if load:
                 for attributes in ["aria-live", "aria-hidden", "class"]:
@@ -145,6 +207,8 @@ class Interact(CrawJUD):
             if not load:
                 break
 
+            self.wait_or_stop(self.wait_engine.tunables["poll"])
+
     def display_none(self, elemento: WebElement) -> None:
         """Wait for an element's display style to change to 'none'.
 
@@ -172,13 +236,15 @@ class Interact(CrawJUD):
             if check_wait:
                 break
 
+            self.wait_or_stop(0.05)
+
     def wait_fileupload(self) -> None:
         """Wait until the file upload progress completes.
 
         Checks repeatedly until no progress bar is present.
         """
         while True:
-            sleep(0.05)
+            self.wait_or_stop(0.05)
             div1 = 'div[class="ui-fileupload-files"]'
             div2 = 'div[class="ui-fileupload-row"]'
             div0 = 'div[id*="uploadGedEFile"]'
@@ -226,21 +292,83 @@ class Interact(CrawJUD):
             if not selector:
                 selector: WebElement = self.wait.until(ec.presence_of_element_located((By.XPATH, element_select)))
 
-        element_select = "[id='{_id}']".format(_id=selector.get_attribute("id"))  # noqa: N806
-        items = selector.find_elements(By.TAG_NAME, "option")
-        opt_itens: dict[str, str] = {}
+        value_opt = self.resolve_option(selector, to_search_elaw)
+
+        if value_opt:
+            self.driver.execute_script("$(arguments[0]).val([arguments[1]]).trigger('change');", selector, value_opt)
+
+    def option_index(self, selector: WebElement) -> dict[str, str | dict[str, str]]:
+        """Return the (text -> value) index of a select's options.
+
+        The options are read in a single script call and cached per session and
+        select id. On later calls the script only returns the options again when
+        their signature changed (e.g. a dependent select reloaded after its parent
+        changed), so a warm lookup costs one small round-trip.
+
+        Args:
+            selector (WebElement): The ``select`` element.
+
+        Returns:
+            dict[str, str | dict[str, str]]: The options ``"signature"``, and the values
+            keyed by upper-case text (``"text"``) and by normalized text (``"normalized"``).
+
+        """
+        key = (self.driver.session_id, selector.get_attribute("id"))
+        cached = Interact.option_index_.get(key) if key[1] else None
+
+        signature, options = self.driver.execute_script(
+            SELECT_OPTIONS_SCRIPT,
+            selector,
+            cached["signature"] if cached else None,
+        )
+        if options is None and cached:
+            return cached
 
-        for item in items:
-            value_item = item.get_attribute("value")
-            option_css = "option[value='{value_item}']".format(value_item=value_item)
-            css = "{element} > {option_css}".format(element=element_select, option_css=option_css)
+        normalizar_nome = self.OtherUtils.normalizar_nome
+        index = {"signature": signature, "text": {}, "normalized": {}}
+        for text_item, value_item in options:
+            index["text"].setdefault(text_item.strip().upper(), value_item)
+            index["normalized"].setdefault(normalizar_nome(text_item), value_item)
 
-            text_item = self.driver.execute_script("return $(arguments[0]).text();", css)
+        if key[1]:
+            Interact.option_index_[key] = index
 
-            opt_itens.update({text_item.upper(): value_item})
+        return index
 
-        value_opt = opt_itens.get(to_search_elaw.upper())
+    def resolve_option(self, selector: WebElement, to_search_elaw: str) -> str | None:
+        """Find the value of the option matching a text.
 
+        Matches the exact text first (case-insensitive), then the normalized text,
+        then the most similar option above ``OPTION_SIMILARITY``. Fuzzy matches must
+        keep the same digits, so e.g. "1ª Vara Cível" never resolves to "2ª Vara Cível".
+
+        Args:
+            selector (WebElement): The ``select`` element.
+            to_search_elaw (str): The option text.
+
+        Returns:
+            str | None: The option value, or None if no option matches.
+
+        """
+        index = self.option_index(selector)
+
+        value_opt = index["text"].get(str(to_search_elaw).strip().upper())
         if value_opt:
-            self.driver.execute_script("$(arguments[0]).val([arguments[1]]);", element_select, value_opt)
-            self.driver.execute_script("$(arguments[0]).trigger('change');", element_select)
+            return value_opt
+
+        search = self.OtherUtils.normalizar_nome(str(to_search_elaw))
+        value_opt = index["normalized"].get(search)
+        if value_opt or not search:
+            return value_opt
+
+        digits = re.sub(r"\D", "", search)
+        best_ratio, best_value = 0.0, None
+        for text_item, value_item in index["normalized"].items():
+            if re.sub(r"\D", "", text_item) != digits:
+                continue
+
+            ratio = self.similaridade(search, text_item)
+            if ratio > best_ratio:
+                best_ratio, best_value = ratio, value_item
+
+        return best_value if best_ratio > OPTION_SIMILARITY else None
@@ -0,0 +1,192 @@
+"""Lookup cache module: Remember which eLaw parties and lawyers exist across rows and runs.
+
+This module provides the EntityCache class. The result of each party/lawyer search
+is stored in Redis under a key built from the system, the client and the normalized
+CPF/CNPJ/OAB or name, so rows (and later executions) referencing the same entity
+skip the polling and registration round-trips. Entries expire after a TTL, shorter
+for entities that were not found, since those are usually registered soon after.
+
+The entries live in the database of ``redis_conn.redis_url()`` (``REDIS_DB_LOGS``).
+Those written to database 0 of ``REDIS_URL`` before it moved are not read; they
+expire with their TTL while the cache fills again.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import unicodedata
+from os import getenv
+
+import redis
+
+from crawjud.bot.common.redis_conn import redis_client
+from crawjud.bot.core import CrawJUD
+
+logger = logging.getLogger(__name__)
+
+LOOKUP_TTL = int(getenv("LOOKUP_CACHE_TTL", 60 * 60 * 24 * 30))
+LOOKUP_MISSING_TTL = int(getenv("LOOKUP_CACHE_MISSING_TTL", 60 * 60))
+DOCUMENT_KINDS = frozenset({"cpf", "cnpj", "doc", "oab"})
+
+
+def normalize_key(kind: str, value: str) -> str:
+    """Normalize the value identifying an entity.
+
+    Documents keep only letters and digits (so masked and unmasked CPF/CNPJ/OAB
+    match); names also drop accents, spaces and punctuation.
+
+    Args:
+        kind (str): The entity kind (``cpf``, ``cnpj``, ``doc``, ``oab`` or a name kind).
+        value (str): The raw value from the spreadsheet.
+
+    Returns:
+        str: The normalized value.
+
+    """
+    value = unicodedata.normalize("NFKD", str(value or "")).encode("ascii", "ignore").decode()
+    if kind in DOCUMENT_KINDS:
+        return re.sub(r"[^0-9A-Za-z]", "", value).upper()
+
+    return re.sub(r"[^0-9a-z]", "", value.lower())
+
+
+class EntityCache(CrawJUD):
+    """Persistent cache of eLaw party and lawyer existence checks.
+
+    Attributes:
+        hits_ (int): Lookups answered by the cache in the execution.
+        misses_ (int): Lookups that needed a search on the site.
+        disabled_ (bool): Set when Redis is unreachable, so the bot stops trying.
+        owner_pid_ (int): Process the counters belong to (a forked worker starts its own).
+
+    """
+
+    hits_: int = 0
+    misses_: int = 0
+    disabled_: bool = False
+    owner_pid_: int = None
+
+    def __init__(self) -> None:
+        """Initialize the EntityCache instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    def reset_owner(self) -> None:
+        """Start fresh counters when running in a new process."""
+        if EntityCache.owner_pid_ != os.getpid():
+            EntityCache.owner_pid_ = os.getpid()
+            EntityCache.hits_ = EntityCache.misses_ = 0
+            EntityCache.disabled_ = False
+
+    def key(self, kind: str, value: str) -> str | None:
+        """Return the Redis key of an entity.
+
+        Args:
+            kind (str): The entity kind.
+            value (str): The raw value identifying the entity.
+
+        Returns:
+            str | None: The key, or None if the value is empty.
+
+        """
+        normalized = normalize_key(kind, value)
+        if not normalized:
+            return None
+
+        system = str(self.system or "").lower()
+        client = normalize_key("nome", self.state_or_client or "")
+        return f"crawjud:lookup:{system}:{client}:{kind}:{normalized}"
+
+    def lookup(self, kind: str, value: str) -> bool | None:
+        """Return whether an entity is known to exist.
+
+        Args:
+            kind (str): The entity kind.
+            value (str): The raw value identifying the entity.
+
+        Returns:
+            bool | None: True or False if cached, None if the site must be searched.
+
+        """
+        self.reset_owner()
+        key = self.key(kind, value)
+        if key is None or EntityCache.disabled_:
+            EntityCache.misses_ += 1
+            return None
+
+        try:
+            cached = redis_client(decode_responses=True).get(key)
+
+        except redis.RedisError as e:
+            logger.warning("Cache de consultas indisponível: %s", str(e))
+            EntityCache.disabled_ = True
+            cached = None
+
+        if cached is None:
+            EntityCache.misses_ += 1
+            return None
+
+        EntityCache.hits_ += 1
+        return cached == "1"
+
+    def remember(self, kind: str, value: str, exists: bool) -> None:
+        """Store the result of an entity search.
+
+        Args:
+            kind (str): The entity kind.
+            value (str): The raw value identifying the entity.
+            exists (bool): Whether the entity exists on the site.
+
+        """
+        self.reset_owner()
+        key = self.key(kind, value)
+        if key is None or EntityCache.disabled_:
+            return
+
+        try:
+            ttl = LOOKUP_TTL if exists else LOOKUP_MISSING_TTL
+            redis_client(decode_responses=True).set(key, "1" if exists else "0", ex=ttl)
+
+        except redis.RedisError as e:
+            logger.warning("Cache de consultas indisponível: %s", str(e))
+            EntityCache.disabled_ = True
+
+    def forget(self, kind: str, value: str) -> None:
+        """Drop a cached entity that turned out to be stale.
+
+        Args:
+            kind (str): The entity kind.
+            value (str): The raw value identifying the entity.
+
+        """
+        self.reset_owner()
+        key = self.key(kind, value)
+        if key is None or EntityCache.disabled_:
+            return
+
+        try:
+            redis_client(decode_responses=True).delete(key)
+
+        except redis.RedisError as e:
+            logger.warning("Cache de consultas indisponível: %s", str(e))
+            EntityCache.disabled_ = True
+
+    def report(self) -> str | None:
+        """Return the summary of cache hits and misses.
+
+        Returns:
+            str | None: The summary message, or None if the execution made no lookups.
+
+        """
+        self.reset_owner()
+        total = EntityCache.hits_ + EntityCache.misses_
+        if not total:
+            return None
+
+        return (
+            f"Cache de partes e advogados: {EntityCache.hits_} consultas reaproveitadas, "
+            f"{EntityCache.misses_} buscas no sistema"
+        )
@@ -0,0 +1,177 @@
+"""Move matcher module: Match movement rows against all the keywords of a row at once.
+
+This module provides the MoveMatcher class. The movement bots used to walk the
+movement table once per keyword of ``PALAVRA_CHAVE``, re-compiling the date
+patterns, re-parsing ``DATA_INICIO``/``DATA_FIM`` and running a ``SequenceMatcher``
+per row and keyword. The matcher is built once per spreadsheet row instead: the
+keywords are folded into a single regular expression, the date bounds are parsed
+up front, and the similarity score is only computed for keywords with no exact hit,
+after its cheap upper bounds. Each movement table is then scanned once.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from difflib import SequenceMatcher
+
+SIMILARITY_THRESHOLD = 0.8
+DATE_FORMATS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("%d/%m/%Y", re.compile(r"\b(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/\d{4}\b")),
+    ("%m/%d/%Y", re.compile(r"\b(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])/\d{4}\b")),
+    ("%Y/%m/%d", re.compile(r"\b\d{4}/(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])\b")),
+    ("%Y/%d/%m", re.compile(r"\b\d{4}/(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])\b")),
+)
+
+
+def parse_date(value: str | datetime | None) -> datetime | None:
+    """Parse a movement or filter date.
+
+    Args:
+        value (str | datetime | None): The date, as found in the table or the spreadsheet.
+
+    Returns:
+        datetime | None: The date, or None if it is empty or in an unknown format.
+
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+
+    value = str(value).replace(" ", "")
+    for format_d, pattern in DATE_FORMATS:
+        if pattern.match(value) is not None:
+            try:
+                return datetime.strptime(value, format_d)
+
+            except ValueError:
+                continue
+
+    return None
+
+
+class MoveMatcher:
+    """Compiled keyword, date and ``INTIMADO`` filter of a spreadsheet row.
+
+    Attributes:
+        keywords (list[str]): The keywords, as typed in the spreadsheet (``["*"]`` matches everything).
+        data_inicio (datetime | None): Lower date bound.
+        data_fim (datetime | None): Upper date bound.
+        intimado (str | None): Text that must appear in the movement, lowercased.
+
+    """
+
+    def __init__(
+        self,
+        keywords: list[str],
+        data_inicio: str | datetime | None = None,
+        data_fim: str | datetime | None = None,
+        intimado: str | None = None,
+    ) -> None:
+        """Compile the filter.
+
+        Args:
+            keywords (list[str]): The keywords (surrounding spaces are ignored).
+            data_inicio (str | datetime | None, optional): Lower date bound.
+            data_fim (str | datetime | None, optional): Upper date bound.
+            intimado (str | None, optional): Text that must appear in the movement.
+
+        """
+        self.keywords = list(dict.fromkeys(stripped for keyword in keywords if (stripped := keyword.strip()))) or ["*"]
+        self.match_all = "*" in self.keywords
+        self.lowered = [(keyword, keyword.lower()) for keyword in self.keywords if keyword != "*"]
+        self.pattern = (
+            re.compile("|".join(re.escape(lowered) for _, lowered in self.lowered)) if self.lowered else None
+        )
+        self.data_inicio = parse_date(data_inicio)
+        self.data_fim = parse_date(data_fim)
+        self.intimado = str(intimado).lower() if intimado is not None else None
+        self.similarity = SequenceMatcher()
+
+    @classmethod
+    def from_row(cls, bot_data: dict[str, str]) -> MoveMatcher:
+        """Build the filter of a spreadsheet row.
+
+        Args:
+            bot_data (dict[str, str]): The row data.
+
+        Returns:
+            MoveMatcher: The compiled filter.
+
+        """
+        keyword = str(bot_data.get("PALAVRA_CHAVE", bot_data.get("PALAVRAS_CHAVE", "*")))
+        return cls(
+            keyword.split(","),
+            data_inicio=bot_data.get("DATA_INICIO"),
+            data_fim=bot_data.get("DATA_FIM"),
+            intimado=bot_data.get("INTIMADO"),
+        )
+
+    def date_check(self, data_mov: str) -> bool:
+        """Return whether a movement date falls within the bounds.
+
+        Args:
+            data_mov (str): The movement date.
+
+        Returns:
+            bool: True if there are no bounds or the date is within them.
+
+        """
+        if self.data_inicio is None and self.data_fim is None:
+            return True
+
+        data = parse_date(data_mov)
+        if data is None:
+            return False
+
+        return (self.data_inicio is None or data >= self.data_inicio) and (
+            self.data_fim is None or data <= self.data_fim
+        )
+
+    def similar(self, keyword: str) -> bool:
+        """Return whether a keyword is similar to the first line set in ``similarity``.
+
+        Args:
+            keyword (str): The lowercased keyword.
+
+        Returns:
+            bool: True if the similarity ratio is above ``SIMILARITY_THRESHOLD``.
+
+        """
+        self.similarity.set_seq1(keyword)
+        return (
+            self.similarity.real_quick_ratio() > SIMILARITY_THRESHOLD
+            and self.similarity.quick_ratio() > SIMILARITY_THRESHOLD
+            and self.similarity.ratio() > SIMILARITY_THRESHOLD
+        )
+
+    def match(self, text_mov: str, data_mov: str) -> list[str]:
+        """Return the keywords matched by a movement.
+
+        A keyword matches when it appears in the movement text or is similar to its
+        first line, as long as the date and ``INTIMADO`` filters pass. ``"*"`` matches
+        every movement, alongside the other keywords of the row.
+
+        Args:
+            text_mov (str): The movement text.
+            data_mov (str): The movement date.
+
+        Returns:
+            list[str]: The matched keywords, in spreadsheet order (empty if none).
+
+        """
+        text = text_mov.lower()
+        if self.intimado is not None and self.intimado not in text:
+            return []
+
+        if not self.date_check(data_mov):
+            return []
+
+        hits = {"*"} if self.match_all else set()
+        if self.pattern is not None and self.pattern.search(text):
+            hits.update(keyword for keyword, lowered in self.lowered if lowered in text)
+
+        if len(hits) < len(self.keywords):
+            self.similarity.set_seq2(text.split("\n")[0])
+            hits.update(keyword for keyword, lowered in self.lowered if keyword not in hits and self.similar(lowered))
+
+        return [keyword for keyword in self.keywords if keyword in hits]
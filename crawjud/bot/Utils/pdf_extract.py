@@ -0,0 +1,210 @@
+"""PDF extraction module: Extract PDF text in a process pool with an on-disk cache.
+
+This module provides the PdfExtractor class. Page texts are extracted with PyMuPDF
+(falling back to pypdf for files it cannot open) in worker processes, so parsing
+large documents does not block the Selenium loop. Results are cached on disk by the
+SHA-256 of the file content, so re-runs and the same document downloaded by other
+executions are not parsed again. The pool is started with the spawn context (the
+bot process already runs threads) and shut down when the execution finishes, and
+the cache is trimmed to ``PDF_CACHE_MAX_MB`` and ``PDF_CACHE_TTL_DAYS``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import suppress
+from os import getenv
+from pathlib import Path
+
+import pymupdf
+from pypdf import PdfReader
+
+from crawjud.bot.core import CrawJUD
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).cwd().joinpath("crawjud", "bot", "temp", "pdf_cache").resolve()
+EXTRACT_WORKERS = 2
+CACHE_MAX_BYTES = int(getenv("PDF_CACHE_MAX_MB", "512")) * 1024 * 1024
+CACHE_TTL = float(getenv("PDF_CACHE_TTL_DAYS", "30")) * 60 * 60 * 24
+
+
+def extract_pages(path_pdf: str | Path) -> list[str]:
+    """Extract the text of every page of a PDF, using the content-hash cache.
+
+    Runs inside the extraction pool, so it must stay a module-level function.
+
+    Args:
+        path_pdf (str | Path): The PDF file.
+
+    Returns:
+        list[str]: The text of each page.
+
+    """
+    content = Path(path_pdf).read_bytes()
+    cache_file = CACHE_DIR.joinpath(f"{hashlib.sha256(content).hexdigest()}.json")
+
+    with suppress(Exception):
+        pages = json.loads(cache_file.read_text(encoding="utf-8"))
+        # A hit counts as a use for the eviction, which drops the least recently used files
+        os.utime(cache_file)
+        return pages
+
+    try:
+        with pymupdf.open(stream=content, filetype="pdf") as doc:
+            pages = [page.get_text() for page in doc]
+
+    except Exception:
+        pages = []
+        for page in PdfReader(path_pdf).pages:
+            with suppress(Exception):
+                pages.append(page.extract_text())
+
+    with suppress(Exception):
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(pages, ensure_ascii=False), encoding="utf-8")
+        tmp_file.replace(cache_file)
+
+    return pages
+
+
+def evict_cache(now: float = None) -> int:
+    """Remove expired cache files, then the least recently used ones above the size cap.
+
+    Args:
+        now (float, optional): The current time (defaults to ``time.time()``).
+
+    Returns:
+        int: The number of files removed.
+
+    """
+    now = time.time() if now is None else now
+    entries: list[tuple[float, int, Path]] = []
+    with suppress(OSError):
+        for cache_file in CACHE_DIR.glob("*.json"):
+            with suppress(OSError):
+                stat = cache_file.stat()
+                entries.append((stat.st_mtime, stat.st_size, cache_file))
+
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for mtime, size, cache_file in entries:
+        if now - mtime <= CACHE_TTL and total <= CACHE_MAX_BYTES:
+            break
+
+        with suppress(OSError):
+            cache_file.unlink()
+            removed += 1
+            total -= size
+
+    return removed
+
+
+class PdfExtractor(CrawJUD):
+    """Extract PDF text off the bot loop through a process pool.
+
+    Attributes:
+        executor_ (ProcessPoolExecutor): The extraction pool of the current process.
+        owner_pid_ (int): Process that created the pool (another process builds its own).
+
+    """
+
+    executor_: ProcessPoolExecutor = None
+    owner_pid_: int = None
+
+    def __init__(self) -> None:
+        """Initialize the PdfExtractor instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    @property
+    def executor(self) -> ProcessPoolExecutor | None:
+        """The extraction pool, created on first use in this process."""
+        if PdfExtractor.executor_ is None or PdfExtractor.owner_pid_ != os.getpid():
+            PdfExtractor.owner_pid_ = os.getpid()
+            try:
+                PdfExtractor.executor_ = ProcessPoolExecutor(
+                    max_workers=EXTRACT_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+
+            except Exception:
+                logger.warning("Pool de extração indisponível: %s", traceback.format_exc())
+                PdfExtractor.executor_ = None
+
+        return PdfExtractor.executor_
+
+    def shutdown(self) -> None:
+        """Stop the extraction pool of this process and trim the cache."""
+        executor = PdfExtractor.executor_
+        if executor is not None and PdfExtractor.owner_pid_ == os.getpid():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        PdfExtractor.executor_ = None
+        PdfExtractor.owner_pid_ = None
+
+        removed = evict_cache()
+        if removed:
+            logger.info("Cache de PDFs: %s arquivos removidos", removed)
+
+    def submit(self, paths: list[str | Path]) -> list[Future[list[str]]]:
+        """Queue PDFs for extraction without waiting for them.
+
+        Args:
+            paths (list[str | Path]): The PDF files.
+
+        Returns:
+            list[Future[list[str]]]: The page texts of each file, in the same order.
+
+        """
+        executor = self.executor
+        futures: list[Future[list[str]]] = []
+        for path_pdf in paths:
+            if executor is not None:
+                with suppress(Exception):
+                    futures.append(executor.submit(extract_pages, str(path_pdf)))
+                    continue
+
+            future: Future[list[str]] = Future()
+            try:
+                future.set_result(extract_pages(path_pdf))
+            except Exception as e:
+                future.set_exception(e)
+
+            futures.append(future)
+
+        return futures
+
+    def pages(self, path_pdf: str | Path) -> list[str]:
+        """Extract the text of every page of a PDF.
+
+        Args:
+            path_pdf (str | Path): The PDF file.
+
+        Returns:
+            list[str]: The text of each page.
+
+        """
+        return self.submit([path_pdf])[0].result()
+
+    def text(self, path_pdf: str | Path) -> str:
+        """Extract the text of a PDF as a single line.
+
+        Args:
+            path_pdf (str | Path): The PDF file.
+
+        Returns:
+            str: The pages joined, with line breaks replaced by spaces.
+
+        """
+        return "".join(page.replace("\n", " ") for page in self.pages(path_pdf))
@@ -0,0 +1,177 @@
+"""Profiling module: Time the phases of an execution and publish them per PID.
+
+This module provides the PhaseTimer class and the ``timed`` decorator. Spans are
+opened around login, browser launch, searches, waits, downloads and spreadsheet
+writes; each whole row is timed as the ``linha`` phase. Durations are aggregated in
+memory and flushed to the phase hash of the execution (see
+``crawjud.bot.common.phases``) once per row, so the logs page can show where the
+time of a slow execution goes while it runs and after it finishes.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Generator, ParamSpec, TypeVar
+
+import redis
+
+from crawjud.bot.common.phases import PHASES_TTL, bucket_of, decode_phases, phases_key
+from crawjud.bot.common.redis_conn import redis_client
+from crawjud.bot.core import CrawJUD
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+MAX_SCRIPT = """
+local current = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '0')
+if tonumber(ARGV[2]) > current then
+    redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+end
+"""
+
+
+def timed(phase: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Time every call of a bot method as a phase.
+
+    Args:
+        phase (str): The phase name.
+
+    Returns:
+        Callable[[Callable[P, R]], Callable[P, R]]: The decorator.
+
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(self: CrawJUD, *args: P.args, **kwargs: P.kwargs) -> R:
+            timer = self.phase_timer
+            if timer is None:
+                return func(self, *args, **kwargs)
+
+            with timer.span(phase):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class PhaseTimer(CrawJUD):
+    """Aggregate phase durations and flush them to the execution's phase hash.
+
+    Attributes:
+        pending_ (dict[str, list[float]]): Durations recorded since the last flush, per phase.
+        row_started_ (float): When the current row started.
+        owner_pid_ (int): Process the buffer belongs to (a forked worker starts its own).
+
+    """
+
+    pending_: dict[str, list[float]] = {}
+    row_started_: float = None
+    owner_pid_: int = None
+
+    def __init__(self) -> None:
+        """Initialize the PhaseTimer instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    def reset_owner(self) -> None:
+        """Start an empty buffer when running in a new process."""
+        if PhaseTimer.owner_pid_ != os.getpid():
+            PhaseTimer.owner_pid_ = os.getpid()
+            PhaseTimer.pending_ = {}
+            PhaseTimer.row_started_ = None
+
+    @contextmanager
+    def span(self, phase: str) -> Generator[None, None, None]:
+        """Time the enclosed block as a phase.
+
+        Args:
+            phase (str): The phase name.
+
+        Yields:
+            None: Control to the timed block.
+
+        """
+        started = time.perf_counter()
+        try:
+            yield
+
+        finally:
+            self.record(phase, time.perf_counter() - started)
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Add a duration to a phase.
+
+        Args:
+            phase (str): The phase name.
+            seconds (float): The duration.
+
+        """
+        self.reset_owner()
+        PhaseTimer.pending_.setdefault(phase, []).append(seconds)
+
+    def start_row(self, row: int) -> None:
+        """Close the timing of the previous row and flush the buffered spans.
+
+        Args:
+            row (int): The row being started.
+
+        """
+        self.reset_owner()
+        now = time.perf_counter()
+        if PhaseTimer.row_started_ is not None:
+            self.record("linha", now - PhaseTimer.row_started_)
+
+        PhaseTimer.row_started_ = now if row else None
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered durations to the phase hash of the execution."""
+        self.reset_owner()
+        if not PhaseTimer.pending_ or not self.pid:
+            return
+
+        pending, PhaseTimer.pending_ = PhaseTimer.pending_, {}
+        key = phases_key(self.pid)
+        try:
+            pipe = redis_client().pipeline()
+            for phase, durations in pending.items():
+                pipe.hincrby(key, f"{phase}:count", len(durations))
+                pipe.hincrbyfloat(key, f"{phase}:total", sum(durations))
+                pipe.eval(MAX_SCRIPT, 1, key, f"{phase}:max", max(durations))
+                for seconds in durations:
+                    pipe.hincrby(key, f"{phase}:le:{bucket_of(seconds)}", 1)
+
+            pipe.expire(key, PHASES_TTL)
+            pipe.execute()
+
+        except redis.RedisError as e:
+            logger.warning("Falha ao publicar tempos do PID %s: %s", self.pid, str(e))
+
+    def report(self) -> str | None:
+        """Return the phase breakdown of the execution as a log message.
+
+        Returns:
+            str | None: The summary message, or None if nothing was timed.
+
+        """
+        self.flush()
+        try:
+            phases = decode_phases(redis_client().hgetall(phases_key(self.pid)))
+
+        except redis.RedisError:
+            return None
+
+        if not phases:
+            return None
+
+        parts = [f"{entry['phase']}: {entry['total']:.0f}s ({entry['share']:.0f}%)" for entry in phases]
+        return f"Tempo por etapa: {' | '.join(parts)}"
@@ -0,0 +1,168 @@
+"""Result sink module: Journal result rows on disk and build the output spreadsheets once.
+
+This module provides the ResultSink class. Each success/error row is appended to a
+JSON Lines journal next to its target spreadsheet and flushed to disk immediately, so
+an interrupted bot still leaves its partial results behind. The .xlsx files are built
+a single time when the execution is finalized.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import logging
+import os
+import traceback
+from pathlib import Path
+from threading import RLock
+
+from crawjud.bot.core import CrawJUD, pd
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSink(CrawJUD):
+    """Append result rows to per-spreadsheet journals and materialize them on finalize.
+
+    Attributes:
+        journals_ (dict[str, Path]): Spreadsheet path mapped to its journal file.
+        lock_ (RLock): Guards journal writes shared between threads of the same bot.
+
+    """
+
+    journals_: dict[str, Path] = {}
+    lock_ = RLock()
+
+    def __init__(self) -> None:
+        """Initialize the ResultSink instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    def journal_path(self, output: Path | str) -> Path:
+        """Return the journal file used for the given spreadsheet.
+
+        Worker processes of a parallel execution each get their own journal,
+        so concurrent appends never interleave inside a file.
+
+        Args:
+            output (Path | str): The target .xlsx path.
+
+        Returns:
+            Path: The ``.jsonl`` journal placed beside the spreadsheet.
+
+        """
+        output = Path(output)
+        if self.worker_id:
+            return output.with_name(f"{output.name}.w{self.worker_id}.jsonl")
+
+        return output.with_name(f"{output.name}.jsonl")
+
+    @staticmethod
+    def journals_of(output: Path) -> list[Path]:
+        """Return every journal (main and per-worker) written for a spreadsheet.
+
+        Args:
+            output (Path): The target .xlsx path.
+
+        Returns:
+            list[Path]: The journals sorted by name.
+
+        """
+        return sorted(output.parent.glob(f"{glob.escape(output.name)}*.jsonl"))
+
+    def append(self, output: Path | str, rows: list[dict[str, str]]) -> None:
+        """Append rows to the journal of a spreadsheet and flush them to disk.
+
+        Args:
+            output (Path | str): The target .xlsx path.
+            rows (list[dict[str, str]]): The records to append.
+
+        """
+        output = Path(output).resolve()
+        journal = self.journal_path(output)
+        lines = "".join(f"{json.dumps(row, default=str, ensure_ascii=False)}\n" for row in rows)
+
+        with ResultSink.lock_:
+            with journal.open("a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+            ResultSink.journals_[str(output)] = journal
+
+    @staticmethod
+    def read_journal(journal: Path) -> list[dict[str, str]]:
+        """Read every complete record stored in a journal.
+
+        A truncated last line (left by a killed process) is ignored.
+
+        Args:
+            journal (Path): The journal file.
+
+        Returns:
+            list[dict[str, str]]: The journaled records in insertion order.
+
+        """
+        rows: list[dict[str, str]] = []
+        if not journal.exists():
+            return rows
+
+        with journal.open("r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning("Linha corrompida ignorada no journal %s", journal)
+
+        return rows
+
+    def materialize(self, output: Path | str) -> None:
+        """Build a spreadsheet from its journal, keeping rows already written to it.
+
+        Args:
+            output (Path | str): The target .xlsx path.
+
+        """
+        output = Path(output).resolve()
+        journals = self.journals_of(output)
+        rows: list[dict[str, str]] = []
+        for journal in journals:
+            rows.extend(self.read_journal(journal))
+
+        if not rows:
+            return
+
+        records: list[dict[str, str]] = []
+        if output.exists():
+            records.extend(pd.read_excel(output).to_dict(orient="records"))
+
+        records.extend(rows)
+        pd.DataFrame(records).to_excel(output, index=False)
+        for journal in journals:
+            journal.unlink(missing_ok=True)
+
+    def finalize(self) -> None:
+        """Build every journaled spreadsheet of the current execution.
+
+        Also picks up journals written by worker processes or left in the output
+        directory by a previous, interrupted process with the same PID.
+        """
+        with ResultSink.lock_:
+            outputs = set(ResultSink.journals_)
+            if self.output_dir_path:
+                for journal in Path(self.output_dir_path).glob(f"*{self.pid}*.xlsx*.jsonl"):
+                    name = journal.name.split(".xlsx")[0]
+                    outputs.add(str(journal.with_name(f"{name}.xlsx")))
+
+            for output in sorted(outputs):
+                try:
+                    self.materialize(output)
+                except Exception:
+                    err = traceback.format_exc()
+                    logger.exception(err)
+
+            ResultSink.journals_.clear()
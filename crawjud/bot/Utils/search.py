@@ -19,6 +19,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from crawjud.bot.common import ExecutionError
 from crawjud.bot.core import CrawJUD
+from crawjud.bot.Utils.profiling import timed
 
 
 class SearchBot(CrawJUD):
@@ -34,6 +35,7 @@ class SearchBot(CrawJUD):
         Sets up necessary attributes for search operations.
         """
 
+    @timed("busca")
     def search_(self) -> bool:
         """Perform a search for a legal process using the appropriate system method.
 
@@ -151,7 +153,7 @@ class SearchBot(CrawJUD):
         # Insere o processo no Campo
         lineprocess: WebElement = self.wait.until(ec.presence_of_element_located((By.ID, "nuProcessoAntigoFormatado")))
         self.interact.click(lineprocess)
-        self.interact.send_key(lineprocess, self.bot_data.get("NUMERO_PROCESSO"))
+        self.interact.send_key(lineprocess, self.bot_data.get("NUMERO_PROCESSO"), mode="slow")
 
         # Abre o Processo
         openprocess = None
@@ -311,7 +313,7 @@ class SearchBot(CrawJUD):
 
         if inputproc:
             proc = self.bot_data.get("NUMERO_PROCESSO")
-            self.interact.send_key(inputproc, proc)
+            self.interact.send_key(inputproc, proc, mode="slow")
             sleep(1)
             consultar = self.driver.find_element(By.CSS_SELECTOR, "#pesquisar")
             consultar.click()
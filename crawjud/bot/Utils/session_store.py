@@ -0,0 +1,319 @@
+"""Session store module: Persist authenticated sessions and restore them in new browsers.
+
+This module provides the SessionStore class. After a successful login, the cookies
+(every domain, read through CDP when available) and the ``localStorage`` of the page
+are serialized, encrypted with Fernet and kept in Redis for each (system,
+state_or_client, username). The next execution restores them into its new driver,
+checks the session with a single page load and only falls back to the interactive
+login when the session has expired.
+
+The sessions live in the database of ``redis_conn.redis_url()`` (``REDIS_DB_LOGS``).
+Those saved to database 0 of ``REDIS_URL`` before it moved are not read, so each
+user logs in interactively once more and the session is saved again.
+
+Settings (environment variables):
+    SESSION_STORE_KEY: Fernet key used to encrypt the sessions (the store is disabled without it).
+    SESSION_STORE_TTL: Seconds a saved session is kept.
+    SESSION_PROBE_TIMEOUT: Seconds the probe waits for the logged-in page.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from contextlib import suppress
+from functools import lru_cache
+from os import getenv
+from urllib.parse import urlsplit
+
+import redis
+from cryptography.fernet import Fernet, InvalidToken
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as ec
+from selenium.webdriver.support.ui import WebDriverWait
+
+from crawjud.bot.common.redis_conn import redis_client
+from crawjud.bot.core import CrawJUD
+
+logger = logging.getLogger(__name__)
+
+SESSION_TTL = int(getenv("SESSION_STORE_TTL", 60 * 60 * 8))
+PROBE_TIMEOUT = float(getenv("SESSION_PROBE_TIMEOUT", "5"))
+SESSION_METRICS = "crawjud:session:metrics"
+
+# Fields accepted by CDP Network.setCookies (getAllCookies returns a few more)
+CDP_COOKIE_FIELDS = frozenset({
+    "name",
+    "value",
+    "domain",
+    "path",
+    "secure",
+    "httpOnly",
+    "sameSite",
+    "expires",
+    "priority",
+})
+
+EXPORT_STORAGE_SCRIPT = "return JSON.stringify(Object.assign({}, window.localStorage));"
+IMPORT_STORAGE_SCRIPT = """
+const items = JSON.parse(arguments[0] || "{}");
+for (const [key, value] of Object.entries(items)) {
+    window.localStorage.setItem(key, value);
+}
+"""
+
+
+@lru_cache(maxsize=1)
+def session_cipher() -> Fernet | None:
+    """Return the cipher used to encrypt the sessions.
+
+    Returns:
+        Fernet | None: The cipher, or None if ``SESSION_STORE_KEY`` is not set or invalid.
+
+    """
+    key = getenv("SESSION_STORE_KEY")
+    if not key:
+        return None
+
+    try:
+        return Fernet(key.encode())
+
+    except ValueError:
+        logger.warning("SESSION_STORE_KEY inválida, sessões não serão reaproveitadas")
+        return None
+
+
+class SessionStore(CrawJUD):
+    """Save and restore authenticated browser sessions across executions.
+
+    Attributes:
+        restored_ (int): Logins avoided in the execution.
+        logins_ (int): Interactive logins performed in the execution.
+        expired_ (int): Saved sessions found logged out in the execution.
+        owner_pid_ (int): Process the counters belong to (a forked worker starts its own).
+
+    """
+
+    restored_: int = 0
+    logins_: int = 0
+    expired_: int = 0
+    owner_pid_: int = None
+
+    def __init__(self) -> None:
+        """Initialize the SessionStore instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    def reset_owner(self) -> None:
+        """Start fresh counters when running in a new process."""
+        if SessionStore.owner_pid_ != os.getpid():
+            SessionStore.owner_pid_ = os.getpid()
+            SessionStore.restored_ = SessionStore.logins_ = SessionStore.expired_ = 0
+
+    def key(self) -> str:
+        """Return the Redis key of the current (system, state_or_client, username).
+
+        Returns:
+            str: The key. The username is hashed so it never appears in Redis.
+
+        """
+        user = hashlib.sha256(str(self.username or "").encode()).hexdigest()[:16]
+        system = str(self.system or "").lower()
+        return f"crawjud:session:{system}:{str(self.state_or_client or '').lower()}:{user}"
+
+    def count(self, field: str) -> None:
+        """Update the execution and global login counters.
+
+        Args:
+            field (str): ``restored``, ``logins`` or ``expired``.
+
+        """
+        self.reset_owner()
+        if field == "restored":
+            SessionStore.restored_ += 1
+        elif field == "logins":
+            SessionStore.logins_ += 1
+        elif field == "expired":
+            SessionStore.expired_ += 1
+
+        with suppress(redis.RedisError):
+            redis_client().hincrby(SESSION_METRICS, field, 1)
+
+    def export_cookies(self) -> list[dict]:
+        """Return the cookies of every domain visited by the browser.
+
+        Returns:
+            list[dict]: The cookies, in CDP format when available.
+
+        """
+        with suppress(AttributeError, WebDriverException):
+            return self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+
+        return self.driver.get_cookies()
+
+    def import_cookies(self, cookies: list[dict], url: str) -> None:
+        """Load cookies into the browser.
+
+        Args:
+            cookies (list[dict]): The saved cookies.
+            url (str): The page the session was saved on (used by the fallback).
+
+        """
+        with suppress(AttributeError, WebDriverException):
+            params = [
+                {name: value for name, value in cookie.items() if name in CDP_COOKIE_FIELDS} for cookie in cookies
+            ]
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+            return
+
+        # Sem CDP, só é possível definir cookies do domínio aberto
+        self.driver.get(url)
+        host = urlsplit(url).hostname or ""
+        for cookie in cookies:
+            if not host.endswith(str(cookie.get("domain", "")).lstrip(".")):
+                continue
+
+            with suppress(WebDriverException):
+                self.driver.add_cookie({
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "path": cookie.get("path", "/"),
+                    "secure": cookie.get("secure", False),
+                })
+
+    def save(self) -> None:
+        """Encrypt and store the session of the logged-in browser."""
+        self.count("logins")
+        cipher = session_cipher()
+        if cipher is None:
+            return
+
+        try:
+            payload = {
+                "url": self.driver.current_url,
+                "cookies": self.export_cookies(),
+                "local_storage": self.driver.execute_script(EXPORT_STORAGE_SCRIPT),
+                "saved_at": time.time(),
+            }
+            token = cipher.encrypt(json.dumps(payload).encode())
+            redis_client().set(self.key(), token, ex=SESSION_TTL)
+
+        except (WebDriverException, redis.RedisError) as e:
+            logger.warning("Falha ao salvar a sessão autenticada: %s", str(e))
+
+    def load(self) -> dict | None:
+        """Read and decrypt the stored session.
+
+        Returns:
+            dict | None: The session, or None if there is none (or it cannot be read).
+
+        """
+        cipher = session_cipher()
+        if cipher is None:
+            return None
+
+        try:
+            token = redis_client().get(self.key())
+            if not token:
+                return None
+
+            return json.loads(cipher.decrypt(token, ttl=SESSION_TTL))
+
+        except (redis.RedisError, InvalidToken, ValueError) as e:
+            logger.warning("Sessão armazenada ilegível: %s", str(e))
+            return None
+
+    def discard(self) -> None:
+        """Remove the stored session."""
+        if session_cipher() is None:
+            return
+
+        with suppress(redis.RedisError):
+            redis_client().delete(self.key())
+
+    def probe(self, url: str) -> bool:
+        """Check that the restored session is still logged in.
+
+        Args:
+            url (str): The page the session was saved on.
+
+        Returns:
+            bool: True if the page loads without being sent back to the login.
+
+        """
+        chk_login = getattr(self.elements, "chk_login", "")
+        url_login = getattr(self.elements, "url_login", "")
+        try:
+            if chk_login and not chk_login.startswith("http"):
+                WebDriverWait(self.driver, PROBE_TIMEOUT).until(
+                    ec.presence_of_element_located((By.CSS_SELECTOR, chk_login)),
+                )
+                return True
+
+            self.wait_engine.idle(PROBE_TIMEOUT)
+            current_url = self.driver.current_url
+            if chk_login:
+                return current_url.startswith(chk_login)
+
+            expired = self.driver.title.lower() == "a sessao expirou"
+            return not expired and "login" not in current_url.lower() and current_url != url_login
+
+        except (TimeoutException, WebDriverException):
+            return False
+
+    def restore(self) -> bool:
+        """Restore the stored session into the current driver.
+
+        Returns:
+            bool: True if the session was restored and is still logged in.
+
+        """
+        session = self.load()
+        if not session:
+            return False
+
+        try:
+            self.import_cookies(session["cookies"], session["url"])
+            self.driver.get(session["url"])
+            if session.get("local_storage"):
+                self.driver.execute_script(IMPORT_STORAGE_SCRIPT, session["local_storage"])
+                self.driver.refresh()
+
+            if self.probe(session["url"]):
+                self.count("restored")
+                return True
+
+        except WebDriverException as e:
+            logger.warning("Falha ao restaurar a sessão autenticada: %s", str(e))
+
+        self.count("expired")
+        self.discard()
+        with suppress(WebDriverException):
+            self.driver.delete_all_cookies()
+
+        return False
+
+    def report(self) -> str | None:
+        """Return the summary of logins avoided by restoring saved sessions.
+
+        Returns:
+            str | None: The summary message, or None if the execution did not log in.
+
+        """
+        self.reset_owner()
+        if not SessionStore.restored_ + SessionStore.logins_:
+            return None
+
+        message = (
+            f"Sessões salvas: {SessionStore.restored_} logins evitados, "
+            f"{SessionStore.logins_} logins no sistema"
+        )
+        if SessionStore.expired_:
+            message += f" ({SessionStore.expired_} sessões expiradas)"
+
+        return message
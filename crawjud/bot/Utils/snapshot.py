@@ -0,0 +1,335 @@
+"""Snapshot module: Read whole tables in one WebDriver round-trip and parse them locally.
+
+This module provides the TableSnapshot class. Instead of one WebDriver call per row and
+cell (``find_elements``/``.text`` on each ``td``), the ``outerHTML`` of a table is read
+once and parsed with the standard library HTML parser into a small tree of ``HtmlNode``
+objects, whose ``text`` follows the rendered-text rules of WebElement ``.text`` (hidden
+elements are skipped, block elements and ``<br>`` break lines, whitespace is collapsed).
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Iterator
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from crawjud.bot.core import CrawJUD
+
+VOID_TAGS = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"})
+BLOCK_TAGS = frozenset({
+    "address",
+    "article",
+    "blockquote",
+    "caption",
+    "div",
+    "dl",
+    "dt",
+    "dd",
+    "fieldset",
+    "form",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "footer",
+    "li",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "tbody",
+    "thead",
+    "tfoot",
+    "tr",
+    "ul",
+})
+CELL_TAGS = frozenset({"td", "th"})
+SKIP_TAGS = frozenset({"script", "style", "template", "noscript"})
+
+RE_SPACES = re.compile(r"[ \t\r\f\v\u00a0]+")
+RE_HIDDEN = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden")
+RE_SELECTOR = re.compile(r"^([\w-]*)((?:\[[\w-]+(?:=\"[^\"]*\")?\])*)$")
+RE_SELECTOR_ATTR = re.compile(r"\[([\w-]+)(=\"([^\"]*)\")?\]")
+
+
+@lru_cache(maxsize=256)
+def parse_selector(selector: str) -> tuple[str, tuple[tuple[str, str, str], ...]]:
+    """Parse a simple selector.
+
+    Supports the selectors used across the bots: a tag name, attribute equality
+    and attribute presence, e.g. ``a[href="javascript://nop/"]``.
+
+    Args:
+        selector (str): The selector.
+
+    Returns:
+        tuple[str, tuple[tuple[str, str, str], ...]]: The tag name and the attribute filters.
+
+    Raises:
+        ValueError: If the selector is not supported.
+
+    """
+    match_ = RE_SELECTOR.match(selector.strip())
+    if match_ is None:
+        raise ValueError(f"Seletor não suportado: {selector}")
+
+    tag, attrs = match_.groups()
+    return tag.lower(), tuple(RE_SELECTOR_ATTR.findall(attrs))
+
+
+class HtmlNode:
+    """Element parsed from an HTML snapshot.
+
+    Attributes:
+        tag (str): The tag name, in lower case.
+        attrs (dict[str, str]): The element attributes.
+        children (list[HtmlNode | str]): Child elements and text, in document order.
+
+    """
+
+    __slots__ = ("attrs", "children", "tag")
+
+    def __init__(self, tag: str, attrs: dict[str, str] = None) -> None:
+        """Initialize the HtmlNode.
+
+        Args:
+            tag (str): The tag name.
+            attrs (dict[str, str], optional): The element attributes.
+
+        """
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.children: list[HtmlNode | str] = []
+
+    def __repr__(self) -> str:
+        """Return a short representation of the node."""
+        return f"<HtmlNode {self.tag} {self.attrs}>"
+
+    def get_attribute(self, name: str) -> str | None:
+        """Return an attribute of the element, like WebElement.get_attribute.
+
+        Args:
+            name (str): The attribute name.
+
+        Returns:
+            str | None: The attribute value, or None if it is not set.
+
+        """
+        return self.attrs.get(name)
+
+    @property
+    def hidden(self) -> bool:
+        """Whether the element is hidden by its own attributes."""
+        return (
+            self.tag in SKIP_TAGS
+            or "hidden" in self.attrs
+            or bool(RE_HIDDEN.search(self.attrs.get("style") or ""))
+            or (self.tag == "input" and self.attrs.get("type") == "hidden")
+        )
+
+    def has_class(self, *names: str) -> bool:
+        """Return whether the class attribute contains any of the given names.
+
+        Args:
+            *names (str): The class names (matched as substrings, like XPath ``contains``).
+
+        Returns:
+            bool: True if any name is present.
+
+        """
+        classes = self.attrs.get("class") or ""
+        return any(name in classes for name in names)
+
+    def iter(self) -> Iterator[HtmlNode]:
+        """Iterate over the descendant elements, in document order."""
+        for child in self.children:
+            if isinstance(child, HtmlNode):
+                yield child
+                yield from child.iter()
+
+    def matches(self, selector: str) -> bool:
+        """Return whether the element matches a simple selector.
+
+        Args:
+            selector (str): The tag name or selector (see ``parse_selector``).
+
+        Returns:
+            bool: True if the element matches.
+
+        """
+        tag, attrs = parse_selector(selector)
+        if tag and self.tag != tag:
+            return False
+
+        for name, equals, value in attrs:
+            if name not in self.attrs or (equals and self.attrs[name] != value):
+                return False
+
+        return True
+
+    def find_all(self, selector: str) -> list[HtmlNode]:
+        """Return every descendant element matching a tag name or simple selector.
+
+        Args:
+            selector (str): The tag name or selector.
+
+        Returns:
+            list[HtmlNode]: The matching elements, in document order.
+
+        """
+        return [node for node in self.iter() if node.matches(selector)]
+
+    def find(self, selector: str) -> HtmlNode:
+        """Return the first descendant element matching a tag name or simple selector.
+
+        Args:
+            selector (str): The tag name or selector.
+
+        Returns:
+            HtmlNode: The first matching element.
+
+        Raises:
+            LookupError: If no descendant matches.
+
+        """
+        for node in self.iter():
+            if node.matches(selector):
+                return node
+
+        raise LookupError(f"Elemento {selector} não encontrado")
+
+    def write_text(self, parts: list[str]) -> None:
+        """Append the rendered text of the element to ``parts``.
+
+        Args:
+            parts (list[str]): The text fragments being collected.
+
+        """
+        if self.hidden:
+            return
+
+        if self.tag == "br":
+            parts.append("\n")
+            return
+
+        block = self.tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+
+        for child in self.children:
+            if isinstance(child, HtmlNode):
+                child.write_text(parts)
+            else:
+                parts.append(child)
+
+        if block:
+            parts.append("\n")
+        elif self.tag in CELL_TAGS:
+            parts.append(" ")
+
+    @property
+    def text(self) -> str:
+        """The rendered text of the element, like WebElement.text."""
+        if self.hidden:
+            return ""
+
+        parts: list[str] = []
+        for child in self.children:
+            if isinstance(child, HtmlNode):
+                child.write_text(parts)
+            else:
+                parts.append(child)
+
+        lines = (RE_SPACES.sub(" ", line).strip() for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+
+class SnapshotParser(HTMLParser):
+    """Build an HtmlNode tree from serialized HTML."""
+
+    def __init__(self) -> None:
+        """Initialize the parser with an empty root element."""
+        super().__init__(convert_charrefs=True)
+        self.root = HtmlNode("#root")
+        self.stack: list[HtmlNode] = [self.root]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Open an element under the current one."""
+        node = HtmlNode(tag, {name: value if value is not None else "" for name, value in attrs})
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Add a self-closed element under the current one."""
+        node = HtmlNode(tag, {name: value if value is not None else "" for name, value in attrs})
+        self.stack[-1].children.append(node)
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close the element, and any unclosed element inside it."""
+        for pos in range(len(self.stack) - 1, 0, -1):
+            if self.stack[pos].tag == tag:
+                del self.stack[pos:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        """Add text to the current element."""
+        self.stack[-1].children.append(data)
+
+
+def parse_html(html: str) -> HtmlNode:
+    """Parse serialized HTML into an HtmlNode tree.
+
+    Args:
+        html (str): The HTML, usually an ``outerHTML``.
+
+    Returns:
+        HtmlNode: The root of the tree; the snapshot element is its first child.
+
+    """
+    parser = SnapshotParser()
+    parser.feed(html)
+    parser.close()
+    return parser.root
+
+
+class TableSnapshot(CrawJUD):
+    """Read page fragments in a single WebDriver call and query them locally."""
+
+    def __init__(self) -> None:
+        """Initialize the TableSnapshot instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    def take(self, element: WebElement) -> HtmlNode:
+        """Snapshot an element and everything inside it.
+
+        Args:
+            element (WebElement): The element to read (usually a table).
+
+        Returns:
+            HtmlNode: The parsed copy of the element.
+
+        """
+        root = parse_html(element.get_attribute("outerHTML") or "")
+        return next(root.iter(), root)
+
+    def rows(self, element: WebElement) -> list[HtmlNode]:
+        """Snapshot a table and return its rows.
+
+        Args:
+            element (WebElement): The table (or table section) to read.
+
+        Returns:
+            list[HtmlNode]: Every ``tr`` of the table, in document order.
+
+        """
+        return self.take(element).find_all("tr")
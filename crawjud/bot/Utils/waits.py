@@ -0,0 +1,328 @@
+"""Waits module: Wait for pages to settle instead of sleeping for fixed periods.
+
+This module provides the WaitEngine class. A small script, registered through CDP
+(``Page.addScriptToEvaluateOnNewDocument``) so it runs before the page scripts of
+every document, counts the XHR/fetch requests in flight and records the last DOM
+mutation seen by a MutationObserver. ``WaitEngine.idle`` polls it together with
+``jQuery.active`` and the PrimeFaces ajax queue, and returns as soon as the page is
+idle rather than after a fixed ``sleep``.
+
+The time spent waiting is accounted per spreadsheet row, so the execution log shows
+how much of each row was spent waiting on the site versus working.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from os import getenv
+from pathlib import Path
+
+from selenium.common.exceptions import (
+    NoSuchWindowException,
+    UnexpectedAlertPresentException,
+    WebDriverException,
+)
+
+from crawjud.bot.common.exceptions import ExecutionError
+from crawjud.bot.core import CrawJUD
+from crawjud.bot.Utils.profiling import timed
+
+logger = logging.getLogger(__name__)
+
+# Per-site tunables, in seconds. Override with WAIT_<SITE>_<KEY>, e.g. WAIT_ELAW_TIMEOUT=45
+#   timeout: longest wait for the page to go idle
+#   quiet: DOM quiet period that counts as idle
+#   settle: longest wait for the DOM to go quiet once the network is idle
+#   poll: polling interval
+SITE_TUNABLES: dict[str, dict[str, float]] = {
+    "default": {"timeout": 15.0, "quiet": 0.25, "settle": 2.0, "poll": 0.1},
+    "elaw": {"timeout": 30.0, "quiet": 0.35, "settle": 2.0, "poll": 0.1},
+    "esaj": {"timeout": 20.0, "quiet": 0.3, "settle": 2.0, "poll": 0.1},
+    "caixa": {"timeout": 30.0, "quiet": 0.5, "settle": 3.0, "poll": 0.2},
+    "calculadoras": {"timeout": 20.0, "quiet": 0.3, "settle": 2.0, "poll": 0.1},
+    "projudi": {"timeout": 20.0, "quiet": 0.3, "settle": 2.0, "poll": 0.1},
+    "pje": {"timeout": 20.0, "quiet": 0.3, "settle": 2.0, "poll": 0.1},
+}
+
+IDLE_SCRIPT = """
+(() => {
+    if (window.__crawjudIdle) {
+        return;
+    }
+    const state = (window.__crawjudIdle = { pending: 0, lastChange: Date.now() });
+    const touch = () => {
+        state.lastChange = Date.now();
+    };
+    const start = () => {
+        state.pending += 1;
+        touch();
+    };
+    const done = () => {
+        state.pending = Math.max(0, state.pending - 1);
+        touch();
+    };
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        start();
+        this.addEventListener("loadend", done, { once: true });
+        return send.apply(this, args);
+    };
+    if (window.fetch) {
+        const fetch = window.fetch;
+        window.fetch = function (...args) {
+            start();
+            return fetch.apply(this, args).finally(done);
+        };
+    }
+    const observe = () =>
+        new MutationObserver(touch).observe(document.documentElement, {
+            subtree: true,
+            childList: true,
+            attributes: true,
+            characterData: true,
+        });
+    if (document.documentElement) {
+        observe();
+    } else {
+        document.addEventListener("DOMContentLoaded", observe);
+    }
+})();
+"""
+
+STATE_SCRIPT = """
+const state = window.__crawjudIdle;
+const jquery = window.jQuery ? window.jQuery.active : 0;
+const queue = window.PrimeFaces && PrimeFaces.ajax && PrimeFaces.ajax.Queue;
+const primefaces = queue && queue.isEmpty ? !queue.isEmpty() : false;
+return [
+    document.readyState,
+    state ? state.pending + jquery + (primefaces ? 1 : 0) : -1,
+    state ? Date.now() - state.lastChange : -1,
+];
+"""
+
+
+class WaitEngine(CrawJUD):
+    """Wait on page conditions and account the waiting time per row.
+
+    Attributes:
+        installed_ (set[str]): WebDriver sessions with the idle script registered.
+        waited_ (float): Seconds waited in the current row.
+        current_row_ (int): The row being accounted.
+        row_started_ (float): When the current row started.
+        total_waited_ (float): Seconds waited in the whole execution.
+        owner_pid_ (int): Process the counters belong to (a forked worker starts its own).
+
+    """
+
+    installed_: set[str] = set()
+    waited_: float = 0.0
+    current_row_: int = None
+    row_started_: float = None
+    total_waited_: float = 0.0
+    owner_pid_: int = None
+
+    def __init__(self) -> None:
+        """Initialize the WaitEngine instance.
+
+        No additional parameters are required during initialization.
+        """
+
+    @property
+    def tunables(self) -> dict[str, float]:
+        """The wait tunables of the current site."""
+        site = str(self.system or "default").lower()
+        values = dict(SITE_TUNABLES.get(site, SITE_TUNABLES["default"]))
+        for key in values:
+            value = getenv(f"WAIT_{site.upper()}_{key.upper()}")
+            if value:
+                values[key] = float(value)
+
+        return values
+
+    def install(self) -> None:
+        """Register the idle script for every new document of the current session."""
+        session_id = self.driver.session_id
+        if session_id in WaitEngine.installed_:
+            return
+
+        WaitEngine.installed_.add(session_id)
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": IDLE_SCRIPT})
+
+        except (AttributeError, WebDriverException):
+            logger.debug("CDP indisponível, o script de espera será injetado por página")
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep for a short while, accounting the time and honouring stop requests.
+
+        Args:
+            seconds (float): The time to sleep.
+
+        Raises:
+            ExecutionError: If a stop was requested for the execution.
+
+        """
+        started = time.perf_counter()
+        try:
+            if self.stop_signal.wait(seconds):
+                raise ExecutionError(message="Execução interrompida pelo usuário")
+
+        finally:
+            self.account(time.perf_counter() - started)
+
+    def idle(self, timeout: float = None) -> bool:
+        """Wait until the page is idle.
+
+        The page is idle when the document is loaded, no XHR/fetch, jQuery or
+        PrimeFaces request is in flight, and the DOM has not changed for the
+        ``quiet`` period. Pages that keep mutating (clocks, carousels) count as
+        idle ``settle`` seconds after the network went idle.
+
+        Args:
+            timeout (float, optional): The longest wait. Defaults to the site ``timeout``.
+
+        Returns:
+            bool: True if the page went idle, False if the timeout was reached.
+
+        Raises:
+            ExecutionError: If a stop was requested for the execution.
+
+        """
+        tunables = self.tunables
+        timeout = tunables["timeout"] if timeout is None else timeout
+        quiet_ms = tunables["quiet"] * 1000
+
+        self.install()
+        started = time.perf_counter()
+        network_idle_at = None
+        try:
+            while True:
+                now = time.perf_counter()
+                try:
+                    ready, pending, quiet_for = self.driver.execute_script(STATE_SCRIPT)
+                    if pending < 0:
+                        self.driver.execute_script(IDLE_SCRIPT)
+
+                    elif ready == "complete" and pending == 0:
+                        network_idle_at = network_idle_at or now
+                        if quiet_for >= quiet_ms or now - network_idle_at >= tunables["settle"]:
+                            return True
+
+                    else:
+                        network_idle_at = None
+
+                except (UnexpectedAlertPresentException, NoSuchWindowException):
+                    # A dialog is waiting for the bot, or the window was closed: nothing to wait for
+                    return True
+
+                except WebDriverException:
+                    # The page is navigating; poll again
+                    network_idle_at = None
+
+                if now - started >= timeout:
+                    logger.debug("Página não ficou ociosa em %.1fs", timeout)
+                    return False
+
+                if self.stop_signal.wait(tunables["poll"]):
+                    raise ExecutionError(message="Execução interrompida pelo usuário")
+
+        finally:
+            self.account(time.perf_counter() - started)
+
+    @timed("download")
+    def for_file(self, path_file: str | Path, timeout: float = None) -> bool:
+        """Wait until a downloaded file exists and its size stops changing.
+
+        Args:
+            path_file (str | Path): The expected file.
+            timeout (float, optional): The longest wait. Defaults to the site ``timeout``.
+
+        Returns:
+            bool: True if the file is complete, False if the timeout was reached.
+
+        Raises:
+            ExecutionError: If a stop was requested for the execution.
+
+        """
+        tunables = self.tunables
+        timeout = tunables["timeout"] if timeout is None else timeout
+        path_file = Path(path_file)
+        partial = path_file.with_name(f"{path_file.name}.crdownload")
+
+        started = time.perf_counter()
+        last_size = -1
+        try:
+            while time.perf_counter() - started < timeout:
+                if path_file.exists() and not partial.exists():
+                    size = path_file.stat().st_size
+                    if size > 0 and size == last_size:
+                        return True
+
+                    last_size = size
+
+                if self.stop_signal.wait(tunables["poll"] * 2):
+                    raise ExecutionError(message="Execução interrompida pelo usuário")
+
+            return path_file.exists()
+
+        finally:
+            self.account(time.perf_counter() - started)
+
+    def account(self, seconds: float) -> None:
+        """Add waiting time to the current row.
+
+        Args:
+            seconds (float): The time waited.
+
+        """
+        if WaitEngine.owner_pid_ != os.getpid():
+            WaitEngine.owner_pid_ = os.getpid()
+            WaitEngine.waited_ = WaitEngine.total_waited_ = 0.0
+            WaitEngine.row_started_ = None
+
+        WaitEngine.waited_ += seconds
+        WaitEngine.total_waited_ += seconds
+        if seconds and self.phase_timer is not None:
+            self.phase_timer.record("espera", seconds)
+
+    def start_row(self, row: int) -> None:
+        """Log the timing of the previous row and start accounting a new one.
+
+        Args:
+            row (int): The row being started.
+
+        """
+        self.account(0.0)
+
+        now = time.perf_counter()
+        if WaitEngine.row_started_ is not None:
+            elapsed = now - WaitEngine.row_started_
+            logger.info(
+                "PID %s linha %s: %.1fs aguardando o site, %.1fs trabalhando",
+                self.pid,
+                WaitEngine.current_row_,
+                WaitEngine.waited_,
+                max(elapsed - WaitEngine.waited_, 0.0),
+            )
+
+        WaitEngine.current_row_ = row
+        WaitEngine.row_started_ = now
+        WaitEngine.waited_ = 0.0
+
+    def report(self, execution_time: float) -> str:
+        """Return the summary of time spent waiting on the site.
+
+        Args:
+            execution_time (float): The total execution time, in seconds.
+
+        Returns:
+            str: The summary message.
+
+        """
+        waited = min(WaitEngine.total_waited_, execution_time)
+        percent = (waited / execution_time * 100) if execution_time else 0
+        minutes, seconds = divmod(int(waited), 60)
+        return f"Tempo aguardando o site: {minutes} minutos e {seconds} segundos ({percent:.0f}% da execução)"
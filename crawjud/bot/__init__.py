@@ -45,6 +45,7 @@ class WorkerBot:
 
     Note:
         All launcher methods are decorated with @shared_task for Celery integration.
+        Each execution leases a warm Chrome session from ``DriverPool`` when possible.
 
     """
 
@@ -79,6 +80,7 @@ class WorkerBot:
 
         """
         from crawjud.bot.scripts import Projudi
+        from crawjud.bot.Utils.Driver.pool import DriverPool
 
         bot_class = Projudi
         try:
@@ -87,17 +89,18 @@ class WorkerBot:
             typebot = kwargs.get("typebot")
             logger.info("Starting bot %s with system %s and type %s", display_name, system, typebot)
 
-            process = BotThread(target=bot_class, args=args, kwargs=kwargs)
-            process.daemon = True
-            process.start()
-            sleep(2)
+            with DriverPool.lease(kwargs) as pool_kwargs:
+                process = BotThread(target=bot_class, args=args, kwargs={**kwargs, **pool_kwargs})
+                process.daemon = True
+                process.start()
+                sleep(2)
 
-            if not process.is_alive():
-                try:
-                    process.join()
-                except Exception as e:
-                    raise e
-            process.join()
+                if not process.is_alive():
+                    try:
+                        process.join()
+                    except Exception as e:
+                        raise e
+                process.join()
 
         except Exception as e:
             raise e
@@ -126,6 +129,7 @@ class WorkerBot:
 
         """
         from crawjud.bot.scripts import Esaj
+        from crawjud.bot.Utils.Driver.pool import DriverPool
 
         bot_class = Esaj
         try:
@@ -134,17 +138,18 @@ class WorkerBot:
             typebot = kwargs.get("typebot")
             logger.info("Starting bot %s with system %s and type %s", display_name, system, typebot)
 
-            process = BotThread(target=bot_class, args=args, kwargs=kwargs)
-            process.daemon = True
-            process.start()
-            sleep(2)
+            with DriverPool.lease(kwargs) as pool_kwargs:
+                process = BotThread(target=bot_class, args=args, kwargs={**kwargs, **pool_kwargs})
+                process.daemon = True
+                process.start()
+                sleep(2)
 
-            if not process.is_alive():
-                try:
-                    process.join()
-                except Exception as e:
-                    raise e
-            process.join()
+                if not process.is_alive():
+                    try:
+                        process.join()
+                    except Exception as e:
+                        raise e
+                process.join()
 
         except Exception as e:
             raise e
@@ -173,6 +178,7 @@ class WorkerBot:
 
         """
         from crawjud.bot.scripts import PJe
+        from crawjud.bot.Utils.Driver.pool import DriverPool
 
         bot_class = PJe
         try:
@@ -181,17 +187,18 @@ class WorkerBot:
             typebot = kwargs.get("typebot")
             logger.info("Starting bot %s with system %s and type %s", display_name, system, typebot)
 
-            process = BotThread(target=bot_class, args=args, kwargs=kwargs)
-            process.daemon = True
-            process.start()
-            sleep(2)
+            with DriverPool.lease(kwargs) as pool_kwargs:
+                process = BotThread(target=bot_class, args=args, kwargs={**kwargs, **pool_kwargs})
+                process.daemon = True
+                process.start()
+                sleep(2)
 
-            if not process.is_alive():
-                try:
-                    process.join()
-                except Exception as e:
-                    raise e
-            process.join()
+                if not process.is_alive():
+                    try:
+                        process.join()
+                    except Exception as e:
+                        raise e
+                process.join()
 
         except Exception as e:
             raise e
@@ -220,6 +227,7 @@ class WorkerBot:
 
         """
         from crawjud.bot.scripts import Elaw
+        from crawjud.bot.Utils.Driver.pool import DriverPool
 
         bot_class = Elaw
         try:
@@ -228,17 +236,18 @@ class WorkerBot:
             typebot = kwargs.get("typebot")
             logger.info("Starting bot %s with system %s and type %s", display_name, system, typebot)
 
-            process = BotThread(target=bot_class, args=args, kwargs=kwargs)
-            process.daemon = True
-            process.start()
-            sleep(2)
+            with DriverPool.lease(kwargs) as pool_kwargs:
+                process = BotThread(target=bot_class, args=args, kwargs={**kwargs, **pool_kwargs})
+                process.daemon = True
+                process.start()
+                sleep(2)
 
-            if not process.is_alive():
-                try:
-                    process.join()
-                except Exception as e:
-                    raise e
-            process.join()
+                if not process.is_alive():
+                    try:
+                        process.join()
+                    except Exception as e:
+                        raise e
+                process.join()
 
         except Exception as e:
             raise e
@@ -267,6 +276,7 @@ class WorkerBot:
 
         """
         from crawjud.bot.scripts import Caixa
+        from crawjud.bot.Utils.Driver.pool import DriverPool
 
         bot_class = Caixa
         try:
@@ -275,17 +285,18 @@ class WorkerBot:
             typebot = kwargs.get("typebot")
             logger.info("Starting bot %s with system %s and type %s", display_name, system, typebot)
 
-            process = BotThread(target=bot_class, args=args, kwargs=kwargs)
-            process.daemon = True
-            process.start()
-            sleep(2)
+            with DriverPool.lease(kwargs) as pool_kwargs:
+                process = BotThread(target=bot_class, args=args, kwargs={**kwargs, **pool_kwargs})
+                process.daemon = True
+                process.start()
+                sleep(2)
 
-            if not process.is_alive():
-                try:
-                    process.join()
-                except Exception as e:
-                    raise e
-            process.join()
+                if not process.is_alive():
+                    try:
+                        process.join()
+                    except Exception as e:
+                        raise e
+                process.join()
 
         except Exception as e:
             raise e
@@ -314,6 +325,7 @@ class WorkerBot:
 
         """
         from crawjud.bot.scripts import Calculadoras
+        from crawjud.bot.Utils.Driver.pool import DriverPool
 
         bot_class = Calculadoras
         try:
@@ -322,17 +334,18 @@ class WorkerBot:
             typebot = kwargs.get("typebot")
             logger.info("Starting bot %s with system %s and type %s", display_name, system, typebot)
 
-            process = BotThread(target=bot_class, args=args, kwargs=kwargs)
-            process.daemon = True
-            process.start()
-            sleep(2)
+            with DriverPool.lease(kwargs) as pool_kwargs:
+                process = BotThread(target=bot_class, args=args, kwargs={**kwargs, **pool_kwargs})
+                process.daemon = True
+                process.start()
+                sleep(2)
 
-            if not process.is_alive():
-                try:
-                    process.join()
-                except Exception as e:
-                    raise e
-            process.join()
+                if not process.is_alive():
+                    try:
+                        process.join()
+                    except Exception as e:
+                        raise e
+                process.join()
 
         except Exception as e:
             raise e
@@ -344,7 +357,8 @@ class WorkerBot:
         """Stop a running bot process gracefully.
 
         Attempts to stop a bot process using either task_id or process ID. Creates a flag
-        file to signal the process to terminate if direct task termination is not possible.
+        file and publishes the Redis stop signal to terminate the process if direct task
+        termination is not possible.
 
         Args:
             task_id (int): Celery task identifier.
@@ -358,6 +372,8 @@ class WorkerBot:
             Exception: If process termination fails.
 
         """
+        from crawjud.bot.common.stop_signal import publish_stop
+
         try:
             process = None
             if task_id:
@@ -370,6 +386,8 @@ class WorkerBot:
                 with path_flag.open("w") as f:
                     f.write("Encerrar processo")
 
+                publish_stop(pid)
+
             return f"Process {task_id} stopped!"
 
         except Exception as e:
@@ -395,6 +413,8 @@ class WorkerBot:
             or error messages.
 
         """
+        from crawjud.bot.common.stop_signal import publish_stop
+
         try:
             path_flag = Path(app.config["TEMP_PATH"]).joinpath(pid).joinpath(f"{pid}.flag").resolve()
             process = None
@@ -422,6 +442,7 @@ class WorkerBot:
                 with path_flag.open("w") as f:
                     f.write("Encerrar processo")
 
+                publish_stop(pid)
                 return "Process stopped!"
 
             return "Process running!"
@@ -0,0 +1,79 @@
+"""Execution phase timings shared by the bots and the web application.
+
+The bots aggregate how long each phase of an execution took (login, search,
+waits, downloads, spreadsheet writes, whole rows) into a Redis hash per PID,
+``process:{pid}:phases``, with a count, a total and a histogram per phase. The
+logs page reads the same hash to render the phase breakdown. The hash expires
+with the other progress keys of the execution.
+"""
+
+from __future__ import annotations
+
+PHASES_TTL = 60 * 60 * 24 * 7
+PHASE_BUCKETS: tuple[float, ...] = (0.5, 1, 2, 5, 10, 30, 60, 120)
+
+
+def phases_key(pid: str) -> str:
+    """Return the Redis hash holding the phase timings of an execution.
+
+    Args:
+        pid (str): The execution PID.
+
+    Returns:
+        str: The hash key.
+
+    """
+    return f"process:{pid}:phases"
+
+
+def bucket_of(seconds: float) -> str:
+    """Return the histogram bucket of a duration.
+
+    Args:
+        seconds (float): The duration.
+
+    Returns:
+        str: The upper bound of the bucket (``inf`` for the last one).
+
+    """
+    for bound in PHASE_BUCKETS:
+        if seconds <= bound:
+            return f"{bound:g}"
+
+    return "inf"
+
+
+def decode_phases(values: dict[bytes | str, bytes | str]) -> list[dict[str, str | int | float]]:
+    """Turn the raw phase hash into rows for display.
+
+    Args:
+        values (dict[bytes | str, bytes | str]): The hash, fields ``{phase}:count``,
+            ``{phase}:total``, ``{phase}:max`` and ``{phase}:le:{bucket}``.
+
+    Returns:
+        list[dict[str, str | int | float]]: One entry per phase, slowest first, with
+        ``phase``, ``count``, ``total``, ``mean``, ``max``, ``share`` (percent of the
+        row time, or of all phases when rows were not timed) and ``histogram``.
+
+    """
+    phases: dict[str, dict[str, str | int | float]] = {}
+    for key, value in values.items():
+        key = key.decode() if isinstance(key, bytes) else key
+        value = value.decode() if isinstance(value, bytes) else value
+        phase, _, field = key.partition(":")
+        entry = phases.setdefault(phase, {"phase": phase, "count": 0, "total": 0.0, "max": 0.0, "histogram": {}})
+        if field.startswith("le:"):
+            entry["histogram"][field[3:]] = int(value)
+        elif field == "count":
+            entry["count"] = int(value)
+        elif field in {"total", "max"}:
+            entry[field] = float(value)
+
+    reference = phases["linha"]["total"] if "linha" in phases else sum(entry["total"] for entry in phases.values())
+    for entry in phases.values():
+        entry["mean"] = entry["total"] / entry["count"] if entry["count"] else 0.0
+        entry["share"] = entry["total"] / reference * 100 if reference else 0.0
+        buckets = [*(f"{bound:g}" for bound in PHASE_BUCKETS), "inf"]
+        entry["histogram"] = [(bucket, entry["histogram"].get(bucket, 0)) for bucket in buckets]
+
+    return sorted(phases.values(), key=lambda entry: entry["total"], reverse=True)
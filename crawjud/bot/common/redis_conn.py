@@ -0,0 +1,51 @@
+"""Redis connection shared by the bots and the web application.
+
+The web application keeps its own clients (``app.extensions["redis"]``) on
+``REDIS_HOST``/``REDIS_PORT``, database ``REDIS_DB_LOGS``. ``REDIS_URL`` holds the
+server only (the Celery settings append the broker and backend databases to it),
+so the bots point their clients at that same database through ``redis_url()``: the
+keys they publish for the web application (phase timings) and the keys both sides
+use (stop flags, checkpoints, output index, lookup cache, saved sessions) live there.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from os import getenv
+from urllib.parse import urlsplit
+
+import redis
+
+
+def redis_url() -> str:
+    """Return the URL of the Redis database shared by the bots and the web application.
+
+    Returns:
+        str: The server of ``REDIS_HOST``/``REDIS_PORT`` (or of ``REDIS_URL`` when
+            ``REDIS_HOST`` is not set), with the ``REDIS_DB_LOGS`` database.
+
+    """
+    host = getenv("REDIS_HOST")
+    if host:
+        scheme, netloc = "redis", f"{host}:{getenv('REDIS_PORT') or '6379'}"
+    else:
+        parts = urlsplit(getenv("REDIS_URL") or "redis://localhost:6379")
+        scheme, netloc = parts.scheme, parts.netloc
+
+    return f"{scheme}://{netloc}/{getenv('REDIS_DB_LOGS') or '0'}"
+
+
+@lru_cache(maxsize=4)
+def redis_client(decode_responses: bool = False, socket_timeout: float | None = 2) -> redis.Redis:
+    """Return a client of the shared Redis database, one per process and settings.
+
+    Args:
+        decode_responses (bool, optional): Return ``str`` instead of ``bytes``.
+        socket_timeout (float | None, optional): Socket timeout; None for blocking
+            subscriptions.
+
+    Returns:
+        redis.Redis: The client.
+
+    """
+    return redis.Redis.from_url(redis_url(), decode_responses=decode_responses, socket_timeout=socket_timeout)
@@ -0,0 +1,129 @@
+"""Cross-node stop signal for running bots.
+
+The web application publishes the stop request of an execution on a Redis channel
+(and keeps it in a key for a day, in case the bot subscribes later). Each bot
+process listens to its own channel in a daemon thread and sets an in-process event,
+so waits and row loops notice the stop within a second on any worker node, without
+sharing the output directory with the web application.
+
+The key lives in the database of ``redis_conn.redis_url()`` (``REDIS_DB_LOGS``); it
+was kept in database 0 of ``REDIS_URL`` before. Channels do not belong to a database,
+so only a stop requested before the move and not yet received is missed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from threading import Event, Thread
+
+import redis
+
+from crawjud.bot.common.redis_conn import redis_client
+
+logger = logging.getLogger(__name__)
+
+STOP_TTL = 60 * 60 * 24
+
+
+def stop_channel(pid: str) -> str:
+    """Return the Redis channel (and key) used to stop an execution.
+
+    Args:
+        pid (str): The execution PID.
+
+    Returns:
+        str: The channel name.
+
+    """
+    return f"crawjud:stop:{pid}"
+
+
+def publish_stop(pid: str) -> None:
+    """Ask the bot running the execution to stop.
+
+    Args:
+        pid (str): The execution PID.
+
+    """
+    try:
+        client = redis_client(socket_timeout=None)
+        client.set(stop_channel(pid), "1", ex=STOP_TTL)
+        client.publish(stop_channel(pid), "stop")
+
+    except redis.RedisError as e:
+        logger.warning("Falha ao publicar parada do PID %s: %s", pid, str(e))
+
+
+class StopSignal:
+    """In-process cancellation event fed by the Redis stop channel.
+
+    Attributes:
+        event (Event): Set once a stop was requested for the execution.
+        owner_pid (int): OS process running the listener (a forked worker starts its own).
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the StopSignal."""
+        self.event = Event()
+        self.owner_pid = None
+
+    def listen(self, pid: str) -> None:
+        """Start listening for the stop request of an execution.
+
+        Args:
+            pid (str): The execution PID.
+
+        """
+        if self.owner_pid == os.getpid():
+            return
+
+        self.owner_pid = os.getpid()
+        Thread(target=self.run, args=(pid,), name="stop-signal", daemon=True).start()
+
+    def run(self, pid: str) -> None:
+        """Wait for the stop message of the execution and set the event.
+
+        Args:
+            pid (str): The execution PID.
+
+        """
+        try:
+            client = redis_client(socket_timeout=None)
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(stop_channel(pid))
+
+            # A stop published before the subscription is kept in the key
+            if client.exists(stop_channel(pid)):
+                self.event.set()
+                return
+
+            for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self.event.set()
+                    return
+
+        except redis.RedisError as e:
+            logger.warning("Canal de parada indisponível para o PID %s: %s", pid, str(e))
+
+    def is_set(self) -> bool:
+        """Return whether a stop was requested.
+
+        Returns:
+            bool: True once the stop message was received.
+
+        """
+        return self.event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep for up to ``timeout`` seconds, waking up as soon as a stop is requested.
+
+        Args:
+            timeout (float): The maximum time to sleep.
+
+        Returns:
+            bool: True if a stop was requested.
+
+        """
+        return self.event.wait(timeout)
@@ -10,10 +10,15 @@ import json
 import logging
 import platform
 import traceback
+from contextlib import suppress
 from datetime import datetime
+from importlib import import_module
 from pathlib import Path
+from typing import Iterator
 
 import pandas as pd
+from billiard import get_context
+from billiard.context import Process
 from openai import OpenAI
 from pytz import timezone
 
@@ -141,6 +146,12 @@ class CrawJUD(PropertiesCrawJUD):
         self.row = 0
 
         try:
+            # Kept to build the bot again in worker processes (see ``spawn_worker``)
+            self.launch_kwargs = {
+                key: str(value) if key == "path_args" else value
+                for key, value in kwargs.items()
+                if isinstance(value, (str, int, float, bool, Path))
+            }
             self.kwargs = kwargs
             list_kwargs = list(kwargs.items())
             for key, value in list_kwargs:
@@ -166,6 +177,7 @@ class CrawJUD(PropertiesCrawJUD):
 
         try:
             self.init_log_bot()
+            self.stop_signal.listen(self.pid)
             self.message = "Inicializando robô"
             self.type_log = "log"
             self.prt()
@@ -184,20 +196,21 @@ class CrawJUD(PropertiesCrawJUD):
             if self.name_cert:
                 self.install_cert()
 
-            time_xlsx = datetime.now(timezone("America/Manaus")).strftime("%d-%m-%y")
-
-            self.path = Path(self.output_dir_path).joinpath(f"Sucessos - PID {self.pid} {time_xlsx}.xlsx").resolve()
+            self.path, self.path_erro = self.output_paths()
 
-            self.path_erro = Path(self.output_dir_path).joinpath(f"Erros - PID {self.pid} {time_xlsx}.xlsx").resolve()
-
-            self.name_colunas = self.MakeXlsx.make_output("sucesso", self.path)
-            self.MakeXlsx.make_output("erro", self.path_erro)
+            # Ao retomar, as planilhas da execução anterior são mantidas
+            keep_existing = bool(self.resume or self.worker_id)
+            self.name_colunas = self.MakeXlsx.make_output("sucesso", self.path, keep_existing=keep_existing)
+            self.MakeXlsx.make_output("erro", self.path_erro, keep_existing=keep_existing)
 
             if not self.xlsx and self.data_inicio is not None:
                 self.data_inicio = datetime.strptime(self.data_inicio, "%Y-%m-%d")
                 self.data_fim = datetime.strptime(self.data_fim, "%Y-%m-%d")
 
-            driver, wait = self.driver_launch()
+            if self.pooled_session:
+                driver, wait = self.use_pooled(self.pooled_session)
+            else:
+                driver, wait = self.driver_launch()
 
             self.driver = driver
             self.wait = wait
@@ -215,6 +228,37 @@ class CrawJUD(PropertiesCrawJUD):
 
             raise e
 
+    def output_paths(self) -> tuple[Path, Path]:
+        """Return the success and error spreadsheets of the execution.
+
+        The names carry the start date, so they are saved in the arguments file on
+        the first run and reused by worker processes and when the execution is
+        resumed on a later day.
+
+        Returns:
+            tuple[Path, Path]: The success and error spreadsheet paths.
+
+        """
+        reuse = self.resume or self.worker_id
+        saved = self.output_files if reuse and isinstance(self.output_files, dict) else None
+        if saved and saved.get("sucesso") and saved.get("erro"):
+            names = saved
+
+        else:
+            time_xlsx = datetime.now(timezone("America/Manaus")).strftime("%d-%m-%y")
+            names = {
+                "sucesso": f"Sucessos - PID {self.pid} {time_xlsx}.xlsx",
+                "erro": f"Erros - PID {self.pid} {time_xlsx}.xlsx",
+            }
+            with suppress(OSError, ValueError):
+                path_args = Path(self.path_args)
+                args_bot = json.loads(path_args.read_text())
+                args_bot.update({"output_files": names})
+                path_args.write_text(json.dumps(args_bot))
+
+        output_dir = Path(self.output_dir_path)
+        return output_dir.joinpath(names["sucesso"]).resolve(), output_dir.joinpath(names["erro"]).resolve()
+
     def auth_bot(self) -> None:
         """Authenticate the bot using the specified login method.
 
@@ -227,12 +271,24 @@ class CrawJUD(PropertiesCrawJUD):
 
         """
         try:
+            pooled = self.pooled_session
+            if pooled and pooled.auth_valid():
+                self.message = "Sessão autenticada reaproveitada"
+                self.type_log = "log"
+                self.prt()
+                return
+
+            if pooled:
+                pooled.authenticated.value = 0
+
             if self.login_method:
                 chk_logged = self.AuthBot()
                 if chk_logged is True:
                     self.message = "Login efetuado com sucesso!"
                     self.type_log = "log"
                     self.prt()
+                    if pooled:
+                        pooled.authenticated.value = 1
 
                 elif chk_logged is False:
                     self.driver.quit()
@@ -254,3 +310,114 @@ class CrawJUD(PropertiesCrawJUD):
                 self.driver.quit()
 
             raise e
+
+    def shard_rows(self, frame: list[dict[str, str]]) -> Iterator[tuple[int, dict[str, str]]]:
+        """Return the (position, row) pairs this process must handle.
+
+        With the opt-in ``workers`` argument greater than 1, the rows are split
+        round-robin across N browser sessions: the main process keeps the first
+        shard with its current driver, and one worker process is started for each
+        remaining shard. Workers are started with the spawn context, since the
+        bot process already runs threads (log shipper, stop listener, download
+        observer) whose locks a forked child could inherit while held; each worker
+        builds the bot again from the launch arguments (see ``spawn_worker``).
+        Positions always refer to the original spreadsheet, so
+        ``self.row`` and the progress sent by ``prt()`` stay correct. When the
+        execution is resumed, rows finished by the previous run are dropped first
+        (see ``Checkpoint``). Between rows, the browser is restarted if it grew
+        past the memory cap of its profile (see ``DriverBot.recycle``).
+
+        Args:
+            frame (list[dict[str, str]]): The rows loaded by ``dataFrame()``.
+
+        Returns:
+            Iterator[tuple[int, dict[str, str]]]: The rows of this process with their positions.
+
+        """
+        if PropertiesCrawJUD.assigned_rows_ is not None:
+            return self.recycling(PropertiesCrawJUD.assigned_rows_)
+
+        rows = list(enumerate(frame))
+        if self.resume:
+            rows = self.checkpoint.pending(rows)
+
+        try:
+            workers = min(int(self.workers or 1), len(rows))
+        except (TypeError, ValueError):
+            workers = 1
+
+        if workers <= 1:
+            return self.recycling(rows)
+
+        shards = [rows[pos::workers] for pos in range(workers)]
+        context = get_context("spawn")
+        bot_class = type(self)
+        for worker_id in range(1, workers):
+            process = context.Process(
+                target=spawn_worker,
+                args=(bot_class.__module__, bot_class.__name__, self.launch_kwargs, worker_id, shards[worker_id]),
+            )
+            process.daemon = False
+            process.start()
+            PropertiesCrawJUD.worker_processes_.append(process)
+
+        self.message = f"Execução paralela iniciada com {workers} navegadores"
+        self.type_log = "log"
+        self.prt()
+
+        return self.recycling(shards[0])
+
+    def recycling(self, rows: list[tuple[int, dict[str, str]]]) -> Iterator[tuple[int, dict[str, str]]]:
+        """Yield the rows, checking the browser memory before each row but the first.
+
+        Args:
+            rows (list[tuple[int, dict[str, str]]]): The rows with their positions.
+
+        Yields:
+            tuple[int, dict[str, str]]: The next row with its position.
+
+        """
+        for count, row in enumerate(rows):
+            if count:
+                self.recycle_driver()
+
+            yield row
+
+    def join_workers(self) -> None:
+        """Wait for the worker processes of a parallel execution to finish."""
+        while PropertiesCrawJUD.worker_processes_:
+            process: Process = PropertiesCrawJUD.worker_processes_.pop()
+            process.join()
+
+            if process.exitcode:
+                self.message = f"Worker {process.name} encerrado com código {process.exitcode}"
+                self.type_log = "error"
+                self.prt()
+
+
+def spawn_worker(
+    module: str,
+    name: str,
+    kwargs: dict[str, str | int],
+    worker_id: int,
+    rows: list[tuple[int, dict[str, str]]],
+) -> None:
+    """Run a shard of a parallel execution inside a spawned worker process.
+
+    The bot is built again from its launch arguments, so it sets up its own log
+    connection, stop listener and WebDriver session and logs in, then runs
+    ``execution()``, which picks the assigned rows through ``shard_rows``.
+
+    Args:
+        module (str): The module of the bot class.
+        name (str): The bot class name.
+        kwargs (dict[str, str | int]): The launch arguments of the bot.
+        worker_id (int): The worker index (starting at 1).
+        rows (list[tuple[int, dict[str, str]]]): The rows assigned to this worker.
+
+    """
+    PropertiesCrawJUD.worker_id_ = worker_id
+    PropertiesCrawJUD.assigned_rows_ = rows
+
+    bot: CrawJUD = getattr(import_module(module), name)(**kwargs)
+    bot.execution()
@@ -9,11 +9,11 @@ import re
 import shutil
 import time
 import traceback
+from concurrent.futures import Future
 from contextlib import suppress
-from time import sleep
+from pathlib import Path
 from typing import Self
 
-from pypdf import PdfReader
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
@@ -78,7 +78,7 @@ class Emissor(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -131,8 +131,8 @@ class Emissor(CrawJUD):
             self.proc_nattribut()
             self.dados_partes()
             self.info_deposito()
-            self.make_doc()
-            nameboleto = self.rename_pdf()
+            download = self.make_doc()
+            nameboleto = self.rename_pdf(download)
             data = self.get_val_doc_and_codebar(nameboleto)
             self.append_success(data)
 
@@ -151,20 +151,20 @@ class Emissor(CrawJUD):
         self.prt()
 
         self.driver.get("https://depositojudicial.caixa.gov.br/sigsj_internet/depositos-judiciais/justica-estadual/")
-        sleep(0.5)
+        self.wait_engine.idle()
         list_opt: WebElement = self.wait.until(
             ec.presence_of_element_located((By.CSS_SELECTOR, 'select[id="j_id5:filtroView:j_id6:tpDeposito"]')),
         )
-        sleep(0.5)
+        self.wait_engine.idle()
         list_options = list_opt.find_elements(By.TAG_NAME, "option")
 
         for option in list_options:
             if option.text == "Depósitos Judiciais da Justiça Estadual":
-                sleep(0.5)
+                self.wait_engine.idle()
                 option.click()
                 break
 
-        sleep(0.5)
+        self.wait_engine.idle()
         captchainput: WebElement = self.wait.until(
             ec.presence_of_element_located((By.CSS_SELECTOR, 'input[id="autoCaptcha"')),
         )
@@ -180,7 +180,7 @@ class Emissor(CrawJUD):
         next_btn = self.driver.find_element(By.CSS_SELECTOR, 'input[class="hand btnConfirmar"]')
         next_btn.click()
 
-        sleep(2)
+        self.wait_engine.idle()
         next_btn: WebElement = self.wait.until(
             ec.presence_of_element_located(
                 (By.CSS_SELECTOR, 'a[id="j_id5:filtroView:mensagemView:j_id77:btnProsseguir'),
@@ -419,11 +419,15 @@ class Emissor(CrawJUD):
             val_deposito = f"{val_deposito},00"
         campo_val_deposito.send_keys(val_deposito)
 
-    def make_doc(self) -> None:
+    def make_doc(self) -> Future[Path]:
         """Generate the deposit document and initiate the PDF download sequence.
 
         Trigger the system to create a deposit PDF that is saved for further
         renaming and data extraction.
+
+        Returns:
+            Future[Path]: The PDF download, resolved once the file is complete.
+
         """
         self.interact.wait_caixa()
         self.message = "Gerando documento"
@@ -437,28 +441,38 @@ class Emissor(CrawJUD):
         self.type_log = "log"
         self.prt()
         download_pdf = self.driver.find_element(By.CSS_SELECTOR, 'a[id="j_id5:filtroView:formFormulario:j_id554"]')
+        download = self.download_manager.expect("guia_boleto.pdf")
         download_pdf.click()
 
-    def rename_pdf(self) -> str:
+        return download
+
+    def rename_pdf(self, download: Future[Path]) -> str:
         """Rename and relocate the downloaded PDF with a standardized file name.
 
         Use bot_data for constructing the new name and move the file to its
         final output directory, then return the new filename.
 
+        Args:
+            download (Future[Path]): The PDF download started by ``make_doc``.
+
         Returns:
             str: New PDF filename after relocation.
 
+        Raises:
+            ExecutionError: If the download does not finish.
+
         """
         pgto_name = self.bot_data.get("NOME_CUSTOM", "Guia De Depósito")
 
         numproc = self.bot_data.get("NUMERO_PROCESSO")
         pdf_name = f"{pgto_name} - {numproc} - {self.bot_data.get('AUTOR')} - {self.pid}.pdf"
-        sleep(10)
 
-        caminho_old_pdf = os.path.join(self.output_dir_path, "guia_boleto.pdf")
         renamepdf = os.path.join(self.output_dir_path, pdf_name)
 
-        sleep(5)
+        caminho_old_pdf = self.download_manager.wait(download)
+        if caminho_old_pdf is None:
+            raise ExecutionError(message="Download da guia não concluído")
+
         shutil.move(caminho_old_pdf, renamepdf)
 
         return pdf_name
@@ -476,8 +490,6 @@ class Emissor(CrawJUD):
             list: Contains process information, including barcodes and deposit data.
 
         """
-        sleep(0.5)
-
         path_pdf = os.path.join(self.output_dir_path, pdf_name)
         # Inicialize uma lista para armazenar os números encontrados
         bar_code = ""
@@ -487,11 +499,7 @@ class Emissor(CrawJUD):
         pattern = r"\b\d{5}\.\d{5}\s*\d{5}\.\d{6}\s*\d{5}\.\d{6}\s*\d\s*\d{14}\b"
 
         pdf_file = path_pdf
-        read = PdfReader(pdf_file)
-
-        for page in read.pages:
-            text = page.extract_text()
-
+        for text in self.pdf_extractor.pages(pdf_file):
             with suppress(Exception):
                 # Use a expressão regular para encontrar números
                 numeros = re.findall(pattern, text)
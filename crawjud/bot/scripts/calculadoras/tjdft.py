@@ -10,7 +10,6 @@ import os
 import time
 import traceback
 from contextlib import suppress
-from time import sleep
 from typing import Self
 
 from selenium.common.exceptions import TimeoutException
@@ -81,7 +80,7 @@ class Tjdft(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -168,7 +167,7 @@ class Tjdft(CrawJUD):
                 )
 
             if check_cookies:
-                sleep(2)
+                self.wait_engine.idle()
 
                 aceitar_cookies_css = 'button[class="btn btn-primary btn-sm acceptcookies"]'
                 aceitar_cookies: WebElement = self.driver.find_element(By.CSS_SELECTOR, aceitar_cookies_css)
@@ -189,7 +188,7 @@ class Tjdft(CrawJUD):
 
         """
         try:
-            sleep(2)
+            self.wait_engine.idle()
             self.message = "Informando numero do processo"
             self.type_log = "log"
             self.prt()
@@ -218,7 +217,7 @@ class Tjdft(CrawJUD):
 
         """
         try:
-            sleep(2)
+            self.wait_engine.idle()
             css_name_requerente = 'input[name="requerente"][id="requerente"]'
             self.message = "Informando requerente"
             self.type_log = "log"
@@ -247,7 +246,7 @@ class Tjdft(CrawJUD):
 
         """
         try:
-            sleep(2)
+            self.wait_engine.idle()
             css_name_requerido = 'input[name="requerido"][id="requerido"]'
             self.message = "Informado requerido"
             self.type_log = "log"
@@ -300,6 +299,7 @@ class Tjdft(CrawJUD):
                         ec.presence_of_element_located((By.CSS_SELECTOR, 'input[id="juros_percent_variavel"]')),
                     ),
                     percent,
+                    mode="slow",
                 )
 
             if not juros_partir == "VENCIMENTO":
@@ -307,6 +307,7 @@ class Tjdft(CrawJUD):
                 self.interact.send_key(
                     self.driver.find_element(By.CSS_SELECTOR, css_data_incide),
                     self.bot_data.get("DATA_INCIDENCIA"),
+                    mode="slow",
                 )
 
         except Exception as e:
@@ -333,7 +334,7 @@ class Tjdft(CrawJUD):
             data_valor_devido.click()
             data_valor_devido.send_keys(self.bot_data.get("DATA_CALCULO"))
 
-            sleep(2)
+            self.wait_engine.idle()
             css_valor_devido = 'input[id="valor-0"][name="parcela_valor:list"]'
             self.message = "Informando valor devido"
             self.type_log = "log"
@@ -364,7 +365,7 @@ class Tjdft(CrawJUD):
 
         def multa_percentual() -> None | Exception:
             try:
-                sleep(1)
+                self.wait_engine.idle()
                 css_multa_percentual = 'input[name="multa_percent"][id="multa_percent"]'
                 self.message = "Informando multa percentual"
                 self.type_log = "log"
@@ -387,8 +388,8 @@ class Tjdft(CrawJUD):
                     valor = str(self.bot_data.get("MULTA_VALOR"))
                     valor = f"{valor},00" if "," not in valor else valor
 
-                    self.interact.send_key(multa_data, self.bot_data.get("MULTA_DATA"))
-                    self.interact.send_key(multa_valor, valor)
+                    self.interact.send_key(multa_data, self.bot_data.get("MULTA_DATA"), mode="slow")
+                    self.interact.send_key(multa_valor, valor, mode="slow")
 
                 self.message = "Multa informada"
                 self.type_log = "log"
@@ -417,7 +418,7 @@ class Tjdft(CrawJUD):
 
                     honorario_sucumb.send_keys(percent)
                     self.driver.execute_script(f"document.querySelector('{css_honorario_sucumb}').blur()")
-                    sleep(0.5)
+                    self.wait_engine.idle()
 
                     disabled_state = self.driver.find_element(
                         By.CSS_SELECTOR,
@@ -435,9 +436,13 @@ class Tjdft(CrawJUD):
                     valor = str(self.bot_data.get("HONORARIO_SUCUMB_VALOR"))
                     valor = f"{valor},00" if "," not in valor else valor
 
-                    self.interact.send_key(honor_sucumb_data, self.bot_data.get("HONORARIO_SUCUMB_DATA"))
-                    self.interact.send_key(honor_sucumb_valor, valor)
-                    self.interact.send_key(sucumb_juros_partir, self.bot_data.get("HONORARIO_SUCUMB_PARTIR"))
+                    self.interact.send_key(honor_sucumb_data, self.bot_data.get("HONORARIO_SUCUMB_DATA"), mode="slow")
+                    self.interact.send_key(honor_sucumb_valor, valor, mode="slow")
+                    self.interact.send_key(
+                        sucumb_juros_partir,
+                        self.bot_data.get("HONORARIO_SUCUMB_PARTIR"),
+                        mode="slow",
+                    )
 
                 self.message = "Percentual Honorários de Sucumbência informado"
                 self.type_log = "log"
@@ -450,7 +455,7 @@ class Tjdft(CrawJUD):
         def percent_multa_475J() -> None:  # noqa: N802
             try:
                 percent_multa_ = self.driver.find_element(By.CSS_SELECTOR, 'input[id="multa475_exec_percent"]')
-                self.interact.send_key(percent_multa_, self.bot_data.get("PERCENT_MULTA_475J"))
+                self.interact.send_key(percent_multa_, self.bot_data.get("PERCENT_MULTA_475J"), mode="slow")
 
             except Exception as e:
                 self.logger.exception("".join(traceback.format_exception(e)))
@@ -475,7 +480,7 @@ class Tjdft(CrawJUD):
 
                     honorario_exec.send_keys(percent)
                     self.driver.execute_script(f"document.querySelector('{css_honorario_exec}').blur()")
-                    sleep(0.5)
+                    self.wait_engine.idle()
 
                     disabled_state = self.driver.find_element(
                         By.CSS_SELECTOR,
@@ -490,9 +495,17 @@ class Tjdft(CrawJUD):
                     valor = str(self.bot_data.get("HONORARIO_CUMPRIMENTO_VALOR"))
                     valor = f"{valor},00" if "," not in valor else valor
 
-                    self.interact.send_key(honor_exec_data, self.bot_data.get("HONORARIO_CUMPRIMENTO_DATA"))
-                    self.interact.send_key(honor_exec_valor, valor)
-                    self.interact.send_key(exec_juros_partir, self.bot_data.get("HONORARIO_CUMPRIMENTO_PARTIR"))
+                    self.interact.send_key(
+                        honor_exec_data,
+                        self.bot_data.get("HONORARIO_CUMPRIMENTO_DATA"),
+                        mode="slow",
+                    )
+                    self.interact.send_key(honor_exec_valor, valor, mode="slow")
+                    self.interact.send_key(
+                        exec_juros_partir,
+                        self.bot_data.get("HONORARIO_CUMPRIMENTO_PARTIR"),
+                        mode="slow",
+                    )
 
                 self.message = "Informado Honorários de Cumprimento"
                 self.type_log = "log"
@@ -512,7 +525,7 @@ class Tjdft(CrawJUD):
                 data_custas.click()
                 data_custas.send_keys(self.bot_data.get("CUSTAS_DATA"))
 
-                sleep(2)
+                self.wait_engine.idle()
                 css_custas_valor = 'input[id="custas-valor-0"]'
                 self.message = "Informando valor devido"
                 self.type_log = "log"
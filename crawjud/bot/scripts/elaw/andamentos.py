@@ -71,7 +71,7 @@ class Andamentos(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -165,7 +165,7 @@ class Andamentos(CrawJUD):
             campo_data.send_keys(Keys.CONTROL, "a")
             sleep(0.5)
             campo_data.send_keys(Keys.BACKSPACE)
-            self.interact.send_key(campo_data, self.bot_data.get("DATA"))
+            self.interact.send_key(campo_data, self.bot_data.get("DATA"), mode="slow")
             campo_data.send_keys(Keys.TAB)
 
             self.interact.sleep_load('div[id="j_id_34"]')
@@ -191,7 +191,7 @@ class Andamentos(CrawJUD):
             ocorrencia = self.driver.find_element(By.CSS_SELECTOR, self.elements.inpt_ocorrencia)
             text_andamento = str(self.bot_data.get("OCORRENCIA")).replace("\t", "").replace("\n", "")
 
-            self.interact.send_key(ocorrencia, text_andamento)
+            self.interact.send_key(ocorrencia, text_andamento, mode="js")
 
         except Exception as e:
             self.logger.exception("".join(traceback.format_exception(e)))
@@ -214,7 +214,7 @@ class Andamentos(CrawJUD):
             observacao = self.driver.find_element(By.CSS_SELECTOR, self.elements.inpt_obs)
             text_andamento = str(self.bot_data.get("OBSERVACAO")).replace("\t", "").replace("\n", "")
 
-            self.interact.send_key(observacao, text_andamento)
+            self.interact.send_key(observacao, text_andamento, mode="js")
 
         except Exception as e:
             self.logger.exception("".join(traceback.format_exception(e)))
@@ -90,7 +90,7 @@ class Cadastro(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -220,7 +220,7 @@ class Cadastro(CrawJUD):
         text = str(self.bot_data.get("AREA_DIREITO"))
         sleep(0.5)
 
-        element_area_direito = wait.until(ec.presence_of_element_located((By.XPATH, self.elements.css_label_area)))
+        element_area_direito = wait.until(ec.presence_of_element_located(self.elements.locator("css_label_area")))
         self.select2_elaw(element_area_direito, text)
         self.interact.sleep_load('div[id="j_id_47"]')
 
@@ -243,7 +243,7 @@ class Cadastro(CrawJUD):
         text = str(self.bot_data.get("SUBAREA_DIREITO"))
         sleep(0.5)
 
-        element_subarea = wait.until(ec.presence_of_element_located((By.XPATH, self.elements.comboareasub_css)))
+        element_subarea = wait.until(ec.presence_of_element_located(self.elements.locator("comboareasub_css")))
         self.select2_elaw(element_subarea, text)
 
         self.interact.sleep_load('div[id="j_id_4p"]')
@@ -416,7 +416,7 @@ class Cadastro(CrawJUD):
         )
         campo_processo.click()
 
-        self.interact.send_key(campo_processo, self.bot_data.get(key))
+        self.interact.send_key(campo_processo, self.bot_data.get(key), mode="slow")
 
         self.driver.execute_script(f'document.querySelector("{css_campo_processo}").blur()')
         self.interact.sleep_load('div[id="j_id_4p"]')
@@ -509,7 +509,7 @@ class Cadastro(CrawJUD):
         sleep(0.05)
         campo_doc.clear()
         sleep(0.05)
-        self.interact.send_key(campo_doc, self.bot_data.get("DOC_PARTE_CONTRARIA"))
+        self.interact.send_key(campo_doc, self.bot_data.get("DOC_PARTE_CONTRARIA"), mode="slow")
         self.interact.sleep_load('div[id="j_id_4p"]')
 
         search_button_parte: WebElement = self.wait.until(
@@ -519,7 +519,8 @@ class Cadastro(CrawJUD):
         search_button_parte.click()
         self.interact.sleep_load('div[id="j_id_4p"]')
 
-        check_parte = self.check_part_found()
+        doc_parte = self.bot_data.get("DOC_PARTE_CONTRARIA")
+        check_parte = self.entity_cache.lookup("doc", doc_parte) or self.check_part_found()
 
         if not check_parte:
             try:
@@ -531,6 +532,8 @@ class Cadastro(CrawJUD):
                 self.logger.exception("".join(traceback.format_exception(e)))
                 raise ExecutionError(message="Não foi possível cadastrar parte", e=e) from e
 
+        self.entity_cache.remember("doc", doc_parte, True)
+
         self.messsage = "Parte adicionada!"
         self.type_log = "info"
         self.prt()
@@ -619,7 +622,7 @@ class Cadastro(CrawJUD):
 
         self.interact.clear(data_distribuicao)
 
-        self.interact.send_key(data_distribuicao, self.bot_data.get("DATA_DISTRIBUICAO"))
+        self.interact.send_key(data_distribuicao, self.bot_data.get("DATA_DISTRIBUICAO"), mode="slow")
         self.interact.send_key(data_distribuicao, Keys.TAB)
         self.interact.sleep_load('div[id="j_id_4p"]')
 
@@ -646,11 +649,15 @@ class Cadastro(CrawJUD):
         self.type_log = "log"
         prt()
 
+        adv_interno = bot_data.get("ADVOGADO_INTERNO")
+        if self.entity_cache.lookup("advogado_interno", adv_interno) is False:
+            raise ExecutionError(message="Advogado interno não encontrado")
+
         input_adv_responsavel: WebElement = wait.until(
-            ec.presence_of_element_located((By.XPATH, elements.adv_responsavel)),
+            ec.presence_of_element_located(elements.locator("adv_responsavel")),
         )
         input_adv_responsavel.click()
-        interact.send_key(input_adv_responsavel, bot_data.get("ADVOGADO_INTERNO"))
+        interact.send_key(input_adv_responsavel, adv_interno)
 
         id_input_adv = input_adv_responsavel.get_attribute("id").replace("_input", "_panel")
         css_wait_adv = f"span[id='{id_input_adv}'] > ul > li"
@@ -662,15 +669,21 @@ class Cadastro(CrawJUD):
                 ec.presence_of_element_located((By.CSS_SELECTOR, css_wait_adv)),
             )
 
-        if wait_adv:
-            wait_adv.click()
-        elif not wait_adv:
+        if not wait_adv:
+            # Only a search that answered with an empty list is cached as "not found";
+            # a slow autocomplete is searched again on the next row
+            if driver.find_elements(By.CSS_SELECTOR, f"span[id='{id_input_adv}'] > ul"):
+                self.entity_cache.remember("advogado_interno", adv_interno, False)
+
             raise ExecutionError(message="Advogado interno não encontrado")
 
+        self.entity_cache.remember("advogado_interno", adv_interno, True)
+        wait_adv.click()
+
         interact.sleep_load('div[id="j_id_4p"]')
 
         interact.sleep_load('div[id="j_id_4p"]')
-        element_select = wait.until(ec.presence_of_element_located((By.XPATH, elements.select_advogado_responsavel)))
+        element_select = wait.until(ec.presence_of_element_located(elements.locator("select_advogado_responsavel")))
         select2_elaw(element_select, bot_data.get("ADVOGADO_INTERNO"))
 
         id_element = element_select.get_attribute("id")
@@ -717,6 +730,7 @@ class Cadastro(CrawJUD):
 
         interact.send_key(campo_adv, text)
 
+        known_adv = self.entity_cache.lookup("advogado", text)
         check_adv = None
 
         interact.sleep_load('div[id="j_id_4p"]')
@@ -725,7 +739,7 @@ class Cadastro(CrawJUD):
             check_adv = (
                 WebDriverWait(driver, 15)
                 .until(
-                    ec.presence_of_element_located((By.XPATH, elements.css_check_adv)),
+                    ec.presence_of_element_located(elements.locator("css_check_adv")),
                     message="Erro ao encontrar elemento",
                 )
                 .text
@@ -737,6 +751,7 @@ class Cadastro(CrawJUD):
             driver.execute_script(f"document.querySelector('{element_campo_adv_outraparte}').blur()")
 
             interact.sleep_load('div[id="j_id_4p"]')
+            self.entity_cache.remember("advogado", text, True)
 
             self.message = "Adv. parte contrária informado!"
             self.type_log = "info"
@@ -744,9 +759,14 @@ class Cadastro(CrawJUD):
 
             return
 
+        if known_adv:
+            # Cadastrado anteriormente, mas não localizado na busca: o cache está desatualizado
+            self.entity_cache.forget("advogado", text)
+
         if not check_adv:
             self.cadastro_advogado_contra()
             driver.switch_to.default_content()
+            self.entity_cache.remember("advogado", text, True)
 
         interact.sleep_load('div[id="j_id_4p"]')
 
@@ -775,7 +795,7 @@ class Cadastro(CrawJUD):
         prt()
 
         valor_causa: WebElement = wait.until(
-            ec.presence_of_element_located((By.XPATH, elements.valor_causa)),
+            ec.presence_of_element_located(elements.locator("valor_causa")),
             message="Erro ao encontrar elemento",
         )
 
@@ -784,7 +804,7 @@ class Cadastro(CrawJUD):
         valor_causa.clear()
         id_valor_causa = valor_causa.get_attribute("id")
         input_valor_causa = f'input[id="{id_valor_causa}"]'
-        interact.send_key(valor_causa, bot_data.get("VALOR_CAUSA"))
+        interact.send_key(valor_causa, bot_data.get("VALOR_CAUSA"), mode="slow")
 
         driver.execute_script(f"document.querySelector('{input_valor_causa}').blur()")
 
@@ -813,14 +833,14 @@ class Cadastro(CrawJUD):
         prt()
 
         div_escritrorioexterno: WebElement = wait.until(
-            ec.presence_of_element_located((By.XPATH, elements.escritrorio_externo)),
+            ec.presence_of_element_located(elements.locator("escritrorio_externo")),
             message="Erro ao encontrar elemento",
         )
         div_escritrorioexterno.click()
         sleep(1)
 
         text = bot_data.get("ESCRITORIO_EXTERNO")
-        select_escritorio = wait.until(ec.presence_of_element_located((By.XPATH, elements.select_escritorio)))
+        select_escritorio = wait.until(ec.presence_of_element_located(elements.locator("select_escritorio")))
         interact.select2_elaw(select_escritorio, text)
         interact.sleep_load('div[id="j_id_4p"]')
 
@@ -852,8 +872,8 @@ class Cadastro(CrawJUD):
         if str(bot_data.get("TIPO_EMPRESA")).lower() == "autor":
             text = ["Ativa", "Ativo"]
 
-        select_contigencia = wait.until(ec.presence_of_element_located((By.XPATH, elements.contingencia)))
-        select_polo = wait.until(ec.presence_of_element_located((By.XPATH, elements.tipo_polo)))
+        select_contigencia = wait.until(ec.presence_of_element_located(elements.locator("contingencia")))
+        select_polo = wait.until(ec.presence_of_element_located(elements.locator("tipo_polo")))
 
         select2_elaw(select_contigencia, text[0])
         interact.sleep_load('div[id="j_id_4p"]')
@@ -888,7 +908,7 @@ class Cadastro(CrawJUD):
             prt()
 
             add_parte: WebElement = wait.until(
-                ec.presence_of_element_located((By.XPATH, elements.btn_novo_advogado_contra)),
+                ec.presence_of_element_located(elements.locator("btn_novo_advogado_contra")),
                 message="Erro ao encontrar elemento",
             )
             add_parte.click()
@@ -979,7 +999,7 @@ class Cadastro(CrawJUD):
             select2_elaw = self.select2_elaw
 
             add_parte: WebElement = wait.until(
-                ec.presence_of_element_located((By.XPATH, elements.parte_contraria)),
+                ec.presence_of_element_located(elements.locator("parte_contraria")),
                 message="Erro ao encontrar elemento",
             )
             add_parte.click()
@@ -1033,7 +1053,7 @@ class Cadastro(CrawJUD):
             input_doc.click()
             sleep(0.05)
             input_doc.clear()
-            interact.send_key(input_doc, bot_data.get("DOC_PARTE_CONTRARIA"))
+            interact.send_key(input_doc, bot_data.get("DOC_PARTE_CONTRARIA"), mode="slow")
             continuar = driver.find_element(By.CSS_SELECTOR, elements.botao_parte_contraria)
             continuar.click()
 
@@ -112,12 +112,12 @@ class Complement(CrawJUD):
 
 
         """
-        frame = [self.elawFormats(item) for item in self.dataFrame()]
+        frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
-            self.bot_data = value
+            self.bot_data = self.elawFormats(value)
             if self.isStoped:
                 break
 
@@ -467,7 +467,7 @@ class Complement(CrawJUD):
         self.prt()
 
         input_adv_responsavel: WebElement = self.wait.until(
-            ec.presence_of_element_located((By.XPATH, self.elements.adv_responsavel)),
+            ec.presence_of_element_located(self.elements.locator("adv_responsavel")),
         )
         input_adv_responsavel.click()
         self.interact.send_key(input_adv_responsavel, self.bot_data.get("ADVOGADO_INTERNO"))
@@ -490,7 +490,7 @@ class Complement(CrawJUD):
 
         self.interact.sleep_load('div[id="j_id_4p"]')
         element_select = self.wait.until(
-            ec.presence_of_element_located((By.XPATH, self.elements.select_advogado_responsavel))
+            ec.presence_of_element_located(self.elements.locator("select_advogado_responsavel"))
         )
         self.select2_elaw(element_select, self.bot_data.get("ADVOGADO_INTERNO"))
 
@@ -677,7 +677,7 @@ class Complement(CrawJUD):
         self.prt()
 
         input_uc: WebElement = self.wait.until(
-            ec.presence_of_element_located((By.XPATH, self.elements.css_input_uc)),
+            ec.presence_of_element_located(self.elements.locator("css_input_uc")),
         )
         input_uc.click()
 
@@ -745,7 +745,7 @@ class Complement(CrawJUD):
 
         bairro_ = self.bot_data.get("BAIRRO")
 
-        input_bairro = self.driver.find_element(By.XPATH, self.elements.bairro_input)
+        input_bairro = self.driver.find_element(*self.elements.locator("bairro_input"))
         input_bairro.click()
         self.interact.clear(input_bairro)
         self.interact.send_key(input_bairro, bairro_)
@@ -808,11 +808,11 @@ class Complement(CrawJUD):
         self.prt()
 
         data_citacao: WebElement = self.wait.until(
-            ec.presence_of_element_located((By.XPATH, self.elements.data_citacao)),
+            ec.presence_of_element_located(self.elements.locator("data_citacao")),
         )
         self.interact.clear(data_citacao)
         self.interact.sleep_load('div[id="j_id_4p"]')
-        self.interact.send_key(data_citacao, self.bot_data.get("DATA_CITACAO"))
+        self.interact.send_key(data_citacao, self.bot_data.get("DATA_CITACAO"), mode="slow")
         sleep(2)
         id_element = data_citacao.get_attribute("id")
         id_input_css = f'[id="{id_element}"]'
@@ -899,7 +899,7 @@ class Complement(CrawJUD):
         self.prt()
 
         valor_causa: WebElement = self.wait.until(
-            ec.element_to_be_clickable((By.XPATH, self.elements.valor_causa)),
+            ec.element_to_be_clickable(self.elements.locator("valor_causa")),
             message="Erro ao encontrar elemento",
         )
 
@@ -907,7 +907,7 @@ class Complement(CrawJUD):
         sleep(0.5)
         valor_causa.clear()
 
-        self.interact.send_key(valor_causa, self.bot_data.get("VALOR_CAUSA"))
+        self.interact.send_key(valor_causa, self.bot_data.get("VALOR_CAUSA"), mode="slow")
 
         id_element = valor_causa.get_attribute("id")
         id_input_css = f'[id="{id_element}"]'
@@ -964,14 +964,14 @@ class Complement(CrawJUD):
 
         """
         input_descobjeto = self.wait.until(
-            ec.presence_of_element_located((By.XPATH, self.elements.input_descobjeto)),
+            ec.presence_of_element_located(self.elements.locator("input_descobjeto")),
         )
         self.interact.click(input_descobjeto)
 
         text = self.bot_data.get("DESC_OBJETO")
 
         self.interact.clear(input_descobjeto)
-        self.interact.send_key(input_descobjeto, text)
+        self.interact.send_key(input_descobjeto, text, mode="js")
 
         id_element = input_descobjeto.get_attribute("id")
         id_input_css = f'[id="{id_element}"]'
@@ -1025,7 +1025,7 @@ class Complement(CrawJUD):
         self.type_log = "log"
         self.prt()
 
-        element_select = self.wait.until(ec.presence_of_element_located((By.XPATH, self.elements.contingencia)))
+        element_select = self.wait.until(ec.presence_of_element_located(self.elements.locator("contingencia")))
 
         text = ["Passiva", "Passivo"]
         if str(self.bot_data.get("TIPO_EMPRESA")).lower() == "autor":
@@ -1034,7 +1034,7 @@ class Complement(CrawJUD):
         self.select2_elaw(element_select, text[0])
         self.interact.sleep_load('div[id="j_id_4p"]')
 
-        element_select = self.wait.until(ec.presence_of_element_located((By.XPATH, self.elements.tipo_polo)))
+        element_select = self.wait.until(ec.presence_of_element_located(self.elements.locator("tipo_polo")))
 
         text = ["Passiva", "Passivo"]
         if str(self.bot_data.get("TIPO_EMPRESA")).lower() == "autor":
@@ -1067,7 +1067,7 @@ class Complement(CrawJUD):
 
         text = self.bot_data.get("ESCRITORIO_EXTERNO")
 
-        element_select = driver.find_element(By.XPATH, elements.select_escritorio)
+        element_select = driver.find_element(*elements.locator("select_escritorio"))
 
         self.interact.select2_elaw(element_select, text)
         self.interact.sleep_load('div[id="j_id_4p"]')
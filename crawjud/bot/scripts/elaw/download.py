@@ -11,7 +11,9 @@ import os
 import shutil
 import time
 import traceback
+from concurrent.futures import Future
 from contextlib import suppress
+from pathlib import Path
 from time import sleep
 from typing import Self
 
@@ -77,7 +79,7 @@ class Download(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -205,42 +207,32 @@ class Download(CrawJUD):
                         By.CSS_SELECTOR,
                         self.elements.botao_baixar,
                     )
+                    expected = get_name_file.replace(" ", "")
+                    download = self.download_manager.expect(
+                        lambda name, expected=expected: name.replace(" ", "") == expected,
+                    )
                     baixar.click()
 
-                    self.rename_doc(get_name_file)
+                    self.rename_doc(download)
                     self.message = "Arquivo baixado com sucesso!"
                     self.type_log = "info"
                     self.prt()
 
-    def rename_doc(self, namefile: str) -> None:
+    def rename_doc(self, download: Future[Path]) -> None:
         """Rename the downloaded document.
 
         Args:
-            namefile (str): The new name for the file.
+            download (Future[Path]): The download registered before clicking the button.
 
         Raises:
-            DocumentRenameError: If an error occurs during renaming.
+            ExecutionError: If the download does not finish.
 
         """
-        filedownloaded = False
-        while True:
-            for _, __, files in os.walk(os.path.join(self.output_dir_path)):
-                for file in files:
-                    if file.replace(" ", "") == namefile.replace(" ", ""):
-                        filedownloaded = True
-                        namefile = file
-                        break
-
-                if filedownloaded is True:
-                    break
-
-            old_file = os.path.join(self.output_dir_path, namefile)
-            if os.path.exists(old_file):
-                sleep(0.5)
-                break
-
-            sleep(0.01)
+        old_file = self.download_manager.wait(download)
+        if old_file is None:
+            raise ExecutionError(message="Download do documento não concluído")
 
+        namefile = old_file.name
         filename_replaced = f"{self.pid} - {namefile.replace(' ', '')}"
         path_renamed = os.path.join(self.output_dir_path, filename_replaced)
         shutil.move(old_file, path_renamed)
@@ -81,7 +81,7 @@ class Provisao(CrawJUD):
         self.max_rows = len(frame)
         self.driver.maximize_window()
         self.driver.execute_script("document.body.style.zoom = '0.5'")
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -414,7 +414,7 @@ class Provisao(CrawJUD):
                 data_correcao = self.driver.find_element(By.CSS_SELECTOR, self.elements.data_correcaoCss)
                 css_daata_correcao = data_correcao.get_attribute("id")
                 self.interact.clear(data_correcao)
-                self.interact.send_key(data_correcao, data_base_correcao)
+                self.interact.send_key(data_correcao, data_base_correcao, mode="slow")
 
                 self.driver.execute_script(f"document.getElementById('{css_daata_correcao}').blur()")
                 self.interact.sleep_load('div[id="j_id_3q"]')
@@ -423,7 +423,7 @@ class Provisao(CrawJUD):
                 data_juros = self.driver.find_element(By.CSS_SELECTOR, self.elements.data_jurosCss)
                 css_data = data_juros.get_attribute("id")
                 self.interact.clear(data_juros)
-                self.interact.send_key(data_juros, data_base_juros)
+                self.interact.send_key(data_juros, data_base_juros, mode="slow")
                 self.driver.execute_script(f"document.getElementById('{css_data}').blur()")
                 self.interact.sleep_load('div[id="j_id_3q"]')
 
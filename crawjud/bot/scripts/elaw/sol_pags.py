@@ -16,7 +16,6 @@ import time
 import traceback
 from contextlib import suppress
 from datetime import datetime
-from time import sleep
 from typing import Self
 
 from pytz import timezone
@@ -82,7 +81,7 @@ class SolPags(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
         self.driver.maximize_window()
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = self.elawFormats(value)
             if self.isStoped:
@@ -191,7 +190,7 @@ class SolPags(CrawJUD):
             )
             type_itens.click()
 
-            sleep(0.5)
+            self.wait_engine.idle()
 
             list_itens: WebElement = self.wait.until(
                 ec.presence_of_element_located((By.CSS_SELECTOR, self.elements.listitens_css)),
@@ -237,7 +236,7 @@ class SolPags(CrawJUD):
                 ec.element_to_be_clickable((By.CSS_SELECTOR, self.elements.css_element)),
             )
 
-            sleep(0.5)
+            self.wait_engine.idle()
             element.send_keys(Keys.CONTROL, "a")
             element.send_keys(Keys.BACKSPACE)
             self.interact.send_key(element, text)
@@ -249,7 +248,7 @@ class SolPags(CrawJUD):
                 ec.element_to_be_clickable((By.CSS_SELECTOR, self.elements.type_doc_css)),
             )
             div_type_doc.click()
-            sleep(0.5)
+            self.wait_engine.idle()
 
             list_type_doc: WebElement = self.wait.until(
                 ec.presence_of_element_located((By.CSS_SELECTOR, self.elements.list_type_doc_css)),
@@ -287,7 +286,7 @@ class SolPags(CrawJUD):
                 insert_doc.send_keys(path_doc)
 
                 self.interact.wait_fileupload()
-                sleep(0.5)
+                self.wait_engine.idle()
 
             self.message = "Informando tipo de condenação"
             self.type_log = "log"
@@ -299,12 +298,12 @@ class SolPags(CrawJUD):
 
             tipo_condenacao = str(self.bot_data.get("TIPO_CONDENACAO"))
             if tipo_condenacao.lower() == "sentença":
-                sleep(0.5)
+                self.wait_engine.idle()
                 sentenca = self.driver.find_element(By.CSS_SELECTOR, self.elements.valor_sentenca)
                 sentenca.click()
 
             elif tipo_condenacao.lower() == "acórdão":
-                sleep(0.5)
+                self.wait_engine.idle()
                 acordao = self.driver.find_element(By.CSS_SELECTOR, self.elements.valor_acordao)
                 acordao.click()
 
@@ -324,7 +323,7 @@ class SolPags(CrawJUD):
             elif "\t" in desc_pagamento:
                 desc_pagamento = desc_pagamento.replace("\t", "")
             desc_pgto.send_keys(desc_pagamento)
-            sleep(0.5)
+            self.wait_engine.idle()
 
             self.driver.execute_script(f"document.querySelector('{self.elements.css_desc_pgto}').blur()")
 
@@ -350,7 +349,7 @@ class SolPags(CrawJUD):
             )
             input_favorecido.click()
             input_favorecido.clear()
-            sleep(2)
+            self.wait_engine.idle()
 
             input_favorecido.send_keys(self.bot_data.get("CNPJ_FAVORECIDO", "00.360.305/0001-04"))
 
@@ -367,7 +366,7 @@ class SolPags(CrawJUD):
             label_forma_pgto = self.driver.find_element(By.CSS_SELECTOR, self.elements.valor_processo)
             label_forma_pgto.click()
 
-            sleep(1)
+            self.wait_engine.idle()
             boleto = self.driver.find_element(By.CSS_SELECTOR, self.elements.boleto)
             boleto.click()
 
@@ -377,7 +376,7 @@ class SolPags(CrawJUD):
                 ec.element_to_be_clickable((By.CSS_SELECTOR, self.elements.css_cod_bars)),
             )
             campo_cod_barras.click()
-            sleep(0.5)
+            self.wait_engine.idle()
 
             cod_barras = str(self.bot_data.get("COD_BARRAS"))
             campo_cod_barras.send_keys(cod_barras.replace("\t", "").replace("\n", ""))
@@ -396,7 +395,7 @@ class SolPags(CrawJUD):
 
             self.driver.execute_script(f"document.querySelector('{self.elements.css_centro_custas}').blur()")
 
-            sleep(1)
+            self.wait_engine.idle()
             self.message = "Informando conta para débito"
             self.type_log = "log"
             self.prt()
@@ -405,7 +404,7 @@ class SolPags(CrawJUD):
                 ec.element_to_be_clickable((By.CSS_SELECTOR, self.elements.css_div_conta_debito)),
             )
             div_conta_debito.click()
-            sleep(1)
+            self.wait_engine.idle()
             conta_debito = self.driver.find_element(
                 By.CSS_SELECTOR,
                 'li[data-label="AMAZONAS - PAGTO CONDENAÇÕES DE LITÍGIOS CÍVEIS CONTRAPARTIDA"]',
@@ -435,25 +434,25 @@ class SolPags(CrawJUD):
             )
             element.click()
             element.send_keys(Keys.CONTROL, "a")
-            sleep(0.5)
+            self.wait_engine.idle()
             element.send_keys(Keys.BACK_SPACE)
-            sleep(0.5)
+            self.wait_engine.idle()
             element.send_keys(valor_doc)
 
             self.driver.execute_script(f"document.querySelector('{self.elements.valor_guia}').blur()")
 
-            sleep(0.5)
+            self.wait_engine.idle()
 
             list_tipo_doc: WebElement = self.wait.until(
                 ec.presence_of_element_located((By.CSS_SELECTOR, self.elements.type_doc_css)),
             )
             list_tipo_doc.click()
-            sleep(1)
+            self.wait_engine.idle()
 
             set_gru = self.driver.find_element(By.CSS_SELECTOR, self.elements.css_gru)
             set_gru.click()
 
-            sleep(2)
+            self.wait_engine.idle()
             self.message = "Inserindo documento"
             self.type_log = "log"
             self.prt()
@@ -490,7 +489,7 @@ class SolPags(CrawJUD):
             self.type_log = "log"
             self.prt()
 
-            sleep(1)
+            self.wait_engine.idle()
 
             tipo_guia = str(self.bot_data.get("TIPO_GUIA"))
             list_tipo_custa: WebElement = self.wait.until(
@@ -498,7 +497,7 @@ class SolPags(CrawJUD):
             )
             self.select2_elaw(list_tipo_custa, tipo_guia)
 
-            sleep(1)
+            self.wait_engine.idle()
             self.message = "Informando data para pagamento"
             self.type_log = "log"
             self.prt()
@@ -512,7 +511,7 @@ class SolPags(CrawJUD):
             label_forma_pgto = self.driver.find_element(By.CSS_SELECTOR, self.elements.valor_processo)
             label_forma_pgto.click()
 
-            sleep(1)
+            self.wait_engine.idle()
             boleto = self.driver.find_element(By.CSS_SELECTOR, self.elements.boleto)
             boleto.click()
 
@@ -522,7 +521,7 @@ class SolPags(CrawJUD):
                 ec.presence_of_element_located((By.CSS_SELECTOR, self.elements.css_cod_bars)),
             )
             campo_cod_barras.click()
-            sleep(0.5)
+            self.wait_engine.idle()
             campo_cod_barras.send_keys(self.bot_data.get("COD_BARRAS"))
             self.driver.execute_script(f"document.querySelector('{self.elements.css_cod_bars}').blur()")
 
@@ -530,12 +529,12 @@ class SolPags(CrawJUD):
             self.type_log = "log"
             self.prt()
 
-            sleep(2)
+            self.wait_engine.idle()
             input_favorecido: WebElement = self.wait.until(
                 ec.presence_of_element_located((By.CSS_SELECTOR, self.elements.css_inputfavorecido)),
             )
             input_favorecido.click()
-            sleep(1)
+            self.wait_engine.idle()
             input_favorecido.clear()
 
             input_favorecido.send_keys(self.bot_data.get("CNPJ_FAVORECIDO", "04.812.509/0001-90"))
@@ -550,7 +549,7 @@ class SolPags(CrawJUD):
             self.type_log = "log"
             self.prt()
 
-            sleep(1)
+            self.wait_engine.idle()
 
             centro_custas: WebElement = self.wait.until(
                 ec.presence_of_element_located((By.CSS_SELECTOR, self.elements.css_centro_custas)),
@@ -568,7 +567,7 @@ class SolPags(CrawJUD):
                 ec.presence_of_element_located((By.CSS_SELECTOR, self.elements.css_div_conta_debito)),
             )
             div_conta_debito.click()
-            sleep(1)
+            self.wait_engine.idle()
 
             if solicitante == "jec":
                 conta_debito = self.driver.find_element(By.CSS_SELECTOR, self.elements.custas_civis)
@@ -623,11 +622,11 @@ class SolPags(CrawJUD):
                 if item.text == "Nenhum registro encontrado!":
                     raise ExecutionError(message="Pagamento não solicitado")
 
-                sleep(2)
+                self.wait_engine.idle()
                 open_details = item.find_element(By.CSS_SELECTOR, self.elements.botao_ver)
                 open_details.click()
 
-                sleep(1)
+                self.wait_engine.idle()
                 id_task = item.find_elements(By.TAG_NAME, "td")[2].text
                 closeContext = self.wait.until(  # noqa: N806
                     ec.presence_of_element_located(
@@ -642,7 +641,7 @@ class SolPags(CrawJUD):
                     ec.presence_of_element_located((By.CSS_SELECTOR, self.elements.valor)),
                 )
                 self.driver.switch_to.frame(WaitFrame)
-                sleep(1)
+                self.wait_engine.idle()
 
                 tipoCusta = ""  # noqa: N806
                 cod_bars = ""
@@ -716,7 +715,7 @@ class SolPags(CrawJUD):
 
                 self.driver.switch_to.default_content()
                 closeContext.click()
-                sleep(0.25)
+                self.wait_engine.idle()
 
             raise ExecutionError(message="Pagamento não solicitado")
 
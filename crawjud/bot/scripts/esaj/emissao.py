@@ -9,11 +9,9 @@ import re
 import time
 import traceback
 from contextlib import suppress
-from time import sleep
 from typing import Self
 
 import requests
-from pypdf import PdfReader
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
@@ -114,7 +112,7 @@ class Emissao(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -218,9 +216,9 @@ class Emissao(CrawJUD):
         )
         set_doc = self.driver.find_element(By.CSS_SELECTOR, elements[0])
         set_doc.click()
-        sleep(0.5)
+        self.wait_engine.idle()
         setcpf_cnpj = self.driver.find_element(By.CSS_SELECTOR, elements[1]).find_element(By.CSS_SELECTOR, elements[2])
-        sleep(0.5)
+        self.wait_engine.idle()
         setcpf_cnpj.send_keys(self.bot_data.get("CPF_CNPJ"))
 
         avançar = self.driver.find_element(By.CSS_SELECTOR, self.elements.botao_avancar)
@@ -262,26 +260,26 @@ class Emissao(CrawJUD):
 
             set_doc = self.driver.find_element(By.CSS_SELECTOR, elements[0])
             set_doc.click()
-            sleep(0.5)
+            self.wait_engine.idle()
             setcpf_cnpj = self.driver.find_element(By.CSS_SELECTOR, elements[1]).find_element(
                 By.CSS_SELECTOR,
                 elements[2],
             )
-            sleep(0.5)
+            self.wait_engine.idle()
             setcpf_cnpj.send_keys(self.bot_data.get("CPF_CNPJ"))
 
             avançar = self.driver.find_element(By.CSS_SELECTOR, self.elements.botao_avancar)
             avançar.click()
 
-            sleep(1)
+            self.wait_engine.idle()
             set_RI: WebElement = self.wait.until(ec.presence_of_element_located((By.CSS_SELECTOR, self.elements.check)))  # noqa: N806
             set_RI.click()
 
-            sleep(1)
+            self.wait_engine.idle()
             last_avançar = self.driver.find_element(By.CSS_SELECTOR, self.elements.botao_avancar_dois)
             last_avançar.click()
 
-            sleep(1)
+            self.wait_engine.idle()
             css_val_doc = "body > table:nth-child(4) > tbody > tr > td > table:nth-child(10) > tbody > tr:nth-child(3) > td:nth-child(3) > strong"  # noqa: E501
             self.valor_doc: WebElement = self.wait.until(
                 ec.presence_of_element_located((By.CSS_SELECTOR, css_val_doc)),
@@ -332,10 +330,10 @@ class Emissao(CrawJUD):
         url_start = onclick_value.find("'") + 1
         url_end = onclick_value.find("'", url_start)
         url = onclick_value[url_start:url_end]
-        sleep(0.5)
+        self.wait_engine.idle()
         self.driver.switch_to.new_window("tab")
         self.driver.get(f"https://consultasaj.tjam.jus.br{url}")
-        sleep(2)
+        self.wait_engine.idle()
 
         # Checar se não ocorreu o erro "Boleto inexistente"
         check = None
@@ -348,7 +346,6 @@ class Emissao(CrawJUD):
 
         if check:
             self.driver.close()
-            sleep(0.7)
             self.driver.switch_to.window(original_window)
             raise ExecutionError(message="Esaj não gerou a guia")
 
@@ -381,7 +378,6 @@ class Emissao(CrawJUD):
             file.write(response.content)
 
         self.driver.close()
-        sleep(0.7)
         self.driver.switch_to.window(self.original_window)
         self.message = f"Boleto Nº{self.bot_data.get('NUMERO_PROCESSO')} emitido com sucesso!"
         self.type_log = "log"
@@ -402,7 +398,6 @@ class Emissao(CrawJUD):
             self.type_log = "log"
             self.prt()
 
-            sleep(2)
             # Inicialize uma lista para armazenar os números encontrados
             bar_code = ""
             numeros_encontrados = []
@@ -411,12 +406,8 @@ class Emissao(CrawJUD):
             pattern = r"\b\d{5}\.\d{5}\s*\d{5}\.\d{6}\s*\d{5}\.\d{6}\s*\d\s*\d{14}\b"
 
             pdf_file = self.path_pdf
-            read = PdfReader(pdf_file)
-
             # Read PDF
-            for page in read.pages:
-                text = page.extract_text()
-
+            for text in self.pdf_extractor.pages(pdf_file):
                 # Use a expressão regular para encontrar números
                 numeros = re.findall(pattern, text)
 
@@ -17,6 +17,7 @@ from selenium.webdriver.support import expected_conditions as ec
 
 from crawjud.bot.common import ExecutionError
 from crawjud.bot.core import CrawJUD
+from crawjud.bot.Utils.move_matcher import MoveMatcher
 
 
 class Movimentacao(CrawJUD):
@@ -86,7 +87,7 @@ class Movimentacao(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -182,176 +183,44 @@ class Movimentacao(CrawJUD):
             ExecutionError: If no movements are found in the scraping process.
 
         """
-        encontrado = False
-        keywords = []
         self.set_page_size()
         self.set_tablemoves()
 
-        keyword = self.bot_data.get("PALAVRA_CHAVE", self.bot_data.get("PALAVRAS_CHAVE", "*"))
-
-        if keyword != "*":
-            keywords.extend(keyword.split(",") if "," in keyword else [keyword])
-
-        if len(keywords) > 0:
-            for keyword in keywords:
-                encontrado = self.scrap_moves(keyword)
-
-        elif len(keywords) == 0 and keyword == "*":
-            encontrado = self.scrap_moves(keyword)
+        self.move_matcher = MoveMatcher.from_row(self.bot_data)
+        encontrado = self.scrap_moves()
 
         if encontrado is False:
             raise ExecutionError(message="Nenhuma movimentação encontrada")
 
-    def filter_moves(self, move: WebElement) -> bool:
-        """Filter a movement element based on given date and keyword criteria.
+    def filter_moves(self, move: WebElement) -> list[str]:
+        """Match a movement against the keyword, date and INTIMADO criteria of the row.
 
         Args:
             move (WebElement): A movement element to be filtered.
 
         Returns:
-            bool: True if the movement meets all criteria; otherwise, False.
+            list[str]: The keywords matched by the movement (empty if it does not meet the criteria).
 
         """
-        keyword = self.kword
         itensmove = move.find_elements(By.TAG_NAME, "td")
 
         if len(itensmove) < 5:
-            return False
+            return []
 
         text_mov = str(itensmove[2].text)
         data_mov = str(itensmove[0].text.strip())
 
-        def data_check(data_mov: str) -> bool:
-            """Validate the given date string against multiple date formats and checks if it falls within a specified date range.
-
-            Args:
-                data_mov (str): The date string to be validated.
-
-            Returns:
-                bool: True if the date string is valid and falls within the specified date range, False otherwise.
-            The function performs the following steps:
-            1. Tries to match the given date string against multiple date formats.
-            2. Converts the matched date string to a datetime object.
-            3. Retrieves the start and end dates from the bot's data.
-            4. Validates and converts the start and end dates if they are not already datetime objects.
-            5. Checks if the given date falls within the start and end dates.
-            The supported date formats are:
-            - "%d/%m/%Y"
-            - "%m/%d/%Y"
-            - "%Y/%m/%d"
-            - "%Y/%d/%m"
-
-            """  # noqa: E501
-            patterns = [
-                ("%d/%m/%Y", r"\b(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/\d{4}\b"),
-                ("%m/%d/%Y", r"\b(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])/\d{4}\b"),
-                ("%Y/%m/%d", r"\b\d{4}/(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])\b"),
-                ("%Y/%d/%m", r"\b\d{4}/(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])\b"),
-            ]
-
-            for format_d, pattern in patterns:
-                match_ = re.match(pattern, data_mov)
-                match_: re.Match | None = match_
-                if match_ is not None:
-                    data_mov = datetime.strptime(data_mov, format_d)
-                    break
-
-            data_inicio = self.bot_data.get("DATA_INICIO", data_mov)
-            data_fim = self.bot_data.get("DATA_FIM", data_mov)
-            chk_datafim = type(data_fim) is datetime
-            chk_datainicio = type(data_inicio) is datetime
-
-            if chk_datainicio is False:
-                for format_d, pattern in patterns:
-                    data_inicio.replace(" ", "")
-                    match_ = re.match(pattern, data_mov)
-                    match_: re.Match | None = match_
-                    if match_ is not None:
-                        data_inicio = datetime.strptime(data_inicio, format_d)
-                        break
-
-            if chk_datafim is False:
-                for format_d, pattern in patterns:
-                    data_fim.replace(" ", "")
-
-                    match_ = re.match(pattern, data_mov)
-                    match_: re.Match | None = match_
-                    if match_ is not None:
-                        data_fim = datetime.strptime(data_fim, format_d)
-                        break
-
-            return all([data_mov >= data_inicio, data_mov <= data_fim])
-
-        def text_check(text_mov: str) -> bool:
-            """Check if the given text matches certain criteria.
-
-            This function evaluates whether the provided text (`text_mov`) meets any of the following conditions:
-            - Contains a keyword that is an asterisk ("*").
-            - The first line of the text matches a keyword (case-insensitive).
-            - The entire text matches a keyword (case-insensitive).
-            - The keyword is a substring of the text (case-insensitive).
-            - The similarity between the keyword and the first line of the text is greater than 0.8.
-
-            Args:
-                text_mov (str): The text to be checked.
-
-            Returns:
-                bool: True if any of the conditions are met, False otherwise.
-
-            """
-            check_palavra = any(
-                chk is True
-                for chk in [
-                    keyword == "*",
-                    keyword.lower() == text_mov.split("\n")[0].lower(),
-                    keyword.lower() == text_mov.lower(),
-                    keyword.lower() in text_mov.lower(),
-                    self.similaridade(keyword.lower(), text_mov.split("\n")[0].lower()) > 0.8,
-                ]
-            )
-
-            return check_palavra
-
-        def check_intimado() -> bool:
-            """Check if the bot is intimated based on the bot data.
-
-            This function checks if the bot has been intimated by looking for the
-            "INTIMADO" key in the bot data. If the key is present, it verifies if
-            the value associated with the key is present in the text_mov string
-            (case insensitive).
-
-            Returns:
-                bool: True if the bot is intimated or if the "INTIMADO" key is not
-                present in the bot data, False otherwise.
-
-            """
-            intimado_chk = True
-            intimado = self.bot_data.get("INTIMADO", None)
-
-            if intimado is not None:
-                intimado_chk = str(intimado).lower() in text_mov.lower()
-
-            return intimado_chk
-
-        resultados = all([data_check(data_mov), text_check(text_mov), check_intimado()])
-
-        return resultados
-
-    def scrap_moves(self, keyword: str) -> None:
-        """Scrape movements that contain the specified keyword.
+        return self.move_matcher.match(text_mov, data_mov)
 
-        Args:
-            keyword (str): The keyword to filter movements by.
+    def scrap_moves(self) -> None:
+        """Scrape the movements matching any keyword of the row, in a single pass over the table.
 
         Raises:
             ExecutionError: If an error is encountered during scraping.
 
-        Returns:
-            bool: True if movements are found, otherwise False.
-
         """
-        self.kword = keyword
-        move_filter = list(filter(self.filter_moves, self.table_moves))
+        move_filter = [(move, keywords) for move in self.table_moves if (keywords := self.filter_moves(move))]
+        keyword = ", ".join(self.move_matcher.keywords)
 
         message_ = [
             "\n====================================================\n",
@@ -415,7 +284,8 @@ class Movimentacao(CrawJUD):
             return (mov_chk, trazer_teor, mov, use_gpt, save_another_file)
 
         """ Iteração dentro das movimentações filtradas """
-        for move in move_filter:
+        matched: list[tuple[list[str], str, dict[str, str]]] = []
+        for move, keywords in move_filter:
             mov_texdoc = ""
             itensmove = move.find_elements(By.TAG_NAME, "td")
 
@@ -461,15 +331,23 @@ class Movimentacao(CrawJUD):
                 "Classiicação Peticionante": qualificacao_movimentador,
                 "Texto documento Mencionado (Caso Tenha)": mov_texdoc,
             }
-            ms_ = [f'Movimentação "{nome_mov}" salva na planilha!']
-            if keyword != "*":
-                ms_.append(f" Parâmetro: {keyword}")
-            self.message = "".join(ms_)
+            matched.append((keywords, nome_mov, data))
 
-            self.type_log = "info"
-            self.prt()
+        """ Linhas agrupadas por palavra-chave, na ordem da planilha """
+        for keyword in self.move_matcher.keywords:
+            for keywords, nome_mov, data in matched:
+                if keyword not in keywords:
+                    continue
+
+                ms_ = [f'Movimentação "{nome_mov}" salva na planilha!']
+                if keyword != "*":
+                    ms_.append(f" Parâmetro: {keyword}")
+                self.message = "".join(ms_)
+
+                self.type_log = "info"
+                self.prt()
 
-            self.appends.append(data)
+                self.appends.append(dict(data))
 
     def set_page_size(self) -> None:
         """Set the page size for movement scraping."""
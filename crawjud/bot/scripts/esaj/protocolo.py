@@ -105,7 +105,7 @@ class Protocolo(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -271,7 +271,7 @@ class Protocolo(CrawJUD):
             self.interact.send_key(input_categoria_peticao, self.bot_data.get("SUBTIPO_PROTOCOLO"))
 
             input_categoria_peticao_option: WebElement = self.wait.until(
-                ec.presence_of_element_located((By.XPATH, self.elements.selecionar_grupo)),
+                ec.presence_of_element_located(self.elements.locator("selecionar_grupo")),
             )
             input_categoria_peticao_option.click()
             sleep(1)
@@ -312,7 +312,7 @@ class Protocolo(CrawJUD):
             file_uploaded = ""
             with suppress(TimeoutException):
                 file_uploaded: WebElement = WebDriverWait(self.driver, 25).until(
-                    ec.presence_of_element_located((By.XPATH, self.elements.documento)),
+                    ec.presence_of_element_located(self.elements.locator("documento")),
                 )
 
             if file_uploaded == "":
@@ -388,7 +388,7 @@ class Protocolo(CrawJUD):
         """
         self.prt.print_log("log", "Finalizando...")
 
-        finish_button = self.driver.find_element(By.XPATH, self.elements.botao_protocolar)
+        finish_button = self.driver.find_element(*self.elements.locator("botao_protocolar"))
         sleep(1)
         finish_button.click()
         sleep(5)
@@ -0,0 +1,356 @@
+"""Harvest PJe pautas over HTTP, concurrently across the vara × date grid.
+
+The pauta bot used to open ``{url_pautas}/{vara}-{date}`` one page at a time in
+the browser, sleeping between pages. The PautaHarvester takes the authenticated
+session of the browser once (cookies and user agent) and fetches the JSON
+endpoint backing those pages with an async HTTP client instead, with bounded
+concurrency, a per-host rate limit and retries with backoff.
+
+The endpoint is read from ``PJE_PAUTAS_API``, a URL template with the ``{vara}``
+(code without ``#``), ``{date}`` (``YYYY-MM-DD``) and ``{page}`` placeholders, taken
+from the request the consultation page sends when a pauta is opened. When it is
+not set, the bot keeps using the browser.
+
+With ``PJE_PAUTAS_RECORD`` set, every page received is also saved to that
+directory as ``{vara}-{date}-{page}.json``. ``tests/replay.py`` serves such a
+directory again, so a run recorded against PJe can be replayed with
+``PJE_PAUTAS_API=http://127.0.0.1:<port>/{vara}-{date}-{page}.json``; the tests
+drive the harvester against it with the responses in ``tests/fixtures/pje_pautas``.
+
+Settings (environment variables):
+    PJE_PAUTAS_API: URL template of the pauta endpoint.
+    PJE_PAUTAS_RECORD: Directory where the responses are recorded (optional).
+    PJE_PAUTAS_CONCURRENCY: Requests in flight at once.
+    PJE_PAUTAS_RATE: Requests per second per host.
+    PJE_PAUTAS_RETRIES: Attempts per page before giving up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from os import getenv
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Spreadsheet column -> candidate keys of a pauta item, first found wins; a dotted
+# key reads a nested object. Check new candidates against a recorded response.
+FIELD_MAP: dict[str, tuple[str, ...]] = {
+    "INDICE": ("indice", "ordem", "posicao"),
+    "NUMERO_PROCESSO": ("processo.numero", "numeroProcesso", "nrProcesso"),
+    "HORARIO": ("horario", "hora", "dataInicio"),
+    "TIPO": ("tipo.descricao", "tipoAudiencia", "descricaoTipo", "tipo"),
+    "ATO": ("processo.classeJudicial.sigla", "siglaClasse", "classe", "ato"),
+    "PARTES": ("poloAtivoPassivo", "descricaoPartes", "partes"),
+    "SALA": ("sala.nome", "nomeSala", "sala"),
+    "SITUACAO": ("descricaoSituacao", "situacao", "status"),
+}
+
+
+def pauta_api_url() -> str | None:
+    """Return the URL template of the pauta endpoint.
+
+    Returns:
+        str | None: The template, or None if the harvester is not configured.
+
+    """
+    return getenv("PJE_PAUTAS_API") or None
+
+
+def pick(item: dict, keys: tuple[str, ...]) -> str:
+    """Return the first value of an item found among the candidate keys.
+
+    Args:
+        item (dict): The pauta item.
+        keys (tuple[str, ...]): The candidate keys (``a.b`` reads ``item["a"]["b"]``).
+
+    Returns:
+        str: The value, or an empty string if none of the keys holds a plain value.
+
+    """
+    for key in keys:
+        value = item
+        for part in key.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+
+        if value not in (None, "") and not isinstance(value, (dict, list)):
+            return value if isinstance(value, (int, float)) else str(value)
+
+    return ""
+
+
+def parse_page(payload: dict | list, vara_name: str) -> tuple[list[dict[str, str]], int]:
+    """Turn a page of the pauta endpoint into spreadsheet rows.
+
+    Args:
+        payload (dict | list): The decoded JSON; either a list of items or a page
+            with the items in ``resultado``/``content``/``itens`` and the page count in
+            ``qtdPaginas``/``totalPages``.
+        vara_name (str): The vara name written in the ``VARA`` column.
+
+    Returns:
+        tuple[list[dict[str, str]], int]: The rows and the number of pages.
+
+    """
+    if isinstance(payload, list):
+        items, pages = payload, 1
+
+    else:
+        items = payload.get("resultado") or payload.get("content") or payload.get("itens") or []
+        pages = int(payload.get("qtdPaginas") or payload.get("totalPages") or 1)
+
+    rows = []
+    for item in items:
+        row = {column: pick(item, keys) for column, keys in FIELD_MAP.items()}
+        row["VARA"] = vara_name
+        rows.append(row)
+
+    return rows, pages
+
+
+@dataclass
+class HostLimiter:
+    """Space the requests sent to each host.
+
+    Attributes:
+        rate (float): Requests per second per host.
+        next_slot (dict[str, float]): When each host accepts its next request.
+        lock (asyncio.Lock): Guards ``next_slot``.
+
+    """
+
+    rate: float
+    next_slot: dict[str, float] = field(default_factory=dict)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    async def wait(self, url: str) -> None:
+        """Wait for the turn of the host of a URL.
+
+        Args:
+            url (str): The URL about to be requested.
+
+        """
+        host = urlsplit(url).netloc
+        async with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + 1 / self.rate
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class PautaHarvester:
+    """Fetch the pautas of every (vara, date) pair concurrently.
+
+    Attributes:
+        url_template (str): URL template of the pauta endpoint.
+        cookies (dict[str, str]): Cookies of the authenticated browser session.
+        headers (dict[str, str]): Headers sent with every request.
+        concurrency (int): Requests in flight at once.
+        rate (float): Requests per second per host.
+        retries (int): Attempts per page.
+        record_dir (Path | None): Directory where the responses are recorded.
+
+    """
+
+    def __init__(
+        self,
+        url_template: str,
+        cookies: dict[str, str] = None,
+        headers: dict[str, str] = None,
+    ) -> None:
+        """Configure the harvester.
+
+        Args:
+            url_template (str): URL template of the pauta endpoint.
+            cookies (dict[str, str], optional): Cookies of the authenticated browser session.
+            headers (dict[str, str], optional): Headers sent with every request.
+
+        """
+        self.url_template = url_template
+        self.cookies = cookies or {}
+        self.headers = {"Accept": "application/json", **(headers or {})}
+        self.concurrency = int(getenv("PJE_PAUTAS_CONCURRENCY", "8"))
+        self.rate = float(getenv("PJE_PAUTAS_RATE", "4"))
+        self.retries = int(getenv("PJE_PAUTAS_RETRIES", "3"))
+        self.record_dir = Path(getenv("PJE_PAUTAS_RECORD")) if getenv("PJE_PAUTAS_RECORD") else None
+
+    def record(self, code: str, date: str, page: int, payload: dict | list) -> None:
+        """Save a response to the record directory, in the layout the replay server serves.
+
+        Args:
+            code (str): The vara code, without ``#``.
+            date (str): The date, ``YYYY-MM-DD``.
+            page (int): The page number.
+            payload (dict | list): The decoded JSON.
+
+        """
+        try:
+            self.record_dir.mkdir(parents=True, exist_ok=True)
+            self.record_dir.joinpath(f"{code}-{date}-{page}.json").write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+
+        except OSError as e:
+            logger.warning("Falha ao gravar resposta da pauta %s em %s: %s", code, date, str(e))
+
+    async def get_json(
+        self,
+        client: httpx.AsyncClient,
+        limiter: HostLimiter,
+        url: str,
+    ) -> dict | list:
+        """Request a page, retrying transient failures with exponential backoff.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client.
+            limiter (HostLimiter): The per-host rate limiter.
+            url (str): The page URL.
+
+        Returns:
+            dict | list: The decoded JSON.
+
+        Raises:
+            httpx.HTTPError: If the page still fails after the last attempt.
+
+        """
+        for attempt in range(1, self.retries + 1):
+            await limiter.wait(url)
+            try:
+                response = await client.get(url)
+                if response.status_code in RETRY_STATUS and attempt < self.retries:
+                    retry_after = response.headers.get("Retry-After", "")
+                    await asyncio.sleep(float(retry_after) if retry_after.isdigit() else 2**attempt)
+                    continue
+
+                response.raise_for_status()
+                return response.json()
+
+            except httpx.TransportError:
+                if attempt == self.retries:
+                    raise
+
+                await asyncio.sleep(2**attempt)
+
+        raise httpx.HTTPError(f"Sem resposta de {url}")
+
+    async def fetch(
+        self,
+        client: httpx.AsyncClient,
+        limiter: HostLimiter,
+        semaphore: asyncio.Semaphore,
+        vara_name: str,
+        vara: str,
+        date: str,
+        stop: Callable[[], bool] = None,
+    ) -> list[dict[str, str]] | None:
+        """Fetch every page of the pauta of a vara on a date.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client.
+            limiter (HostLimiter): The per-host rate limiter.
+            semaphore (asyncio.Semaphore): Bounds the requests in flight.
+            vara_name (str): The vara name.
+            vara (str): The vara code, as in ``varas_dict``.
+            date (str): The date, ``YYYY-MM-DD``.
+            stop (Callable[[], bool], optional): Checked before each page request.
+
+        Returns:
+            list[dict[str, str]] | None: The pauta rows, or None if the harvest was stopped first.
+
+        """
+        code = vara.replace("#", "")
+        rows: list[dict[str, str]] = []
+        page, pages = 1, 1
+        while page <= pages:
+            url = self.url_template.format(vara=code, date=date, page=page)
+            async with semaphore:
+                if stop is not None and stop():
+                    return None
+
+                payload = await self.get_json(client, limiter, url)
+
+            if self.record_dir is not None:
+                self.record(code, date, page, payload)
+
+            page_rows, pages = parse_page(payload, vara_name)
+            rows.extend(page_rows)
+            page += 1
+
+        return rows
+
+    async def harvest(
+        self,
+        jobs: list[tuple[str, str, str]],
+        on_done: Callable[[str, str, str, list[dict[str, str]] | Exception], None],
+        stop: Callable[[], bool] = None,
+    ) -> None:
+        """Fetch all the (vara, date) pairs.
+
+        Args:
+            jobs (list[tuple[str, str, str]]): The (vara name, vara code, date) triples.
+            on_done (Callable): Called with the vara name, code, date and the rows (or
+                the exception) as each pair finishes, in completion order. It runs in a
+                worker thread, one call at a time, so it may block on disk or the log socket.
+            stop (Callable[[], bool], optional): Returns True once the harvest must stop; checked
+                before each page request, and the pairs left unfinished are not reported.
+
+        """
+        done_lock = Lock()
+
+        def report(vara_name: str, vara: str, date: str, result: list[dict[str, str]] | Exception) -> None:
+            with done_lock:
+                on_done(vara_name, vara, date, result)
+
+        limiter = HostLimiter(self.rate)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        async with httpx.AsyncClient(
+            cookies=self.cookies,
+            headers=self.headers,
+            limits=limits,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            follow_redirects=True,
+        ) as client:
+
+            async def run(vara_name: str, vara: str, date: str) -> None:
+                try:
+                    result = await self.fetch(client, limiter, semaphore, vara_name, vara, date, stop)
+
+                except (httpx.HTTPError, ValueError) as e:
+                    logger.warning("Falha ao buscar pauta %s em %s: %s", vara, date, str(e))
+                    result = e
+
+                if result is not None:
+                    await asyncio.to_thread(report, vara_name, vara, date, result)
+
+            await asyncio.gather(*(run(vara_name, vara, date) for vara_name, vara, date in jobs))
+
+    def run(
+        self,
+        jobs: list[tuple[str, str, str]],
+        on_done: Callable[[str, str, str, list[dict[str, str]] | Exception], None],
+        stop: Callable[[], bool] = None,
+    ) -> None:
+        """Fetch all the (vara, date) pairs from synchronous code.
+
+        Args:
+            jobs (list[tuple[str, str, str]]): The (vara name, vara code, date) triples.
+            on_done (Callable): Called as each pair finishes (see ``harvest``).
+            stop (Callable[[], bool], optional): Returns True once the harvest must stop (see ``harvest``).
+
+        """
+        asyncio.run(self.harvest(jobs, on_done, stop))
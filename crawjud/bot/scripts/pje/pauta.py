@@ -11,13 +11,14 @@ from datetime import datetime, timedelta
 from time import sleep
 from typing import Self
 
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 
 from crawjud.bot.common import ExecutionError
 from crawjud.bot.core import CrawJUD
+from crawjud.bot.scripts.pje.common.pauta_harvester import PautaHarvester, pauta_api_url
 from crawjud.bot.scripts.pje.common.varas_dict import varas as varas_pje
 
 
@@ -83,6 +84,12 @@ class Pauta(CrawJUD):
             varas = {k: v for k, v in varas_pje().items() if v in varas_}
             list_varas = list(varas.items())
 
+        url_template = pauta_api_url()
+        if url_template:
+            self.harvest(list_varas, url_template)
+            self.finalize_execution()
+            return
+
         self.total_rows = len(list_varas)
         for pos, row in enumerate(list_varas):
             vara_name, vara = row
@@ -180,6 +187,71 @@ class Pauta(CrawJUD):
             self.logger.exception("".join(traceback.format_exception(e)))
             raise ExecutionError(e=e) from e
 
+    def harvest(self, list_varas: list[tuple[str, str]], url_template: str) -> None:
+        """Fetch the pautas of every vara and date over HTTP and write them to the output.
+
+        The authenticated session of the browser is handed to the PautaHarvester once;
+        the (vara, date) pairs are then fetched concurrently, and each one is written
+        to its own spreadsheet as soon as it finishes.
+
+        Args:
+            list_varas (list[tuple[str, str]]): The (vara name, vara code) pairs.
+            url_template (str): URL template of the pauta endpoint.
+
+        """
+        dates: list[str] = []
+        current_date = self.data_inicio
+        while current_date <= self.data_fim:
+            dates.append(current_date.strftime("%Y-%m-%d"))
+            current_date += timedelta(days=1)
+
+        jobs = [(vara_name, vara, date) for vara_name, vara in list_varas for date in dates]
+        self.total_rows = len(jobs)
+
+        self.message = f"Buscando pautas de {len(list_varas)} varas em {len(dates)} datas"
+        self.type_log = "log"
+        self.prt()
+
+        harvester = PautaHarvester(
+            url_template,
+            cookies={cookie["name"]: cookie["value"] for cookie in self.driver.get_cookies()},
+            headers={"User-Agent": self.driver.execute_script("return navigator.userAgent")},
+        )
+
+        def on_done(vara_name: str, vara: str, date: str, result: list[dict[str, str]] | Exception) -> None:
+            self.row += 1
+            if isinstance(result, Exception):
+                self.type_log = "error"
+                self.message_error = f"{result}. | Operação: Buscando pautas na vara {vara_name} em {date}"
+                self.prt()
+
+                self.append_error({"VARA": vara_name, "DATA": date, "MOTIVO_ERRO": self.message_error})
+                self.message_error = None
+                return
+
+            if not result:
+                return
+
+            self.data_append.setdefault(vara, {})[date] = result
+            fileN = f"{vara.replace('#', '').upper()} - {date.replace('-', '.')} - {self.pid}.xlsx"  # noqa: N806
+            self.append_success(
+                data=result,
+                fileN=fileN,
+                message=f"{len(result)} pautas encontradas na vara {vara_name} em {date}",
+            )
+
+        harvester.run(jobs, on_done, stop=lambda: self.isStoped)
+
+        data_append = self.group_date_all(self.data_append)
+        if len(data_append) > 0:
+            fileN = os.path.basename(self.path)  # noqa: N806
+            self.append_success(data=data_append, fileN=fileN, message="Dados extraídos com sucesso!")
+
+        elif len(data_append) == 0:
+            self.message = "Nenhuma pauta encontrada"
+            self.type_log = "error"
+            self.prt()
+
     def get_pautas(self, current_date: type[datetime], vara: str) -> None:
         """Retrieve and parse pautas from the page for the given date and court branch now.
 
@@ -211,7 +283,7 @@ class Pauta(CrawJUD):
             )[-1]
 
             with suppress(NoSuchElementException, TimeoutException):
-                itens_pautas = table_pautas.find_element(By.TAG_NAME, "tbody").find_elements(By.TAG_NAME, "tr")
+                itens_pautas = self.table_snapshot.rows(table_pautas.find_element(By.TAG_NAME, "tbody"))
 
             if itens_pautas:
                 self.message = "Pautas encontradas!"
@@ -220,34 +292,31 @@ class Pauta(CrawJUD):
 
                 times = 6
 
+                vara_name = self.driver.find_element(
+                    By.CSS_SELECTOR,
+                    'span[class="ng-tns-c11-1 ng-star-inserted"]',
+                ).text
+
                 for item in itens_pautas:
-                    vara_name = self.driver.find_element(
-                        By.CSS_SELECTOR,
-                        'span[class="ng-tns-c11-1 ng-star-inserted"]',
-                    ).text
-                    with suppress(StaleElementReferenceException):
-                        item: WebElement = item
-                        itens_tr = item.find_elements(By.TAG_NAME, "td")
-
-                        appends = {
-                            "INDICE": int(itens_tr[0].text),
-                            "NUMERO_PROCESSO": itens_tr[3].find_element(By.TAG_NAME, "a").text.split(" ")[1],
-                            "VARA": vara_name,
-                            "HORARIO": itens_tr[1].text,
-                            "TIPO": itens_tr[2].text,
-                            "ATO": itens_tr[3].find_element(By.TAG_NAME, "a").text.split(" ")[0],
-                            "PARTES": itens_tr[3]
-                            .find_element(By.TAG_NAME, "span")
-                            .find_element(By.TAG_NAME, "span")
-                            .text,
-                            "SALA": itens_tr[5].text,
-                            "SITUACAO": itens_tr[6].text,
-                        }
-
-                        self.data_append[vara][current_date].append(appends)
-                        self.message = f"Processo {appends['NUMERO_PROCESSO']} adicionado!"
-                        self.type_log = "info"
-                        self.prt()
+                    itens_tr = item.find_all("td")
+                    link_processo = itens_tr[3].find("a").text
+
+                    appends = {
+                        "INDICE": int(itens_tr[0].text),
+                        "NUMERO_PROCESSO": link_processo.split(" ")[1],
+                        "VARA": vara_name,
+                        "HORARIO": itens_tr[1].text,
+                        "TIPO": itens_tr[2].text,
+                        "ATO": link_processo.split(" ")[0],
+                        "PARTES": itens_tr[3].find("span").find("span").text,
+                        "SALA": itens_tr[5].text,
+                        "SITUACAO": itens_tr[6].text,
+                    }
+
+                    self.data_append[vara][current_date].append(appends)
+                    self.message = f"Processo {appends['NUMERO_PROCESSO']} adicionado!"
+                    self.type_log = "info"
+                    self.prt()
 
                 try:
                     btn_next = self.driver.find_element(By.CSS_SELECTOR, 'button[aria-label="Próxima página"]')
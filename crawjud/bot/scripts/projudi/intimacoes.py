@@ -17,6 +17,7 @@ from selenium.webdriver.support.ui import Select
 
 from crawjud.bot.common import ExecutionError
 from crawjud.bot.core import CrawJUD
+from crawjud.bot.Utils.snapshot import HtmlNode
 
 
 class Intimacoes(CrawJUD):
@@ -189,12 +190,12 @@ class Intimacoes(CrawJUD):
             self.logger.exception(str(e))
             raise ExecutionError(e=e) from e
 
-    def get_intimacao_information(self, name_colunas: list[WebElement], intimacoes: list[WebElement]) -> dict:
+    def get_intimacao_information(self, name_colunas: list[HtmlNode], intimacoes: list[HtmlNode]) -> dict:
         """Extract detailed intimation information from table rows.
 
         Args:
-            name_colunas (list[WebElement]): Table header elements.
-            intimacoes (list[WebElement]): Table row elements for intimations.
+            name_colunas (list[HtmlNode]): Table header cells.
+            intimacoes (list[HtmlNode]): Table rows for intimations, from the table snapshot.
 
         Returns:
             dict: Processed intimation data.
@@ -203,9 +204,10 @@ class Intimacoes(CrawJUD):
         list_data = []
         for item in intimacoes:
             data: dict[str, str] = {}
-            itens: tuple[str] = tuple(item.find_elements(By.TAG_NAME, "td")[0].text.split("\n"))
-            itens2: tuple[str] = tuple(item.find_elements(By.TAG_NAME, "td")[1].text.split("\n"))
-            itens3: tuple[str] = tuple(item.find_elements(By.TAG_NAME, "td")[2].text.split("\n"))
+            cells = item.find_all("td")
+            itens: tuple[str] = tuple(cells[0].text.split("\n"))
+            itens2: tuple[str] = tuple(cells[1].text.split("\n"))
+            itens3: tuple[str] = tuple(cells[2].text.split("\n"))
 
             self.message = "Intimação do processo %s encontrada!" % itens[0]
             self.type_log = "log"
@@ -228,8 +230,8 @@ class Intimacoes(CrawJUD):
 
         return list_data
 
-    def get_intimacoes(self, aba_intimacoes: WebElement) -> tuple[list[WebElement], list[WebElement]]:
-        """Retrieve the header and row elements from the intimações table.
+    def get_intimacoes(self, aba_intimacoes: WebElement) -> tuple[list[HtmlNode], list[HtmlNode]]:
+        """Retrieve the header cells and rows of the intimações table in a single snapshot.
 
         Args:
             aba_intimacoes (WebElement): The intimacoes table element.
@@ -239,8 +241,9 @@ class Intimacoes(CrawJUD):
 
         """
         table_intimacoes = aba_intimacoes.find_element(By.CSS_SELECTOR, 'table[class="resultTable"]')
+        snapshot = self.table_snapshot.take(table_intimacoes)
 
-        thead_table = table_intimacoes.find_element(By.TAG_NAME, "thead").find_elements(By.TAG_NAME, "th")
-        tbody_table = table_intimacoes.find_element(By.TAG_NAME, "tbody").find_elements(By.TAG_NAME, "tr")
+        thead_table = snapshot.find("thead").find_all("th")
+        tbody_table = snapshot.find("tbody").find_all("tr")
 
         return thead_table, tbody_table
@@ -9,14 +9,11 @@ import shutil
 import time
 import traceback
 from contextlib import suppress
-from datetime import datetime
 from pathlib import Path
 from time import sleep
 from typing import Self
+from urllib.parse import urljoin
 
-import requests
-from pypdf import PdfReader
-from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
@@ -24,6 +21,8 @@ from selenium.webdriver.support.ui import Select
 
 from crawjud.bot.common import ExecutionError
 from crawjud.bot.core import CrawJUD
+from crawjud.bot.Utils.move_matcher import MoveMatcher
+from crawjud.bot.Utils.snapshot import HtmlNode
 
 
 class Movimentacao(CrawJUD):
@@ -70,7 +69,7 @@ class Movimentacao(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -175,176 +174,44 @@ class Movimentacao(CrawJUD):
             ExecutionError: If no movements are found in the scraping process.
 
         """
-        encontrado = False
-        keywords = []
         self.set_page_size()
         self.set_tablemoves()
 
-        keyword = self.bot_data.get("PALAVRA_CHAVE", self.bot_data.get("PALAVRAS_CHAVE", "*"))
-
-        if keyword != "*":
-            keywords.extend(keyword.split(",") if "," in keyword else [keyword])
-
-        if len(keywords) > 0:
-            for keyword in keywords:
-                encontrado = self.scrap_moves(keyword)
-
-        elif len(keywords) == 0 and keyword == "*":
-            encontrado = self.scrap_moves(keyword)
+        self.move_matcher = MoveMatcher.from_row(self.bot_data)
+        encontrado = self.scrap_moves()
 
         if encontrado is False:
             raise ExecutionError(message="Nenhuma movimentação encontrada")
 
-    def filter_moves(self, move: WebElement) -> bool:
-        """Filter a movement element based on given date and keyword criteria.
+    def filter_moves(self, move: HtmlNode) -> list[str]:
+        """Match a movement against the keyword, date and INTIMADO criteria of the row.
 
         Args:
-            move (WebElement): A movement element to be filtered.
+            move (HtmlNode): A movement row, from the table snapshot.
 
         Returns:
-            bool: True if the movement meets all criteria; otherwise, False.
+            list[str]: The keywords matched by the movement (empty if it does not meet the criteria).
 
         """
-        keyword = self.kword
-        itensmove = move.find_elements(By.TAG_NAME, "td")
+        itensmove = move.find_all("td")
 
         if len(itensmove) < 5:
-            return False
+            return []
 
         text_mov = str(itensmove[3].text)
         data_mov = str(itensmove[2].text.split(" ")[0]).replace(" ", "")
 
-        def data_check(data_mov: str) -> bool:
-            """Validate the given date string against multiple date formats and checks if it falls within a specified date range.
-
-            Args:
-                data_mov (str): The date string to be validated.
-
-            Returns:
-                bool: True if the date string is valid and falls within the specified date range, False otherwise.
-            The function performs the following steps:
-            1. Tries to match the given date string against multiple date formats.
-            2. Converts the matched date string to a datetime object.
-            3. Retrieves the start and end dates from the bot's data.
-            4. Validates and converts the start and end dates if they are not already datetime objects.
-            5. Checks if the given date falls within the start and end dates.
-            The supported date formats are:
-            - "%d/%m/%Y"
-            - "%m/%d/%Y"
-            - "%Y/%m/%d"
-            - "%Y/%d/%m"
-
-            """  # noqa: E501
-            patterns = [
-                ("%d/%m/%Y", r"\b(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/\d{4}\b"),
-                ("%m/%d/%Y", r"\b(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])/\d{4}\b"),
-                ("%Y/%m/%d", r"\b\d{4}/(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])\b"),
-                ("%Y/%d/%m", r"\b\d{4}/(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])\b"),
-            ]
-
-            for format_d, pattern in patterns:
-                match_ = re.match(pattern, data_mov)
-                match_: re.Match | None = match_
-                if match_ is not None:
-                    data_mov = datetime.strptime(data_mov, format_d)
-                    break
-
-            data_inicio = self.bot_data.get("DATA_INICIO", data_mov)
-            data_fim = self.bot_data.get("DATA_FIM", data_mov)
-            chk_datafim = type(data_fim) is datetime
-            chk_datainicio = type(data_inicio) is datetime
-
-            if chk_datainicio is False:
-                for format_d, pattern in patterns:
-                    data_inicio.replace(" ", "")
-                    match_ = re.match(pattern, data_mov)
-                    match_: re.Match | None = match_
-                    if match_ is not None:
-                        data_inicio = datetime.strptime(data_inicio, format_d)
-                        break
-
-            if chk_datafim is False:
-                for format_d, pattern in patterns:
-                    data_fim.replace(" ", "")
-
-                    match_ = re.match(pattern, data_mov)
-                    match_: re.Match | None = match_
-                    if match_ is not None:
-                        data_fim = datetime.strptime(data_fim, format_d)
-                        break
-
-            return all([data_mov >= data_inicio, data_mov <= data_fim])
-
-        def text_check(text_mov: str) -> bool:
-            """Check if the given text matches certain criteria.
-
-            This function evaluates whether the provided text (`text_mov`) meets any of the following conditions:
-            - Contains a keyword that is an asterisk ("*").
-            - The first line of the text matches a keyword (case-insensitive).
-            - The entire text matches a keyword (case-insensitive).
-            - The keyword is a substring of the text (case-insensitive).
-            - The similarity between the keyword and the first line of the text is greater than 0.8.
-
-            Args:
-                text_mov (str): The text to be checked.
-
-            Returns:
-                bool: True if any of the conditions are met, False otherwise.
-
-            """
-            check_palavra = any(
-                chk is True
-                for chk in [
-                    keyword == "*",
-                    keyword.lower() == text_mov.split("\n")[0].lower(),
-                    keyword.lower() == text_mov.lower(),
-                    keyword.lower() in text_mov.lower(),
-                    self.similaridade(keyword.lower(), text_mov.split("\n")[0].lower()) > 0.8,
-                ]
-            )
-
-            return check_palavra
-
-        def check_intimado() -> bool:
-            """Check if the bot is intimated based on the bot data.
-
-            This function checks if the bot has been intimated by looking for the
-            "INTIMADO" key in the bot data. If the key is present, it verifies if
-            the value associated with the key is present in the text_mov string
-            (case insensitive).
-
-            Returns:
-                bool: True if the bot is intimated or if the "INTIMADO" key is not
-                present in the bot data, False otherwise.
-
-            """
-            intimado_chk = True
-            intimado = self.bot_data.get("INTIMADO", None)
-
-            if intimado is not None:
-                intimado_chk = str(intimado).lower() in text_mov.lower()
+        return self.move_matcher.match(text_mov, data_mov)
 
-            return intimado_chk
-
-        resultados = all([data_check(data_mov), text_check(text_mov), check_intimado()])
-
-        return resultados
-
-    def scrap_moves(self, keyword: str) -> None:
-        """Scrape movements that contain the specified keyword.
-
-        Args:
-            keyword (str): The keyword to filter movements by.
+    def scrap_moves(self) -> None:
+        """Scrape the movements matching any keyword of the row, in a single pass over the table.
 
         Raises:
             ExecutionError: If an error is encountered during scraping.
 
-        Returns:
-            bool: True if movements are found, otherwise False.
-
         """
-        self.kword = keyword
-        move_filter = list(filter(self.filter_moves, self.table_moves))
+        move_filter = [(move, keywords) for move in self.table_moves if (keywords := self.filter_moves(move))]
+        keyword = ", ".join(self.move_matcher.keywords)
 
         message_ = [
             "\n====================================================\n",
@@ -408,9 +275,10 @@ class Movimentacao(CrawJUD):
             return (mov_chk, trazer_teor, mov, use_gpt, save_another_file)
 
         """ Iteração dentro das movimentações filtradas """
-        for move in move_filter:
+        matched: list[tuple[list[str], str, dict[str, str]]] = []
+        for move, keywords in move_filter:
             mov_texdoc = ""
-            itensmove = move.find_elements(By.TAG_NAME, "td")
+            itensmove = move.find_all("td")
 
             text_mov = str(itensmove[3].text)
             data_mov = str(itensmove[2].text.split(" ")[0]).replace(" ", "")
@@ -418,7 +286,7 @@ class Movimentacao(CrawJUD):
             """ Outros Checks """
             mov_chk, trazerteor, mov_name, use_gpt, save_another_file = check_others(text_mov)
 
-            nome_mov = str(itensmove[3].find_element(By.TAG_NAME, "b").text)
+            nome_mov = str(itensmove[3].find("b").text)
             movimentador = itensmove[4].text
 
             """ Formatação Nome Movimentador """
@@ -427,9 +295,9 @@ class Movimentacao(CrawJUD):
                 qualificacao_movimentador = movimentador
 
             elif "\n" in movimentador:
-                info_movimentador = movimentador.split("\n ")
+                info_movimentador = movimentador.split("\n")
                 movimentador = info_movimentador[0].replace("  ", "")
-                qualificacao_movimentador = info_movimentador[1]
+                qualificacao_movimentador = info_movimentador[1].strip()
 
             """ Verifica se o usuario optou por trazer o texto do documento caso seja mencionado um no andamento """
             if trazerteor:
@@ -454,72 +322,80 @@ class Movimentacao(CrawJUD):
                 "Classiicação Peticionante": qualificacao_movimentador,
                 "Texto documento Mencionado (Caso Tenha)": mov_texdoc,
             }
-            ms_ = [f'Movimentação "{nome_mov}" salva na planilha!']
-            if keyword != "*":
-                ms_.append(f" Parâmetro: {keyword}")
-            self.message = "".join(ms_)
+            matched.append((keywords, nome_mov, data))
 
-            self.type_log = "info"
-            self.prt()
+        """ Linhas agrupadas por palavra-chave, na ordem da planilha """
+        for keyword in self.move_matcher.keywords:
+            for keywords, nome_mov, data in matched:
+                if keyword not in keywords:
+                    continue
+
+                ms_ = [f'Movimentação "{nome_mov}" salva na planilha!']
+                if keyword != "*":
+                    ms_.append(f" Parâmetro: {keyword}")
+                self.message = "".join(ms_)
 
-            self.appends.append(data)
+                self.type_log = "info"
+                self.prt()
+
+                self.appends.append(dict(data))
 
-    def get_another_move(self, keyword: str) -> list[WebElement]:
+    def get_another_move(self, keyword: str) -> list[HtmlNode]:
         """Retrieve movement entries that contain a document matching the keyword.
 
         Args:
             keyword (str): Document keyword to search for.
 
         Returns:
-            list[WebElement]: List of movement elements that match.
+            list[HtmlNode]: List of movement rows that match.
 
         """
 
-        def getmovewithdoc(move: WebElement) -> bool:
-            def check_namemov(move: WebElement) -> bool:
-                itensmove = move.find_elements(By.TAG_NAME, "td")
-                text_mov = itensmove[3].find_element(By.TAG_NAME, "b").text
+        def getmovewithdoc(move: HtmlNode) -> bool:
+            def check_namemov(move: HtmlNode) -> bool:
+                itensmove = move.find_all("td")
+                text_mov = itensmove[3].find("b").text
                 return keyword.upper() == text_mov.upper()
 
             return check_namemov(move)
 
         return list(filter(getmovewithdoc, self.table_moves))
 
-    def movecontainsdoc(self, move: WebElement) -> bool:
-        """Determine if a movement element includes an associated document.
+    def movecontainsdoc(self, move: HtmlNode) -> bool:
+        """Determine if a movement row includes an associated document.
 
         Args:
-            move (WebElement): The movement element to check.
+            move (HtmlNode): The movement row to check.
 
         Returns:
             bool: True if the document exists; otherwise, False.
 
         """
         expand = None
-        with suppress(NoSuchElementException):
-            self.expand_btn = move.find_element(By.CSS_SELECTOR, self.elements.expand_btn_projudi)
+        with suppress(LookupError):
+            self.expand_btn = move.find(self.elements.expand_btn_projudi)
 
             expand = self.expand_btn
 
         return expand is not None
 
-    def getdocmove(self, move: WebElement, save_in_anotherfile: bool = None) -> str:
-        """Extract the document text from the movement element.
+    def getdocmove(self, move: HtmlNode, save_in_anotherfile: bool = None) -> str:
+        """Extract the document text from the movement row.
 
         Args:
-            move (WebElement): Movement element to process.
+            move (HtmlNode): Movement row to process, from the table snapshot.
             save_in_anotherfile (bool, optional): If True, save the doc info in a separate file.
 
         Returns:
             str: The extracted document text.
 
         """
-        itensmove = move.find_elements(By.TAG_NAME, "td")
+        itensmove = move.find_all("td")
 
         text_mov = str(itensmove[3].text)
         data_mov = str(itensmove[2].text.split(" ")[0]).replace(" ", "")
 
-        nome_mov = str(itensmove[3].find_element(By.TAG_NAME, "b").text)
+        nome_mov = str(itensmove[3].find("b").text)
         movimentador = itensmove[4].text
 
         """ Formatação Nome Movimentador """
@@ -528,13 +404,13 @@ class Movimentacao(CrawJUD):
             qualificacao_movimentador = movimentador
 
         elif "\n" in movimentador:
-            info_movimentador = movimentador.split("\n ")
+            info_movimentador = movimentador.split("\n")
             movimentador = info_movimentador[0].replace("  ", "")
-            qualificacao_movimentador = info_movimentador[1]
+            qualificacao_movimentador = info_movimentador[1].strip()
 
         """ Botão para ver os documentos da movimentação """
-        expand = self.expand_btn
-        expandattrib = expand.get_attribute("class")
+        expandattrib = self.expand_btn.get_attribute("class")
+        expand = self.driver.find_element(By.CSS_SELECTOR, f'a[class="{expandattrib}"]')
         id_tr = expandattrib.replace("linkArquivos", "row")
         css_tr = f'tr[id="{id_tr}"]'
 
@@ -550,62 +426,43 @@ class Movimentacao(CrawJUD):
 
         sleep(2)
         table_docs: WebElement = self.wait.until(ec.presence_of_element_located((By.CSS_SELECTOR, css_tr)))
-        rows = table_docs.find_elements(By.TAG_NAME, "tr")
+        rows = self.table_snapshot.rows(table_docs)
         rows_reverse = rows[::-1]
         max_rows = len(rows) - 1
+
+        numproc = self.bot_data.get("NUMERO_PROCESSO")
+        path_pdfs = Path(self.output_dir_path).resolve().joinpath(numproc)
+        path_pdfs.mkdir(exist_ok=True, parents=True)
+
+        """ Coleta os links de todos os documentos antes de baixá-los em paralelo """
+        docs_move: list[tuple[int, str, str, str, str]] = []
         for pos, docs in enumerate(rows_reverse):
-            numproc = self.bot_data.get("NUMERO_PROCESSO")
             nomearquivo = (
                 f"{numproc}",
                 f" - {nome_mov.upper()} - {self.pid} - DOC{pos}.pdf",
             )
-
-            path_pdfs = Path(self.output_dir_path).resolve().joinpath(numproc)
-            path_pdfs.mkdir(exist_ok=True, parents=True)
             path_pdf = os.path.join(path_pdfs, "".join(nomearquivo))
 
             if os.path.exists(path_pdf):
                 continue
 
-            doc = docs.find_elements(By.TAG_NAME, "td")[4]
-            link_doc = doc.find_element(By.TAG_NAME, "a")
+            doc = docs.find_all("td")[4]
+            link_doc = doc.find("a")
             name_pdf = self.format_string(str(link_doc.text))
-            old_pdf = Path(os.path.join(self.output_dir_path), name_pdf)  # noqa: F841
-            url = link_doc.get_attribute("href")
+            url = urljoin(self.driver.current_url, link_doc.get_attribute("href"))
+            docs_move.append((pos, "".join(nomearquivo), path_pdf, name_pdf, url))
 
-            # Get cookies from ChromeDriver session
-            cookies = {cookie["name"]: cookie["value"] for cookie in self.driver.get_cookies()}
+        downloaded = self.document_fetcher.fetch_all([(url, path_pdf) for _, _, path_pdf, _, url in docs_move])
 
-            # Download using requests
-            response = requests.get(url, cookies=cookies, allow_redirects=True, timeout=60)
+        for (_, _, path_pdf, name_pdf, url), ok in zip(docs_move, downloaded, strict=True):
+            if not ok:
+                # Fallback to ChromeDriver download if the HTTP client fails
+                self.download_with_browser(url, name_pdf, path_pdf)
 
-            if response.status_code == 200:
-                with open(path_pdf, "wb") as f:
-                    f.write(response.content)
-            elif response.status_code != 200:
-                # Fallback to ChromeDriver download if requests fails
-                self.driver.get(url)
+        extracted = self.pdf_extractor.submit([path_pdf for _, _, path_pdf, _, _ in docs_move])
 
-                sleep(2)
-                while True:
-                    for root, _, files in self.output_dir_path.walk():
-                        for f in files:
-                            grau_similaridade = self.similaridade(name_pdf, f)
-                            if grau_similaridade > 0.8:
-                                old_pdf = Path(root).joinpath(f)
-                                file_found = True
-                                break
-
-                        if file_found:
-                            break
-
-                    if file_found:
-                        break
-                    sleep(0.5)
-
-                shutil.move(old_pdf, path_pdf)
-
-            text_mov = self.openfile(path_pdf)
+        for (pos, nomearquivo, _, _, _), pages in zip(docs_move, extracted, strict=True):
+            text_mov = "".join(page.replace("\n", " ") for page in pages.result())
 
             # if str(self.bot_data.get("TRAZER_PDF", "NÃO")).upper() == "NÃO" or pos < max_rows:
             #     sleep(1)
@@ -618,7 +475,7 @@ class Movimentacao(CrawJUD):
                 "Texto da movimentação": text_mov,
                 "Nome peticionante": movimentador,
                 "Classiicação Peticionante": qualificacao_movimentador,
-                "Nome Arquivo (Caso Tenha)": "".join(nomearquivo),
+                "Nome Arquivo (Caso Tenha)": nomearquivo,
             }
             if save_in_anotherfile is True:
                 msg = (
@@ -633,6 +490,27 @@ class Movimentacao(CrawJUD):
 
         return text_doc_1
 
+    def download_with_browser(self, url: str, name_pdf: str, path_pdf: str) -> None:
+        """Download a document through the browser and move it to its final path.
+
+        Args:
+            url (str): The document URL.
+            name_pdf (str): The file name expected from the browser download.
+            path_pdf (str): The destination path.
+
+        Raises:
+            ExecutionError: If the download does not finish.
+
+        """
+        download = self.download_manager.expect(lambda name: self.similaridade(name_pdf, name) > 0.8)
+        self.driver.get(url)
+
+        old_pdf = self.download_manager.wait(download)
+        if old_pdf is None:
+            raise ExecutionError(message="Download do documento não concluído")
+
+        shutil.move(old_pdf, path_pdf)
+
     def openfile(self, path_pdf: str) -> str:
         """Open a PDF file and extract its text content.
 
@@ -643,19 +521,13 @@ class Movimentacao(CrawJUD):
             str: The extracted text from the PDF.
 
         """
-        with open(path_pdf, "rb") as pdf:
-            read = PdfReader(pdf)
-            # Read PDF
-            pagescontent = ""
-            for page in read.pages:
-                with suppress(Exception):
-                    text = page.extract_text()
-                    remove_n_space = text.replace("\n", " ")
-                    pagescontent = pagescontent + remove_n_space
-
-        return pagescontent
+        return self.pdf_extractor.text(path_pdf)
 
     def set_tablemoves(self) -> None:
-        """Locate the movement table and assign its elements to self.table_moves."""
+        """Snapshot the movement table and assign its visible movement rows to self.table_moves."""
         table_moves = self.driver.find_element(By.CLASS_NAME, "resultTable")
-        self.table_moves = table_moves.find_elements(By.XPATH, self.elements.table_moves)
+        self.table_moves = [
+            row
+            for row in self.table_snapshot.rows(table_moves)
+            if row.has_class("odd", "even") and row.get_attribute("style") != "display:none"
+        ]
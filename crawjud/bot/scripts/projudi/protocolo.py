@@ -88,7 +88,7 @@ class Protocolo(CrawJUD):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
+        for pos, value in self.shard_rows(frame):
             self.row = pos + 1
             self.bot_data = value
             if self.isStoped:
@@ -426,7 +426,7 @@ class Protocolo(CrawJUD):
                 self.type_log = "log"
                 self.prt()
                 input_file_element: WebElement = WebDriverWait(self.driver, 10).until(
-                    ec.presence_of_element_located((By.XPATH, self.elements.conteudo)),
+                    ec.presence_of_element_located(self.elements.locator("conteudo")),
                 )
                 input_file_element.send_keys(
                     f"{os.path.join(Path(self.path_args).parent.resolve())}/{file_to_upload}",
@@ -23,18 +23,30 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.wait import WebDriverWait
 from socketio import Client
 
+from crawjud.bot.common.stop_signal import StopSignal
 from crawjud.logs import log_cfg
 from crawjud.types import SubDict, TypeValues
 
 if TYPE_CHECKING:
     from crawjud.bot.Utils import ELAW_AME, ESAJ_AM, PJE_AM, PROJUDI_AM
+    from crawjud.bot.Utils import Checkpoint as _Checkpoint_
+    from crawjud.bot.Utils import DocumentFetcher as _DocumentFetcher_
+    from crawjud.bot.Utils import DownloadManager as _DownloadManager_
     from crawjud.bot.Utils import ElementsBot as ElementsBot_
+    from crawjud.bot.Utils import EntityCache as _EntityCache_
     from crawjud.bot.Utils import Interact as _Interact_
     from crawjud.bot.Utils import MakeXlsx as _MakeXlsx_
     from crawjud.bot.Utils import OtherUtils as _OtherUtils_
+    from crawjud.bot.Utils import PdfExtractor as _PdfExtractor_
+    from crawjud.bot.Utils import PhaseTimer as _PhaseTimer_
     from crawjud.bot.Utils import PrintBot as _PrintBot_
+    from crawjud.bot.Utils import ResultSink as _ResultSink_
     from crawjud.bot.Utils import SearchBot as _SearchBot_
     from crawjud.bot.Utils import SendMessage as _SendMessage_
+    from crawjud.bot.Utils import SessionStore as _SessionStore_
+    from crawjud.bot.Utils import TableSnapshot as _TableSnapshot_
+    from crawjud.bot.Utils import WaitEngine as _WaitEngine_
+    from crawjud.bot.Utils.Driver.pool import PooledSession
 
 
 load_dotenv()
@@ -61,6 +73,9 @@ class PropertiesCrawJUD:
         state_or_client_ (str): State or client identifier.
         type_log_ (str): Log type (default "info").
         graphicMode_ (str): Graphic mode (default "doughnut").
+        worker_id_ (int): Index of the worker process in parallel mode (0 for the main process).
+        assigned_rows_ (list[tuple[int, dict[str, str]]]): Rows assigned to a worker process.
+        pooled_session_ (PooledSession): Warm session leased by the worker's DriverPool, if any.
 
     """
 
@@ -91,6 +106,17 @@ class PropertiesCrawJUD:
     MakeXlsx_ = None
     OtherUtils_ = None
     PrintBot_ = None
+    ResultSink_ = None
+    DocumentFetcher_ = None
+    DownloadManager_ = None
+    PdfExtractor_ = None
+    TableSnapshot_ = None
+    WaitEngine_ = None
+    EntityCache_ = None
+    SessionStore_ = None
+    Checkpoint_ = None
+    PhaseTimer_ = None
+    StopSignal_ = StopSignal()
     SearchBot_ = None
     ElementsBotConfig_ = None
     path_: Path = None
@@ -107,6 +133,10 @@ class PropertiesCrawJUD:
     cr_list_args: list[str] = []
     another_append_: list[str] = []
     prompt_: str = None
+    worker_id_: int = 0
+    assigned_rows_: list[tuple[int, dict[str, str]]] = None
+    worker_processes_: list = []
+    pooled_session_: PooledSession = None
     kwargs_: dict[str, Union[TypeValues, SubDict]] = {}
     bot_data_: dict[str, TypeValues | SubDict] = {}
     logger = None
@@ -184,14 +214,24 @@ class PropertiesCrawJUD:
 
         """
         from crawjud.bot.Utils import AuthBot as _AuthBot_
+        from crawjud.bot.Utils import Checkpoint as _Checkpoint_
+        from crawjud.bot.Utils import DocumentFetcher as _DocumentFetcher_
+        from crawjud.bot.Utils import DownloadManager as _DownloadManager_
         from crawjud.bot.Utils import DriverBot as _DriverBot_
         from crawjud.bot.Utils import ElementsBot as _ElementsBot_
+        from crawjud.bot.Utils import EntityCache as _EntityCache_
         from crawjud.bot.Utils import Interact as _Interact_
         from crawjud.bot.Utils import MakeXlsx as _MakeXlsx_
         from crawjud.bot.Utils import OtherUtils as _OtherUtils_
+        from crawjud.bot.Utils import PdfExtractor as _PdfExtractor_
+        from crawjud.bot.Utils import PhaseTimer as _PhaseTimer_
         from crawjud.bot.Utils import PrintBot as _PrintBot_
+        from crawjud.bot.Utils import ResultSink as _ResultSink_
         from crawjud.bot.Utils import SearchBot as _SearchBot_
         from crawjud.bot.Utils import SendMessage as _SendMessage_
+        from crawjud.bot.Utils import SessionStore as _SessionStore_
+        from crawjud.bot.Utils import TableSnapshot as _TableSnapshot_
+        from crawjud.bot.Utils import WaitEngine as _WaitEngine_
 
         PropertiesCrawJUD.OtherUtils_ = _OtherUtils_()
         PropertiesCrawJUD.SearchBot_ = _SearchBot_()
@@ -203,6 +243,16 @@ class PropertiesCrawJUD:
         PropertiesCrawJUD.PrintBot_ = _PrintBot_()
         PropertiesCrawJUD.DriverBot_ = _DriverBot_()
         PropertiesCrawJUD.SendMessage_ = _SendMessage_()
+        PropertiesCrawJUD.ResultSink_ = _ResultSink_()
+        PropertiesCrawJUD.DocumentFetcher_ = _DocumentFetcher_()
+        PropertiesCrawJUD.DownloadManager_ = _DownloadManager_()
+        PropertiesCrawJUD.PdfExtractor_ = _PdfExtractor_()
+        PropertiesCrawJUD.TableSnapshot_ = _TableSnapshot_()
+        PropertiesCrawJUD.WaitEngine_ = _WaitEngine_()
+        PropertiesCrawJUD.EntityCache_ = _EntityCache_()
+        PropertiesCrawJUD.SessionStore_ = _SessionStore_()
+        PropertiesCrawJUD.Checkpoint_ = _Checkpoint_()
+        PropertiesCrawJUD.PhaseTimer_ = _PhaseTimer_()
 
     def prt(self, status: str = "Em Execução") -> None:
         """Print a message via print_bot.
@@ -539,6 +589,38 @@ class PropertiesCrawJUD:
         """
         PropertiesCrawJUD.kwargs_ = new_kwg
 
+    @property
+    def worker_id(self) -> int:
+        """The worker index (0 for the main process)."""
+        return PropertiesCrawJUD.worker_id_
+
+    @worker_id.setter
+    def worker_id(self, new_id: int) -> None:
+        """
+        Set the worker index.
+
+        Args:
+            new_id (int): The new worker index.
+
+        """
+        PropertiesCrawJUD.worker_id_ = new_id
+
+    @property
+    def pooled_session(self) -> PooledSession:
+        """The warm session leased by the worker's DriverPool, if any."""
+        return PropertiesCrawJUD.pooled_session_
+
+    @pooled_session.setter
+    def pooled_session(self, session: PooledSession) -> None:
+        """
+        Set the leased pool session.
+
+        Args:
+            session (PooledSession): The leased session.
+
+        """
+        PropertiesCrawJUD.pooled_session_ = session
+
     @property
     def row(self) -> int:
         """Return the current row index."""
@@ -554,6 +636,11 @@ class PropertiesCrawJUD:
 
         """
         PropertiesCrawJUD.row_ = new_row
+        if PropertiesCrawJUD.WaitEngine_ is not None:
+            PropertiesCrawJUD.WaitEngine_.start_row(new_row)
+
+        if PropertiesCrawJUD.PhaseTimer_ is not None:
+            PropertiesCrawJUD.PhaseTimer_.start_row(new_row)
 
     @property
     def message_error(self) -> str:
@@ -760,6 +847,56 @@ class PropertiesCrawJUD:
         """Return the Interact instance."""
         return PropertiesCrawJUD.Interact_
 
+    @property
+    def result_sink(self) -> _ResultSink_:
+        """The ResultSink instance."""
+        return PropertiesCrawJUD.ResultSink_
+
+    @property
+    def document_fetcher(self) -> _DocumentFetcher_:
+        """The DocumentFetcher instance."""
+        return PropertiesCrawJUD.DocumentFetcher_
+
+    @property
+    def download_manager(self) -> _DownloadManager_:
+        """The DownloadManager instance."""
+        return PropertiesCrawJUD.DownloadManager_
+
+    @property
+    def pdf_extractor(self) -> _PdfExtractor_:
+        """The PdfExtractor instance."""
+        return PropertiesCrawJUD.PdfExtractor_
+
+    @property
+    def table_snapshot(self) -> _TableSnapshot_:
+        """The TableSnapshot instance."""
+        return PropertiesCrawJUD.TableSnapshot_
+
+    @property
+    def wait_engine(self) -> _WaitEngine_:
+        """The WaitEngine instance."""
+        return PropertiesCrawJUD.WaitEngine_
+
+    @property
+    def entity_cache(self) -> _EntityCache_:
+        """The EntityCache instance."""
+        return PropertiesCrawJUD.EntityCache_
+
+    @property
+    def session_store(self) -> _SessionStore_:
+        """The SessionStore instance."""
+        return PropertiesCrawJUD.SessionStore_
+
+    @property
+    def checkpoint(self) -> _Checkpoint_:
+        """The Checkpoint instance."""
+        return PropertiesCrawJUD.Checkpoint_
+
+    @property
+    def phase_timer(self) -> _PhaseTimer_:
+        """The PhaseTimer instance."""
+        return PropertiesCrawJUD.PhaseTimer_
+
     @property
     def SearchBot(self) -> _SearchBot_:  # noqa: N802
         """Return the SearchBot instance."""
@@ -789,6 +926,21 @@ class PropertiesCrawJUD:
         """Return the driver_launch callable."""
         return PropertiesCrawJUD.DriverBot_.driver_launch
 
+    @property
+    def use_pooled(self) -> Callable[..., tuple[WebDriver, WebDriverWait]]:
+        """The use_pooled callable."""
+        return PropertiesCrawJUD.DriverBot_.use_pooled
+
+    @property
+    def recycle_driver(self) -> Callable[[], None]:
+        """The recycle callable of the DriverBot."""
+        return PropertiesCrawJUD.DriverBot_.recycle
+
+    @property
+    def memory_report(self) -> Callable[[], str | None]:
+        """The memory_report callable of the DriverBot."""
+        return PropertiesCrawJUD.DriverBot_.memory_report
+
     @property
     def search_bot(self) -> Callable[[], bool]:
         """Return the search_bot callable."""
@@ -799,9 +951,17 @@ class PropertiesCrawJUD:
         """Return the dataFrame callable."""
         return self.OtherUtils.dataFrame
 
+    @property
+    def stop_signal(self) -> StopSignal:
+        """The StopSignal instance."""
+        return PropertiesCrawJUD.StopSignal_
+
     @property
     def isStoped(self) -> bool:  # noqa: N802
-        """Check if the process is stopped."""
+        """Check if the process is stopped (Redis stop signal or local flag file)."""
+        if self.stop_signal.is_set():
+            return True
+
         stopped = Path(self.output_dir_path).joinpath(f"{self.pid}.flag").exists()
         return stopped
 
@@ -847,7 +1007,7 @@ class PropertiesCrawJUD:
 
     @property
     def similaridade(self) -> Callable[..., float]:
-        """Return the similaridade callable."""
+        """The similaridade callable."""
         return self.OtherUtils.similaridade
 
     @property
@@ -4,6 +4,7 @@ from os import getenv
 
 from quart import Quart
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from socketio import AsyncRedisManager, AsyncServer
 
 from crawjud.core import db, login_manager, mail
@@ -37,6 +38,7 @@ async def init_extensions(app: Quart) -> AsyncServer:
     await security_config(app)
 
     app.extensions["redis"] = Redis(host=host_redis, port=port_redis, db=database_redis)
+    app.extensions["redis_async"] = AsyncRedis(host=host_redis, port=port_redis, db=database_redis)
     app.extensions["socketio"] = io
 
     return io
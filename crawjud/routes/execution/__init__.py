@@ -3,10 +3,13 @@
 This module provides endpoints for listing executions and downloading execution files.
 """
 
+import json
 import os
 import pathlib
 from importlib import import_module
 
+from celery import Celery
+from celery.result import AsyncResult
 from flask_sqlalchemy import SQLAlchemy
 from quart import (
     Blueprint,
@@ -25,7 +28,8 @@ from crawjud.core import db
 from crawjud.decorators import login_required
 from crawjud.forms import SearchExec
 from crawjud.misc import generate_signed_url
-from crawjud.models import Executions, SuperUser, Users, admins
+from crawjud.models import Executions, SuperUser, ThreadBots, Users, admins
+from crawjud.utils.status import clear_finished
 
 path_template = os.path.join(pathlib.Path(__file__).parent.resolve(), "templates")
 exe = Blueprint("exe", __name__, template_folder=path_template)
@@ -147,3 +151,73 @@ async def clear_executions() -> Response:
             message=message,
         ),
     )
+
+
+@exe.post("/executions/<pid>/resume")
+@login_required
+async def resume_execution(pid: str) -> Response:
+    """Relaunch an interrupted execution, skipping the rows it already finished.
+
+    The arguments file of the execution is flagged with ``"resume": true`` and
+    the same PID is sent to the bot launcher again; the bot reads its checkpoints
+    and keeps the output spreadsheets of the previous run. The end event, the stop
+    request and the stop flag file of the previous run are cleared first, so the
+    stop and status views wait for the new run.
+
+    Args:
+        pid (str): The PID of the execution to resume.
+
+    Returns:
+        Response: A Quart response with the result message.
+
+    """
+    try:
+        db: SQLAlchemy = app.extensions["sqlalchemy"]
+        celery_app: Celery = app.extensions["celery"]
+
+        execut = db.session.query(Executions).filter(Executions.pid == pid).first()
+        path_args = pathlib.Path(os.getcwd()).joinpath("crawjud", "bot", "temp", pid, f"{pid}.json")
+
+        last_thread = (
+            db.session.query(ThreadBots).filter(ThreadBots.pid == pid).order_by(ThreadBots.id.desc()).first()
+        )
+
+        if not execut or not path_args.exists():
+            message = "Execução não encontrada ou sem arquivos para retomar!"
+
+        elif last_thread and not AsyncResult(last_thread.processID, app=celery_app).ready():
+            message = "Execução ainda em andamento!"
+
+        else:
+            args_bot = json.loads(path_args.read_text())
+            args_bot.update({"resume": True})
+            path_args.write_text(json.dumps(args_bot))
+
+            clear_finished(app, pid)
+            path_args.with_name(f"{pid}.flag").unlink(missing_ok=True)
+
+            kwargs_ = {
+                "display_name": str(execut.bot.display_name),
+                "system": execut.bot.system,
+                "typebot": execut.bot.type,
+                "path_args": str(path_args),
+            }
+            task = celery_app.send_task(f"crawjud.bot.{execut.bot.system.lower()}_launcher", kwargs=kwargs_)
+
+            execut.status = "Em Execução"
+            db.session.add(ThreadBots(pid=pid, processID=str(task.id)))
+            db.session.commit()
+
+            message = f"Execução {pid} retomada!"
+
+    except Exception as e:
+        app.logger.exception(str(e))
+        abort(500)
+
+    template = "include/show.html"
+    return await make_response(
+        await render_template(
+            template,
+            message=message,
+        ),
+    )
@@ -157,9 +157,12 @@ async def log_message(
 ) -> None:
     """Process and forward incoming log messages from crawjud.bots.
 
+    Bots send their messages in batches (``{"pid": ..., "messages": [...]}``);
+    a single message payload is still accepted.
+
     Args:
         sid (str): The session ID of the client sending the log.
-        data (dict[str, str], optional): Contains the log message and PID.
+        data (dict[str, str], optional): Contains the log message (or messages) and PID.
 
     Returns:
         None
@@ -168,11 +171,16 @@ async def log_message(
     async with app.app_context():
         try:
             pid = data["pid"]
-            # Format the log message appropriately.
-            if "message" in data:
-                data = await format_message_log(data, pid, app)
-                # Emit the formatted log to the specified room.
-                await io.emit("log_message", data, room=pid, namespace="/log")
+            messages = data.get("messages", [data])
+            if data.get("dropped"):
+                logger.warning("Bot %s descartou %s mensagens de log", pid, data["dropped"])
+
+            for message in messages:
+                # Format the log message appropriately.
+                if "message" in message:
+                    message = await format_message_log(message, pid, app)
+                    # Emit the formatted log to the specified room.
+                    await io.emit("log_message", message, room=pid, namespace="/log")
 
             await io.send("message received!", to=sid, namespace="/log", room=pid)
 
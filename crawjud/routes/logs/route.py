@@ -23,16 +23,40 @@ from quart import (
     url_for,
 )
 from quart import current_app as app
+from redis import Redis, RedisError
 
+from crawjud.bot.common.phases import decode_phases, phases_key
 from crawjud.decorators import login_required
 from crawjud.misc import generate_signed_url
 from crawjud.models import Executions, LicensesUsers, Users
-from crawjud.utils.status import TaskExec
+from crawjud.utils.status import TaskExec, wait_finished
 
 from . import logsbot
 
+STOP_TIMEOUT = 60
+STATUS_TIMEOUT = 10
 
-def stopbot(user: str, pid: str, socket: str) -> None:
+
+async def finished_within(pid: str, seconds: float) -> bool:
+    """Wait up to ``seconds`` for the completion event of an execution.
+
+    Args:
+        pid (str): The process identifier.
+        seconds (float): The longest wait.
+
+    Returns:
+        bool: True if the execution finished in time.
+
+    """
+    try:
+        async with asyncio.timeout(seconds):
+            return await wait_finished(app, pid) is not None
+
+    except TimeoutError:
+        return False
+
+
+async def stopbot(user: str, pid: str, socket: str) -> None:
     """Stop a bot by sending a POST request to the stop endpoint.
 
     Args:
@@ -41,7 +65,12 @@ def stopbot(user: str, pid: str, socket: str) -> None:
         socket (str): The socket URL.
 
     """
-    requests.post(url=f"{socket}/stop/{user}/{pid}", timeout=300)
+    try:
+        async with requests.AsyncClient(timeout=STATUS_TIMEOUT) as client:
+            await client.post(url=f"{socket}/stop/{user}/{pid}")
+
+    except requests.HTTPError as e:
+        app.logger.warning("Falha ao solicitar parada do PID %s: %s", pid, str(e))
 
 
 @logsbot.context_processor
@@ -194,11 +223,37 @@ async def logs_bot(pid: str) -> Response:
     return resp
 
 
+@logsbot.route("/logs_bot/<pid>/phases", methods=["GET"])
+@login_required
+async def phases(pid: str) -> Response:
+    """Render the time spent in each phase of the execution.
+
+    Args:
+        pid (str): The process identifier.
+
+    Returns:
+        Response: A Quart response rendering the phase breakdown table.
+
+    """
+    redis_client: Redis = app.extensions["redis"]
+    try:
+        entries = decode_phases(redis_client.hgetall(phases_key(pid)))
+
+    except RedisError as e:
+        app.logger.warning("Falha ao carregar tempos do PID %s: %s", pid, str(e))
+        entries = []
+
+    return await make_response(await render_template("phases.html", phases=entries))
+
+
 @logsbot.route("/stop_bot/<pid>", methods=["GET"])
 @login_required
 async def stop_bot(pid: str) -> Response:
     """Stop the bot execution and wait until it has finished.
 
+    The view awaits the completion event of the execution (published by
+    ``TaskExec.task_exec``) instead of polling the database, up to ``STOP_TIMEOUT``.
+
     Args:
         pid (str): The process identifier.
 
@@ -208,19 +263,18 @@ async def stop_bot(pid: str) -> Response:
     """
     db: SQLAlchemy = app.extensions["sqlalchemy"]
     socket = request.cookies.get("socket_bot")
-    stopbot(session["login"], pid, f"https://{socket}")
+    await stopbot(session["login"], pid, f"https://{socket}")
 
-    is_stopped = True
+    execut = db.session.query(Executions).filter(Executions.pid == pid).first()
+    finished = str(execut.status).lower() == "finalizado" if execut else True
+    if not finished:
+        finished = await finished_within(pid, STOP_TIMEOUT)
 
-    while is_stopped:
-        execut = db.session.query(Executions).filter(Executions.pid == pid).first()
+    if finished:
+        await flash("Execução encerrada", "success")
+    else:
+        await flash("Parada solicitada, a execução será encerrada em instantes", "info")
 
-        if str(execut.status).lower() == "finalizado":
-            is_stopped = False
-
-        asyncio.sleep(2)
-
-    await flash("Execução encerrada", "success")
     return await make_response(
         redirect(
             url_for(
@@ -230,11 +284,60 @@ async def stop_bot(pid: str) -> Response:
     )
 
 
+def query_execution(pid: str) -> Executions | None:
+    """Return the execution visible to the logged user.
+
+    Args:
+        pid (str): The process identifier.
+
+    Returns:
+        Executions | None: The execution, or None if the user cannot see it.
+
+    """
+    db: SQLAlchemy = app.extensions["sqlalchemy"]
+    user_id = Users.query.filter(Users.login == session["login"]).first().id
+    execution = (
+        db.session.query(Executions)
+        .join(Users, Users.id == user_id)
+        .filter(
+            Executions.pid == pid,
+        )
+        .first()
+    )
+
+    admin_cookie, supersu_cookie = None, None
+
+    admin_cookie = request.cookies.get("roles_admin")
+    supersu_cookie = request.cookies.get("roles_supersu")
+
+    if admin_cookie and not supersu_cookie:
+        if json.loads(admin_cookie).get("login_id") == session["_id"]:
+            execution = (
+                db.session.query(Executions)
+                .join(Users)
+                .join(LicensesUsers)
+                .filter(
+                    LicensesUsers.license_token == session["license_token"],
+                    Executions.pid == pid,
+                )
+                .first()
+            )
+
+    elif supersu_cookie:
+        if json.loads(supersu_cookie).get("login_id") == session["_id"]:
+            execution = db.session.query(Executions).filter(Executions.pid == pid).first()
+
+    return execution
+
+
 @logsbot.route("/status/<pid>", methods=["GET"])
 @login_required
 async def status(pid: str) -> Response:
     """Check the status of an execution and return its result.
 
+    When the execution is still running, the view awaits its completion event for
+    up to ``STATUS_TIMEOUT`` seconds before answering.
+
     Args:
         pid (str): The process identifier.
 
@@ -242,58 +345,25 @@ async def status(pid: str) -> Response:
         Response: A Quart JSON response with execution status or error message.
 
     """
-    db: SQLAlchemy = app.extensions["sqlalchemy"]
-    i = 0
     if not session.get("license_token"):
         abort(405, description="Sessão expirada. Faça login novamente.")
 
     response_data = {"erro": "erro"}
 
-    while i <= 5:
-        user_id = Users.query.filter(Users.login == session["login"]).first().id
-        execution = (
-            db.session.query(Executions)
-            .join(Users, Users.id == user_id)
-            .filter(
-                Executions.pid == pid,
-            )
-            .first()
-        )
-
-        admin_cookie, supersu_cookie = None, None
+    execution = query_execution(pid)
+    if execution and execution.status != "Finalizado" and await finished_within(pid, STATUS_TIMEOUT):
+        db: SQLAlchemy = app.extensions["sqlalchemy"]
+        db.session.refresh(execution)
 
-        admin_cookie = request.cookies.get("roles_admin")
-        supersu_cookie = request.cookies.get("roles_supersu")
-
-        if admin_cookie and not supersu_cookie:
-            if json.loads(admin_cookie).get("login_id") == session["_id"]:
-                execution = (
-                    db.session.query(Executions)
-                    .join(Users)
-                    .join(LicensesUsers)
-                    .filter(
-                        LicensesUsers.license_token == session["license_token"],
-                        Executions.pid == pid,
-                    )
-                    .first()
-                )
-
-        elif supersu_cookie:
-            if json.loads(supersu_cookie).get("login_id") == session["_id"]:
-                execution = db.session.query(Executions).filter(Executions.pid == pid).first()
-
-        if execution.status and execution.status == "Finalizado":
-            signed_url = generate_signed_url(execution.file_output)
-            response_data = {"message": "OK", "document_url": signed_url}
-            return await make_response(
-                jsonify(
-                    response_data,
-                ),
-                200,
-            )
-
-        await asyncio.sleep(1.5)
-        i += 1
+    if execution and execution.status == "Finalizado":
+        signed_url = generate_signed_url(execution.file_output)
+        response_data = {"message": "OK", "document_url": signed_url}
+        return await make_response(
+            jsonify(
+                response_data,
+            ),
+            200,
+        )
 
     return await make_response(
         jsonify(
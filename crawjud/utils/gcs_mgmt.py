@@ -1,16 +1,49 @@
-"""Module to manage Google Cloud Storage (GCS) operations."""
+"""Module to manage Google Cloud Storage (GCS) operations.
+
+The storage client, its credentials and the bucket are built once per process. The
+output archive of each execution is recorded in a Redis hash (PID -> blob name) when
+it is uploaded, so looking it up does not list the whole bucket; executions uploaded
+before the index existed are found by a prefix-filtered listing and indexed then.
+
+The index lives in the database of ``redis_conn.redis_url()`` (``REDIS_DB_LOGS``). It
+was kept in database 0 of ``REDIS_URL`` before; the entries left there are not read,
+and their executions are listed and indexed again on their first lookup.
+
+Setting ``STORAGE_EMULATOR_HOST`` points the client at a local GCS emulator, with
+anonymous credentials.
+"""
 
 import json
-from pathlib import Path
+import logging
+import os
+from functools import lru_cache
 
+import redis
 from dotenv import dotenv_values
+from google.auth.credentials import AnonymousCredentials
 from google.cloud.storage import Bucket, Client
 from google.cloud.storage.blob import Blob
 from google.oauth2.service_account import Credentials
 
+from crawjud.bot.common.redis_conn import redis_client
+
 environ = dotenv_values()
+logger = logging.getLogger(__name__)
+
+OUTPUT_INDEX = "crawjud:gcs:outputs"
+
+
+def emulator_host() -> str | None:
+    """Return the GCS emulator address, if one is configured.
+
+    Returns:
+        str | None: The emulator host.
+
+    """
+    return os.getenv("STORAGE_EMULATOR_HOST") or environ.get("STORAGE_EMULATOR_HOST")
 
 
+@lru_cache(maxsize=1)
 def storage_client() -> Client:
     """Create a Google Cloud Storage client.
 
@@ -19,12 +52,17 @@ def storage_client() -> Client:
 
     """
     project_id = environ.get("project_id")
+    if emulator_host():
+        os.environ.setdefault("STORAGE_EMULATOR_HOST", emulator_host())
+        return Client(credentials=AnonymousCredentials(), project=project_id or "crawjud")
+
     # Configure a autenticação para a conta de serviço do GCS
     credentials = credentials_gcs()
 
     return Client(credentials=credentials, project=project_id)
 
 
+@lru_cache(maxsize=1)
 def credentials_gcs() -> Credentials:
     """Create Google Cloud Storage credentials from environment variables.
 
@@ -32,18 +70,10 @@ def credentials_gcs() -> Credentials:
         Credentials: GCS service account credentials.
 
     """
-    path_cred = Path(__file__).cwd().joinpath("crawjud", "bot", "temp", "cred_json.json")
-    with path_cred.open("w") as f:
-        f.write(environ.get("CREDENTIALS_DICT"))
-
-    with path_cred.open("r") as f:
-        credential = json.loads(f.read())
-
-        return Credentials.from_service_account_info(credential).with_scopes(
-            ["https://www.googleapis.com/auth/cloud-platform"],
-        )
-
-    # Configure a autenticação para a conta de serviço do GCS
+    credential = json.loads(environ.get("CREDENTIALS_DICT"))
+    return Credentials.from_service_account_info(credential).with_scopes(
+        ["https://www.googleapis.com/auth/cloud-platform"],
+    )
 
 
 def bucket_gcs(storage_client: Client) -> Bucket:
@@ -60,6 +90,39 @@ def bucket_gcs(storage_client: Client) -> Bucket:
     return bucket_obj
 
 
+def index_file(pid: str, blob_name: str) -> None:
+    """Record the output archive of an execution.
+
+    Args:
+        pid (str): The process identifier of the bot.
+        blob_name (str): The uploaded blob name.
+
+    """
+    try:
+        redis_client(decode_responses=True, socket_timeout=None).hset(OUTPUT_INDEX, pid, blob_name)
+
+    except redis.RedisError as e:
+        logger.warning("Falha ao indexar arquivo do PID %s: %s", pid, str(e))
+
+
+def indexed_file(pid: str) -> str:
+    """Return the indexed output archive of an execution.
+
+    Args:
+        pid (str): The process identifier of the bot.
+
+    Returns:
+        str: The blob name, or an empty string if it is not indexed.
+
+    """
+    try:
+        return redis_client(decode_responses=True, socket_timeout=None).hget(OUTPUT_INDEX, pid) or ""
+
+    except redis.RedisError as e:
+        logger.warning("Índice de arquivos indisponível: %s", str(e))
+        return ""
+
+
 def get_file(pid: str) -> str:
     """Retrieve the output file associated with a bot's PID.
 
@@ -70,16 +133,19 @@ def get_file(pid: str) -> str:
         str: The filename if found, else an empty string.
 
     """
+    arquivo = indexed_file(pid)
+    if arquivo:
+        return arquivo
+
     # Obtém o bucket
     bucket = bucket_gcs(storage_client())
 
-    arquivo = ""
-    list_blobs: list[Blob] = list(bucket.list_blobs())
-    for blob in list_blobs:
-        blobnames = str(blob.name).split("/")[1] if "/" in str(blob.name) else str(blob.name)
-        arquivo = blobnames if pid in blobnames else ""
-        if pid in blobnames:
-            arquivo = blobnames
+    # Arquivos anteriores ao índice: listagem filtrada no servidor
+    for options in ({"prefix": f"PID {pid}"}, {"match_glob": f"**{pid}*"}):
+        blobs: list[Blob] = list(bucket.list_blobs(max_results=1, **options))
+        if blobs:
+            arquivo = str(blobs[0].name)
+            index_file(pid, arquivo)
             break
 
     return arquivo
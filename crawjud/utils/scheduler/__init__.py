@@ -9,6 +9,7 @@ Classes:
 
 import json
 import re
+import time
 from typing import Any, Union
 
 from celery import Celery  # noqa: F401
@@ -18,6 +19,8 @@ from celery.loaders.base import BaseLoader  # noqa: F401
 from celery.schedules import crontab
 from quart import current_app as app  # noqa: F401
 
+SYNC_EVERY = 15
+
 
 class DatabaseScheduler(Scheduler):
     """Manage Celery task schedules using database-stored configurations.
@@ -27,6 +30,8 @@ class DatabaseScheduler(Scheduler):
 
     Attributes:
         _schedule (dict): Internal cache of current schedule entries.
+        _fingerprints (dict): Database values each cached entry was built from.
+        _last_sync (float): Monotonic time of the last database sync.
 
     """
 
@@ -59,8 +64,74 @@ class DatabaseScheduler(Scheduler):
             **kwargs: Variable keyword arguments passed to parent Scheduler.
 
         """
+        self._schedule = {}
+        self._fingerprints = {}
+        self._last_sync = 0.0
         super().__init__(*args, **kwargs)
         self._schedule = {}
+        self._fingerprints = {}
+        self._last_sync = 0.0
+
+    @staticmethod
+    def fetch_rows() -> dict[str, tuple]:
+        """Load the schedule rows as plain tuples keyed by entry name.
+
+        A single joined query returning only the columns that define an entry, so no
+        ORM objects (nor one crontab query per schedule) are built on each sync.
+
+        Returns:
+            dict[str, tuple]: Entry name mapped to (task, args, kwargs, cron fields..., last_run_at).
+
+        """
+        from crawjud.models import CrontabModel, ScheduleModel
+
+        rows = (
+            ScheduleModel.query.join(CrontabModel, ScheduleModel.schedule_id == CrontabModel.id)
+            .with_entities(
+                ScheduleModel.name,
+                ScheduleModel.task,
+                ScheduleModel.args,
+                ScheduleModel.kwargs,
+                CrontabModel.minute,
+                CrontabModel.hour,
+                CrontabModel.day_of_week,
+                CrontabModel.day_of_month,
+                CrontabModel.month_of_year,
+                ScheduleModel.last_run_at,
+            )
+            .all()
+        )
+
+        # if entry.name not unicode, fix it
+        return {DatabaseScheduler.fix_unicode(row[0]): tuple(row[1:]) for row in rows}
+
+    @staticmethod
+    def build_entry(name: str, row: tuple) -> ScheduleEntry:
+        """Build the ScheduleEntry of a schedule row.
+
+        Args:
+            name (str): The entry name.
+            row (tuple): The row returned by ``fetch_rows``.
+
+        Returns:
+            ScheduleEntry: The entry with its crontab schedule.
+
+        """
+        task, args, kwargs, minute, hour, day_of_week, day_of_month, month_of_year, last_run_at = row
+        return ScheduleEntry(
+            name=name,
+            task=task,
+            schedule=crontab(
+                minute=minute,
+                hour=hour,
+                day_of_week=day_of_week,
+                day_of_month=day_of_month,
+                month_of_year=month_of_year,
+            ),
+            args=json.loads(args or "[]"),
+            kwargs=json.loads(kwargs or "{}"),
+            last_run_at=last_run_at,
+        )
 
     def get_schedule(self) -> dict:
         """Retrieve and construct schedule entries from the database.
@@ -69,36 +140,14 @@ class DatabaseScheduler(Scheduler):
         objects with their associated crontab schedules.
 
         Returns:
-            dict: Mapping of task names to their corresponding ScheduleEntry objects.
+            dict: Mapping of entry names to their corresponding ScheduleEntry objects.
 
         Note:
             The schedule entries include task name, schedule (as crontab), arguments, and keyword
             arguments loaded from the database.
 
         """
-        schedules = {}
-
-        from crawjud.models import CrontabModel, ScheduleModel
-
-        db_entries: list[ScheduleModel] = ScheduleModel.query.all()
-        for entry in db_entries:
-            cron_args = {}
-            old_cron_args: CrontabModel = entry.schedule
-            cron_args_items = list(old_cron_args.__dict__.items())
-            for key, value in cron_args_items:
-                if (not key.startswith("_")) and key != "schedule" and key != "id":
-                    cron_args.update({key: value})
-
-            # if entry.name not unicode, fix it
-            name_custom = DatabaseScheduler.fix_unicode(entry.name)
-            schedules[entry.task] = ScheduleEntry(
-                name=name_custom,
-                task=entry.task,
-                schedule=crontab(**cron_args),
-                args=json.loads(entry.args or "[]"),
-                kwargs=json.loads(entry.kwargs or "{}"),
-            )
-        return schedules
+        return {name: self.build_entry(name, row) for name, row in self.fetch_rows().items()}
 
     @staticmethod
     def parse_cron(cron_string: str) -> dict[str, any]:
@@ -127,31 +176,46 @@ class DatabaseScheduler(Scheduler):
     def schedule(self) -> dict:
         """Access the current task schedule.
 
-        Ensures the schedule is synchronized with the database before returning it.
+        Synchronizes the schedule with the database when the last sync is older
+        than ``SYNC_EVERY`` seconds before returning it.
 
         Returns:
-            dict: The current mapping of task names to ScheduleEntry objects.
-
-        Note:
-            This property triggers a database sync on each access to ensure schedule freshness.
+            dict: The current mapping of entry names to ScheduleEntry objects.
 
         """
-        self.sync()
+        if time.monotonic() - self._last_sync >= SYNC_EVERY:
+            self.sync()
         return self._schedule
 
     def sync(self) -> None:
-        """Update the internal schedule cache with the latest database entries.
+        """Apply the database changes to the internal schedule cache.
 
-        Refreshes the internal schedule dictionary by fetching the most recent schedule
-        configurations from the database.
+        Only added, modified or removed schedules are rebuilt. Unchanged entries are
+        kept as they are, so Celery's run state (``last_run_at``, ``total_run_count``)
+        survives the sync. Entries that were not loaded from the database (e.g.
+        Celery's default ones) are left untouched.
         """
-        self._schedule = self.get_schedule()
+        self._last_sync = time.monotonic()
+        rows = self.fetch_rows()
+
+        for name in set(self._fingerprints) - set(rows):
+            self._fingerprints.pop(name)
+            self._schedule.pop(name, None)
+
+        for name, row in rows.items():
+            fingerprint = row[:-1]
+            if self._fingerprints.get(name) == fingerprint and name in self._schedule:
+                continue
+
+            self._schedule[name] = self.build_entry(name, row)
+            self._fingerprints[name] = fingerprint
 
     def tick(self) -> Union[int, Any]:
         """Process scheduled tasks and determine the next execution time.
 
-        Processes any due tasks, updates the schedule from the database, and calculates
-        the time until the next task needs to run.
+        Processes any due tasks and calculates the time until the next task needs
+        to run. The schedule is refreshed from the database by the ``schedule``
+        property, at most every ``SYNC_EVERY`` seconds.
 
         Returns:
             Union[int, Any]: Number of seconds until the next scheduled task execution.
@@ -161,6 +225,4 @@ class DatabaseScheduler(Scheduler):
             the scheduler's operation.
 
         """
-        remaining_times = super().tick()
-        self.sync()
-        return remaining_times
+        return super().tick()
@@ -25,8 +25,10 @@ from quart import Quart, session
 from quart.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
+from crawjud.bot.common.stop_signal import publish_stop
 from crawjud.models import BotsCrawJUD, CrontabModel, Executions, LicensesUsers, ScheduleModel, ThreadBots, Users
 
+from .completion import clear_finished, publish_finished, wait_finished
 from .makefile import makezip
 from .permalink import generate_signed_url
 from .server_side import format_message_log, load_cache
@@ -81,6 +83,7 @@ class TaskExec:
 
                 filename, _ = await cls.make_zip(pid)
                 execut = await cls.send_stop_exec(app, db, pid, status, filename)
+                publish_finished(app, pid, status or "Finalizado")
 
                 try:
                     await cls.send_email(execut, app, "stop", schedule=schedule)
@@ -89,6 +92,7 @@ class TaskExec:
 
                 if path_flag:
                     Path(path_flag).touch(exist_ok=True)
+                    publish_stop(pid)
                 return 200
         except Exception as e:
             app.logger.exception("An error occurred: %s", str(e))
@@ -461,7 +465,7 @@ class TaskExec:
 
         if filename == "":
             file_zip, f_path = makezip(pid)
-            filename, _ = await cls.send_file_gcs(file_zip, f_path)
+            filename, _ = await cls.send_file_gcs(file_zip, f_path, pid)
 
         return generate_signed_url(filename)
 
@@ -480,19 +484,20 @@ class TaskExec:
 
         if filename == "":
             file_zip, f_path = makezip(pid)
-            filename, file_path = await cls.send_file_gcs(file_zip, f_path)
+            filename, file_path = await cls.send_file_gcs(file_zip, f_path, pid)
         return filename, file_path
 
     @classmethod
-    async def send_file_gcs(cls, zip_file: str, file_path: Path) -> tuple[str, Path]:
+    async def send_file_gcs(cls, zip_file: str, file_path: Path, pid: str = None) -> tuple[str, Path]:
         """Send a file to Google Cloud Storage.
 
         Args:
             zip_file (str): The ZIP file to send.
             file_path (Path): The path to the file.
+            pid (str, optional): The process identifier of the bot, used to index the file.
 
         """
-        file_zip1, file_path2 = enviar_arquivo_para_gcs(zip_file, file_path)
+        file_zip1, file_path2 = enviar_arquivo_para_gcs(zip_file, file_path, pid)
         return file_zip1, file_path2
 
     @classmethod
@@ -578,5 +583,7 @@ __all__ = [
     enviar_arquivo_para_gcs,
     load_cache,
     format_message_log,
+    wait_finished,
+    clear_finished,
     "generate_signed_url",
 ]
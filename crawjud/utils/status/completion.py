@@ -0,0 +1,109 @@
+"""Completion events of the executions.
+
+``TaskExec.task_exec`` publishes the end of an execution on a Redis channel per PID,
+``process:{pid}:finished``, and keeps it in a key of the same name for
+``PROGRESS_TTL`` seconds, so a request that subscribes after the fact still sees
+it. The stop and status views await that event, bounded by ``asyncio.timeout``,
+instead of polling the database, which keeps the event loop free while users
+watch or stop executions.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from quart import Quart
+from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
+
+from crawjud.bot.common.stop_signal import stop_channel
+
+from .server_side import PROGRESS_TTL, progress_key
+
+logger = logging.getLogger(__name__)
+
+
+def finished_key(pid: str) -> str:
+    """Return the Redis channel (and key) announcing the end of an execution.
+
+    Args:
+        pid (str): The process ID.
+
+    Returns:
+        str: The channel name.
+
+    """
+    return f"process:{pid}:finished"
+
+
+def publish_finished(app: Quart, pid: str, status: str = "Finalizado") -> None:
+    """Announce the end of an execution to the requests waiting for it.
+
+    Args:
+        app (Quart): The Quart application instance.
+        pid (str): The process ID.
+        status (str, optional): The final status of the execution. Defaults to "Finalizado".
+
+    """
+    redis_client: Redis = app.extensions["redis"]
+    try:
+        redis_client.set(finished_key(pid), status, ex=PROGRESS_TTL)
+        redis_client.publish(finished_key(pid), status)
+
+    except RedisError as e:
+        logger.warning("Falha ao publicar fim do PID %s: %s", pid, str(e))
+
+
+def clear_finished(app: Quart, pid: str) -> None:
+    """Forget the end and the stop request of an execution that is launched again.
+
+    Args:
+        app (Quart): The Quart application instance.
+        pid (str): The process ID.
+
+    """
+    redis_client: Redis = app.extensions["redis"]
+    try:
+        pipe = redis_client.pipeline()
+        pipe.delete(finished_key(pid), stop_channel(pid))
+        if redis_client.exists(progress_key(pid)):
+            pipe.hset(progress_key(pid), "status", "Iniciado")
+
+        pipe.execute()
+
+    except RedisError as e:
+        logger.warning("Falha ao limpar fim do PID %s: %s", pid, str(e))
+
+
+async def wait_finished(app: Quart, pid: str) -> str | None:
+    """Wait for the end of an execution without blocking the event loop.
+
+    The wait has no limit of its own; callers bound it with ``asyncio.timeout``.
+
+    Args:
+        app (Quart): The Quart application instance.
+        pid (str): The process ID.
+
+    Returns:
+        str | None: The final status, or None if the completion channel is unavailable.
+
+    """
+    redis_client: AsyncRedis = app.extensions["redis_async"]
+    try:
+        async with redis_client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(finished_key(pid))
+
+            # An end published before the subscription is kept in the key
+            status = await redis_client.get(finished_key(pid))
+            if status:
+                return status.decode() if isinstance(status, bytes) else status
+
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    data = message["data"]
+                    return data.decode() if isinstance(data, bytes) else data
+
+    except RedisError as e:
+        logger.warning("Canal de fim indisponível para o PID %s: %s", pid, str(e))
+
+    return None
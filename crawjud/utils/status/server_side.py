@@ -1,9 +1,124 @@
-"""Handle server-side operations for bot status tracking and caching with Redis integration."""
+"""Handle server-side operations for bot status tracking and caching with Redis integration.
+
+The progress of each execution lives in a single Redis hash, ``process:{pid}``,
+updated with atomic ``HINCRBY`` counters, plus a capped list with the latest
+messages, ``process:{pid}:messages``. Both keys expire ``PROGRESS_TTL`` seconds
+after the last update. Executions recorded with the legacy layout (one
+``process:{pid}:pos:{n}`` hash per log line) are migrated on first access, or all
+at once through ``migrate_progress_store``.
+"""
+
+from __future__ import annotations
+
+import json
 
 from flask_sqlalchemy import SQLAlchemy
 from quart import Quart
 from redis_flask import Redis
 
+PROGRESS_TTL = 60 * 60 * 24 * 7
+MAX_MESSAGES = 500
+
+
+def progress_key(pid: str) -> str:
+    """Return the Redis hash holding the progress of an execution.
+
+    Args:
+        pid (str): The process ID.
+
+    Returns:
+        str: The hash key.
+
+    """
+    return f"process:{pid}"
+
+
+def messages_key(pid: str) -> str:
+    """Return the Redis list holding the latest messages of an execution.
+
+    Args:
+        pid (str): The process ID.
+
+    Returns:
+        str: The list key.
+
+    """
+    return f"process:{pid}:messages"
+
+
+def decode_hash(values: dict[bytes | str, bytes | str]) -> dict[str, str]:
+    """Decode a hash read from Redis.
+
+    Args:
+        values (dict[bytes | str, bytes | str]): The raw hash.
+
+    Returns:
+        dict[str, str]: The hash with str keys and values.
+
+    """
+    return {
+        (key.decode() if isinstance(key, bytes) else key): (value.decode() if isinstance(value, bytes) else value)
+        for key, value in values.items()
+    }
+
+
+def migrate_legacy_cache(pid: str, redis_client: Redis) -> dict[str, str]:
+    """Move the legacy per-position hashes of a PID into the per-PID hash.
+
+    The hash of the highest position holds the latest counters; it becomes the
+    new record and every legacy key of the PID is removed.
+
+    Args:
+        pid (str): The process ID.
+        redis_client (Redis): The Redis client.
+
+    Returns:
+        dict[str, str]: The migrated record (empty if there was nothing to migrate).
+
+    """
+    legacy_keys = list(redis_client.scan_iter(match=f"process:{pid}:pos:*", count=500))
+    if not legacy_keys:
+        return {}
+
+    def position(key: bytes | str) -> int:
+        key = key.decode() if isinstance(key, bytes) else key
+        return int(key.rsplit(":", 1)[-1])
+
+    latest = max(legacy_keys, key=position)
+    log_pid = decode_hash(redis_client.hgetall(latest))
+
+    pipe = redis_client.pipeline()
+    if log_pid:
+        pipe.hset(progress_key(pid), mapping=log_pid)
+        pipe.expire(progress_key(pid), PROGRESS_TTL)
+    pipe.delete(*legacy_keys)
+    pipe.execute()
+
+    return log_pid
+
+
+def migrate_progress_store(app: Quart) -> int:
+    """Migrate every execution still stored with the legacy layout.
+
+    Args:
+        app (Quart): The Quart application instance.
+
+    Returns:
+        int: The number of migrated executions.
+
+    """
+    redis_client: Redis = app.extensions["redis"]
+
+    pids: set[str] = set()
+    for key in redis_client.scan_iter(match="process:*:pos:*", count=1000):
+        key = key.decode() if isinstance(key, bytes) else key
+        pids.add(key.split(":")[1])
+
+    for pid in pids:
+        migrate_legacy_cache(pid, redis_client)
+
+    return len(pids)
+
 
 async def load_cache(pid: str, app: Quart) -> dict[str, str]:
     """Load cache data for a given PID from Redis.
@@ -16,30 +131,11 @@ async def load_cache(pid: str, app: Quart) -> dict[str, str]:
         dict[str, str]: A dictionary containing cached log data.
 
     """
-    log_pid: dict[str, str | int] = {}
-    list_cached: list[dict[str, str | int]] = []
-
     redis_client: Redis = app.extensions["redis"]
-    redis_key = f"*{pid}*"
 
-    get_cache: list | None = redis_client.keys(redis_key)
-    if get_cache:
-        list_cache: list[str | bytes] = list(get_cache)
-        for cache in list_cache:
-            cache = cache.decode()
-            _, k_pid, __, k_value = cache.split(":")
-            cached = [{"pid": k_pid, "pos": int(k_value)}]
-            list_cached.extend(cached)
-
-        sorted_cache: list[dict[str, str | int]] = sorted(list_cached, key=lambda x: x.get("pos"), reverse=True)
-
-        for item in sorted_cache:
-            pos = item["pos"]
-            redis_key = f"process:{pid}:pos:{pos}"
-            logs_pid = redis_client.hgetall(redis_key)
-
-            log_pid = dict(logs_pid)
-            log_pid = {key.decode(): value.decode() for key, value in log_pid.items()}
+    log_pid = decode_hash(redis_client.hgetall(progress_key(pid)))
+    if not log_pid:
+        log_pid = migrate_legacy_cache(pid, redis_client)
 
     return log_pid
 
@@ -87,7 +183,7 @@ async def format_message_log(
         data_message = data.get("message", "Finalizado")
         data_system = data.get("system", "vazio")  # noqa: F841
         data_pid = data.get("pid", "vazio")
-        data_pos = data.get("pos", 0)
+        data_pos = int(data.get("pos", 0))
 
         # Verificar informações obrigatórias
         chk_infos = [data.get("system"), data.get("typebot")]
@@ -96,15 +192,18 @@ async def format_message_log(
                 await TaskExec.task_exec(data=data, exec_type="stop", app=app)
 
         # Chave única para o processo no Redis
-        redis_key = f"process:{data_pid}:pos:{data_pos}"
+        redis_key = progress_key(data_pid)
 
         # Carregar dados do processo do Redis
-        log_pid = redis_client.hgetall(redis_key)
+        log_pid = decode_hash(redis_client.hgetall(redis_key))
+        if not log_pid:
+            log_pid = migrate_legacy_cache(data_pid, redis_client)
 
-        log_pid = {key.decode(): value.decode() for key, value in log_pid.items()}
+        pipe = redis_client.pipeline()
 
         # Caso não exista, inicializar o registro
-        if not log_pid and int(data_pos) == 0:
+        created = not log_pid
+        if created:
             log_pid = {
                 "pid": data_pid,
                 "pos": data_pos,
@@ -115,68 +214,40 @@ async def format_message_log(
                 "status": "Iniciado",
                 "message": data_message,
             }
-            redis_client.hset(redis_key, mapping=log_pid)
+            pipe.hset(redis_key, mapping=log_pid)
 
         # Atualizar informações existentes
-        elif int(data_pos) > 0 or data_message != log_pid["message"] or "pid" not in data:
-            if not log_pid or "pid" not in data:
-                if data_pos > 1:
-                    # Chave única para o processo no Redis
-                    redis_key_tmp = f"process:{data_pid}:pos:{data_pos - 1}"
-
-                    # Carregar dados do processo do Redis
-                    log_pid = redis_client.hgetall(redis_key_tmp)
-                    if not log_pid:
-                        redis_key_tmp = f"process:{data_pid}:pos:{data_pos - 2}"
-                        log_pid = redis_client.hgetall(redis_key_tmp)
-                        if not log_pid:
-                            log_pid = {
-                                "pid": data_pid,
-                                "pos": data_pos,
-                                "total": data.get("total", 100),
-                                "remaining": data.get("total", 100),
-                                "success": 0,
-                                "errors": 0,
-                                "status": "Iniciado",
-                                "message": data_message,
-                            }
-
-                elif data_pos == 1:
-                    log_pid = {
-                        "pid": data_pid,
-                        "pos": data_pos,
-                        "total": data.get("total", 100),
-                        "remaining": data.get("total", 100),
-                        "success": 0,
-                        "errors": 0,
-                        "status": "Iniciado",
-                        "message": data_message,
-                    }
-
+        if data_pos > 0 or data_message != log_pid["message"]:
             type_s1 = data_type == "success"
             type_s2 = data_type == "info"
             type_s3 = data_graphic != "doughnut"
 
             type_success = type_s1 or (type_s2 and type_s3)
 
-            log_pid["pos"] = data_pos
+            update = {"pos": data_pos, "message": data_message}
 
             if type_success:
-                if log_pid.get("remaining") and log_pid.get("success"):
-                    log_pid["remaining"] = int(log_pid["remaining"]) - 1
-                    if "fim da execução" not in data_message.lower():
-                        log_pid["success"] = int(log_pid["success"]) + 1
+                pipe.hincrby(redis_key, "remaining", -1)
+                if "fim da execução" not in data_message.lower():
+                    pipe.hincrby(redis_key, "success", 1)
 
             elif data_type == "error":
-                log_pid.update({"remaining": int(log_pid.get("remaining", 1)) - 1})
-                log_pid.update({"errors": int(log_pid["errors"]) + 1})
-
                 if data_pos == 0 or app.testing:
-                    log_pid["errors"] = log_pid["total"]
-                    log_pid["remaining"] = 0
+                    update.update({"errors": log_pid["total"], "remaining": 0})
+                else:
+                    pipe.hincrby(redis_key, "remaining", -1)
+                    pipe.hincrby(redis_key, "errors", 1)
+
+            pipe.hset(redis_key, mapping=update)
+
+        # Mensagens recentes em lista limitada
+        pipe.rpush(messages_key(data_pid), json.dumps({"pos": data_pos, "message": data_message}))
+        pipe.ltrim(messages_key(data_pid), -MAX_MESSAGES, -1)
+        pipe.expire(redis_key, PROGRESS_TTL)
+        pipe.expire(messages_key(data_pid), PROGRESS_TTL)
+        pipe.hgetall(redis_key)
 
-            log_pid["message"] = data_message
-            redis_client.hset(redis_key, mapping=log_pid)
+        log_pid = decode_hash(pipe.execute()[-1])
 
         # Atualizar o dicionário de saída
         data.update(
@@ -2,15 +2,17 @@
 
 from pathlib import Path
 
-from ..gcs_mgmt import bucket_gcs, storage_client
+from ..gcs_mgmt import bucket_gcs, index_file, storage_client
 
 
-def enviar_arquivo_para_gcs(zip_file: str, file_path: Path) -> tuple[str, Path]:
-    """Upload a ZIP file to Google Cloud Storage.
+def enviar_arquivo_para_gcs(zip_file: str, file_path: Path, pid: str = None) -> tuple[str, Path]:
+    """Upload a ZIP file to Google Cloud Storage and index it by PID.
 
     Args:
         zip_file (str): The name of the ZIP file to upload.
         file_path (Path): The path to the ZIP file.
+        pid (str, optional): The process identifier of the bot. Defaults to the
+            PID in the ``PID {pid} ...`` archive name.
 
     Returns:
         Optional[str]: The basename of the uploaded file if successful, else None.
@@ -39,6 +41,12 @@ def enviar_arquivo_para_gcs(zip_file: str, file_path: Path) -> tuple[str, Path]:
         # Upload the local file to the Blob object
         blob.upload_from_filename(arquivo_local)
 
+        if not pid and zip_file.startswith("PID "):
+            pid = zip_file.split(" ")[1]
+
+        if pid:
+            index_file(pid, objeto_destino)
+
         return zip_file, file_path
 
     except Exception as e:
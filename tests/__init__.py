@@ -0,0 +1 @@
+"""Tests of the CrawJUD bots and utilities."""
@@ -0,0 +1,4 @@
+"""Micro-benchmarks, run by hand with ``python -m tests.benchmarks.<name>``.
+
+They are not collected by pytest (the files are named ``bench_*.py``).
+"""
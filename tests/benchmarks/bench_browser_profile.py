@@ -0,0 +1,87 @@
+"""Measure browser memory and page-load time of the full and lean profiles.
+
+Chrome is launched once per mode with the options DriverBot builds for the
+system, and each page is loaded in turn. The script reports the load time of
+each page (``loadEventEnd`` of the navigation) and the resident memory of
+chromedriver plus its Chrome processes after the last one. Without URLs, the
+saved fixture pages are served from a local HTTP server. Needs Chrome and a
+chromedriver reachable by Selenium Manager.
+
+    python -m tests.benchmarks.bench_browser_profile [system] [url ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from statistics import mean
+from threading import Thread
+
+from selenium import webdriver
+
+from crawjud.bot.Utils.Driver import DriverBot
+from crawjud.bot.Utils.elements.profiles import browser_profile
+
+FIXTURES = Path(__file__).parents[1].joinpath("fixtures")
+PAGES = ("projudi/movimentacoes.html", "forms/cadastro.html")
+LOAD_TIME_SCRIPT = "const [nav] = performance.getEntriesByType('navigation'); return nav.loadEventEnd - nav.startTime;"
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Serve the fixtures without logging each request."""
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Skip the request log."""
+
+
+def measure(system: str, mode: str, urls: list[str]) -> tuple[list[float], float]:
+    """Load the pages in a browser of the given mode.
+
+    Returns:
+        tuple[list[float], float]: The load time of each page (ms) and the final RSS (MB).
+
+    """
+    profile = browser_profile(system, mode)
+    with tempfile.TemporaryDirectory() as tmp:
+        options = webdriver.ChromeOptions()
+        DriverBot.fill_options(options, Path(tmp, "chrome"), Path(tmp), system, profile=profile)
+        driver = webdriver.Chrome(options=options)
+        try:
+            DriverBot.apply_profile(driver, profile)
+            load_times = []
+            for url in urls:
+                driver.get(url)
+                load_times.append(float(driver.execute_script(LOAD_TIME_SCRIPT)))
+
+            return load_times, DriverBot.rss_mb(driver)
+
+        finally:
+            driver.quit()
+
+
+def main(system: str = "pje", *urls: str) -> None:
+    """Run every page through both modes and print the results."""
+    server = None
+    if not urls:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=str(FIXTURES)))
+        Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[:2]
+        urls = tuple(f"http://{host}:{port}/{page}" for page in PAGES)
+
+    print(f"Sistema {system}, {len(urls)} páginas")  # noqa: T201
+    print(f"{'perfil':<8}{'carga média (ms)':>18}{'carga máx. (ms)':>18}{'RSS (MB)':>12}")  # noqa: T201
+    try:
+        for mode in ("full", "lean"):
+            load_times, rss = measure(system, mode, list(urls))
+            print(f"{mode:<8}{mean(load_times):>18.0f}{max(load_times):>18.0f}{rss:>12.0f}")  # noqa: T201
+
+    finally:
+        if server:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,97 @@
+"""Time the loading of a synthetic input spreadsheet.
+
+A spreadsheet shaped like the bots' inputs (CNJ numbers, dates with blanks,
+values, integers, free text and a mixed column) is written once. It is then
+loaded by ``OtherUtils.dataFrame`` and by the former per-value ``apply``
+pipeline. Both start from the same ``read_excel`` frame, which is timed
+separately, and the benchmark checks that they return the same records.
+
+    python -m tests.benchmarks.bench_dataframe [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import Timestamp
+
+from crawjud.bot.shared import PropertiesCrawJUD
+from crawjud.bot.Utils import OtherUtils
+
+
+def synthetic(rows: int) -> pd.DataFrame:
+    """Build a frame shaped like an input spreadsheet."""
+    rng = np.random.default_rng(7)
+    dates = pd.Series(pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, rows), unit="D"))
+    return pd.DataFrame({
+        "numero_processo": [f"{index:07d}-11.2024.8.04.0001" for index in range(rows)],
+        "data_limite": dates.where(rng.random(rows) > 0.1),
+        "valor": rng.random(rows).round(2) * 10_000,
+        "vara": rng.integers(1, 20, rows),
+        "parte_contraria": [f"PARTE {index}" for index in range(rows)],
+        "observacao": pd.Series(["Aguardar prazo"] * rows).where(rng.random(rows) > 0.5),
+        "referencia": [datetime(2024, 3, 4) if index % 3 == 0 else index for index in range(rows)],
+    })
+
+
+def legacy(df: pd.DataFrame) -> list[dict]:
+    """Format the frame the way ``dataFrame`` did before."""
+
+    def format_data(x: object) -> object:
+        if str(x) == "NaT" or str(x) == "nan":
+            return ""
+
+        if isinstance(x, (datetime, Timestamp)):
+            return x.strftime("%d/%m/%Y")
+
+        return x
+
+    for col in df.columns:
+        df[col] = df[col].apply(format_data)
+
+    for col in df.select_dtypes(include=["float"]).columns:
+        df[col] = df[col].apply(lambda x: f"{x:.2f}".replace(".", ","))
+
+    return [dict(list(item.items())) for item in df.to_dict(orient="records")]
+
+
+def main(rows: int = 50_000) -> None:
+    """Write the spreadsheet and time both pipelines."""
+    with tempfile.TemporaryDirectory() as tmp:
+        synthetic(rows).to_excel(Path(tmp, "entrada.xlsx"), index=False)
+        PropertiesCrawJUD.out_dir = Path(tmp)
+        PropertiesCrawJUD.kwargs_ = {"xlsx": "entrada.xlsx"}
+
+        start = time.perf_counter()
+        df = pd.read_excel(Path(tmp, "entrada.xlsx"))
+        df.columns = df.columns.str.upper()
+        read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = legacy(df.copy())
+        legacy_time = time.perf_counter() - start
+
+        original = pd.read_excel
+        pd.read_excel = lambda *args, **kwargs: df.copy()
+        try:
+            start = time.perf_counter()
+            records = OtherUtils().dataFrame()
+            new_time = time.perf_counter() - start
+        finally:
+            pd.read_excel = original
+
+    print(f"{rows} linhas; leitura do xlsx: {read:.2f} s (igual nos dois)")  # noqa: T201
+    print(f"{'formatação':<14}{'s':>10}")  # noqa: T201
+    print(f"{'apply':<14}{legacy_time:>10.3f}")  # noqa: T201
+    print(f"{'vetorizada':<14}{new_time:>10.3f}")  # noqa: T201
+    assert records == expected, "Os registros divergem"  # noqa: S101
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
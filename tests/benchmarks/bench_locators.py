@@ -0,0 +1,76 @@
+"""Time each selector of a system on saved pages, as XPath and as rewritten CSS.
+
+Every page is opened in headless Chrome. For each selector of the system that
+the registry rewrites, one script runs the original XPath
+(``document.evaluate``) and the CSS selector (``querySelectorAll``) many
+times in the page. It reports the mean cost of each in microseconds and
+checks that both match the same number of elements. Selectors kept as XPath or
+CSS are timed on their own. Pages are file paths or URLs (by default the saved
+fixture pages). Needs Chrome and a chromedriver reachable by Selenium Manager.
+
+    python -m tests.benchmarks.bench_locators [system] [state] [page ...]
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+from crawjud.bot.Utils.elements.registry import ElementRegistry
+
+FIXTURES = Path(__file__).parents[1].joinpath("fixtures")
+PAGES = ("projudi/movimentacoes.html", "forms/cadastro.html")
+RUNS = 200
+
+TIME_SCRIPT = """
+const [xpath, css, runs] = arguments;
+const time = (find) => {
+    let count = 0;
+    const start = performance.now();
+    for (let i = 0; i < runs; i++) {
+        count = find();
+    }
+    return [(performance.now() - start) * 1000 / runs, count];
+};
+const snapshot = XPathResult.ORDERED_NODE_SNAPSHOT_TYPE;
+const byXpath = () => document.evaluate(xpath, document, null, snapshot, null).snapshotLength;
+const byCss = () => document.querySelectorAll(css).length;
+return [xpath ? time(byXpath) : null, css ? time(byCss) : null];
+"""
+
+
+def main(system: str = "elaw", state: str = "ame", *pages: str) -> None:
+    """Time the selectors of a system and state on each page."""
+    elements = ElementRegistry.get(system, state)
+    urls = [page if "://" in page else Path(page).resolve().as_uri() for page in pages]
+    urls = urls or [FIXTURES.joinpath(page).as_uri() for page in PAGES]
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        for url in urls:
+            driver.get(url)
+            print(f"\n{url}")  # noqa: T201
+            print(f"{'seletor':<40}{'XPath (µs)':>12}{'CSS (µs)':>12}{'achados':>10}")  # noqa: T201
+            for name, (by, locator) in sorted(elements.locators_.items()):
+                original = getattr(elements, name)
+                xpath = original if original.startswith(("/", "(", "./")) else None
+                css = locator if by == By.CSS_SELECTOR else None
+                by_xpath, by_css = driver.execute_script(TIME_SCRIPT, xpath, css, RUNS)
+
+                found = {result[1] for result in (by_xpath, by_css) if result}
+                xpath_us = f"{by_xpath[0]:.1f}" if by_xpath else "-"
+                css_us = f"{by_css[0]:.1f}" if by_css else "-"
+                matches = "/".join(map(str, sorted(found))) + (" DIVERGE" if len(found) > 1 else "")
+                print(f"{name[:39]:<40}{xpath_us:>12}{css_us:>12}{matches:>10}")  # noqa: T201
+
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
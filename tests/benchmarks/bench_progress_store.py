@@ -0,0 +1,91 @@
+"""Compare the per-PID progress hash with the legacy per-line layout.
+
+The legacy layout wrote one ``process:{pid}:pos:{pos}`` hash per log line and
+read a PID back with ``KEYS *{pid}*`` plus one ``HGETALL`` per key. Both are
+replayed here on an in-memory Redis holding other executions, so the keyspace
+scan cost shows up.
+
+    python -m tests.benchmarks.bench_progress_store [executions] [lines]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import time
+from types import SimpleNamespace
+
+import fakeredis
+
+from crawjud.utils.status.server_side import format_message_log, load_cache
+
+
+def legacy_log(redis_client: fakeredis.FakeRedis, pid: str, pos: int, total: int) -> None:
+    """Write one log line the way the legacy store did."""
+    previous = redis_client.hgetall(f"process:{pid}:pos:{pos - 1}") or redis_client.hgetall(
+        f"process:{pid}:pos:{pos - 2}"
+    )
+    success = int(previous.get(b"success", 0)) + 1
+    redis_client.hset(
+        f"process:{pid}:pos:{pos}",
+        mapping={"pid": pid, "pos": pos, "total": total, "success": success, "remaining": total - success},
+    )
+
+
+def legacy_load(redis_client: fakeredis.FakeRedis, pid: str) -> dict:
+    """Read a PID back the way the legacy store did."""
+    log_pid = {}
+    for key in redis_client.keys(f"*{pid}*"):
+        log_pid.update(redis_client.hgetall(key))
+
+    return log_pid
+
+
+def timed(func: callable, runs: int) -> float:
+    """Return the mean milliseconds of ``runs`` calls of ``func``."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+def main(executions: int = 50, lines: int = 200) -> None:
+    """Fill both layouts with ``executions`` PIDs of ``lines`` lines and time them."""
+    legacy = fakeredis.FakeRedis()
+    app = SimpleNamespace(
+        extensions={"redis": fakeredis.FakeRedis(), "sqlalchemy": None},
+        testing=False,
+        logger=logging.getLogger(__name__),
+    )
+    pids = [f"PID{index:03d}" for index in range(executions)]
+
+    start = time.perf_counter()
+    for pid in pids:
+        for pos in range(lines):
+            legacy_log(legacy, pid, pos, lines)
+
+    legacy_write = (time.perf_counter() - start) * 1000 / (executions * lines)
+
+    async def fill() -> None:
+        for pid in pids:
+            for pos in range(lines):
+                data = {"pid": pid, "pos": pos, "message": f"Linha {pos}", "type": "success", "total": lines}
+                await format_message_log(data=data, pid=pid, app=app)
+
+    start = time.perf_counter()
+    asyncio.run(fill())
+    new_write = (time.perf_counter() - start) * 1000 / (executions * lines)
+
+    legacy_read = timed(lambda: legacy_load(legacy, pids[-1]), 20)
+    new_read = timed(lambda: asyncio.run(load_cache(pids[-1], app)), 20)
+
+    print(f"{executions} execuções x {lines} linhas")  # noqa: T201
+    print(f"{'layout':<10}{'chaves':>10}{'escrita (ms/linha)':>22}{'leitura (ms/pid)':>20}")  # noqa: T201
+    print(f"{'legado':<10}{legacy.dbsize():>10}{legacy_write:>22.3f}{legacy_read:>20.3f}")  # noqa: T201
+    print(f"{'hash':<10}{app.extensions['redis'].dbsize():>10}{new_write:>22.3f}{new_read:>20.3f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
@@ -0,0 +1,94 @@
+"""Time a DatabaseScheduler sync over a synthetic table of schedules.
+
+The legacy sync (``ScheduleModel.query.all()`` plus one lazy crontab load per
+row, every entry rebuilt) is compared with the incremental sync, with no
+changes and with 1% of the schedules changed. Runs on an in-memory SQLite.
+
+    python -m tests.benchmarks.bench_scheduler [schedules]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+
+import quart_flask_patch  # noqa: F401
+from celery import Celery
+from celery.beat import ScheduleEntry
+from celery.schedules import crontab
+from quart import Quart
+from sqlalchemy import event
+
+from crawjud.core import db
+from crawjud.models import CrontabModel, ScheduleModel
+from crawjud.utils.scheduler import DatabaseScheduler
+
+
+def legacy_schedule() -> dict:
+    """Build every entry the way the legacy ``get_schedule`` did."""
+    schedules = {}
+    for entry in ScheduleModel.query.all():
+        cron = entry.schedule
+        schedules[entry.task] = ScheduleEntry(
+            name=DatabaseScheduler.fix_unicode(entry.name),
+            task=entry.task,
+            schedule=crontab(
+                minute=cron.minute,
+                hour=cron.hour,
+                day_of_week=cron.day_of_week,
+                day_of_month=cron.day_of_month,
+                month_of_year=cron.month_of_year,
+            ),
+            args=json.loads(entry.args or "[]"),
+            kwargs=json.loads(entry.kwargs or "{}"),
+        )
+
+    return schedules
+
+
+async def run(total: int) -> None:
+    """Fill the table with ``total`` schedules and time each sync."""
+    app = Quart(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+
+    async with app.app_context():
+        db.create_all()
+        crontabs = [CrontabModel(minute=str(index % 60), hour=str(index % 24)) for index in range(total)]
+        db.session.add_all(crontabs)
+        db.session.flush()
+        db.session.add_all(
+            ScheduleModel(name=f"agendamento {index}", task=f"crawjud.bot.{index}", schedule_id=cron.id)
+            for index, cron in enumerate(crontabs)
+        )
+        db.session.commit()
+
+        statements = [0]
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.__setitem__(0, statements[0] + 1))
+
+        def timed(label: str, func: callable) -> None:
+            db.session.expire_all()
+            statements[0] = 0
+            start = time.perf_counter()
+            func()
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{label:<28}{elapsed:>12.1f}{statements[0]:>12}")  # noqa: T201
+
+        beat = DatabaseScheduler(app=Celery(set_as_current=False), lazy=True)
+        print(f"{total} agendamentos")  # noqa: T201
+        print(f"{'sync':<28}{'ms':>12}{'consultas':>12}")  # noqa: T201
+        timed("legado (reconstrói tudo)", legacy_schedule)
+        timed("incremental (primeira)", beat.sync)
+        timed("incremental (sem mudanças)", beat.sync)
+
+        for cron in crontabs[::100]:
+            cron.hour = str((int(cron.hour) + 1) % 24)
+
+        db.session.commit()
+        timed("incremental (1% alterado)", beat.sync)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
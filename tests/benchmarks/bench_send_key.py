@@ -0,0 +1,57 @@
+"""Time the input modes of ``Interact.send_key`` on a local HTML form.
+
+Each row types a CNJ number, a party name and an observation into the saved
+form, served by the local WebDriver stub (``tests.webdriver_stub``). The
+``slow`` mode is the former per-character typing, sleeps included. Real
+drivers add the browser round-trip to each command.
+
+    python -m tests.benchmarks.bench_send_key [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+from crawjud.bot.shared import PropertiesCrawJUD
+from crawjud.bot.Utils.interator import Interact
+from tests.webdriver_stub import WebDriverStub
+
+FORM = Path(__file__).parents[1].joinpath("fixtures", "forms", "cadastro.html")
+ROW = {
+    "numero": "0001234-56.2024.8.04.0001",
+    "parte": "EMPRESA ALFA COMÉRCIO E SERVIÇOS LTDA",
+    "observacao": "Cliente informou novo endereço para intimações; aguardar retorno do escritório parceiro. " * 4,
+}
+
+
+def main(rows: int = 10) -> None:
+    """Fill the form ``rows`` times in each mode and print the cost of a row."""
+    stub = WebDriverStub(FORM.read_text(encoding="utf-8"))
+    PropertiesCrawJUD.driver_ = webdriver.Remote(command_executor=stub.url, options=webdriver.ChromeOptions())
+    interact = Interact()
+
+    print(f"{rows} linhas, {sum(map(len, ROW.values()))} caracteres por linha")  # noqa: T201
+    print(f"{'modo':<8}{'ms/linha':>12}{'chamadas/linha':>16}")  # noqa: T201
+    for mode in ("slow", "fast", "js"):
+        stub.commands = 0
+        start = time.perf_counter()
+        for _ in range(rows):
+            for field, value in ROW.items():
+                element = PropertiesCrawJUD.driver_.find_element(By.CSS_SELECTOR, f'[id="{field}"]')
+                element.clear()
+                interact.send_key(element, value, mode)
+
+        elapsed = (time.perf_counter() - start) * 1000 / rows
+        print(f"{mode:<8}{elapsed:>12.1f}{stub.commands / rows:>16.0f}")  # noqa: T201
+
+    PropertiesCrawJUD.driver_.quit()
+    stub.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
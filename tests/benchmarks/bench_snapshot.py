@@ -0,0 +1,83 @@
+"""Compare per-element extraction with a table snapshot on a saved movement table.
+
+The saved Projudi movement table is repeated to the requested number of
+movements and served by the local WebDriver stub (``tests.webdriver_stub``),
+so the Selenium client makes the same HTTP round-trips it makes against a
+driver, without a browser. Real drivers add the browser round-trip to each
+command, so the per-element figures are a lower bound.
+
+    python -m tests.benchmarks.bench_snapshot [movements]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from crawjud.bot.Utils.snapshot import TableSnapshot
+from tests.webdriver_stub import WebDriverStub
+
+FIXTURE = Path(__file__).parents[1].joinpath("fixtures", "projudi", "movimentacoes.html")
+
+
+def build_page(movements: int) -> str:
+    """Repeat the rows of the saved table until it has at least ``movements`` visible movements."""
+    html = FIXTURE.read_text(encoding="utf-8")
+    head, rest = html.split("<tbody>", 1)
+    body, tail = rest.split("</tbody>", 1)
+    visible = len(snapshot(SimpleNamespace(get_attribute=lambda name: html)))
+    return f"{head}<tbody>{body * -(-movements // visible)}</tbody>{tail}"
+
+
+def per_element(table: WebElement) -> list[tuple[str, str]]:
+    """Read the movements one WebDriver call per row and cell, as the scrapers did."""
+    moves = []
+    for row in table.find_elements(By.TAG_NAME, "tr"):
+        classes = row.get_attribute("class") or ""
+        if ("odd" in classes or "even" in classes) and row.get_attribute("style") != "display:none":
+            cells = row.find_elements(By.TAG_NAME, "td")
+            moves.append((cells[2].text.split(" ")[0], cells[3].text))
+
+    return moves
+
+
+def snapshot(table: WebElement) -> list[tuple[str, str]]:
+    """Read the movements from a single snapshot of the table."""
+    moves = []
+    for row in TableSnapshot().rows(table):
+        if row.has_class("odd", "even") and row.get_attribute("style") != "display:none":
+            cells = row.find_all("td")
+            moves.append((cells[2].text.split(" ")[0], cells[3].text))
+
+    return moves
+
+
+def main(movements: int = 1000) -> None:
+    """Extract the movement table both ways and print time and WebDriver calls."""
+    stub = WebDriverStub(build_page(movements))
+    driver = webdriver.Remote(command_executor=stub.url, options=webdriver.ChromeOptions())
+
+    print(f"{movements} movimentações")  # noqa: T201
+    print(f"{'extração':<16}{'ms':>12}{'chamadas':>12}")  # noqa: T201
+    results = []
+    for label, extract in (("por elemento", per_element), ("snapshot", snapshot)):
+        table = driver.find_element(By.CSS_SELECTOR, 'table[class="resultTable"]')
+        stub.commands = 0
+        start = time.perf_counter()
+        results.append(extract(table))
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{label:<16}{elapsed:>12.1f}{stub.commands:>12}")  # noqa: T201
+
+    driver.quit()
+    stub.close()
+    assert results[0] == results[1], "As duas extrações divergem"  # noqa: S101
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
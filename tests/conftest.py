@@ -0,0 +1,51 @@
+"""Shared fixtures of the test suite."""
+
+from __future__ import annotations
+
+from typing import Generator
+
+import fakeredis
+import pytest
+
+# Patch Flask before any crawjud module imports Flask-SQLAlchemy, as crawjud.core does for the app
+import quart_flask_patch  # noqa: F401
+import redis
+
+from crawjud.bot.common.redis_conn import redis_client
+from crawjud.bot.shared import PropertiesCrawJUD
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> Generator[fakeredis.FakeRedis, None, None]:
+    """Point every client built by ``redis_client`` at an in-memory Redis.
+
+    Yields:
+        fakeredis.FakeRedis: A client of the same server, decoding responses.
+
+    """
+    server = fakeredis.FakeServer()
+
+    def from_url(cls: type[redis.Redis], url: str, **kwargs: object) -> fakeredis.FakeRedis:
+        kwargs.pop("socket_timeout", None)
+        return fakeredis.FakeRedis(server=server, **kwargs)
+
+    redis_client.cache_clear()
+    monkeypatch.setattr(redis.Redis, "from_url", classmethod(from_url))
+    yield fakeredis.FakeRedis(server=server, decode_responses=True)
+    redis_client.cache_clear()
+
+
+@pytest.fixture
+def bot_state(monkeypatch: pytest.MonkeyPatch) -> type[PropertiesCrawJUD]:
+    """Give the test a clean execution state (PID, row, worker and bot data).
+
+    Returns:
+        type[PropertiesCrawJUD]: The class holding the state, to set more of it.
+
+    """
+    monkeypatch.setattr(PropertiesCrawJUD, "pid_", "TEST01")
+    monkeypatch.setattr(PropertiesCrawJUD, "row_", 0)
+    monkeypatch.setattr(PropertiesCrawJUD, "worker_id_", 0)
+    monkeypatch.setattr(PropertiesCrawJUD, "bot_data_", {})
+    monkeypatch.setattr(PropertiesCrawJUD, "kwargs_", {})
+    return PropertiesCrawJUD
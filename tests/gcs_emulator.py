@@ -0,0 +1,134 @@
+"""Local stand-in for the parts of the GCS JSON API the app uses.
+
+It keeps the objects of any bucket in memory and answers object listings
+(``prefix``, ``matchGlob``, ``maxResults``) and multipart uploads. Point the
+storage client at it with ``STORAGE_EMULATOR_HOST=<base_url>``.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from fnmatch import fnmatchcase
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Self
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+class GCSEmulator:
+    """Serve an in-memory GCS on a local port, in a background thread.
+
+    Attributes:
+        objects (dict[str, dict[str, bytes]]): Bucket name mapped to its objects.
+        requests (list[tuple[str, str]]): The (method, path) requested, in order.
+
+    """
+
+    def __init__(self, port: int = 0) -> None:
+        """Configure the server.
+
+        Args:
+            port (int, optional): The port (0 picks a free one).
+
+        """
+        self.objects: dict[str, dict[str, bytes]] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.lock = Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self.handler())
+        self.thread = Thread(target=self.server.serve_forever, name="gcs-emulator", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """The URL of the server root."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def listings(self) -> int:
+        """Return how many object listings were requested."""
+        return sum(1 for method, path in self.requests if method == "GET" and path.endswith("/o"))
+
+    def handler(self) -> type[BaseHTTPRequestHandler]:
+        """Build the request handler bound to this server.
+
+        Returns:
+            type[BaseHTTPRequestHandler]: The handler class.
+
+        """
+        emulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def reply(self, status: int, body: dict) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def resource(self, bucket: str, name: str) -> dict:
+                size = len(emulator.objects[bucket][name])
+                return {"kind": "storage#object", "bucket": bucket, "name": name, "size": str(size)}
+
+            def do_GET(self) -> None:  # noqa: N802
+                url = urlsplit(self.path)
+                with emulator.lock:
+                    emulator.requests.append(("GET", url.path))
+
+                match = re.fullmatch(r"/storage/v1/b/([^/]+)/o", url.path)
+                if not match:
+                    self.reply(404, {"error": {"code": 404, "message": "Not Found"}})
+                    return
+
+                bucket = unquote(match.group(1))
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                names = sorted(emulator.objects.get(bucket, {}))
+                names = [name for name in names if name.startswith(query.get("prefix", ""))]
+                if "matchGlob" in query:
+                    names = [name for name in names if fnmatchcase(name, query["matchGlob"].replace("**", "*"))]
+
+                names = names[: int(query.get("maxResults", len(names)))]
+                self.reply(200, {"kind": "storage#objects", "items": [self.resource(bucket, name) for name in names]})
+
+            def do_POST(self) -> None:  # noqa: N802
+                url = urlsplit(self.path)
+                with emulator.lock:
+                    emulator.requests.append(("POST", url.path))
+
+                match = re.fullmatch(r"/upload/storage/v1/b/([^/]+)/o", url.path)
+                boundary = re.search(r'boundary="?([^";]+)"?', self.headers.get("Content-Type", ""))
+                if not match or not boundary:
+                    self.reply(400, {"error": {"code": 400, "message": "Only multipart uploads"}})
+                    return
+
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                metadata, content = (
+                    part.split(b"\r\n\r\n", 1)[1].removesuffix(b"\r\n")
+                    for part in body.split(b"--" + boundary.group(1).encode())[1:3]
+                )
+                bucket = unquote(match.group(1))
+                name = json.loads(metadata)["name"]
+                with emulator.lock:
+                    emulator.objects.setdefault(bucket, {})[name] = content
+
+                self.reply(200, self.resource(bucket, name))
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                return
+
+        return Handler
+
+    def __enter__(self) -> Self:
+        """Start serving.
+
+        Returns:
+            Self: The running server.
+
+        """
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop serving."""
+        self.server.shutdown()
+        self.server.server_close()
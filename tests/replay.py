@@ -0,0 +1,115 @@
+"""Local stand-in server that replays recorded HTTP responses.
+
+The server answers ``GET /<name>`` with the file ``<name>`` of a directory, as
+JSON, and 404 for anything not recorded. Paths listed in ``fail_first`` answer
+``503`` (with ``Retry-After: 0``) the first time they are requested, to exercise
+retries.
+
+The PJe pauta harvester records its responses as ``{vara}-{date}-{page}.json``
+(see ``PJE_PAUTAS_RECORD``), so a recorded run is replayed with::
+
+    python -m tests.replay <directory> [port]
+    PJE_PAUTAS_API=http://127.0.0.1:<port>/{vara}-{date}-{page}.json
+"""
+
+from __future__ import annotations
+
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Self
+
+
+class ReplayServer:
+    """Serve the files of a directory on a local port, in a background thread.
+
+    Attributes:
+        directory (Path): The recorded responses.
+        fail_first (set[str]): Paths that fail once with ``503``.
+        requests (list[str]): The paths requested, in order.
+
+    """
+
+    def __init__(self, directory: Path, fail_first: set[str] = None, port: int = 0) -> None:
+        """Configure the server.
+
+        Args:
+            directory (Path): The recorded responses.
+            fail_first (set[str], optional): Paths (``/name``) that fail once with ``503``.
+            port (int, optional): The port (0 picks a free one).
+
+        """
+        self.directory = Path(directory)
+        self.fail_first = set(fail_first or ())
+        self.requests: list[str] = []
+        self.lock = Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self.handler())
+        self.thread = Thread(target=self.server.serve_forever, name="replay-server", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """The URL of the server root."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handler(self) -> type[BaseHTTPRequestHandler]:
+        """Build the request handler bound to this server.
+
+        Returns:
+            type[BaseHTTPRequestHandler]: The handler class.
+
+        """
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                path = self.path.split("?")[0]
+                with replay.lock:
+                    replay.requests.append(path)
+                    fail = path in replay.fail_first
+                    replay.fail_first.discard(path)
+
+                if fail:
+                    self.send_response(503)
+                    self.send_header("Retry-After", "0")
+                    self.end_headers()
+                    return
+
+                file = replay.directory.joinpath(path.lstrip("/"))
+                if "/" in path.lstrip("/") or not file.is_file():
+                    self.send_error(404)
+                    return
+
+                body = file.read_bytes()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                return
+
+        return Handler
+
+    def __enter__(self) -> Self:
+        """Start serving.
+
+        Returns:
+            Self: The running server.
+
+        """
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop serving."""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+if __name__ == "__main__":
+    with ReplayServer(Path(sys.argv[1]), port=int(sys.argv[2]) if len(sys.argv) > 2 else 8765) as replay:
+        print(f"Servindo {replay.directory} em {replay.base_url}")  # noqa: T201
+        replay.thread.join()
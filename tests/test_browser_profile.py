@@ -0,0 +1,88 @@
+"""Tests for the browser profiles and the Chrome options built from them."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from selenium.webdriver.chrome.options import Options
+
+from crawjud.bot.Utils.Driver import DriverBot
+from crawjud.bot.Utils.elements.profiles import FONT_URLS, FULL, LEAN, THIRD_PARTY_URLS, browser_profile
+
+
+@pytest.fixture(autouse=True)
+def no_profile_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the environment of the machine out of the profile choice."""
+    monkeypatch.delenv("BROWSER_PROFILE", raising=False)
+    monkeypatch.delenv("BROWSER_BASE_PROFILE", raising=False)
+
+
+def test_mode_comes_from_the_execution_then_the_environment_then_the_system(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert browser_profile("pje").mode == "lean"
+    assert browser_profile("esaj").mode == "full"
+    assert browser_profile("PJE", "full") is FULL
+
+    monkeypatch.setenv("BROWSER_PROFILE", "lean")
+    assert browser_profile("esaj").mode == "lean"
+    assert browser_profile("esaj", "FULL") is FULL
+
+
+def test_lean_profiles_follow_the_system() -> None:
+    assert browser_profile("pje", "lean").blocked_urls() == [*THIRD_PARTY_URLS, *FONT_URLS]
+    assert browser_profile("caixa", "lean").blocked_urls() == list(THIRD_PARTY_URLS)
+    assert browser_profile("esaj", "lean").extensions is True
+    assert browser_profile("sistema novo", "lean") is LEAN
+    assert FULL.blocked_urls() == []
+
+
+def chrome_options(tmp_path: Path, system: str, mode: str) -> Options:
+    """Fill Chrome options the way DriverBot does for a system and mode."""
+    options = Options()
+    DriverBot.fill_options(options, tmp_path / "chrome", tmp_path, system, profile=browser_profile(system, mode))
+    return options
+
+
+def test_full_profile_keeps_the_headed_setup(tmp_path: Path) -> None:
+    options = chrome_options(tmp_path, "esaj", "full")
+
+    assert "--display=:99" in options.arguments
+    assert "--headless=new" not in options.arguments
+    assert f"user-data-dir={tmp_path / 'chrome'}" in options.arguments
+    assert "profile.managed_default_content_settings.images" not in options.experimental_options["prefs"]
+
+
+def test_lean_profile_runs_headless_without_images(tmp_path: Path) -> None:
+    options = chrome_options(tmp_path, "pje", "lean")
+
+    assert "--headless=new" in options.arguments
+    assert not any(arg.startswith("--display") for arg in options.arguments)
+    assert options.experimental_options["prefs"]["profile.managed_default_content_settings.images"] == 2
+    assert "--display=:99" in DriverBot.list_args_
+
+
+def test_seed_profile_copies_the_base_without_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    base = tmp_path / "base"
+    for name in ("Default/Preferences", "Default/Cache/data_0", "Default/Code Cache/js", "SingletonLock"):
+        base.joinpath(name).parent.mkdir(parents=True, exist_ok=True)
+        base.joinpath(name).write_text("x")
+
+    monkeypatch.setenv("BROWSER_BASE_PROFILE", str(base))
+    DriverBot.seed_profile(tmp_path / "chrome")
+
+    copied = sorted(str(file.relative_to(tmp_path / "chrome")) for file in (tmp_path / "chrome").rglob("*"))
+    assert copied == ["Default", "Default/Preferences"]
+
+
+def test_apply_profile_blocks_urls_through_cdp() -> None:
+    calls: list[tuple[str, dict]] = []
+
+    class Driver:
+        def execute_cdp_cmd(self, cmd: str, args: dict) -> None:
+            calls.append((cmd, args))
+
+    DriverBot.apply_profile(Driver(), FULL)
+    assert calls == []
+
+    DriverBot.apply_profile(Driver(), browser_profile("caixa", "lean"))
+    assert calls == [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": list(THIRD_PARTY_URLS)})]
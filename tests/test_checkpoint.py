@@ -0,0 +1,118 @@
+"""Tests for the checkpoints that let an interrupted execution resume."""
+
+from __future__ import annotations
+
+import fakeredis
+import pytest
+
+from crawjud.bot.shared import PropertiesCrawJUD
+from crawjud.bot.Utils import checkpoint
+from crawjud.bot.Utils.checkpoint import CHECKPOINT_TTL, Checkpoint, checkpoint_key, migrate_checkpoints
+
+ROWS = [
+    (0, {"NUMERO_PROCESSO": "0000001-11.2024.8.04.0001"}),
+    (1, {"NUMERO_PROCESSO": "0000002-22.2024.8.04.0001"}),
+    (2, {"NUMERO_PROCESSO": "0000003-33.2024.8.04.0001"}),
+]
+
+
+@pytest.fixture
+def checkpoints(
+    fake_redis: fakeredis.FakeRedis,
+    bot_state: type[PropertiesCrawJUD],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Checkpoint:
+    """Return a Checkpoint of the execution TEST01, without logging."""
+    monkeypatch.setattr(Checkpoint, "prt", lambda self: None, raising=False)
+    return Checkpoint()
+
+
+def finish(bot_state: type[PropertiesCrawJUD], checkpoints: Checkpoint, pos: int, failed: bool = False) -> None:
+    """Mark a row of ``ROWS`` as finished, as the bot does after writing its result."""
+    bot_state.row_ = pos + 1
+    bot_state.bot_data_ = ROWS[pos][1]
+    checkpoints.mark(failed)
+
+
+def test_mark_records_rows_by_position_and_process(
+    checkpoints: Checkpoint,
+    bot_state: type[PropertiesCrawJUD],
+    fake_redis: fakeredis.FakeRedis,
+) -> None:
+    finish(bot_state, checkpoints, 0)
+    finish(bot_state, checkpoints, 1, failed=True)
+
+    assert fake_redis.smembers(checkpoint_key("TEST01")) == {"1:0000001-11.2024.8.04.0001"}
+    assert fake_redis.smembers(checkpoint_key("TEST01", failed=True)) == {"2:0000002-22.2024.8.04.0001"}
+    assert 0 < fake_redis.ttl(checkpoint_key("TEST01")) <= CHECKPOINT_TTL
+
+
+def test_mark_without_row_data_records_nothing(
+    checkpoints: Checkpoint,
+    bot_state: type[PropertiesCrawJUD],
+    fake_redis: fakeredis.FakeRedis,
+) -> None:
+    bot_state.row_ = 1
+    checkpoints.mark()
+
+    assert fake_redis.keys("*") == []
+
+
+def test_pending_skips_successes_and_retries_failures(
+    checkpoints: Checkpoint,
+    bot_state: type[PropertiesCrawJUD],
+) -> None:
+    finish(bot_state, checkpoints, 0)
+    finish(bot_state, checkpoints, 1, failed=True)
+
+    assert checkpoints.pending(ROWS) == ROWS[1:]
+    assert checkpoints.message.startswith("Retomando execução: 1 linhas")
+
+
+@pytest.mark.parametrize("retry_errors", [False, "false", "0"])
+def test_pending_skips_failures_when_not_retrying(
+    checkpoints: Checkpoint,
+    bot_state: type[PropertiesCrawJUD],
+    retry_errors: object,
+) -> None:
+    finish(bot_state, checkpoints, 0)
+    finish(bot_state, checkpoints, 1, failed=True)
+    bot_state.kwargs_["retry_errors"] = retry_errors
+
+    assert checkpoints.pending(ROWS) == ROWS[2:]
+
+
+def test_pending_runs_a_row_whose_process_changed(checkpoints: Checkpoint, bot_state: type[PropertiesCrawJUD]) -> None:
+    finish(bot_state, checkpoints, 0)
+    edited = [(0, {"NUMERO_PROCESSO": "0000009-99.2024.8.04.0001"}), *ROWS[1:]]
+
+    assert checkpoints.pending(edited) == edited
+
+
+def test_pending_keeps_every_row_when_redis_is_unreachable(
+    checkpoints: Checkpoint,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    server = fakeredis.FakeServer()
+    server.connected = False
+    monkeypatch.setattr(checkpoint, "redis_client", lambda **kwargs: fakeredis.FakeRedis(server=server, **kwargs))
+
+    assert checkpoints.pending(ROWS) == ROWS
+
+
+def test_checkpoints_of_the_old_database_are_migrated(
+    checkpoints: Checkpoint,
+    fake_redis: fakeredis.FakeRedis,
+) -> None:
+    old = fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    old.sadd(checkpoint_key("TEST01"), "1:0000001-11.2024.8.04.0001")
+    old.expire(checkpoint_key("TEST01"), 3600)
+    old.sadd(checkpoint_key("TEST01", failed=True), "2:0000002-22.2024.8.04.0001")
+    old.set("crawjud:stop:TEST01", "1")
+
+    assert migrate_checkpoints(old) == 2
+    assert 0 < fake_redis.ttl(checkpoint_key("TEST01")) <= 3600
+    assert fake_redis.ttl(checkpoint_key("TEST01", failed=True)) == CHECKPOINT_TTL
+    assert fake_redis.keys("crawjud:stop:*") == []
+
+    assert checkpoints.pending(ROWS) == ROWS[1:]
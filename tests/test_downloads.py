@@ -0,0 +1,90 @@
+"""Tests for the downloads resolved from file system events of the output directory."""
+
+from __future__ import annotations
+
+import shutil
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from crawjud.bot.common.exceptions import ExecutionError
+from crawjud.bot.common.stop_signal import StopSignal
+from crawjud.bot.shared import PropertiesCrawJUD
+from crawjud.bot.Utils.downloads import DownloadManager
+from crawjud.bot.Utils.waits import WaitEngine
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Generator[DownloadManager, None, None]:
+    """Give the test a DownloadManager watching a temporary output directory."""
+    monkeypatch.setattr(PropertiesCrawJUD, "out_dir", tmp_path)
+    monkeypatch.setattr(PropertiesCrawJUD, "WaitEngine_", WaitEngine())
+    monkeypatch.setattr(PropertiesCrawJUD, "StopSignal_", StopSignal())
+    monkeypatch.setattr(PropertiesCrawJUD, "PhaseTimer_", None)
+    for name in ("observer_", "watched_", "owner_pid_"):
+        monkeypatch.setattr(DownloadManager, name, None)
+
+    manager = DownloadManager()
+    yield manager
+    manager.stop()
+
+
+def finish_download(path: Path, content: bytes = b"%PDF-1.4") -> None:
+    """Write a file the way Chrome does: to ``.crdownload``, then renamed."""
+    partial = path.with_name(f"{path.name}.crdownload")
+    partial.write_bytes(content)
+    partial.rename(path)
+
+
+def test_download_resolves_when_the_partial_file_is_renamed(manager: DownloadManager, tmp_path: Path) -> None:
+    download = manager.expect("guia_boleto.pdf")
+    finish_download(tmp_path / "guia_boleto.pdf")
+
+    assert manager.wait(download, timeout=5) == tmp_path.resolve() / "guia_boleto.pdf"
+
+
+def test_concurrent_downloads_get_their_own_files(manager: DownloadManager, tmp_path: Path) -> None:
+    first = manager.expect(lambda name: name.startswith("0001"))
+    second = manager.expect(lambda name: name.startswith("0002"))
+    finish_download(tmp_path / "0002 - sentenca.pdf")
+    finish_download(tmp_path / "0001 - inicial.pdf")
+
+    assert manager.wait(first, timeout=5).name == "0001 - inicial.pdf"
+    assert manager.wait(second, timeout=5).name == "0002 - sentenca.pdf"
+
+
+def test_files_of_earlier_rows_do_not_resolve_the_next_download(manager: DownloadManager, tmp_path: Path) -> None:
+    finish_download(tmp_path / "documento.pdf")
+    manager.start()
+    download = manager.expect(lambda name: name.endswith(".pdf"))
+
+    # The bot moves the earlier file into the process folder and other writers touch the folder
+    tmp_path.joinpath("0001").mkdir()
+    shutil.move(tmp_path / "documento.pdf", tmp_path / "0001" / "documento.pdf")
+    tmp_path.joinpath("0001", "anexo.pdf").write_bytes(b"%PDF-1.4")
+    tmp_path.joinpath("planilha.xlsx").write_bytes(b"PK")
+    with pytest.raises(FutureTimeoutError):
+        download.result(timeout=0.5)
+
+    finish_download(tmp_path / "documento (1).pdf")
+    assert manager.wait(download, timeout=5).name == "documento (1).pdf"
+
+
+def test_wait_gives_up_after_the_timeout(manager: DownloadManager) -> None:
+    download = manager.expect("nunca.pdf")
+
+    assert manager.wait(download, timeout=0.2) is None
+    assert download.cancelled()
+    assert DownloadManager.waiters_ == []
+
+
+def test_wait_stops_with_the_execution(manager: DownloadManager) -> None:
+    download = manager.expect("nunca.pdf")
+    PropertiesCrawJUD.StopSignal_.event.set()
+
+    with pytest.raises(ExecutionError):
+        manager.wait(download, timeout=5)
+
+    assert DownloadManager.waiters_ == []
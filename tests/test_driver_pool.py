@@ -0,0 +1,166 @@
+"""Tests for the pool of warm Chrome sessions, with sessions served by the WebDriver stub."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from selenium import webdriver
+
+from crawjud.bot.Utils.Driver.pool import DriverPool, PooledSession, PoolKey
+from tests.webdriver_stub import WebDriverStub
+
+PAGE = "<html><body><p>CrawJUD</p></body></html>"
+
+
+@pytest.fixture
+def stubs(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Generator[list[WebDriverStub], None, None]:
+    """Give the test an empty pool whose sessions are launched on WebDriver stubs.
+
+    Yields:
+        list[WebDriverStub]: The stub of each launched session, in launch order.
+
+    """
+    stubs: list[WebDriverStub] = []
+
+    def launch(cls: type[DriverPool], key: PoolKey) -> PooledSession:
+        stubs.append(WebDriverStub(PAGE))
+        driver = webdriver.Remote(command_executor=stubs[-1].url, options=webdriver.ChromeOptions())
+        profile_dir = tmp_path.joinpath(f"perfil{len(stubs)}")
+        profile_dir.mkdir()
+        return PooledSession(key, driver, profile_dir)
+
+    for name in ("DRIVER_POOL_MAX_USES", "DRIVER_POOL_MAX_RSS_MB", "DRIVER_POOL_IDLE_TIMEOUT", "DRIVER_POOL_AUTH_TTL"):
+        monkeypatch.delenv(name, raising=False)
+
+    monkeypatch.setenv("DRIVER_POOL_SIZE", "2")
+    monkeypatch.setattr(DriverPool, "idle_", {})
+    monkeypatch.setattr(DriverPool, "in_use_", 0)
+    monkeypatch.setattr(DriverPool, "stats_", dict.fromkeys(DriverPool.stats_, 0))
+    monkeypatch.setattr(DriverPool, "launch", classmethod(launch))
+    yield stubs
+    DriverPool.shutdown()
+    for stub in stubs:
+        stub.close()
+
+
+def execution(tmp_path: Path, **bot_args: str) -> dict[str, str]:
+    """Write the arguments file of an execution and return its launcher arguments."""
+    path_args = tmp_path.joinpath(f"{len(list(tmp_path.glob('*.json')))}.json")
+    path_args.write_text(json.dumps({"state": "AM", "username": "robo", **bot_args}))
+    return {"path_args": str(path_args), "system": "projudi"}
+
+
+def test_lease_reuses_the_session_of_the_same_key(stubs: list[WebDriverStub], tmp_path: Path) -> None:
+    with DriverPool.lease(execution(tmp_path)) as pool_kwargs:
+        session = pool_kwargs["pooled_session"]
+        session.authenticated.value = 1
+
+    with DriverPool.lease(execution(tmp_path)) as pool_kwargs:
+        assert pool_kwargs["pooled_session"] is session
+        assert session.uses == 1
+        assert session.auth_valid()
+
+    assert len(stubs) == 1
+    assert DriverPool.metrics() | {"launch_seconds": 0} == {
+        "hits": 1,
+        "misses": 1,
+        "recycled": 0,
+        "launch_seconds": 0,
+        "saved_seconds": 0,
+        "hit_rate": 0.5,
+        "idle": 1,
+        "in_use": 0,
+    }
+
+
+def test_lease_skips_the_pool_when_the_session_cannot_be_shared(stubs: list[WebDriverStub], tmp_path: Path) -> None:
+    for bot_args in ({"login_method": "cert"}, {"username": ""}):
+        with DriverPool.lease(execution(tmp_path, **bot_args)) as pool_kwargs:
+            assert pool_kwargs == {}
+
+    with DriverPool.lease(execution(tmp_path, username="outro")), DriverPool.lease(execution(tmp_path)):
+        with DriverPool.lease(execution(tmp_path, username="terceiro")) as pool_kwargs:
+            assert pool_kwargs == {}
+
+    assert len(stubs) == 2
+
+
+def test_failed_execution_closes_its_session(stubs: list[WebDriverStub], tmp_path: Path) -> None:
+    profile_dirs: list[Path] = []
+
+    def failing_run() -> None:
+        with DriverPool.lease(execution(tmp_path)) as pool_kwargs:
+            profile_dirs.append(pool_kwargs["pooled_session"].profile_dir)
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        failing_run()
+
+    assert stubs[0].quit
+    assert not profile_dirs[0].exists()
+    assert DriverPool.metrics()["in_use"] == 0
+    assert DriverPool.metrics()["recycled"] == 1
+
+
+def test_sessions_are_recycled_after_max_uses(
+    stubs: list[WebDriverStub],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("DRIVER_POOL_MAX_USES", "1")
+    with DriverPool.lease(execution(tmp_path)):
+        pass
+
+    assert stubs[0].quit
+    assert DriverPool.idle_count() == 0
+
+
+def test_idle_sessions_expire(stubs: list[WebDriverStub], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    with DriverPool.lease(execution(tmp_path)):
+        pass
+
+    monkeypatch.setenv("DRIVER_POOL_IDLE_TIMEOUT", "0")
+    with DriverPool.lease(execution(tmp_path)):
+        pass
+
+    assert stubs[0].quit
+    assert len(stubs) == 2
+
+
+def test_healthy_closes_the_windows_left_behind(stubs: list[WebDriverStub]) -> None:
+    session = DriverPool.launch(("projudi", "AM", "robo", "full"))
+    stubs[0].windows.append("popup")
+
+    assert session.healthy()
+    assert stubs[0].windows == ["main"]
+
+    stubs[0].windows.clear()
+    assert not session.healthy()
+    session.close()
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="sessions are handed to the bot through fork")
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_login_flag_set_in_the_bot_process_reaches_the_worker(
+    stubs: list[WebDriverStub],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = DriverPool.launch(("projudi", "AM", "robo", "full"))
+    assert not session.auth_valid()
+
+    pid = os.fork()
+    if pid == 0:
+        session.authenticated.value = 1
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+    assert session.auth_valid()
+
+    monkeypatch.setenv("DRIVER_POOL_AUTH_TTL", "0")
+    assert not session.auth_valid()
+    session.close()
@@ -0,0 +1,112 @@
+"""Tests for the element registry and the locators it precomputes."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from crawjud.bot.Utils.elements.properties import Configuracao
+from crawjud.bot.Utils.elements.registry import ElementRegistry, balanced, locator_of, to_css
+
+
+@pytest.mark.parametrize(
+    ("xpath", "css"),
+    [
+        ("//select[contains(@id, 'comboVara_input')]", 'select[id*="comboVara_input"]'),
+        ('//*[contains(@class, "ui-button")]', '*[class*="ui-button"]'),
+        ("//input[contains(@name,'numero')]", 'input[name*="numero"]'),
+        ("//div[@id='j_id_4p']", "div#j_id_4p"),
+        ("//*[@id = 'tabela']", "#tabela"),
+        ("//input[@id='form:valor']", 'input[id="form:valor"]'),
+        ("//input[@name='cpf']", 'input[name="cpf"]'),
+        ("//a[contains(text(), 'Salvar')]", None),
+        ("//table//tr[2]", None),
+        ("//div[contains(@title, 'x')]", None),
+    ],
+)
+def test_to_css(xpath: str, css: str | None) -> None:
+    assert to_css(xpath) == css
+
+
+@pytest.mark.parametrize(
+    ("selector", "expected"),
+    [
+        ("//div[contains(@id, 'a')]", True),
+        ('input[value="[x"]', True),
+        ("//div[@id='a']]", False),
+        ("//div[contains(@id, 'a']", False),
+        ("//div[@id='a]", False),
+        ("(//tr)[1", False),
+    ],
+)
+def test_balanced(selector: str, expected: bool) -> None:
+    assert balanced(selector) is expected
+
+
+def test_locator_of() -> None:
+    assert locator_of('input[id="x"]', rewrite=True) == (By.CSS_SELECTOR, 'input[id="x"]')
+    assert locator_of("//div[@id='a']", rewrite=True) == (By.CSS_SELECTOR, "div#a")
+    assert locator_of("//div[@id='a']", rewrite=False) == (By.XPATH, "//div[@id='a']")
+    assert locator_of(".//div[@id='a']", rewrite=True) == (By.XPATH, ".//div[@id='a']")
+    assert locator_of("(//tr)[1]", rewrite=True) == (By.XPATH, "(//tr)[1]")
+
+
+class SAMPLE_BASE(Configuracao):  # noqa: N801
+    """Selectors shared by the sample states."""
+
+    url_login = "https://sistema.example/login"
+    campo_usuario = "//input[@id='usuario']"
+
+
+class SAMPLE_AM(SAMPLE_BASE):  # noqa: N801
+    """Selectors of the sample state."""
+
+    campo_senha = 'input[type="password"]'
+    quebrado = "//div[@id='a'"
+    tentativas = 3
+
+
+def test_build_freezes_the_selectors(caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("ELEMENTS_XPATH_REWRITE", raising=False)
+    with caplog.at_level(logging.WARNING):
+        elements = ElementRegistry.build(SAMPLE_AM)
+
+    assert elements.campo_usuario == "//input[@id='usuario']"
+    assert elements.url_login == "https://sistema.example/login"
+    assert elements.locator("campo_usuario") == (By.CSS_SELECTOR, "input#usuario")
+    assert elements.locator("campo_senha") == (By.CSS_SELECTOR, 'input[type="password"]')
+    assert "Seletor malformado SAMPLE_AM.quebrado" in caplog.text
+
+    for name in ("quebrado", "url_login", "tentativas", "inexistente"):
+        with pytest.raises(AttributeError):
+            elements.locator(name)
+
+    with pytest.raises(AttributeError, match="somente leitura"):
+        elements.campo_usuario = "//input"
+
+
+def test_build_keeps_xpaths_when_rewrite_is_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ELEMENTS_XPATH_REWRITE", "0")
+
+    assert ElementRegistry.build(SAMPLE_AM).locator("campo_usuario") == (By.XPATH, "//input[@id='usuario']")
+
+
+def test_every_system_loads_once_with_well_formed_selectors(
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(ElementRegistry, "owner_pid_", None)
+    monkeypatch.setattr(ElementRegistry, "sets_", {})
+    with caplog.at_level(logging.WARNING):
+        ElementRegistry.load()
+
+    assert "Seletor malformado" not in caplog.text
+    assert {system for system, _ in ElementRegistry.sets_} == {"caixa", "elaw", "esaj", "pje", "projudi"}
+
+    elements = ElementRegistry.get("ELAW", "AME")
+    assert ElementRegistry.get("elaw", "ame") is elements
+
+    with pytest.raises(AttributeError):
+        ElementRegistry.get("elaw", "estado inexistente")
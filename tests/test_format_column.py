@@ -0,0 +1,73 @@
+"""Tests for the formatting of the input spreadsheet columns."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crawjud.bot.shared import PropertiesCrawJUD
+from crawjud.bot.Utils import OtherUtils
+
+format_column = OtherUtils().format_column
+
+
+def test_date_columns_become_strings() -> None:
+    column = pd.Series(pd.to_datetime(["2024-03-04", None, "2024-12-31"]))
+
+    assert format_column(column).tolist() == ["04/03/2024", "", "31/12/2024"]
+
+
+def test_float_columns_use_a_decimal_comma() -> None:
+    assert format_column(pd.Series([1.5, 1234.0, 0.1])).tolist() == ["1,50", "1234,00", "0,10"]
+
+
+def test_float_columns_with_blanks_keep_their_numbers() -> None:
+    assert format_column(pd.Series([1.5, np.nan])).tolist() == [1.5, ""]
+
+
+def test_integer_columns_are_left_alone() -> None:
+    column = pd.Series([1, 2, 3])
+
+    assert format_column(column) is column
+
+
+def test_text_columns_only_blank_the_missing_cells() -> None:
+    assert format_column(pd.Series(["Réu", np.nan, "Autor"], dtype=object)).tolist() == ["Réu", "", "Autor"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [datetime(2024, 3, 4), 7, None],
+        [datetime(2024, 3, 4), "texto", None],
+        [pd.Timestamp("2024-03-04"), 7.5, None],
+    ],
+)
+def test_mixed_object_columns_still_format_their_dates(values: list) -> None:
+    formatted = format_column(pd.Series(values, dtype=object)).tolist()
+
+    assert formatted == ["04/03/2024", values[1], ""]
+
+
+def test_data_frame_reads_the_input_spreadsheet(
+    bot_state: type[PropertiesCrawJUD],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pd.DataFrame({
+        "numero_processo": ["0000001-11.2024.8.04.0001", "0000002-22.2024.8.04.0001"],
+        "data_limite": pd.to_datetime(["2024-03-04", None]),
+        "valor": [1500.0, 20.5],
+        "vara": [1, 2],
+    }).to_excel(tmp_path / "entrada.xlsx", index=False)
+    monkeypatch.setattr(PropertiesCrawJUD, "out_dir", tmp_path)
+    bot_state.kwargs_["xlsx"] = "entrada.xlsx"
+
+    assert OtherUtils().dataFrame() == [
+        {"NUMERO_PROCESSO": "0000001-11.2024.8.04.0001", "DATA_LIMITE": "04/03/2024", "VALOR": "1500,00", "VARA": 1},
+        {"NUMERO_PROCESSO": "0000002-22.2024.8.04.0001", "DATA_LIMITE": "", "VALOR": "20,50", "VARA": 2},
+    ]
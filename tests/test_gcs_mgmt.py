@@ -0,0 +1,68 @@
+"""Tests for the PID index of the output archives, against a local GCS emulator."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Generator
+
+import fakeredis
+import pytest
+
+from crawjud.utils import gcs_mgmt
+from crawjud.utils.gcs_mgmt import OUTPUT_INDEX, get_file, storage_client
+from crawjud.utils.status.upload_zip import enviar_arquivo_para_gcs
+from tests.gcs_emulator import GCSEmulator
+
+BUCKET = "crawjud-outputs"
+
+
+@pytest.fixture
+def gcs(fake_redis: fakeredis.FakeRedis, monkeypatch: pytest.MonkeyPatch) -> Generator[GCSEmulator, None, None]:
+    """Point the storage client at a local GCS emulator."""
+    with GCSEmulator() as emulator:
+        monkeypatch.setenv("STORAGE_EMULATOR_HOST", emulator.base_url)
+        monkeypatch.setitem(gcs_mgmt.environ, "BUCKET_NAME", BUCKET)
+        storage_client.cache_clear()
+        yield emulator
+
+    storage_client.cache_clear()
+
+
+def test_upload_indexes_the_archive_by_pid(gcs: GCSEmulator, fake_redis: fakeredis.FakeRedis, tmp_path: Path) -> None:
+    archive = tmp_path / "PID ABC123 - Execução.zip"
+    archive.write_bytes(b"zip")
+
+    enviar_arquivo_para_gcs(archive.name, archive)
+
+    assert gcs.objects[BUCKET] == {archive.name: b"zip"}
+    assert fake_redis.hget(OUTPUT_INDEX, "ABC123") == archive.name
+    assert get_file("ABC123") == archive.name
+    assert gcs.listings() == 0
+
+
+@pytest.mark.parametrize("name", ["PID ABC123 - Execução.zip", "Resultados ABC123.zip"])
+def test_unindexed_archives_are_listed_once_and_indexed(
+    gcs: GCSEmulator,
+    fake_redis: fakeredis.FakeRedis,
+    name: str,
+) -> None:
+    gcs.objects[BUCKET] = {name: b"zip", "PID XYZ789 - Execução.zip": b"zip"}
+
+    assert get_file("ABC123") == name
+    assert fake_redis.hget(OUTPUT_INDEX, "ABC123") == name
+
+    listings = gcs.listings()
+    assert listings >= 1
+    assert get_file("ABC123") == name
+    assert gcs.listings() == listings
+
+
+def test_missing_archive_is_not_indexed(gcs: GCSEmulator, fake_redis: fakeredis.FakeRedis) -> None:
+    gcs.objects[BUCKET] = {"PID XYZ789 - Execução.zip": b"zip"}
+
+    assert get_file("ABC123") == ""
+    assert fake_redis.hgetall(OUTPUT_INDEX) == {}
+
+
+def test_storage_client_is_built_once(gcs: GCSEmulator) -> None:
+    assert storage_client() is storage_client()
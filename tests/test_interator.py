@@ -0,0 +1,62 @@
+"""Tests for the input modes of ``Interact.send_key``, against the WebDriver stub."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver import Keys
+from selenium.webdriver.common.by import By
+
+from crawjud.bot.shared import PropertiesCrawJUD
+from crawjud.bot.Utils import interator
+from crawjud.bot.Utils.interator import SELENIUM_KEYS, Interact
+from tests.webdriver_stub import WebDriverStub
+
+FORM = Path(__file__).parent.joinpath("fixtures", "forms", "cadastro.html")
+OBSERVACAO = "Cliente informou novo endereço para intimações; aguardar retorno do escritório parceiro. " * 4
+
+
+@pytest.fixture
+def stub(monkeypatch: pytest.MonkeyPatch) -> Generator[WebDriverStub, None, None]:
+    """Open the saved form in the WebDriver stub, as the driver of the bot."""
+    stub = WebDriverStub(FORM.read_text(encoding="utf-8"))
+    driver = webdriver.Remote(command_executor=stub.url, options=webdriver.ChromeOptions())
+    monkeypatch.setattr(PropertiesCrawJUD, "driver_", driver)
+    monkeypatch.setattr(interator, "sleep", lambda seconds: None)
+    yield stub
+    driver.quit()
+    stub.close()
+
+
+def type_into(stub: WebDriverStub, field: str, word: str, mode: str) -> int:
+    """Type into a field of the form and return the WebDriver commands it took."""
+    element = PropertiesCrawJUD.driver_.find_element(By.CSS_SELECTOR, f'[id="{field}"]')
+    stub.commands = 0
+    Interact().send_key(element, word, mode)
+    return stub.commands
+
+
+@pytest.mark.parametrize(("mode", "commands"), [("fast", 2), ("js", 1), ("slow", 1 + len(OBSERVACAO))])
+def test_modes_type_the_same_value(stub: WebDriverStub, mode: str, commands: int) -> None:
+    assert type_into(stub, "observacao", OBSERVACAO, mode) == commands
+    assert stub.document.find('[id="observacao"]').get_attribute("value") == OBSERVACAO
+
+
+def test_special_keys_are_sent_without_clicking(stub: WebDriverStub) -> None:
+    assert type_into(stub, "parte", Keys.ENTER, "slow") == 1
+    assert stub.document.find('[id="parte"]').get_attribute("value") == Keys.ENTER
+
+
+def test_values_are_typed_as_text(stub: WebDriverStub) -> None:
+    type_into(stub, "numero", 12345, "fast")
+
+    assert stub.document.find('[id="numero"]').get_attribute("value") == "12345"
+
+
+def test_selenium_keys_holds_the_key_codes() -> None:
+    assert {Keys.ENTER, Keys.TAB, Keys.ESCAPE} <= SELENIUM_KEYS
+    assert "a" not in SELENIUM_KEYS
+    assert "ENTER" not in SELENIUM_KEYS
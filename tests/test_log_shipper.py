@@ -0,0 +1,76 @@
+"""Tests for the batched log shipping of the bots and its local LogFile."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from crawjud.bot.Utils.PrintLogs import emit_
+from crawjud.bot.Utils.PrintLogs.emit_ import LogShipper
+
+
+class Sender:
+    """Stand-in for SendMessage, recording the batches the socket server received."""
+
+    def __init__(self, output_dir_path: Path) -> None:
+        """Start with the server down."""
+        self.output_dir_path = output_dir_path
+        self.online = False
+        self.received: list[str] = []
+
+    def socket_message(self, data: dict, event: str = "log_message") -> bool:
+        """Receive a batch if the server is up."""
+        if self.online:
+            self.received.extend(message["message"] for message in data["messages"])
+
+        return self.online
+
+
+def message(number: int) -> dict:
+    """Build the payload of a log message."""
+    return {"message": f"Mensagem {number}", "pid": "TEST01"}
+
+
+def log_file(tmp_path: Path) -> list[str]:
+    """Read the lines of the execution LogFile."""
+    return tmp_path.joinpath("LogFile - PID TEST01.txt").read_text().splitlines()
+
+
+def test_log_file_is_written_while_the_server_is_down(tmp_path: Path) -> None:
+    sender = Sender(tmp_path)
+    shipper = LogShipper(sender)
+    for number in range(3):
+        shipper.put(message(number))
+
+    shipper.flush()
+    shipper.flush()
+    assert log_file(tmp_path) == ["Mensagem 0", "Mensagem 1", "Mensagem 2"]
+    assert len(shipper.queue) == 3
+
+    sender.online = True
+    shipper.put(message(3))
+    shipper.flush()
+
+    assert sender.received == ["Mensagem 0", "Mensagem 1", "Mensagem 2", "Mensagem 3"]
+    assert log_file(tmp_path) == sender.received
+    assert shipper.stats["sent"] == 4
+
+
+def test_messages_dropped_from_the_queue_still_reach_the_log_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(emit_, "MAX_QUEUE", 5)
+    sender = Sender(tmp_path)
+    shipper = LogShipper(sender)
+    for number in range(8):
+        shipper.put(message(number))
+
+    shipper.flush()
+    sender.online = True
+    shipper.flush()
+
+    assert log_file(tmp_path) == [f"Mensagem {number}" for number in range(8)]
+    assert sender.received == [f"Mensagem {number}" for number in range(3, 8)]
+    assert shipper.stats["dropped"] == 3
@@ -0,0 +1,101 @@
+"""Tests for the cache of eLaw party and lawyer lookups."""
+
+from __future__ import annotations
+
+import fakeredis
+import pytest
+
+from crawjud.bot.shared import PropertiesCrawJUD
+from crawjud.bot.Utils import lookup_cache
+from crawjud.bot.Utils.lookup_cache import LOOKUP_MISSING_TTL, LOOKUP_TTL, EntityCache, normalize_key
+
+
+@pytest.fixture
+def cache(
+    fake_redis: fakeredis.FakeRedis,
+    bot_state: type[PropertiesCrawJUD],
+    monkeypatch: pytest.MonkeyPatch,
+) -> EntityCache:
+    """Return an EntityCache of a fresh execution for the eLaw of a client."""
+    monkeypatch.setattr(PropertiesCrawJUD, "systembot_", "elaw")
+    monkeypatch.setattr(PropertiesCrawJUD, "state_or_client_", "Banco Exemplo S/A")
+    monkeypatch.setattr(EntityCache, "owner_pid_", None)
+    return EntityCache()
+
+
+@pytest.mark.parametrize(
+    ("kind", "value", "expected"),
+    [
+        ("doc", "123.456.789-09", "12345678909"),
+        ("cnpj", "12.345.678/0001-90", "12345678000190"),
+        ("oab", "am 1.234-a", "AM1234A"),
+        ("advogado", "  José  da Silva-Júnior ", "josedasilvajunior"),
+        ("advogado", None, ""),
+    ],
+)
+def test_normalize_key(kind: str, value: str, expected: str) -> None:
+    assert normalize_key(kind, value) == expected
+
+
+def test_masked_and_unmasked_documents_share_an_entry(cache: EntityCache, fake_redis: fakeredis.FakeRedis) -> None:
+    assert cache.lookup("doc", "123.456.789-09") is None
+
+    cache.remember("doc", "12345678909", True)
+
+    assert cache.lookup("doc", "123.456.789-09") is True
+    key = "crawjud:lookup:elaw:bancoexemplosa:doc:12345678909"
+    assert fake_redis.get(key) == "1"
+    assert LOOKUP_MISSING_TTL < fake_redis.ttl(key) <= LOOKUP_TTL
+
+
+def test_missing_entities_expire_sooner(cache: EntityCache, fake_redis: fakeredis.FakeRedis) -> None:
+    cache.remember("advogado_interno", "José da Silva", False)
+
+    assert cache.lookup("advogado_interno", "JOSE DA SILVA") is False
+    assert 0 < fake_redis.ttl("crawjud:lookup:elaw:bancoexemplosa:advogado_interno:josedasilva") <= LOOKUP_MISSING_TTL
+
+
+def test_entries_are_scoped_by_client(cache: EntityCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache.remember("advogado", "José da Silva", True)
+
+    monkeypatch.setattr(PropertiesCrawJUD, "state_or_client_", "Outro Cliente")
+
+    assert cache.lookup("advogado", "José da Silva") is None
+
+
+def test_forget_drops_a_stale_entry(cache: EntityCache) -> None:
+    cache.remember("advogado", "José da Silva", True)
+
+    cache.forget("advogado", "José da Silva")
+
+    assert cache.lookup("advogado", "José da Silva") is None
+
+
+def test_empty_values_are_not_cached(cache: EntityCache, fake_redis: fakeredis.FakeRedis) -> None:
+    cache.remember("doc", "", True)
+
+    assert cache.lookup("doc", "") is None
+    assert fake_redis.keys("*") == []
+
+
+def test_unreachable_redis_disables_the_cache(cache: EntityCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    server = fakeredis.FakeServer()
+    server.connected = False
+    monkeypatch.setattr(lookup_cache, "redis_client", lambda **kwargs: fakeredis.FakeRedis(server=server, **kwargs))
+
+    assert cache.lookup("doc", "12345678909") is None
+    assert EntityCache.disabled_ is True
+
+    server.connected = True
+    cache.remember("doc", "12345678909", True)
+    assert cache.lookup("doc", "12345678909") is None
+
+
+def test_report_counts_hits_and_misses(cache: EntityCache) -> None:
+    assert cache.report() is None
+
+    cache.lookup("doc", "12345678909")
+    cache.remember("doc", "12345678909", True)
+    cache.lookup("doc", "12345678909")
+
+    assert cache.report() == "Cache de partes e advogados: 1 consultas reaproveitadas, 1 buscas no sistema"
@@ -0,0 +1,91 @@
+"""Tests for the keyword, date and INTIMADO filter of the movement bots."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from crawjud.bot.Utils.move_matcher import MoveMatcher, parse_date
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("18/03/2024", datetime(2024, 3, 18)),
+        ("04/03/2024", datetime(2024, 3, 4)),
+        ("12/31/2024", datetime(2024, 12, 31)),
+        ("2024/03/18", datetime(2024, 3, 18)),
+        ("2024/18/03", datetime(2024, 3, 18)),
+        (" 18/03/2024 ", datetime(2024, 3, 18)),
+        (datetime(2024, 3, 18), datetime(2024, 3, 18)),
+        ("31/02/2024", None),
+        ("18-03-2024", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_date(value: str | datetime | None, expected: datetime | None) -> None:
+    assert parse_date(value) == expected
+
+
+def test_keywords_match_anywhere_in_the_movement() -> None:
+    matcher = MoveMatcher.from_row({"PALAVRA_CHAVE": "Sentença,Juntada"})
+
+    assert matcher.match("JUNTADA DE PETIÇÃO\nPetição (Referente à sentença)", "18/03/2024") == [
+        "Sentença",
+        "Juntada",
+    ]
+    assert matcher.match("DISTRIBUÍDO POR SORTEIO", "18/03/2024") == []
+
+
+def test_keywords_are_stripped_and_deduplicated() -> None:
+    matcher = MoveMatcher.from_row({"PALAVRAS_CHAVE": " Juntada , Sentença,Juntada,, "})
+
+    assert matcher.keywords == ["Juntada", "Sentença"]
+    assert matcher.match("JUNTADA DE PETIÇÃO", "") == ["Juntada"]
+
+
+def test_wildcard_matches_alongside_the_other_keywords() -> None:
+    matcher = MoveMatcher.from_row({"PALAVRA_CHAVE": "*, Juntada"})
+
+    assert matcher.match("DISTRIBUÍDO POR SORTEIO", "01/03/2024") == ["*"]
+    assert matcher.match("JUNTADA DE PETIÇÃO", "15/03/2024") == ["*", "Juntada"]
+
+
+def test_missing_keyword_matches_everything() -> None:
+    matcher = MoveMatcher.from_row({})
+
+    assert matcher.keywords == ["*"]
+    assert matcher.match("QUALQUER MOVIMENTO", "") == ["*"]
+
+
+def test_first_line_similar_to_a_keyword_matches() -> None:
+    matcher = MoveMatcher(["Juntada de petições"])
+
+    assert matcher.match("JUNTADA DE PETIÇÃO\nPetição (Referente ao evento 2)", "") == ["Juntada de petições"]
+    assert matcher.match("Petição (Referente ao evento 2)\nJUNTADA DE PETIÇÃO", "") == []
+
+
+@pytest.mark.parametrize(
+    ("data_mov", "matches"),
+    [("29/02/2024", False), ("01/03/2024", True), ("31/03/2024", True), ("01/04/2024", False), ("sem data", False)],
+)
+def test_date_bounds_are_inclusive(data_mov: str, matches: bool) -> None:
+    matcher = MoveMatcher.from_row({"PALAVRA_CHAVE": "*", "DATA_INICIO": "01/03/2024", "DATA_FIM": "31/03/2024"})
+
+    assert bool(matcher.match("JUNTADA DE PETIÇÃO", data_mov)) is matches
+
+
+def test_one_sided_date_bound() -> None:
+    matcher = MoveMatcher(["*"], data_inicio=datetime(2024, 3, 1))
+
+    assert matcher.match("JUNTADA", "15/03/2030") == ["*"]
+    assert matcher.match("JUNTADA", "15/02/2024") == []
+
+
+def test_intimado_must_appear_in_the_movement() -> None:
+    matcher = MoveMatcher.from_row({"PALAVRA_CHAVE": "Intimação", "INTIMADO": "FULANO DE TAL"})
+
+    assert matcher.match("EXPEDIÇÃO DE INTIMAÇÃO\nPara Fulano de Tal", "") == ["Intimação"]
+    assert matcher.match("EXPEDIÇÃO DE INTIMAÇÃO\nPara Beltrano", "") == []
@@ -0,0 +1,190 @@
+"""Tests for the parallel mode, which shards the spreadsheet rows across worker processes."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from crawjud.bot import core
+from crawjud.bot.core import CrawJUD, spawn_worker
+from crawjud.bot.shared import PropertiesCrawJUD
+
+
+class Process:
+    """Stand-in for a spawned process, running its target in this process on ``join``."""
+
+    def __init__(self, target: Callable[..., None], args: tuple) -> None:
+        """Keep the target the worker would run."""
+        self.target = target
+        self.args = args
+        self.name = f"SpawnProcess-{args[3]}"
+        self.daemon = True
+        self.started = False
+        self.exitcode: int | None = None
+
+    def start(self) -> None:
+        """Mark the process as started."""
+        self.started = True
+
+    def join(self) -> None:
+        """Run the worker, exiting with code 1 on an uncaught error like a real process."""
+        try:
+            self.target(*self.args)
+            self.exitcode = 0
+        except Exception:
+            self.exitcode = 1
+
+
+class Context:
+    """Stand-in for the billiard context, recording the processes it creates."""
+
+    def __init__(self, method: str) -> None:
+        """Record the start method asked for."""
+        self.method = method
+        self.processes: list[Process] = []
+
+    def Process(self, target: Callable[..., None], args: tuple) -> Process:  # noqa: N802
+        """Create a process of this context."""
+        self.processes.append(Process(target, args))
+        return self.processes[-1]
+
+
+class Bot(CrawJUD):
+    """Bot whose execution records the rows it ran instead of driving a browser."""
+
+    processed: list[tuple[int, int, str]] = []
+    logs: list[tuple[str, str]] = []
+
+    def __init__(self, **kwargs: str | int) -> None:
+        """Keep the launch arguments, as ``setup`` does."""
+        self.launch_kwargs = kwargs
+        self.kwargs = kwargs
+        self.recycles = 0
+
+    def execution(self) -> None:
+        """Run the rows of this process, failing on the row marked to fail.
+
+        Raises:
+            RuntimeError: On the row whose number is ``fail``.
+
+        """
+        frame = [{"NUMERO_PROCESSO": f"{number:04d}"} for number in range(self.kwargs["rows"])]
+        for pos, row in self.shard_rows(frame):
+            if pos == self.kwargs.get("fail"):
+                raise RuntimeError(row["NUMERO_PROCESSO"])
+
+            Bot.processed.append((self.worker_id, pos, row["NUMERO_PROCESSO"]))
+
+    def recycle_driver(self) -> None:
+        """Count the memory checks between rows."""
+        self.recycles += 1
+
+    def prt(self, status: str = "Em Execução") -> None:
+        """Record the message instead of sending it."""
+        Bot.logs.append((self.message, self.type_log))
+
+
+@pytest.fixture
+def contexts(bot_state: type[PropertiesCrawJUD], monkeypatch: pytest.MonkeyPatch) -> list[Context]:
+    """Run the bot as the main process, with the worker processes faked.
+
+    Returns:
+        list[Context]: The contexts asked for by ``shard_rows``.
+
+    """
+    contexts: list[Context] = []
+
+    def get_context(method: str) -> Context:
+        contexts.append(Context(method))
+        return contexts[-1]
+
+    monkeypatch.setattr(core, "get_context", get_context)
+    monkeypatch.setattr(bot_state, "assigned_rows_", None)
+    monkeypatch.setattr(bot_state, "worker_processes_", [])
+    monkeypatch.setattr(bot_state, "message_", "")
+    monkeypatch.setattr(bot_state, "type_log_", "log")
+    monkeypatch.setattr(Bot, "processed", [])
+    monkeypatch.setattr(Bot, "logs", [])
+    return contexts
+
+
+def run(rows: int, workers: object, **kwargs: int) -> Bot:
+    """Run the main process of a parallel execution, then wait for its workers."""
+    bot = Bot(rows=rows, workers=workers, **kwargs)
+    bot.execution()
+    bot.join_workers()
+    return bot
+
+
+@pytest.mark.parametrize(
+    ("rows", "workers", "shards"),
+    [
+        pytest.param(6, 3, [[0, 3], [1, 4], [2, 5]], id="even split"),
+        pytest.param(7, 3, [[0, 3, 6], [1, 4], [2, 5]], id="remainder"),
+        pytest.param(2, 4, [[0], [1]], id="fewer rows than workers"),
+    ],
+)
+def test_rows_are_sharded_across_the_workers(
+    contexts: list[Context],
+    rows: int,
+    workers: int,
+    shards: list[list[int]],
+) -> None:
+    bot = Bot(rows=rows, workers=workers)
+    frame = [{"NUMERO_PROCESSO": f"{number:04d}"} for number in range(rows)]
+    main_rows = list(bot.shard_rows(frame))
+
+    (context,) = contexts
+    assert context.method == "spawn"
+    assert [pos for pos, _ in main_rows] == shards[0]
+    assert bot.recycles == len(shards[0]) - 1
+
+    assert PropertiesCrawJUD.worker_processes_ == context.processes
+    assert len(context.processes) == len(shards) - 1
+    for worker_id, process in enumerate(context.processes, start=1):
+        module, name, kwargs, process_worker_id, worker_rows = process.args
+        assert process.target is spawn_worker
+        assert (module, name) == (__name__, "Bot")
+        assert kwargs == {"rows": rows, "workers": workers}
+        assert process_worker_id == worker_id
+        assert worker_rows == [(pos, frame[pos]) for pos in shards[worker_id]]
+        assert process.started
+        assert not process.daemon
+
+    assert Bot.logs == [(f"Execução paralela iniciada com {len(shards)} navegadores", "log")]
+
+
+@pytest.mark.parametrize("workers", [1, None, "abc"])
+def test_single_worker_runs_every_row_in_the_main_process(contexts: list[Context], workers: object) -> None:
+    run(rows=3, workers=workers)
+
+    assert contexts == []
+    assert Bot.processed == [(0, 0, "0000"), (0, 1, "0001"), (0, 2, "0002")]
+
+
+def test_spawned_worker_runs_only_its_assigned_rows(contexts: list[Context]) -> None:
+    rows = [(1, {"NUMERO_PROCESSO": "0001"}), (4, {"NUMERO_PROCESSO": "0004"})]
+    spawn_worker(__name__, "Bot", {"rows": 6, "workers": 3}, 2, rows)
+
+    assert PropertiesCrawJUD.worker_id_ == 2
+    assert Bot.processed == [(2, 1, "0001"), (2, 4, "0004")]
+    assert contexts == []
+
+
+def test_join_waits_for_every_worker(contexts: list[Context]) -> None:
+    run(rows=7, workers=3)
+
+    assert PropertiesCrawJUD.worker_processes_ == []
+    assert [process.exitcode for process in contexts[0].processes] == [0, 0]
+    assert sorted(pos for _, pos, _ in Bot.processed) == list(range(7))
+    assert [log for log in Bot.logs if log[1] == "error"] == []
+
+
+def test_failed_worker_is_reported_as_an_error(contexts: list[Context]) -> None:
+    # Row 4 belongs to the first worker
+    run(rows=6, workers=3, fail=4)
+
+    assert [process.exitcode for process in contexts[0].processes] == [1, 0]
+    assert sorted(pos for _, pos, _ in Bot.processed) == [0, 1, 2, 3, 5]
+    assert Bot.logs[-1] == ("Worker SpawnProcess-1 encerrado com código 1", "error")
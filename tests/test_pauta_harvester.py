@@ -0,0 +1,150 @@
+"""Tests for the PJe pauta harvester, driven against the replay server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from threading import Thread, current_thread, main_thread
+
+import httpx
+import pytest
+
+from crawjud.bot.scripts.pje.common.pauta_harvester import HostLimiter, PautaHarvester, parse_page
+from tests.replay import ReplayServer
+
+FIXTURES = Path(__file__).parent.joinpath("fixtures", "pje_pautas")
+TEMPLATE = "{base}/{{vara}}-{{date}}-{{page}}.json"
+
+
+@pytest.fixture(autouse=True)
+def fast_harvester(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lift the rate limit and keep the retries short."""
+    monkeypatch.setenv("PJE_PAUTAS_RATE", "1000")
+    monkeypatch.setenv("PJE_PAUTAS_RETRIES", "2")
+    monkeypatch.delenv("PJE_PAUTAS_RECORD", raising=False)
+
+
+def harvest(template: str, jobs: list[tuple[str, str, str]], **kwargs: object) -> dict[tuple[str, str], object]:
+    """Run the harvester and collect the result of each (vara, date) pair."""
+    results: dict[tuple[str, str], object] = {}
+
+    def on_done(vara_name: str, vara: str, date: str, result: object) -> None:
+        results[(vara, date)] = result
+
+    PautaHarvester(template).run(jobs, on_done, **kwargs)
+    return results
+
+
+def test_parse_page_maps_recorded_items() -> None:
+    payload = json.loads(FIXTURES.joinpath("VTBV1-1-2024-03-04-1.json").read_text(encoding="utf-8"))
+
+    rows, pages = parse_page(payload, "1ª Vara do Trabalho de Boa Vista")
+
+    assert pages == 2
+    assert rows[0] == {
+        "INDICE": 1,
+        "NUMERO_PROCESSO": "0000123-45.2023.5.11.0051",
+        "HORARIO": "08:30",
+        "TIPO": "Inicial (rito sumaríssimo)",
+        "ATO": "ATSum",
+        "PARTES": "FULANO DE TAL X EMPRESA ALFA LTDA",
+        "SALA": "Sala 1 - Principal",
+        "SITUACAO": "Designada",
+        "VARA": "1ª Vara do Trabalho de Boa Vista",
+    }
+
+
+def test_parse_page_accepts_lists_and_empty_pages() -> None:
+    rows, pages = parse_page([{"numeroProcesso": "0001", "sala": {"nome": "Sala 3"}}], "Vara")
+    assert pages == 1
+    assert rows[0]["NUMERO_PROCESSO"] == "0001"
+    assert rows[0]["SALA"] == "Sala 3"
+    assert rows[0]["TIPO"] == ""
+
+    assert parse_page({"qtdPaginas": 0, "resultado": []}, "Vara") == ([], 1)
+
+
+def test_host_limiter_spaces_requests_per_host() -> None:
+    async def run() -> list[float]:
+        limiter = HostLimiter(rate=20)
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.wait("http://a.example/x")
+
+        await limiter.wait("http://b.example/x")
+        return [time.monotonic() - start]
+
+    (elapsed,) = asyncio.run(run())
+
+    # Three requests to one host take two intervals; another host does not wait
+    assert 0.09 <= elapsed < 0.5
+
+
+def test_run_replays_every_page() -> None:
+    jobs = [
+        ("1ª Vara do Trabalho de Boa Vista", "#VTBV1-1", "2024-03-04"),
+        ("1ª Vara do Trabalho de Boa Vista", "#VTBV1-1", "2024-03-05"),
+        ("2ª Vara do Trabalho de Boa Vista", "#VTBV2-1", "2024-03-04"),
+    ]
+    with ReplayServer(FIXTURES, fail_first={"/VTBV1-1-2024-03-05-1.json"}) as replay:
+        results = harvest(TEMPLATE.format(base=replay.base_url), jobs)
+
+    first_day = results[("#VTBV1-1", "2024-03-04")]
+    assert [row["INDICE"] for row in first_day] == [1, 2, 3]
+    assert first_day[2]["SITUACAO"] == "Cancelada"
+
+    # The 503 is retried
+    assert [row["NUMERO_PROCESSO"] for row in results[("#VTBV1-1", "2024-03-05")]] == ["0000999-99.2024.5.11.0051"]
+    assert replay.requests.count("/VTBV1-1-2024-03-05-1.json") == 2
+
+    assert results[("#VTBV2-1", "2024-03-04")] == []
+
+
+def test_run_reports_missing_pages_as_errors() -> None:
+    with ReplayServer(FIXTURES) as replay:
+        results = harvest(TEMPLATE.format(base=replay.base_url), [("Vara", "#VTBV9-1", "2024-03-04")])
+
+    assert isinstance(results[("#VTBV9-1", "2024-03-04")], httpx.HTTPStatusError)
+
+
+def test_stop_raised_mid_run_skips_the_remaining_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PJE_PAUTAS_CONCURRENCY", "1")
+    jobs = [
+        ("1ª Vara do Trabalho de Boa Vista", "#VTBV1-1", "2024-03-04"),
+        ("1ª Vara do Trabalho de Boa Vista", "#VTBV1-1", "2024-03-05"),
+        ("2ª Vara do Trabalho de Boa Vista", "#VTBV2-1", "2024-03-04"),
+    ]
+    with ReplayServer(FIXTURES) as replay:
+        # Raised once the first page was requested, after every pair has started
+        results = harvest(TEMPLATE.format(base=replay.base_url), jobs, stop=lambda: bool(replay.requests))
+
+    assert replay.requests == ["/VTBV1-1-2024-03-04-1.json"]
+    assert results == {}
+
+
+def test_on_done_runs_outside_the_event_loop() -> None:
+    threads: list[Thread] = []
+    jobs = [("Vara", "#VTBV1-1", "2024-03-04"), ("Vara", "#VTBV2-1", "2024-03-04")]
+    with ReplayServer(FIXTURES) as replay:
+        PautaHarvester(TEMPLATE.format(base=replay.base_url)).run(jobs, lambda *args: threads.append(current_thread()))
+
+    assert len(threads) == 2
+    assert main_thread() not in threads
+
+
+def test_recorded_run_replays_the_same_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    jobs = [("1ª Vara do Trabalho de Boa Vista", "#VTBV1-1", "2024-03-04")]
+    monkeypatch.setenv("PJE_PAUTAS_RECORD", str(tmp_path))
+    with ReplayServer(FIXTURES) as replay:
+        recorded = harvest(TEMPLATE.format(base=replay.base_url), jobs)
+
+    recorded_files = sorted(file.name for file in tmp_path.iterdir())
+    assert recorded_files == ["VTBV1-1-2024-03-04-1.json", "VTBV1-1-2024-03-04-2.json"]
+
+    monkeypatch.delenv("PJE_PAUTAS_RECORD")
+    with ReplayServer(tmp_path) as replay:
+        replayed = harvest(TEMPLATE.format(base=replay.base_url), jobs)
+
+    assert replayed == recorded
@@ -0,0 +1,82 @@
+"""Tests for the per-PID progress store of the executions."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from crawjud.utils.status import server_side
+from crawjud.utils.status.server_side import (
+    PROGRESS_TTL,
+    format_message_log,
+    load_cache,
+    messages_key,
+    migrate_progress_store,
+    progress_key,
+)
+
+
+@pytest.fixture
+def app() -> SimpleNamespace:
+    """Return the parts of the Quart application the progress store uses."""
+    return SimpleNamespace(
+        extensions={"redis": fakeredis.FakeRedis(), "sqlalchemy": None},
+        testing=False,
+        logger=logging.getLogger(__name__),
+    )
+
+
+def log(app: SimpleNamespace, pos: int, message: str, type_: str = "success", total: int = 3) -> dict:
+    """Send one log line through ``format_message_log``."""
+    data = {"pid": "ABC123", "pos": pos, "message": message, "type": type_, "total": total}
+    return asyncio.run(format_message_log(data=data, pid="ABC123", app=app))
+
+
+def test_counters_live_in_one_hash(app: SimpleNamespace) -> None:
+    log(app, 0, "Iniciando execução")
+    log(app, 1, "Linha 1 processada")
+    log(app, 2, "Linha 2 com erro", type_="error")
+    data = log(app, 3, "Linha 3 processada")
+
+    assert (data["success"], data["errors"], data["remaining"]) == ("2", "1", "0")
+
+    redis_client = app.extensions["redis"]
+    assert sorted(redis_client.keys("*")) == [progress_key("ABC123").encode(), messages_key("ABC123").encode()]
+    assert 0 < redis_client.ttl(progress_key("ABC123")) <= PROGRESS_TTL
+
+
+def test_messages_are_capped(app: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(server_side, "MAX_MESSAGES", 2)
+
+    for pos in range(4):
+        log(app, pos, f"Linha {pos}")
+
+    messages = [json.loads(item) for item in app.extensions["redis"].lrange(messages_key("ABC123"), 0, -1)]
+    assert [item["pos"] for item in messages] == [2, 3]
+
+
+def test_legacy_hashes_are_migrated_on_first_access(app: SimpleNamespace) -> None:
+    redis_client = app.extensions["redis"]
+    for pos in (0, 1, 2):
+        redis_client.hset(f"process:ABC123:pos:{pos}", mapping={"pid": "ABC123", "pos": pos, "success": pos})
+
+    log_pid = asyncio.run(load_cache("ABC123", app))
+
+    assert log_pid == {"pid": "ABC123", "pos": "2", "success": "2"}
+    assert redis_client.keys("process:ABC123:pos:*") == []
+    assert redis_client.hget(progress_key("ABC123"), "success") == b"2"
+
+
+def test_migrate_progress_store_converts_every_pid(app: SimpleNamespace) -> None:
+    redis_client = app.extensions["redis"]
+    for pid in ("AAA111", "BBB222"):
+        redis_client.hset(f"process:{pid}:pos:1", mapping={"pid": pid, "pos": 1})
+
+    assert migrate_progress_store(app) == 2
+    assert redis_client.keys("process:*:pos:*") == []
+    assert redis_client.exists(progress_key("AAA111"), progress_key("BBB222")) == 2
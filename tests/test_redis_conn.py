@@ -0,0 +1,31 @@
+"""Tests for the Redis database shared by the bots and the web application."""
+
+from __future__ import annotations
+
+import pytest
+
+from crawjud.bot.common.redis_conn import redis_url
+
+
+@pytest.mark.parametrize(
+    ("env", "url"),
+    [
+        ({"REDIS_HOST": "redis", "REDIS_PORT": "6380", "REDIS_DB_LOGS": "3"}, "redis://redis:6380/3"),
+        ({"REDIS_HOST": "redis", "REDIS_URL": "redis://outro:6379", "REDIS_DB_LOGS": "3"}, "redis://redis:6379/3"),
+        ({"REDIS_URL": "rediss://:senha@nuvem:6380", "REDIS_DB_LOGS": "2"}, "rediss://:senha@nuvem:6380/2"),
+        ({"REDIS_URL": "redis://nuvem:6379/"}, "redis://nuvem:6379/0"),
+        ({}, "redis://localhost:6379/0"),
+    ],
+)
+def test_redis_url_points_at_the_database_of_the_web_application(
+    env: dict[str, str],
+    url: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for name in ("REDIS_HOST", "REDIS_PORT", "REDIS_URL", "REDIS_DB_LOGS"):
+        monkeypatch.delenv(name, raising=False)
+
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    assert redis_url() == url
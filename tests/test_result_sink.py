@@ -0,0 +1,79 @@
+"""Tests for the result journal and the spreadsheets built from it."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from crawjud.bot.shared import PropertiesCrawJUD
+from crawjud.bot.Utils.result_sink import ResultSink
+
+FIRST = "0000001-11.2024.8.04.0001"
+SECOND = "0000002-22.2024.8.04.0001"
+
+
+@pytest.fixture
+def sink(bot_state: type[PropertiesCrawJUD], monkeypatch: pytest.MonkeyPatch) -> ResultSink:
+    """Return a ResultSink with no journals left by other tests."""
+    monkeypatch.setattr(ResultSink, "journals_", {})
+    return ResultSink()
+
+
+def test_append_journals_rows_beside_the_spreadsheet(sink: ResultSink, tmp_path: Path) -> None:
+    output = tmp_path / "Sucessos - PID TEST01.xlsx"
+
+    sink.append(output, [{"NUMERO_PROCESSO": FIRST, "MENSAGEM": "ok"}])
+    sink.append(output, [{"NUMERO_PROCESSO": SECOND, "MENSAGEM": "ok"}])
+
+    journal = tmp_path / "Sucessos - PID TEST01.xlsx.jsonl"
+    assert not output.exists()
+    assert [row["NUMERO_PROCESSO"] for row in sink.read_journal(journal)] == [FIRST, SECOND]
+
+
+def test_read_journal_skips_a_truncated_last_line(sink: ResultSink, tmp_path: Path) -> None:
+    journal = tmp_path / "out.xlsx.jsonl"
+    journal.write_text(f'{{"NUMERO_PROCESSO": "{FIRST}"}}\n{{"NUMERO_PRO', encoding="utf-8")
+
+    assert sink.read_journal(journal) == [{"NUMERO_PROCESSO": FIRST}]
+
+
+def test_materialize_keeps_rows_already_in_the_spreadsheet(sink: ResultSink, tmp_path: Path) -> None:
+    output = tmp_path / "Sucessos - PID TEST01.xlsx"
+    pd.DataFrame([{"NUMERO_PROCESSO": FIRST, "MENSAGEM": "anterior"}]).to_excel(output, index=False)
+
+    sink.append(output, [{"NUMERO_PROCESSO": SECOND, "MENSAGEM": "novo"}])
+    sink.materialize(output)
+
+    records = pd.read_excel(output, dtype=str).to_dict(orient="records")
+    assert records == [
+        {"NUMERO_PROCESSO": FIRST, "MENSAGEM": "anterior"},
+        {"NUMERO_PROCESSO": SECOND, "MENSAGEM": "novo"},
+    ]
+    assert not list(tmp_path.glob("*.jsonl"))
+
+
+def test_materialize_merges_worker_journals(
+    sink: ResultSink,
+    bot_state: type[PropertiesCrawJUD],
+    tmp_path: Path,
+) -> None:
+    output = tmp_path / "Erros - PID TEST01.xlsx"
+    sink.append(output, [{"NUMERO_PROCESSO": FIRST}])
+    bot_state.worker_id_ = 2
+    sink.append(output, [{"NUMERO_PROCESSO": SECOND}])
+    bot_state.worker_id_ = 0
+
+    sink.materialize(output)
+
+    assert sorted(pd.read_excel(output, dtype=str)["NUMERO_PROCESSO"]) == [FIRST, SECOND]
+    assert not list(tmp_path.glob("*.jsonl"))
+
+
+def test_materialize_without_rows_leaves_no_file(sink: ResultSink, tmp_path: Path) -> None:
+    output = tmp_path / "Sucessos - PID TEST01.xlsx"
+
+    sink.materialize(output)
+
+    assert not output.exists()
@@ -0,0 +1,116 @@
+"""Tests for the incremental sync of the database scheduler."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import AsyncContextManager, AsyncGenerator, Callable
+
+import pytest
+from celery import Celery
+from celery.beat import ScheduleEntry
+from quart import Quart
+
+from crawjud.core import db
+from crawjud.models import CrontabModel, ScheduleModel
+from crawjud.utils import scheduler
+from crawjud.utils.scheduler import DatabaseScheduler
+
+Database = Callable[[], AsyncContextManager[None]]
+
+
+@pytest.fixture
+def database() -> Database:
+    """Give the test an in-memory database, opened as an async context manager."""
+    app = Quart(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+
+    @asynccontextmanager
+    async def context() -> AsyncGenerator[None, None]:
+        async with app.app_context():
+            db.create_all()
+            yield
+
+    return context
+
+
+def add_schedule(name: str, task: str = "crawjud.bot", hour: str = "12") -> ScheduleModel:
+    """Store a schedule running daily at ``hour``."""
+    crontab = CrontabModel(minute="0", hour=hour)
+    db.session.add(crontab)
+    db.session.flush()
+    schedule = ScheduleModel(name=name, task=task, schedule_id=crontab.id)
+    db.session.add(schedule)
+    db.session.commit()
+    return schedule
+
+
+@pytest.fixture
+def beat() -> DatabaseScheduler:
+    """Return a scheduler that has not synced yet."""
+    return DatabaseScheduler(app=Celery(set_as_current=False), lazy=True)
+
+
+@pytest.mark.asyncio
+async def test_sync_only_rebuilds_changed_entries(database: Database, beat: DatabaseScheduler) -> None:
+    async with database():
+        add_schedule("diario")
+        changed = add_schedule("semanal")
+        removed = add_schedule("mensal")
+        beat.sync()
+
+        unchanged = beat.schedule["diario"]
+        unchanged.total_run_count = 3
+
+        changed.schedule.hour = "18"
+        db.session.delete(removed)
+        db.session.commit()
+        add_schedule("novo")
+        beat.sync()
+
+    assert beat.schedule["diario"] is unchanged
+    assert beat.schedule["diario"].total_run_count == 3
+    assert beat.schedule["semanal"].schedule.hour == {18}
+    assert sorted(beat.schedule) == ["diario", "novo", "semanal"]
+
+
+@pytest.mark.asyncio
+async def test_sync_keeps_entries_not_loaded_from_the_database(database: Database, beat: DatabaseScheduler) -> None:
+    async with database():
+        add_schedule("diario")
+        cleanup = ScheduleEntry(name="celery.backend_cleanup", task="celery.backend_cleanup", app=beat.app)
+        beat.schedule[cleanup.name] = cleanup
+        beat.sync()
+
+    assert sorted(beat.schedule) == ["celery.backend_cleanup", "diario"]
+
+
+@pytest.mark.asyncio
+async def test_schedules_of_the_same_task_keep_their_own_entries(database: Database, beat: DatabaseScheduler) -> None:
+    async with database():
+        add_schedule("manha", hour="8")
+        add_schedule("tarde", hour="14")
+        beat.sync()
+
+    assert beat.schedule["manha"].schedule.hour == {8}
+    assert beat.schedule["tarde"].schedule.hour == {14}
+
+
+def test_schedule_property_syncs_at_most_every_interval(
+    beat: DatabaseScheduler,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[int] = []
+    now = [1000.0]
+    monkeypatch.setattr(DatabaseScheduler, "fetch_rows", staticmethod(lambda: calls.append(1) or {}))
+    monkeypatch.setattr(scheduler, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    assert beat.schedule == {}
+    now[0] += scheduler.SYNC_EVERY - 1
+    assert beat.schedule == {}
+    assert len(calls) == 1
+
+    now[0] += 1
+    assert beat.schedule == {}
+    assert len(calls) == 2
@@ -0,0 +1,137 @@
+"""Tests for the saved login sessions, restored into a browser served by the WebDriver stub."""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from typing import Generator
+
+import fakeredis
+import pytest
+from cryptography.fernet import Fernet
+from selenium import webdriver
+
+from crawjud.bot.shared import PropertiesCrawJUD
+from crawjud.bot.Utils import session_store
+from crawjud.bot.Utils.session_store import SessionStore, session_cipher
+from tests.webdriver_stub import WebDriverStub
+
+PAGE = '<html><body><span id="usuario-logado">ROBO</span></body></html>'
+URL = "https://projudi.example/projudi/painel"
+COOKIE = {"name": "JSESSIONID", "value": "abc123", "domain": "projudi.example", "path": "/", "secure": True}
+
+
+@pytest.fixture
+def stub(
+    fake_redis: fakeredis.FakeRedis,
+    bot_state: type[PropertiesCrawJUD],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[WebDriverStub, None, None]:
+    """Log a Projudi user into the WebDriver stub, with a session key configured."""
+    monkeypatch.setenv("SESSION_STORE_KEY", Fernet.generate_key().decode())
+    monkeypatch.setattr(session_store, "PROBE_TIMEOUT", 0.3)
+    monkeypatch.setattr(bot_state, "systembot_", "projudi")
+    monkeypatch.setattr(bot_state, "state_or_client_", "AM")
+    monkeypatch.setattr(bot_state, "ElementsBotConfig_", SimpleNamespace(chk_login='[id="usuario-logado"]'))
+    monkeypatch.setattr(SessionStore, "owner_pid_", None)
+    bot_state.kwargs_["username"] = "robo"
+    session_cipher.cache_clear()
+
+    stub = WebDriverStub(PAGE)
+    driver = webdriver.Remote(command_executor=stub.url, options=webdriver.ChromeOptions())
+    monkeypatch.setattr(bot_state, "driver_", driver)
+    stub.current_url = URL
+    stub.cookies.append(dict(COOKIE))
+    stub.local_storage["perfil"] = "advogado"
+    yield stub
+    driver.quit()
+    stub.close()
+    session_cipher.cache_clear()
+
+
+def new_browser(stub: WebDriverStub) -> None:
+    """Start the stub over as a browser that never logged in."""
+    stub.current_url = "about:blank"
+    stub.cookies.clear()
+    stub.local_storage.clear()
+
+
+def test_key_hides_the_username(stub: WebDriverStub, bot_state: type[PropertiesCrawJUD]) -> None:
+    key = SessionStore().key()
+    assert key.startswith("crawjud:session:projudi:am:")
+    assert "robo" not in key
+
+    bot_state.kwargs_["username"] = "outro"
+    assert SessionStore().key() != key
+
+
+def test_saved_session_is_encrypted_and_loads_back(stub: WebDriverStub, fake_redis: fakeredis.FakeRedis) -> None:
+    store = SessionStore()
+    store.save()
+
+    assert "abc123" not in fake_redis.get(store.key())
+    session = store.load()
+    assert session["url"] == URL
+    assert session["cookies"] == [COOKIE]
+    assert session["local_storage"] == '{"perfil": "advogado"}'
+
+
+def test_load_ignores_unreadable_tokens(
+    stub: WebDriverStub,
+    fake_redis: fakeredis.FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    store = SessionStore()
+    fake_redis.set(store.key(), "não é um token")
+    with caplog.at_level(logging.WARNING):
+        assert store.load() is None
+
+    assert "Sessão armazenada ilegível" in caplog.text
+
+    # A session saved under another key cannot be read either
+    store.save()
+    monkeypatch.setenv("SESSION_STORE_KEY", Fernet.generate_key().decode())
+    session_cipher.cache_clear()
+    assert store.load() is None
+
+
+def test_restore_logs_in_a_new_browser(stub: WebDriverStub) -> None:
+    store = SessionStore()
+    store.save()
+    new_browser(stub)
+
+    assert store.restore()
+    assert stub.current_url == URL
+    assert stub.cookies == [{"name": "JSESSIONID", "value": "abc123", "path": "/", "secure": True}]
+    assert stub.local_storage == {"perfil": "advogado"}
+    assert store.report() == "Sessões salvas: 1 logins evitados, 1 logins no sistema"
+
+
+def test_expired_session_is_discarded(
+    stub: WebDriverStub,
+    fake_redis: fakeredis.FakeRedis,
+    bot_state: type[PropertiesCrawJUD],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = SessionStore()
+    store.save()
+    new_browser(stub)
+
+    # The page opens without the logged-in marker
+    monkeypatch.setattr(bot_state, "ElementsBotConfig_", SimpleNamespace(chk_login='[id="painel-inexistente"]'))
+    assert not store.restore()
+    assert fake_redis.get(store.key()) is None
+    assert stub.cookies == []
+    assert store.report() == "Sessões salvas: 0 logins evitados, 1 logins no sistema (1 sessões expiradas)"
+    assert fake_redis.hgetall(session_store.SESSION_METRICS) == {"logins": "1", "expired": "1"}
+
+
+def test_store_is_off_without_a_key(stub: WebDriverStub, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("SESSION_STORE_KEY")
+    session_cipher.cache_clear()
+    store = SessionStore()
+
+    store.save()
+    assert store.load() is None
+    assert not store.restore()
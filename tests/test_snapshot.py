@@ -0,0 +1,67 @@
+"""Tests for the table snapshots read in a single WebDriver call."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from crawjud.bot.Utils.snapshot import TableSnapshot, parse_html
+
+MOVIMENTACOES = Path(__file__).parent.joinpath("fixtures", "projudi", "movimentacoes.html")
+
+
+def test_text_follows_the_rendered_text_rules() -> None:
+    cell = parse_html(
+        '<td>  Petição <br>de <i>juntada</i><span style="display: none">oculto</span>&nbsp;\n'
+        "<div>Anexos</div><script>var x;</script><input type=hidden value=1></td>"
+    ).find("td")
+
+    assert cell.text == "Petição\nde juntada\nAnexos"
+
+
+def test_cells_are_separated_in_the_row_text() -> None:
+    row = parse_html("<tr><td>1</td><td>Petição</td></tr>").find("tr")
+
+    assert row.text == "1 Petição"
+
+
+def test_selectors_match_tags_and_attributes() -> None:
+    root = parse_html('<div><a href="javascript://nop/" class="x">1</a><a href="/doc">2</a><a>3</a></div>')
+
+    assert [node.text for node in root.find_all("a[href]")] == ["1", "2"]
+    assert root.find('a[href="/doc"]').text == "2"
+    assert root.find('[class="x"]').get_attribute("href") == "javascript://nop/"
+
+    with pytest.raises(LookupError):
+        root.find("table")
+
+    with pytest.raises(ValueError, match="Seletor não suportado"):
+        root.find("div > a")
+
+
+def test_unclosed_cells_are_closed_with_their_row() -> None:
+    root = parse_html("<table><tr><td>a<td>b</tr><tr><td>c</td></tr></table>")
+
+    rows = root.find_all("tr")
+    assert len(rows) == 2
+    assert [cell.text for cell in rows[1].find_all("td")] == ["c"]
+
+
+def test_rows_of_a_saved_movement_table() -> None:
+    table = SimpleNamespace(get_attribute=lambda name: MOVIMENTACOES.read_text(encoding="utf-8"))
+
+    moves = [
+        row
+        for row in TableSnapshot().rows(table)
+        if row.has_class("odd", "even") and row.get_attribute("style") != "display:none"
+    ]
+
+    cells = [move.find_all("td") for move in moves]
+    assert [cell[1].text for cell in cells] == ["4", "3", "1"]
+    assert cells[0][2].text.split(" ")[0] == "18/03/2024"
+    assert cells[0][3].find("b").text == "EXPEDIÇÃO DE INTIMAÇÃO"
+    assert cells[0][3].text == "EXPEDIÇÃO DE INTIMAÇÃO\nPara advogados do polo passivo (INTIMADO)"
+    assert cells[1][4].text.split("\n") == ["FULANO DE TAL", "ADVOGADO"]
+    assert cells[0][0].find("a").get_attribute("class") == "linkArquivos4"
@@ -0,0 +1,233 @@
+"""Local stand-in for a WebDriver, answering commands from a parsed HTML page.
+
+It implements the W3C commands the bots use on tables and forms (finding
+elements, ``text``, ``get_attribute``, ``click``, ``clear``, ``send_keys``,
+the value-setting script of ``Interact.send_key``), window handles, navigation,
+cookies and the ``localStorage`` scripts of the SessionStore. The Selenium client
+talks to it over HTTP as it does to a driver, so the round-trips of a scraper
+can be counted and timed without a browser::
+
+    stub = WebDriverStub(html)
+    driver = webdriver.Remote(command_executor=stub.url, options=webdriver.ChromeOptions())
+"""
+
+from __future__ import annotations
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Lock, Thread
+
+from crawjud.bot.Utils.interator import SET_VALUE_SCRIPT
+from crawjud.bot.Utils.session_store import EXPORT_STORAGE_SCRIPT, IMPORT_STORAGE_SCRIPT
+from crawjud.bot.Utils.snapshot import HtmlNode, parse_html
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class CommandError(Exception):
+    """A command the stub answers with a W3C error.
+
+    Attributes:
+        status (int): The HTTP status.
+        error (str): The W3C error code.
+
+    """
+
+    def __init__(self, status: int, error: str, message: str) -> None:
+        """Keep the status and error code of the reply."""
+        super().__init__(message)
+        self.status = status
+        self.error = error
+
+
+class WebDriverStub:
+    """Serve a parsed page as a WebDriver session, in a background thread.
+
+    Attributes:
+        html (str): The page source.
+        document (HtmlNode): The parsed page.
+        commands (int): The commands answered since the last reset.
+        windows (list[str]): The open window handles, the first one being the main window.
+        quit (bool): Whether the session was deleted.
+        current_url (str): The last URL opened.
+        title (str): The page title reported to the driver.
+        cookies (list[dict]): The cookies of the session.
+        local_storage (dict[str, str]): The ``localStorage`` of the page.
+
+    """
+
+    def __init__(self, html: str) -> None:
+        """Parse the page and start serving it.
+
+        Args:
+            html (str): The page source.
+
+        """
+        self.html = html
+        self.document = parse_html(html)
+        self.elements: dict[str, HtmlNode] = {}
+        self.ids = count()
+        self.commands = 0
+        self.windows = ["main"]
+        self.window = "main"
+        self.quit = False
+        self.current_url = "about:blank"
+        self.title = ""
+        self.cookies: list[dict] = []
+        self.local_storage: dict[str, str] = {}
+        self.lock = Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler())
+        Thread(target=self.server.serve_forever, name="webdriver-stub", daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        """The URL of the stub."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def close(self) -> None:
+        """Stop serving."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reference(self, node: HtmlNode) -> dict:
+        """Return the W3C reference of a parsed element."""
+        element_id = str(next(self.ids))
+        self.elements[element_id] = node
+        return {ELEMENT_KEY: element_id}
+
+    def execute(self, script: str, args: list) -> object:
+        """Run the scripts the bots send, on the parsed page."""
+        if script == EXPORT_STORAGE_SCRIPT:
+            return json.dumps(self.local_storage)
+
+        if script == IMPORT_STORAGE_SCRIPT:
+            self.local_storage.update(json.loads(args[0]))
+            return None
+
+        node = self.elements[args[0][ELEMENT_KEY]]
+        if script == SET_VALUE_SCRIPT:
+            node.attrs["value"] = args[1]
+            return None
+
+        # Selenium's getAttribute atom
+        if args[1] == "outerHTML" and node is next(self.document.iter()):
+            return self.html
+
+        return node.get_attribute(args[1])
+
+    def answer(self, method: str, path: str, body: dict) -> object:
+        """Return the value of a WebDriver command."""
+        with self.lock:
+            self.commands += 1
+
+        parts = path.strip("/").split("/")
+        if parts == ["session"]:
+            return {"sessionId": "stub", "capabilities": {"browserName": "stub"}}
+
+        if parts[2:] == ["window", "handles"]:
+            return list(self.windows)
+
+        if parts[2:] == ["window"]:
+            if method == "POST":
+                self.window = body["handle"]
+            elif method == "DELETE":
+                self.windows.remove(self.window)
+                return list(self.windows)
+
+            return self.window
+
+        if parts[2:] == ["url"]:
+            if method == "POST":
+                self.current_url = body["url"]
+                return None
+
+            return self.current_url
+
+        if parts[2:] == ["title"]:
+            return self.title
+
+        if parts[2:] == ["refresh"]:
+            return None
+
+        if parts[2:] == ["cookie"]:
+            if method == "POST":
+                self.cookies.append(body["cookie"])
+            elif method == "DELETE":
+                self.cookies.clear()
+            else:
+                return list(self.cookies)
+
+            return None
+
+        if method == "DELETE":
+            self.quit = self.quit or len(parts) == 2
+            return None
+
+        if parts[2:] == ["element"]:
+            try:
+                return self.reference(self.document.find(body["value"]))
+
+            except LookupError as e:
+                raise CommandError(404, "no such element", str(e)) from None
+
+        if parts[2:] == ["execute", "sync"]:
+            return self.execute(body["script"], body["args"])
+
+        if len(parts) != 5 or parts[2] != "element" or parts[3] not in self.elements:
+            raise CommandError(404, "unknown command", path)
+
+        node = self.elements[parts[3]]
+        command = parts[4]
+        if command == "elements":
+            return [self.reference(child) for child in node.find_all(body["value"])]
+
+        if command == "value":
+            node.attrs["value"] = node.attrs.get("value", "") + body["text"]
+        elif command == "clear":
+            node.attrs["value"] = ""
+        elif command == "text":
+            return node.text
+
+        return None
+
+    def handler(self) -> type[BaseHTTPRequestHandler]:
+        """Build the request handler bound to this stub.
+
+        Returns:
+            type[BaseHTTPRequestHandler]: The handler class.
+
+        """
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def reply(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                try:
+                    value, status = stub.answer(method, self.path, body), 200
+
+                except CommandError as e:
+                    value, status = {"error": e.error, "message": str(e), "stacktrace": ""}, e.status
+
+                data = json.dumps({"value": value}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:  # noqa: N802
+                self.reply("GET")
+
+            def do_POST(self) -> None:  # noqa: N802
+                self.reply("POST")
+
+            def do_DELETE(self) -> None:  # noqa: N802
+                self.reply("DELETE")
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                return
+
+        return Handler